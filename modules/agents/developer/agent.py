@@ -35,15 +35,9 @@ from pathlib import Path
 # Import our foundation
 from ...shared.base_agent import BaseAgent, AgentExecutionResult
 from ...shared.exceptions import AgentExecutionError, DNAComplianceError, QualityGateError
-from ...shared.event_bus import EventBus
+from ...shared.lazy_tools import LazyTool
 
 # Import specialized tools
-from .tools.code_generator import CodeGenerator
-from .tools.api_builder import APIBuilder
-from .tools.git_operations import GitOperations
-from .tools.component_builder import ComponentBuilder
-from .tools.architecture_validator import ArchitectureValidator
-from .tools.dna_code_validator import DNACodeValidator
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -70,6 +64,17 @@ class DeveloperAgent(BaseAgent):
     - Performance: Lighthouse >90, API response <200ms
     """
     
+    # EventBus for team coordination
+    event_bus = LazyTool("modules.shared.event_bus.EventBus")
+    
+    # Specialized tools - imported and constructed on first use, shared per process
+    code_generator = LazyTool(".tools.code_generator.CodeGenerator")
+    api_builder = LazyTool(".tools.api_builder.APIBuilder")
+    git_operations = LazyTool(".tools.git_operations.GitOperations")
+    component_builder = LazyTool(".tools.component_builder.ComponentBuilder")
+    architecture_validator = LazyTool(".tools.architecture_validator.ArchitectureValidator")
+    dna_code_validator = LazyTool(".tools.dna_code_validator.DNACodeValidator")
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize the Developer agent.
@@ -79,17 +84,6 @@ class DeveloperAgent(BaseAgent):
         """
         super().__init__("dev-001", "developer", config)
         
-        # Initialize EventBus for team coordination
-        self.event_bus = EventBus(config)
-        
-        # Initialize specialized tools
-        self.code_generator = CodeGenerator(config)
-        self.api_builder = APIBuilder(config)
-        self.git_operations = GitOperations(config)
-        self.component_builder = ComponentBuilder(config)
-        self.architecture_validator = ArchitectureValidator(config)
-        self.dna_code_validator = DNACodeValidator(config)
-        
         # Developer-specific configuration
         self.frontend_path = self.config.get("frontend_path", "frontend")
         self.backend_path = self.config.get("backend_path", "backend")
@@ -297,6 +291,11 @@ class DeveloperAgent(BaseAgent):
             error_msg = f"Developer implementation failed for {story_id}: {str(e)}"
             self.logger.error(error_msg)
             raise AgentExecutionError(error_msg, self.agent_id, story_id)
+        
+        finally:
+            # Story is committed (or abandoned) - free its worktree for the next story
+            if getattr(self.git_operations, "isolation_mode", None) == "worktree":
+                await self.git_operations.release_story_worktree(story_id)
     
     async def _validate_architecture_requirements(self, input_data: Dict[str, Any]) -> None:
         """
@@ -808,9 +807,10 @@ class DeveloperAgent(BaseAgent):
                     f"docs/implementation/{story_id}_implementation.md"
                 ],
                 "required_data": {
-                    "component_implementations": component_implementations,
-                    "api_implementations": api_implementations,
-                    "test_suite": test_suite,
+                    # Generated source travels as blob references (see BlobStore)
+                    "component_implementations": self.blob_store.externalize(component_implementations),
+                    "api_implementations": self.blob_store.externalize(api_implementations),
+                    "test_suite": self.blob_store.externalize(test_suite),
                     "implementation_docs": implementation_docs,
                     "git_commit_hash": commit_hash
                 },
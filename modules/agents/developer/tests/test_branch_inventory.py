@@ -0,0 +1,125 @@
+"""
+Tests for GitOperations batched branch inventory.
+
+PURPOSE:
+Verify branch refs, ages, merge status and change counts come from a
+constant number of git invocations, and that per-branch queries and
+merged branch cleanup read from that snapshot.
+"""
+
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from ..tools.git_operations import GitOperations
+from .test_git_worktrees import _git, _make_product_repo
+
+
+OLD_DATE = "2020-01-01T12:00:00+00:00"
+
+
+def _commit_file(repo: Path, name: str, message: str, date: str = None) -> None:
+    path = repo / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"{message}\n")
+    env = dict(os.environ)
+    if date:
+        env.update(GIT_AUTHOR_DATE=date, GIT_COMMITTER_DATE=date)
+    subprocess.run(["git", "add", name], cwd=repo, check=True)
+    subprocess.run(["git", "commit", "-q", "-m", message], cwd=repo, check=True, env=env)
+
+
+def _counting(git_operations: GitOperations) -> list:
+    calls = []
+    execute = git_operations._execute_git_command
+    
+    async def counting_execute(args, cwd=None):
+        calls.append(args[0])
+        return await execute(args, cwd=cwd)
+    
+    git_operations._execute_git_command = counting_execute
+    return calls
+
+
+@pytest.fixture
+def product_repo(tmp_path):
+    """Product repository with old merged, recent merged and unmerged branches."""
+    product = _make_product_repo(tmp_path)
+    
+    for index in range(10):
+        _git(product, "checkout", "-q", "-b", f"feature/STORY-OLD-{index}", "main")
+        _commit_file(product, f"old/{index}.py", f"Old story {index}", OLD_DATE)
+        _git(product, "checkout", "-q", "main")
+        _git(product, "merge", "-q", "--ff-only", f"feature/STORY-OLD-{index}")
+    
+    _git(product, "checkout", "-q", "-b", "feature/STORY-RECENT", "main")
+    _commit_file(product, "recent.py", "Recent story")
+    _git(product, "checkout", "-q", "main")
+    _git(product, "merge", "-q", "--ff-only", "feature/STORY-RECENT")
+    
+    _git(product, "checkout", "-q", "-b", "feature/STORY-OPEN", "main")
+    _commit_file(product, "frontend/a.tsx", "Open story part 1")
+    _commit_file(product, "frontend/b.tsx", "Open story part 2")
+    _commit_file(product, "frontend/a.tsx", "Open story part 3")
+    _git(product, "checkout", "-q", "main")
+    return product
+
+
+@pytest.mark.agent
+class TestBranchInventory:
+    """Test suite for batched branch inventory."""
+    
+    @pytest.mark.asyncio
+    async def test_inventory_uses_three_git_calls(self, product_repo):
+        """Test refs, merge status and counts for all branches come from three invocations."""
+        git_operations = GitOperations({"product_repo_path": str(product_repo)})
+        calls = _counting(git_operations)
+        
+        inventory = await git_operations.get_branch_inventory()
+        
+        assert len(calls) == 3
+        assert len(inventory.branches) == 12
+        assert "feature/STORY-OLD-3" in inventory.merged
+        assert "feature/STORY-OPEN" not in inventory.merged
+        
+        open_branch = inventory.branches["feature/STORY-OPEN"]
+        assert open_branch.story_id == "STORY-OPEN"
+        assert open_branch.status == "active"
+        assert open_branch.commits_count == 3
+        assert open_branch.files_count == 2
+        assert open_branch.last_commit == _git(product_repo, "rev-parse", "feature/STORY-OPEN")
+        assert inventory.branches["feature/STORY-OLD-0"].status == "merged"
+        assert inventory.branches["feature/STORY-OLD-0"].commits_count == 0
+    
+    @pytest.mark.asyncio
+    async def test_branch_info_reads_snapshot(self, product_repo):
+        """Test per-branch queries reuse the snapshot instead of spawning git."""
+        git_operations = GitOperations({"product_repo_path": str(product_repo)})
+        calls = _counting(git_operations)
+        
+        for index in range(10):
+            info = await git_operations.get_branch_info(f"feature/STORY-OLD-{index}")
+            assert info.created_at.startswith("2020-01-01T12:00:00")
+        assert await git_operations._count_branch_files("feature/STORY-OPEN") == 2
+        assert len(calls) == 3
+        
+        # Unknown branch forces one refresh, then reports missing
+        assert await git_operations.get_branch_info("feature/STORY-MISSING") is None
+        assert len(calls) == 6
+    
+    @pytest.mark.asyncio
+    async def test_cleanup_deletes_old_merged_branches_in_one_call(self, product_repo):
+        """Test cleanup removes only old merged branches with a constant number of git calls."""
+        git_operations = GitOperations({"product_repo_path": str(product_repo)})
+        calls = _counting(git_operations)
+        
+        cleaned = await git_operations.cleanup_merged_branches(max_age_days=30)
+        
+        assert sorted(cleaned) == sorted(f"feature/STORY-OLD-{index}" for index in range(10))
+        assert calls.count("branch") == 1
+        assert len(calls) == 7
+        
+        remaining = _git(product_repo, "for-each-ref", "--format=%(refname:short)", "refs/heads/feature/")
+        assert sorted(remaining.split()) == ["feature/STORY-OPEN", "feature/STORY-RECENT"]
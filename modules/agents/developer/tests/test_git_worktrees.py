@@ -0,0 +1,135 @@
+"""
+Tests for GitOperations per-story worktree isolation.
+
+PURPOSE:
+Verify that in worktree mode concurrent stories get separate working trees
+on their own feature branches, share one object store, fetch main once per
+batch and leave no worktrees behind once released.
+"""
+
+import asyncio
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from ..tools.git_operations import GitOperations
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def _make_product_repo(tmp_path: Path) -> Path:
+    """Create origin repository with one commit on main and a clone of it."""
+    origin = tmp_path / "origin"
+    origin.mkdir()
+    _git(origin, "init", "-q", "-b", "main")
+    _git(origin, "config", "user.email", "test@diginativa.se")
+    _git(origin, "config", "user.name", "Test")
+    (origin / "README.md").write_text("product\n")
+    _git(origin, "add", "README.md")
+    _git(origin, "commit", "-q", "-m", "Initial commit")
+    
+    product = tmp_path / "product"
+    _git(tmp_path, "clone", "-q", str(origin), str(product))
+    _git(product, "config", "user.email", "developer@diginativa.se")
+    _git(product, "config", "user.name", "Developer Agent")
+    return product
+
+
+def _component(story_id: str) -> dict:
+    path = f"frontend/components/{story_id}/Quiz.tsx"
+    return {"files": {"component": path}, "code": {"component": f"// {story_id}\n"}}
+
+
+@pytest.mark.agent
+class TestGitWorktrees:
+    """Test suite for per-story worktree isolation."""
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_stories_get_isolated_worktrees(self, tmp_path):
+        """Test two stories implemented concurrently never touch the main checkout."""
+        product = _make_product_repo(tmp_path)
+        git_operations = GitOperations({
+            "product_repo_path": str(product),
+            "git_isolation_mode": "worktree"
+        })
+        
+        fetches = []
+        execute = git_operations._execute_git_command
+        
+        async def counting_execute(args, cwd=None):
+            if args[0] == "fetch":
+                fetches.append(args)
+            return await execute(args, cwd=cwd)
+        
+        git_operations._execute_git_command = counting_execute
+        
+        story_ids = ["STORY-WT-001", "STORY-WT-002"]
+        batch = await git_operations.prepare_story_batch(story_ids)
+        assert batch.branch_name == "origin/main"
+        
+        results = await asyncio.gather(*[
+            git_operations.create_feature_branch(story_id) for story_id in story_ids
+        ])
+        assert all(result.success for result in results)
+        assert len(fetches) == 1
+        
+        paths = [git_operations.story_worktrees[story_id] for story_id in story_ids]
+        assert paths[0] != paths[1]
+        for story_id, path in zip(story_ids, paths):
+            assert _git(path, "rev-parse", "--abbrev-ref", "HEAD") == f"feature/{story_id}"
+        
+        commits = await asyncio.gather(*[
+            git_operations.commit_implementation(
+                story_id, f"Implement {story_id}", [_component(story_id)], [], {}
+            )
+            for story_id in story_ids
+        ])
+        
+        # Main checkout untouched, both commits visible from shared object store
+        assert _git(product, "rev-parse", "--abbrev-ref", "HEAD") == "main"
+        assert not (product / "frontend").exists()
+        for story_id, commit_hash in zip(story_ids, commits):
+            assert _git(product, "rev-parse", f"feature/{story_id}") == commit_hash
+            files = _git(product, "ls-tree", "-r", "--name-only", commit_hash)
+            assert f"frontend/components/{story_id}/Quiz.tsx" in files
+            other = [s for s in story_ids if s != story_id][0]
+            assert f"frontend/components/{other}/Quiz.tsx" not in files
+        
+        for story_id in story_ids:
+            released = await git_operations.release_story_worktree(story_id)
+            assert released.success
+        
+        assert git_operations.story_worktrees == {}
+        assert not any(path.exists() for path in paths)
+        assert _git(product, "worktree", "list", "--porcelain").count("worktree ") == 1
+    
+    @pytest.mark.asyncio
+    async def test_main_fetched_once_within_refresh_interval(self, tmp_path):
+        """Test stories outside an explicit batch reuse a recent fetch of main."""
+        product = _make_product_repo(tmp_path)
+        git_operations = GitOperations({
+            "product_repo_path": str(product),
+            "git_isolation_mode": "worktree",
+            "worktree_root": str(tmp_path / "trees")
+        })
+        
+        assert await git_operations._refresh_main_once()
+        fetched_at = git_operations._main_refreshed_at
+        assert await git_operations._refresh_main_once()
+        assert git_operations._main_refreshed_at == fetched_at
+        
+        result = await git_operations.create_feature_branch("STORY-WT-003")
+        assert result.success
+        assert git_operations.story_worktrees["STORY-WT-003"].parent == tmp_path / "trees"
+    
+    def test_shared_checkout_is_default(self):
+        """Test default mode keeps working in the product checkout."""
+        git_operations = GitOperations({"product_repo_path": "/tmp/test_repo"})
+        
+        assert git_operations.isolation_mode == "shared_checkout"
+        assert git_operations._story_repo_path("STORY-1") == Path("/tmp/test_repo")
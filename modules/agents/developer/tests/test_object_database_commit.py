@@ -0,0 +1,116 @@
+"""
+Tests for GitOperations object database commit path.
+
+PURPOSE:
+Verify generated code is committed straight into the object database via
+git fast-import: one fast-import run per commit, unchanged files skipped
+and the product working tree never touched.
+"""
+
+import pytest
+
+from ..tools.git_operations import GitOperations
+from .test_git_worktrees import _git, _make_product_repo
+
+
+def _components(story_id: str, count: int, version: str = "v1") -> list:
+    return [
+        {
+            "files": {"component": f"frontend/components/{story_id}/Component{index}.tsx"},
+            "code": {"component": f"// {story_id} component {index} {version}\n"}
+        }
+        for index in range(count)
+    ]
+
+
+def _api(story_id: str) -> dict:
+    return {
+        "files": {"endpoint": f"backend/endpoints/{story_id}/quiz endpoint.py"},
+        "code": {"endpoint": "def endpoint():\n    return {'svar': 'rätt'}\n"}
+    }
+
+
+def _counting(git_operations: GitOperations) -> list:
+    calls = []
+    execute = git_operations._execute_git_command
+    
+    async def counting_execute(args, cwd=None, input_data=None):
+        calls.append(args[0])
+        return await execute(args, cwd=cwd, input_data=input_data)
+    
+    git_operations._execute_git_command = counting_execute
+    return calls
+
+
+@pytest.mark.agent
+class TestObjectDatabaseCommit:
+    """Test suite for fast-import commit path."""
+    
+    @pytest.mark.asyncio
+    async def test_hundreds_of_files_in_one_fast_import(self, tmp_path):
+        """Test large commit is one fast-import run and leaves the working tree alone."""
+        product = _make_product_repo(tmp_path)
+        git_operations = GitOperations({
+            "product_repo_path": str(product),
+            "git_isolation_mode": "object_database"
+        })
+        story_id = "STORY-ODB-001"
+        
+        branch = await git_operations.create_feature_branch(story_id)
+        assert branch.success
+        
+        calls = _counting(git_operations)
+        commit_hash = await git_operations.commit_implementation(
+            story_id, "Quiz", _components(story_id, 300), [_api(story_id)], {}
+        )
+        
+        assert calls == ["ls-tree", "fast-import"]
+        assert _git(product, "rev-parse", f"feature/{story_id}") == commit_hash
+        assert _git(product, "rev-parse", f"{commit_hash}^") == _git(product, "rev-parse", "main")
+        
+        files = _git(product, "ls-tree", "-r", "--name-only", commit_hash).splitlines()
+        assert len(files) == 1 + 300 + 1 + 1
+        assert _git(product, "show", f"{commit_hash}:backend/endpoints/{story_id}/quiz endpoint.py").endswith("'rätt'}")
+        assert f"Implement {story_id}: Quiz" in _git(product, "log", "-1", "--format=%B", commit_hash)
+        
+        # Working tree and checked out branch untouched
+        assert _git(product, "rev-parse", "--abbrev-ref", "HEAD") == "main"
+        assert not (product / "frontend").exists()
+        assert _git(product, "status", "--porcelain") == ""
+    
+    @pytest.mark.asyncio
+    async def test_unchanged_files_are_skipped(self, tmp_path):
+        """Test recommit sends only changed files and identical content makes no commit."""
+        product = _make_product_repo(tmp_path)
+        git_operations = GitOperations({
+            "product_repo_path": str(product),
+            "git_isolation_mode": "object_database"
+        })
+        story_id = "STORY-ODB-002"
+        await git_operations.create_feature_branch(story_id)
+        
+        first = await git_operations.commit_implementation(
+            story_id, "Quiz", _components(story_id, 5), [], {}
+        )
+        
+        components = _components(story_id, 5)
+        components[2]["code"]["component"] = "// changed\n"
+        second = await git_operations.commit_implementation(
+            story_id, "Quiz fix", components, [], {}
+        )
+        
+        changed = _git(product, "diff-tree", "--no-commit-id", "--name-only", "-r", second).splitlines()
+        assert changed == [f"frontend/components/{story_id}/Component2.tsx"]
+        assert _git(product, "rev-parse", f"{second}^") == first
+        
+        third = await git_operations.commit_implementation(
+            story_id, "Quiz again", components, [], {}
+        )
+        assert third == second
+    
+    def test_blob_id_matches_git_hash_object(self, tmp_path):
+        """Test in-process blob ids equal git's so unchanged detection is exact."""
+        path = tmp_path / "file.txt"
+        path.write_text("Anna lär sig\n", encoding="utf-8")
+        
+        assert GitOperations._blob_id(path.read_bytes()) == _git(tmp_path, "hash-object", str(path))
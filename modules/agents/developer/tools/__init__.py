@@ -10,18 +10,25 @@ This package contains specialized tools for the Developer Agent:
 - DNACodeValidator: DNA compliance validation for generated code
 """
 
-from .code_generator import CodeGenerator
-from .api_builder import APIBuilder
-from .git_operations import GitOperations
-from .component_builder import ComponentBuilder
-from .architecture_validator import ArchitectureValidator
-from .dna_code_validator import DNACodeValidator
+import importlib
 
-__all__ = [
-    "CodeGenerator",
-    "APIBuilder", 
-    "GitOperations",
-    "ComponentBuilder",
-    "ArchitectureValidator",
-    "DNACodeValidator"
-]
\ No newline at end of file
+# Tool classes are imported on first access (PEP 562) so importing the
+# package does not pull in every tool module
+_TOOL_MODULES = {
+    "CodeGenerator": ".code_generator",
+    "APIBuilder": ".api_builder",
+    "GitOperations": ".git_operations",
+    "ComponentBuilder": ".component_builder",
+    "ArchitectureValidator": ".architecture_validator",
+    "DNACodeValidator": ".dna_code_validator",
+}
+
+__all__ = list(_TOOL_MODULES)
+
+
+def __getattr__(name):
+    if name not in _TOOL_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_TOOL_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
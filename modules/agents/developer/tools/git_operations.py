@@ -12,6 +12,8 @@ CRITICAL FEATURES:
 - Integration with dual repository strategy
 - Automated branch protection and cleanup
 - Pre-commit validation and quality gates
+- Optional per-story worktrees so several Developer agents can work concurrently
+- Optional object database mode committing generated code via git fast-import
 
 WORKFLOW INTEGRATION:
 - AI-Team Repository: Agent implementations and coordination
@@ -20,16 +22,22 @@ WORKFLOW INTEGRATION:
 """
 
 import os
+import posixpath
 import subprocess
 import logging
 import asyncio
 import json
-from typing import Dict, Any, List, Optional, Tuple
+import re
+import tempfile
+import time
+from typing import Dict, Any, List, Optional, Set, Tuple
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 import hashlib
 
+from modules.shared.artifact_writer import get_artifact_writer
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
@@ -45,6 +53,11 @@ class GitOperationResult:
     message: str
     warnings: List[str]
     error_message: Optional[str]
+    
+    @property
+    def output(self) -> str:
+        """Command stdout (stored in message by _execute_git_command)."""
+        return self.message
 
 
 @dataclass
@@ -56,10 +69,19 @@ class BranchInfo:
     created_at: str
     last_commit: str
     status: str  # 'active', 'ready_for_review', 'merged', 'abandoned'
-    files_count: int
+    files_count: int  # files changed relative to base branch
     commits_count: int
 
 
+@dataclass
+class BranchInventory:
+    """Snapshot of all feature branches, gathered in a few batched git calls."""
+    branches: Dict[str, BranchInfo]
+    commit_timestamps: Dict[str, int]
+    merged: Set[str]
+    taken_at: float = field(default_factory=time.monotonic)
+
+
 class GitOperations:
     """
     Advanced Git operations for DigiNativa development workflow.
@@ -98,6 +120,30 @@ class GitOperations:
             )
         }
         
+        # Isolation mode: "shared_checkout" works directly in product_repo_path,
+        # "worktree" gives each story its own git worktree on its feature branch
+        # (one object store, main fetched once per batch), "object_database"
+        # never checks branches out and commits generated code via fast-import
+        self.isolation_mode = self.config.get("git_isolation_mode", "shared_checkout")
+        self.worktree_root = Path(self.config.get(
+            "worktree_root",
+            self.product_repo_path.parent / f"{self.product_repo_path.name}-worktrees"
+        ))
+        self.main_refresh_interval_seconds = self.config.get("main_refresh_interval_seconds", 300)
+        
+        # story_id -> worktree path for stories currently being implemented
+        self.story_worktrees: Dict[str, Path] = {}
+        # story_id -> feature branch created for it
+        self.story_branches: Dict[str, str] = {}
+        self._main_refreshed_at: Optional[float] = None
+        self._main_base_ref = self.git_config["main_branch"]
+        self._main_refresh_lock = asyncio.Lock()
+        self._worktree_lock = asyncio.Lock()
+        
+        # Branch snapshot shared by per-branch queries (refreshed after TTL)
+        self.branch_inventory_ttl_seconds = self.config.get("branch_inventory_ttl_seconds", 30)
+        self._branch_inventory: Optional[BranchInventory] = None
+        
         # Quality gates for commits
         self.pre_commit_checks = {
             "typescript_compilation": True,
@@ -135,13 +181,22 @@ class GitOperations:
             # Ensure we're in the product repository
             await self._ensure_product_repository()
             
-            # Ensure main branch is up to date
-            await self._update_main_branch()
-            
-            # Create and checkout feature branch
-            result = await self._execute_git_command([
-                "checkout", "-b", branch_name, self.git_config["main_branch"]
-            ], cwd=self.product_repo_path)
+            if self.isolation_mode == "worktree":
+                # Fetch main at most once per batch, then give story its own worktree
+                await self._refresh_main_once()
+                result = await self._add_story_worktree(story_id, branch_name)
+            elif self.isolation_mode == "object_database":
+                # Branch ref only - commits are written straight into the object database
+                await self._refresh_main_once()
+                result = await self._create_branch_ref(branch_name)
+            else:
+                # Ensure main branch is up to date
+                await self._update_main_branch()
+                
+                # Create and checkout feature branch
+                result = await self._execute_git_command([
+                    "checkout", "-b", branch_name, self.git_config["main_branch"]
+                ], cwd=self.product_repo_path)
             
             if not result.success:
                 return GitOperationResult(
@@ -155,11 +210,14 @@ class GitOperations:
                     error_message=f"Failed to create branch: {result.error_message}"
                 )
             
-            # Set up branch tracking and initial commit
-            await self._setup_branch_tracking(branch_name, story_id)
+            self.story_branches[story_id] = branch_name
             
-            # Create initial directory structure for story
-            await self._create_story_directory_structure(story_id)
+            if self.isolation_mode != "object_database":
+                # Set up branch tracking and initial commit
+                await self._setup_branch_tracking(branch_name, story_id)
+                
+                # Create initial directory structure for story
+                await self._create_story_directory_structure(story_id)
             
             self.logger.info(f"Successfully created feature branch: {branch_name}")
             
@@ -215,6 +273,34 @@ class GitOperations:
         try:
             self.logger.info(f"Committing implementation for story: {story_id}")
             
+            # Format commit message
+            formatted_message = self._format_commit_message(
+                "Implement",
+                story_id,
+                commit_message,
+                {
+                    "components": len(component_implementations),
+                    "apis": len(api_implementations),
+                    "tests": len(test_suite.get("unit_tests", []))
+                }
+            )
+            
+            if self.isolation_mode == "object_database":
+                # Build tree and commit from in-memory code, no working tree involved
+                implementation_files = self._collect_implementation_files(
+                    story_id, component_implementations, api_implementations
+                )
+                
+                quality_check_result = await self._run_pre_commit_checks(
+                    [Path(path) for path in implementation_files]
+                )
+                if not quality_check_result.success:
+                    raise Exception(f"Pre-commit checks failed: {quality_check_result.error_message}")
+                
+                return await self._commit_to_object_database(
+                    story_id, formatted_message, implementation_files
+                )
+            
             # Write implementation files to filesystem
             files_written = await self._write_implementation_files(
                 story_id,
@@ -228,29 +314,18 @@ class GitOperations:
             if not quality_check_result.success:
                 raise Exception(f"Pre-commit checks failed: {quality_check_result.error_message}")
             
-            # Stage files for commit
-            for file_path in files_written:
-                await self._execute_git_command(
-                    ["add", str(file_path)],
-                    cwd=self.product_repo_path
-                )
+            repo_path = self._story_repo_path(story_id)
             
-            # Format commit message
-            formatted_message = self._format_commit_message(
-                "Implement",
-                story_id,
-                commit_message,
-                {
-                    "components": len(component_implementations),
-                    "apis": len(api_implementations),
-                    "tests": len(test_suite.get("unit_tests", []))
-                }
+            # Stage all files in one invocation
+            await self._execute_git_command(
+                ["add", "--"] + [str(file_path) for file_path in files_written],
+                cwd=repo_path
             )
             
             # Create commit
             commit_result = await self._execute_git_command([
                 "commit", "-m", formatted_message
-            ], cwd=self.product_repo_path)
+            ], cwd=repo_path)
             
             if not commit_result.success:
                 raise Exception(f"Git commit failed: {commit_result.error_message}")
@@ -258,7 +333,7 @@ class GitOperations:
             # Get commit hash
             hash_result = await self._execute_git_command([
                 "rev-parse", "HEAD"
-            ], cwd=self.product_repo_path)
+            ], cwd=repo_path)
             
             commit_hash = hash_result.output.strip() if hash_result.success else "unknown"
             
@@ -293,7 +368,7 @@ class GitOperations:
             # Push branch to remote
             push_result = await self._execute_git_command([
                 "push", "-u", "origin", branch_name
-            ], cwd=self.product_repo_path)
+            ], cwd=self._story_repo_path(story_id))
             
             if not push_result.success:
                 raise Exception(f"Failed to push branch: {push_result.error_message}")
@@ -337,44 +412,94 @@ class GitOperations:
             BranchInfo if branch exists, None otherwise
         """
         try:
-            # Check if branch exists
-            branch_check = await self._execute_git_command([
-                "show-ref", "--verify", f"refs/heads/{branch_name}"
-            ], cwd=self.product_repo_path)
+            inventory = await self.get_branch_inventory()
+            if branch_name not in inventory.branches:
+                # Branch may have been created after the snapshot was taken
+                inventory = await self.get_branch_inventory(refresh=True)
             
-            if not branch_check.success:
-                return None
+            return inventory.branches.get(branch_name)
             
-            # Get branch details
-            created_at_result = await self._execute_git_command([
-                "log", "--format=%aI", "-1", f"{branch_name}"
-            ], cwd=self.product_repo_path)
+        except Exception as e:
+            self.logger.error(f"Failed to get branch info for {branch_name}: {e}")
+            return None
+    
+    async def get_branch_inventory(self, refresh: bool = False) -> BranchInventory:
+        """
+        Get refs, ages, merge status and change counts of all feature branches.
+        
+        Uses three git invocations regardless of branch count: for-each-ref
+        for refs and dates, for-each-ref --merged for merge status and one
+        log walk over all unmerged feature commits for commit and file counts.
+        
+        Args:
+            refresh: Ignore cached snapshot
             
-            last_commit_result = await self._execute_git_command([
-                "rev-parse", branch_name
-            ], cwd=self.product_repo_path)
+        Returns:
+            BranchInventory snapshot
+        """
+        if (
+            not refresh
+            and self._branch_inventory is not None
+            and time.monotonic() - self._branch_inventory.taken_at < self.branch_inventory_ttl_seconds
+        ):
+            return self._branch_inventory
+        
+        main_branch = self.git_config["main_branch"]
+        prefix = self.git_config["feature_prefix"]
+        ref_pattern = f"refs/heads/{prefix}*" if prefix else "refs/heads/"
+        
+        refs_result = await self._execute_git_command([
+            "for-each-ref",
+            "--format=%(refname:short)%00%(objectname)%00%(committerdate:unix)%00%(authordate:iso-strict)",
+            ref_pattern
+        ], cwd=self.product_repo_path)
+        
+        merged_result = await self._execute_git_command([
+            "for-each-ref", f"--merged={main_branch}", "--format=%(refname:short)", ref_pattern
+        ], cwd=self.product_repo_path)
+        
+        walk_result = await self._execute_git_command([
+            "log", "--format=%x1e%H %P", "--name-only",
+            f"--branches={prefix}*", "--not", main_branch, "--"
+        ], cwd=self.product_repo_path)
+        
+        refs = self._parse_branch_refs(refs_result.output if refs_result.success else "")
+        merged = set(merged_result.output.split()) if merged_result.success else set()
+        commit_parents, commit_files = self._parse_commit_walk(
+            walk_result.output if walk_result.success else ""
+        )
+        
+        branches: Dict[str, BranchInfo] = {}
+        commit_timestamps: Dict[str, int] = {}
+        
+        for name, (tip, committed_at, authored_at) in refs.items():
+            if name == main_branch:
+                continue
             
-            commits_count_result = await self._execute_git_command([
-                "rev-list", "--count", f"{self.git_config['main_branch']}..{branch_name}"
-            ], cwd=self.product_repo_path)
+            commits = self._commits_reachable_in_walk(tip, commit_parents)
+            changed_files: Set[str] = set()
+            for commit in commits:
+                changed_files.update(commit_files.get(commit, ()))
             
-            # Extract story ID from branch name
-            story_id = branch_name.replace(self.git_config['feature_prefix'], "")
-            
-            return BranchInfo(
-                name=branch_name,
-                story_id=story_id,
-                base_branch=self.git_config['main_branch'],
-                created_at=created_at_result.output.strip() if created_at_result.success else "",
-                last_commit=last_commit_result.output.strip() if last_commit_result.success else "",
-                status="active",  # This would be determined by additional checks
-                files_count=await self._count_branch_files(branch_name),
-                commits_count=int(commits_count_result.output.strip()) if commits_count_result.success else 0
+            branches[name] = BranchInfo(
+                name=name,
+                story_id=name.replace(prefix, ""),
+                base_branch=main_branch,
+                created_at=authored_at,
+                last_commit=tip,
+                status="merged" if name in merged else "active",
+                files_count=len(changed_files),
+                commits_count=len(commits)
             )
-            
-        except Exception as e:
-            self.logger.error(f"Failed to get branch info for {branch_name}: {e}")
-            return None
+            commit_timestamps[name] = committed_at
+        
+        self._branch_inventory = BranchInventory(
+            branches=branches,
+            commit_timestamps=commit_timestamps,
+            merged=merged & set(branches)
+        )
+        self.logger.debug(f"Branch inventory refreshed: {len(branches)} branches, {len(merged)} merged")
+        return self._branch_inventory
     
     async def cleanup_merged_branches(self, max_age_days: int = 30) -> List[str]:
         """
@@ -387,36 +512,27 @@ class GitOperations:
             List of cleaned up branch names
         """
         try:
-            # Get merged branches
-            merged_result = await self._execute_git_command([
-                "branch", "--merged", self.git_config['main_branch']
-            ], cwd=self.product_repo_path)
+            inventory = await self.get_branch_inventory(refresh=True)
+            
+            candidates = [
+                branch for branch in sorted(inventory.merged)
+                if await self._check_branch_age(branch, max_age_days)
+            ]
             
-            if not merged_result.success:
+            if not candidates:
                 return []
             
-            merged_branches = [
-                branch.strip().replace("* ", "")
-                for branch in merged_result.output.split("\n")
-                if branch.strip() and not branch.strip().endswith(self.git_config['main_branch'])
-            ]
+            # One delete for all candidates; branches git refuses (e.g. checked
+            # out in a worktree) remain and are detected by the refreshed snapshot
+            await self._execute_git_command(
+                ["branch", "-d", *candidates], cwd=self.product_repo_path
+            )
             
-            cleaned_branches = []
-            
-            for branch in merged_branches:
-                if branch.startswith(self.git_config['feature_prefix']):
-                    # Check branch age
-                    age_check = await self._check_branch_age(branch, max_age_days)
-                    
-                    if age_check:
-                        # Delete local branch
-                        delete_result = await self._execute_git_command([
-                            "branch", "-d", branch
-                        ], cwd=self.product_repo_path)
-                        
-                        if delete_result.success:
-                            cleaned_branches.append(branch)
-                            self.logger.info(f"Cleaned up merged branch: {branch}")
+            remaining = await self.get_branch_inventory(refresh=True)
+            cleaned_branches = [branch for branch in candidates if branch not in remaining.branches]
+            
+            for branch in cleaned_branches:
+                self.logger.info(f"Cleaned up merged branch: {branch}")
             
             return cleaned_branches
             
@@ -424,8 +540,260 @@ class GitOperations:
             self.logger.error(f"Branch cleanup failed: {e}")
             return []
     
+    async def prepare_story_batch(self, story_ids: List[str]) -> GitOperationResult:
+        """
+        Fetch main once for a batch of stories about to be implemented.
+        
+        Worktrees created for the batch afterwards branch from the fetched
+        main without fetching again.
+        
+        Args:
+            story_ids: Stories in the batch
+            
+        Returns:
+            GitOperationResult with the base ref the batch branches from
+        """
+        await self._ensure_product_repository()
+        fetched = await self._refresh_main_once(force=True)
+        
+        return GitOperationResult(
+            success=True,
+            operation="prepare_story_batch",
+            branch_name=self._main_base_ref,
+            commit_hash=None,
+            files_modified=[],
+            message=f"Prepared batch of {len(story_ids)} stories on {self._main_base_ref}",
+            warnings=[] if fetched else [f"Fetch of {self.git_config['main_branch']} failed, using local branch"],
+            error_message=None
+        )
+    
+    async def release_story_worktree(self, story_id: str) -> GitOperationResult:
+        """
+        Remove story worktree and prune stale worktree metadata.
+        
+        The feature branch and its commits stay in the shared object store.
+        
+        Args:
+            story_id: Story whose worktree to remove
+            
+        Returns:
+            GitOperationResult for the removal
+        """
+        async with self._worktree_lock:
+            worktree_path = self.story_worktrees.pop(story_id, None)
+            if worktree_path is None:
+                worktree_path = self._worktree_path(story_id)
+            
+            result = GitOperationResult(
+                success=True,
+                operation="release_story_worktree",
+                branch_name=None,
+                commit_hash=None,
+                files_modified=[],
+                message=f"No worktree for story {story_id}",
+                warnings=[],
+                error_message=None
+            )
+            
+            if worktree_path.exists():
+                result = await self._execute_git_command([
+                    "worktree", "remove", "--force", str(worktree_path)
+                ], cwd=self.product_repo_path)
+                
+                if result.success:
+                    self.logger.info(f"Removed worktree for story {story_id}: {worktree_path}")
+            
+            await self._execute_git_command(["worktree", "prune"], cwd=self.product_repo_path)
+            return result
+    
     # Helper methods
     
+    def _worktree_path(self, story_id: str) -> Path:
+        """Worktree directory for story (story IDs are made filesystem safe)."""
+        return self.worktree_root / re.sub(r"[^A-Za-z0-9._-]", "_", story_id)
+    
+    def _story_repo_path(self, story_id: str) -> Path:
+        """Working tree a story's files are written to and committed from."""
+        return self.story_worktrees.get(story_id, self.product_repo_path)
+    
+    async def _refresh_main_once(self, force: bool = False) -> bool:
+        """
+        Fetch main from origin unless fetched within refresh interval.
+        
+        Concurrent callers wait for one in-flight fetch instead of each
+        fetching. Worktrees branch from origin/main after a successful fetch
+        and from local main otherwise.
+        
+        Returns:
+            True if main is fresh (fetched now or within interval)
+        """
+        async with self._main_refresh_lock:
+            now = time.monotonic()
+            if (
+                not force
+                and self._main_refreshed_at is not None
+                and now - self._main_refreshed_at < self.main_refresh_interval_seconds
+            ):
+                return True
+            
+            main_branch = self.git_config["main_branch"]
+            fetch_result = await self._execute_git_command([
+                "fetch", "origin", main_branch
+            ], cwd=self.product_repo_path)
+            
+            self._main_refreshed_at = now
+            self._main_base_ref = f"origin/{main_branch}" if fetch_result.success else main_branch
+            return fetch_result.success
+    
+    async def _add_story_worktree(self, story_id: str, branch_name: str) -> GitOperationResult:
+        """Create (or reuse) story worktree checked out on its feature branch."""
+        async with self._worktree_lock:
+            worktree_path = self._worktree_path(story_id)
+            
+            if (worktree_path / ".git").exists():
+                self.story_worktrees[story_id] = worktree_path
+                self.logger.info(f"Reusing worktree for story {story_id}: {worktree_path}")
+                return await self._execute_git_command(
+                    ["checkout", branch_name], cwd=worktree_path
+                )
+            
+            worktree_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            # Drop metadata of worktrees whose directories were deleted
+            await self._execute_git_command(["worktree", "prune"], cwd=self.product_repo_path)
+            
+            branch_exists = await self._execute_git_command([
+                "show-ref", "--verify", "--quiet", f"refs/heads/{branch_name}"
+            ], cwd=self.product_repo_path)
+            
+            if branch_exists.success:
+                args = ["worktree", "add", str(worktree_path), branch_name]
+            else:
+                args = ["worktree", "add", "-b", branch_name, str(worktree_path), self._main_base_ref]
+            
+            result = await self._execute_git_command(args, cwd=self.product_repo_path)
+            if result.success:
+                self.story_worktrees[story_id] = worktree_path
+                self.logger.info(f"Created worktree for story {story_id}: {worktree_path}")
+            return result
+    
+    async def _create_branch_ref(self, branch_name: str) -> GitOperationResult:
+        """Create feature branch ref from main base without checking it out."""
+        branch_exists = await self._execute_git_command([
+            "show-ref", "--verify", "--quiet", f"refs/heads/{branch_name}"
+        ], cwd=self.product_repo_path)
+        
+        if branch_exists.success:
+            return branch_exists
+        
+        return await self._execute_git_command([
+            "branch", branch_name, self._main_base_ref
+        ], cwd=self.product_repo_path)
+    
+    async def _commit_to_object_database(
+        self,
+        story_id: str,
+        commit_message: str,
+        files: Dict[str, str]
+    ) -> str:
+        """
+        Commit generated files onto story branch via git fast-import.
+        
+        Blob ids are computed in-process and compared with the parent tree so
+        unchanged files are not sent; the tree, blobs and commit are then
+        written by a single fast-import run.
+        
+        Args:
+            story_id: Story identifier
+            commit_message: Formatted commit message
+            files: Repository-relative path -> file content
+            
+        Returns:
+            Commit hash (parent hash when nothing changed)
+        """
+        branch_name = self.story_branches.get(story_id, f"{self.git_config['feature_prefix']}{story_id}")
+        branch_ref = f"refs/heads/{branch_name}"
+        
+        parent_blobs = await self._read_tree_blobs(branch_ref)
+        parent = f"{branch_ref}^0" if parent_blobs is not None else f"{self._main_base_ref}^0"
+        if parent_blobs is None:
+            parent_blobs = await self._read_tree_blobs(self._main_base_ref) or {}
+        
+        changed = {}
+        for path, content in files.items():
+            path = posixpath.normpath(path)
+            data = content.encode("utf-8")
+            if parent_blobs.get(path) != self._blob_id(data):
+                changed[path] = data
+        
+        if not changed:
+            head = await self._execute_git_command(["rev-parse", parent], cwd=self.product_repo_path)
+            self.logger.info(f"No changes to commit for story {story_id}")
+            return head.output.strip() if head.success else "unknown"
+        
+        identity = f"{self.git_config['user_name']} <{self.git_config['user_email']}>"
+        timestamp = f"{int(time.time())} +0000"
+        message = commit_message.encode("utf-8")
+        
+        stream = bytearray()
+        stream += f"commit {branch_ref}\nmark :1\n".encode("utf-8")
+        stream += f"author {identity} {timestamp}\ncommitter {identity} {timestamp}\n".encode("utf-8")
+        stream += b"data %d\n%s\n" % (len(message), message)
+        stream += f"from {parent}\n".encode("utf-8")
+        for path, data in changed.items():
+            stream += f"M 100644 inline {self._quote_fast_import_path(path)}\n".encode("utf-8")
+            stream += b"data %d\n%s\n" % (len(data), data)
+        stream += b"\ndone\n"
+        
+        marks_fd, marks_path = tempfile.mkstemp(prefix="fast-import-", suffix=".marks")
+        os.close(marks_fd)
+        try:
+            result = await self._execute_git_command(
+                ["fast-import", "--quiet", "--done", f"--export-marks={marks_path}"],
+                cwd=self.product_repo_path,
+                input_data=bytes(stream)
+            )
+            if not result.success:
+                raise Exception(f"git fast-import failed: {result.error_message}")
+            
+            with open(marks_path) as marks_file:
+                commit_hash = marks_file.read().split()[-1]
+        finally:
+            os.unlink(marks_path)
+        
+        self.logger.info(
+            f"Committed {len(changed)}/{len(files)} changed files for {story_id} via fast-import: {commit_hash}"
+        )
+        return commit_hash
+    
+    async def _read_tree_blobs(self, treeish: str) -> Optional[Dict[str, str]]:
+        """Path -> blob id for every file in treeish, None if it does not exist."""
+        result = await self._execute_git_command(
+            ["ls-tree", "-r", "-z", "--full-tree", treeish], cwd=self.product_repo_path
+        )
+        if not result.success:
+            return None
+        
+        blobs = {}
+        for entry in result.output.split("\x00"):
+            if "\t" not in entry:
+                continue
+            meta, path = entry.split("\t", 1)
+            blobs[path] = meta.split()[2]
+        return blobs
+    
+    @staticmethod
+    def _blob_id(data: bytes) -> str:
+        """Git blob id of content (what hash-object would return)."""
+        return hashlib.sha1(b"blob %d\x00" % len(data) + data).hexdigest()
+    
+    @staticmethod
+    def _quote_fast_import_path(path: str) -> str:
+        """Quote path for fast-import when it contains special characters."""
+        if path.startswith('"') or any(char in path for char in ('\n', ' ')):
+            return json.dumps(path, ensure_ascii=False)
+        return path
+    
     async def _ensure_product_repository(self) -> None:
         """Ensure product repository exists and is properly configured."""
         if not self.product_repo_path.exists():
@@ -451,7 +819,8 @@ class GitOperations:
     async def _execute_git_command(
         self,
         args: List[str],
-        cwd: Optional[Path] = None
+        cwd: Optional[Path] = None,
+        input_data: Optional[bytes] = None
     ) -> GitOperationResult:
         """
         Execute Git command and return result.
@@ -459,6 +828,7 @@ class GitOperations:
         Args:
             args: Git command arguments
             cwd: Working directory for command
+            input_data: Optional bytes written to the command's stdin
             
         Returns:
             GitOperationResult with command execution details
@@ -469,11 +839,12 @@ class GitOperations:
             process = await asyncio.create_subprocess_exec(
                 *cmd,
                 cwd=cwd or self.ai_team_repo_path,
+                stdin=asyncio.subprocess.PIPE if input_data is not None else None,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE
             )
             
-            stdout, stderr = await process.communicate()
+            stdout, stderr = await process.communicate(input_data)
             
             success = process.returncode == 0
             output = stdout.decode().strip() if stdout else ""
@@ -520,15 +891,12 @@ class GitOperations:
             "status": "active"
         }
         
-        metadata_file = self.product_repo_path / ".digitativa" / "branches" / f"{story_id}.json"
-        metadata_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(metadata_file, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        metadata_file = self._story_repo_path(story_id) / ".digitativa" / "branches" / f"{story_id}.json"
+        await get_artifact_writer().write_json(metadata_file, metadata, "developer", story_id)
     
     async def _create_story_directory_structure(self, story_id: str) -> None:
         """Create directory structure for story implementation."""
-        base_path = self.product_repo_path
+        base_path = self._story_repo_path(story_id)
         
         # Create directories for story implementation
         directories = [
@@ -566,42 +934,48 @@ class GitOperations:
         Returns:
             List of file paths written
         """
-        written_files = []
-        base_path = self.product_repo_path
+        base_path = self._story_repo_path(story_id)
+        files = self._collect_implementation_files(
+            story_id, component_implementations, api_implementations
+        )
         
-        # Write React components
-        for component in component_implementations:
-            for file_type, file_path in component["files"].items():
-                full_path = base_path / file_path
+        def write_files() -> List[Path]:
+            written_files = []
+            for relative_path, content in files.items():
+                full_path = base_path / relative_path
                 full_path.parent.mkdir(parents=True, exist_ok=True)
                 
                 with open(full_path, 'w') as f:
-                    f.write(component["code"][file_type])
+                    f.write(content)
                 
                 written_files.append(full_path)
+            return written_files
         
-        # Write FastAPI endpoints
-        for api in api_implementations:
-            for file_type, file_path in api["files"].items():
-                full_path = base_path / file_path
-                full_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                with open(full_path, 'w') as f:
-                    f.write(api["code"][file_type])
-                
-                written_files.append(full_path)
+        # Blocking file I/O runs off the event loop
+        return await asyncio.to_thread(write_files)
+    
+    def _collect_implementation_files(
+        self,
+        story_id: str,
+        component_implementations: List[Dict[str, Any]],
+        api_implementations: List[Dict[str, Any]]
+    ) -> Dict[str, str]:
+        """
+        Collect generated files as repository-relative path -> content.
         
-        # Write test files (already included in components/apis above)
-        # But ensure test configuration files are written
-        test_config_file = base_path / f"tests/unit/{story_id}/jest.config.js"
-        test_config_file.parent.mkdir(parents=True, exist_ok=True)
+        Test files are already included in components/apis; the story's
+        test configuration file is added here.
+        """
+        files: Dict[str, str] = {}
         
-        with open(test_config_file, 'w') as f:
-            f.write(self._generate_jest_config(story_id))
+        # React components and FastAPI endpoints
+        for implementation in list(component_implementations) + list(api_implementations):
+            for file_type, file_path in implementation["files"].items():
+                files[str(file_path)] = implementation["code"][file_type]
         
-        written_files.append(test_config_file)
+        files[f"tests/unit/{story_id}/jest.config.js"] = self._generate_jest_config(story_id)
         
-        return written_files
+        return files
     
     async def _run_pre_commit_checks(self, files: List[Path]) -> GitOperationResult:
         """Run pre-commit quality checks."""
@@ -810,49 +1184,76 @@ class GitOperations:
         match = re.search(r'/pull/(\d+)', pr_output)
         return int(match.group(1)) if match else None
     
-    async def _count_branch_files(self, branch_name: str) -> int:
-        """Count files in branch."""
-        result = await self._execute_git_command([
-            "ls-tree", "-r", "--name-only", branch_name
-        ], cwd=self.product_repo_path)
+    def _parse_branch_refs(self, output: str) -> Dict[str, Tuple[str, int, str]]:
+        """Parse for-each-ref output into name -> (tip, commit timestamp, author date)."""
+        refs = {}
+        for line in output.splitlines():
+            parts = line.split("\x00")
+            if len(parts) != 4:
+                continue
+            name, tip, committed_at, authored_at = parts
+            try:
+                refs[name] = (tip, int(committed_at), authored_at)
+            except ValueError:
+                refs[name] = (tip, 0, authored_at)
+        return refs
+    
+    def _parse_commit_walk(self, output: str) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+        """Parse log walk into commit -> parents and commit -> changed files."""
+        commit_parents: Dict[str, List[str]] = {}
+        commit_files: Dict[str, List[str]] = {}
         
-        if result.success:
-            return len([line for line in result.output.split('\n') if line.strip()])
+        for record in output.split("\x1e"):
+            lines = [line for line in record.splitlines() if line.strip()]
+            if not lines:
+                continue
+            header = lines[0].split()
+            commit_parents[header[0]] = header[1:]
+            commit_files[header[0]] = lines[1:]
         
-        return 0
+        return commit_parents, commit_files
+    
+    def _commits_reachable_in_walk(self, tip: str, commit_parents: Dict[str, List[str]]) -> Set[str]:
+        """Commits of the walk (i.e. not on main) reachable from branch tip."""
+        reachable: Set[str] = set()
+        stack = [tip]
+        while stack:
+            commit = stack.pop()
+            if commit in reachable or commit not in commit_parents:
+                continue
+            reachable.add(commit)
+            stack.extend(commit_parents[commit])
+        return reachable
+    
+    async def _count_branch_files(self, branch_name: str) -> int:
+        """Count files changed on branch (read from branch inventory)."""
+        branch = (await self.get_branch_inventory()).branches.get(branch_name)
+        return branch.files_count if branch else 0
     
     async def _check_branch_age(self, branch_name: str, max_age_days: int) -> bool:
-        """Check if branch is older than max age."""
-        # Get branch creation date
-        result = await self._execute_git_command([
-            "log", "--format=%ct", "-1", branch_name
-        ], cwd=self.product_repo_path)
+        """Check if branch is older than max age (read from branch inventory)."""
+        branch_timestamp = (await self.get_branch_inventory()).commit_timestamps.get(branch_name)
+        if not branch_timestamp:
+            return False
         
-        if result.success:
-            try:
-                branch_timestamp = int(result.output.strip())
-                current_timestamp = datetime.now().timestamp()
-                age_days = (current_timestamp - branch_timestamp) / (24 * 60 * 60)
-                
-                return age_days > max_age_days
-            except ValueError:
-                return False
+        current_timestamp = datetime.now().timestamp()
+        age_days = (current_timestamp - branch_timestamp) / (24 * 60 * 60)
         
-        return False
+        return age_days > max_age_days
     
     def _generate_jest_config(self, story_id: str) -> str:
         """Generate Jest configuration for story tests."""
         return f'''module.exports = {{
   displayName: '{story_id} Tests',
   testMatch: [
-    '<rootDir>/**/*.test.{js,ts,tsx}',
-    '<rootDir>/**/*.spec.{js,ts,tsx}'
+    '<rootDir>/**/*.test.{{js,ts,tsx}}',
+    '<rootDir>/**/*.spec.{{js,ts,tsx}}'
   ],
   collectCoverage: true,
   collectCoverageFrom: [
-    '<rootDir>/**/*.{js,ts,tsx}',
+    '<rootDir>/**/*.{{js,ts,tsx}}',
     '!<rootDir>/**/*.d.ts',
-    '!<rootDir>/**/*.stories.{js,ts,tsx}',
+    '!<rootDir>/**/*.stories.{{js,ts,tsx}}',
     '!<rootDir>/**/node_modules/**'
   ],
   coverageThreshold: {{
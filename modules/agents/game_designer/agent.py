@@ -27,16 +27,11 @@ from datetime import datetime
 from pathlib import Path
 
 from ...shared.base_agent import BaseAgent, AgentExecutionResult
-from ...shared.event_bus import EventBus
+from ...shared.lazy_tools import LazyTool
 from ...shared.exceptions import (
     DNAComplianceError, BusinessLogicError, ExternalServiceError,
     AgentExecutionError
 )
-from .tools.component_mapper import ComponentMapper
-from .tools.wireframe_generator import WireframeGenerator
-from .tools.ux_validator import UXValidator
-from .tools.pedagogical_design_helper import PedagogicalDesignHelper
-from .tools.dna_ux_validator import DNAUXValidator
 
 
 class GameDesignerAgent(BaseAgent):
@@ -54,26 +49,24 @@ class GameDesignerAgent(BaseAgent):
     5. Validate designs against DNA principles
     """
     
+    # EventBus for team coordination
+    event_bus = LazyTool("modules.shared.event_bus.EventBus")
+    
+    # Design tools - imported and constructed on first use, shared per process
+    component_mapper = LazyTool(".tools.component_mapper.ComponentMapper", pass_config=False)
+    wireframe_generator = LazyTool(".tools.wireframe_generator.WireframeGenerator", pass_config=False)
+    ux_validator = LazyTool(".tools.ux_validator.UXValidator", pass_config=False)
+    pedagogical_helper = LazyTool(".tools.pedagogical_design_helper.PedagogicalDesignHelper", pass_config=False)
+    dna_ux_validator = LazyTool(".tools.dna_ux_validator.DNAUXValidator", config_key="dna_config")
+    
+    # Shared artifact writer (atomic, skip-if-unchanged, off the event loop)
+    artifact_writer = LazyTool("modules.shared.artifact_writer.ArtifactWriter", pass_config=False)
+    
     def __init__(self, agent_id: str = "gd-001", config: Optional[Dict[str, Any]] = None):
         """Initialize Game Designer agent."""
         super().__init__(agent_id, "game_designer", config)
         
-        # Initialize EventBus for team coordination
-        self.event_bus = EventBus(config)
-        
-        # Initialize design tools
-        try:
-            self.component_mapper = ComponentMapper()
-            self.wireframe_generator = WireframeGenerator()
-            self.ux_validator = UXValidator()
-            self.pedagogical_helper = PedagogicalDesignHelper()
-            self.dna_ux_validator = DNAUXValidator(config=self.config.get("dna_config", {}))
-            
-            self.logger.info("Game Designer agent tools (including DNA UX validator and EventBus) initialized successfully")
-            
-        except Exception as e:
-            self.logger.error(f"Failed to initialize Game Designer tools: {e}")
-            raise AgentExecutionError(f"Tool initialization failed: {e}", agent_id)
+        self.logger.info("Game Designer agent initialized (design tools load on first use)")
     
     async def _notify_team_progress(self, event_type: str, data: Dict[str, Any]):
         """Notify team of progress via EventBus."""
@@ -673,29 +666,19 @@ class GameDesignerAgent(BaseAgent):
                                        asset_requirements: List[Dict[str, Any]]) -> None:
         """Save design documentation for developer reference."""
         try:
-            # Create documentation directory
             docs_path = Path("docs/specs")
-            docs_path.mkdir(parents=True, exist_ok=True)
-            
             wireframes_path = Path("docs/wireframes")
-            wireframes_path.mkdir(parents=True, exist_ok=True)
             
             # Save game design specification
             game_design_doc = self._create_game_design_document(
                 story_id, game_mechanics, ui_components
             )
             
-            with open(docs_path / f"game_design_{story_id}.md", 'w') as f:
-                f.write(game_design_doc)
-            
             # Save UX specification
             ux_spec_doc = self._create_ux_specification_document(
                 story_id, ui_components, interaction_flows
             )
             
-            with open(docs_path / f"ux_specification_{story_id}.md", 'w') as f:
-                f.write(ux_spec_doc)
-            
             # Save component mapping as JSON
             component_mapping = {
                 "story_id": story_id,
@@ -704,9 +687,6 @@ class GameDesignerAgent(BaseAgent):
                 "generated_at": datetime.now().isoformat()
             }
             
-            with open(docs_path / f"component_mapping_{story_id}.json", 'w') as f:
-                json.dump(component_mapping, f, indent=2)
-            
             # Save wireframes
             wireframes_data = {
                 "story_id": story_id,
@@ -715,8 +695,13 @@ class GameDesignerAgent(BaseAgent):
                 "generated_at": datetime.now().isoformat()
             }
             
-            with open(wireframes_path / f"{story_id}_wireframes.json", 'w') as f:
-                json.dump(wireframes_data, f, indent=2)
+            writer = self.artifact_writer
+            await asyncio.gather(
+                writer.write_text(docs_path / f"game_design_{story_id}.md", game_design_doc, self.agent_id, story_id),
+                writer.write_text(docs_path / f"ux_specification_{story_id}.md", ux_spec_doc, self.agent_id, story_id),
+                writer.write_json(docs_path / f"component_mapping_{story_id}.json", component_mapping, self.agent_id, story_id),
+                writer.write_json(wireframes_path / f"{story_id}_wireframes.json", wireframes_data, self.agent_id, story_id)
+            )
             
             self.logger.debug(f"Design documentation saved for story: {story_id}")
             
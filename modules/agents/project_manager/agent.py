@@ -20,7 +20,6 @@ This agent directly impacts revenue by:
 """
 
 import asyncio
-import json
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
@@ -31,15 +30,8 @@ from ...shared.exceptions import (
     DNAComplianceError, BusinessLogicError, ExternalServiceError,
     AgentExecutionError
 )
-from ...shared.event_bus import EventBus
+from ...shared.lazy_tools import LazyTool
 from .tools.github_integration import GitHubIntegration
-from .tools.story_analyzer import StoryAnalyzer
-from .tools.dna_compliance_checker import DNAComplianceChecker
-from .tools.learning_engine import LearningEngine
-from .tools.swedish_municipal_communicator import SwedishMunicipalCommunicator
-from .tools.team_coordinator import TeamCoordinator
-from .tools.stakeholder_relationship_manager import StakeholderRelationshipManager
-from .tools.dna_story_validator import DNAStoryValidator
 
 
 class ProjectManagerAgent(BaseAgent):
@@ -59,6 +51,27 @@ class ProjectManagerAgent(BaseAgent):
     6. Ensure client requirements are properly captured and maintained
     """
     
+    # Specialized tools - imported and constructed on first use, shared per process
+    story_analyzer = LazyTool(".tools.story_analyzer.StoryAnalyzer")
+    dna_compliance_checker = LazyTool(".tools.dna_compliance_checker.DNAComplianceChecker")
+    learning_engine = LazyTool(".tools.learning_engine.LearningEngine")
+    swedish_communicator = LazyTool(".tools.swedish_municipal_communicator.SwedishMunicipalCommunicator")
+    team_coordinator = LazyTool(".tools.team_coordinator.TeamCoordinator")
+    stakeholder_manager = LazyTool(".tools.stakeholder_relationship_manager.StakeholderRelationshipManager")
+    dna_story_validator = LazyTool(".tools.dna_story_validator.DNAStoryValidator")
+    
+    # Feature queue - config["feature_queue"]["queue_backend"] = "shared" selects the
+    # multi-process SQLite queue; holds per-worker claims so never shared
+    priority_queue_manager = LazyTool(
+        ".tools.priority_queue_manager.PriorityQueueManager", config_key="feature_queue", shared=False
+    )
+    
+    # EventBus for team coordination
+    event_bus = LazyTool("modules.shared.event_bus.EventBus")
+    
+    # Shared artifact writer (atomic, skip-if-unchanged, off the event loop)
+    artifact_writer = LazyTool("modules.shared.artifact_writer.ArtifactWriter", pass_config=False)
+    
     def __init__(self, agent_id: str = "pm-001", config: Optional[Dict[str, Any]] = None):
         """
         Initialize Project Manager Agent.
@@ -70,21 +83,12 @@ class ProjectManagerAgent(BaseAgent):
         # Initialize with project_manager agent type
         super().__init__(agent_id, "project_manager", config)
         
-        # Initialize specialized tools
+        # GitHub integration stays eager so missing credentials fail at startup;
+        # remaining tools are LazyTool class attributes
         try:
             self.github_integration = GitHubIntegration(config)
-            self.story_analyzer = StoryAnalyzer(config)
-            self.dna_compliance_checker = DNAComplianceChecker(config)
-            self.learning_engine = LearningEngine(config)
-            self.swedish_communicator = SwedishMunicipalCommunicator(config)
-            self.team_coordinator = TeamCoordinator(config)
-            self.stakeholder_manager = StakeholderRelationshipManager(config)
-            self.dna_story_validator = DNAStoryValidator(config)
-            
-            # Initialize EventBus for team coordination
-            self.event_bus = EventBus(config)
             
-            self.logger.info("Project Manager Agent tools (including EventBus) initialized successfully")
+            self.logger.info("Project Manager Agent GitHub integration initialized successfully")
             
         except Exception as e:
             self.logger.error(f"Failed to initialize PM Agent tools: {e}")
@@ -121,6 +125,7 @@ class ProjectManagerAgent(BaseAgent):
             DNAComplianceError: If feature violates DNA principles
             ExternalServiceError: If GitHub integration fails
         """
+        processing_started = datetime.now()
         try:
             story_id = input_contract.get("story_id")
             self.logger.info(f"Processing feature request for story: {story_id}")
@@ -223,7 +228,8 @@ class ProjectManagerAgent(BaseAgent):
             # Step 8: Coordinate team workflow (NEW)
             try:
                 team_coordination = await self.team_coordinator.coordinate_team_workflow(
-                    story_id, output_contract
+                    story_id, output_contract,
+                    processing_time=(datetime.now() - processing_started).total_seconds()
                 )
                 output_contract['team_coordination'] = team_coordination
             except Exception as e:
@@ -258,6 +264,11 @@ class ProjectManagerAgent(BaseAgent):
                 "story_id": story_id,
                 "error": str(e)
             })
+            await self.team_coordinator.record_work_event("team_work_failed", {
+                "agent_type": "project_manager",
+                "story_id": story_id,
+                "error_info": {"error": str(e)}
+            })
             
             # Wrap unexpected errors
             self.logger.error(f"Unexpected error processing contract: {e}")
@@ -523,18 +534,13 @@ class ProjectManagerAgent(BaseAgent):
             # Save story description
             story_doc_path = self.config.get("docs_path", "docs") if self.config else "docs"
             story_file = Path(story_doc_path) / "stories" / f"{story_id}_description.md"
-            story_file.parent.mkdir(parents=True, exist_ok=True)
             
             story_content = self._generate_story_markdown(
                 story_id, feature_data, acceptance_criteria, complexity_assessment
             )
             
-            with open(story_file, 'w', encoding='utf-8') as f:
-                f.write(story_content)
-            
             # Save analysis data
             analysis_file = Path(story_doc_path) / "analysis" / f"{story_id}_feature_analysis.json"
-            analysis_file.parent.mkdir(parents=True, exist_ok=True)
             
             analysis_data = {
                 "story_id": story_id,
@@ -545,15 +551,15 @@ class ProjectManagerAgent(BaseAgent):
                 "created_by": self.agent_id
             }
             
-            with open(analysis_file, 'w', encoding='utf-8') as f:
-                json.dump(analysis_data, f, indent=2, ensure_ascii=False)
-            
             # Save story breakdown
             breakdown_file = Path(story_doc_path) / "breakdown" / f"{story_id}_story_breakdown.json"
-            breakdown_file.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(breakdown_file, 'w', encoding='utf-8') as f:
-                json.dump(story_breakdown, f, indent=2, ensure_ascii=False)
+            writer = self.artifact_writer
+            await asyncio.gather(
+                writer.write_text(story_file, story_content, self.agent_id, story_id),
+                writer.write_json(analysis_file, analysis_data, self.agent_id, story_id),
+                writer.write_json(breakdown_file, story_breakdown, self.agent_id, story_id)
+            )
             
             self.logger.debug(f"Story documentation saved for {story_id}")
             
@@ -1125,8 +1131,12 @@ class ProjectManagerAgent(BaseAgent):
         try:
             self.logger.info(f"Project Manager received team event: {event_type}")
             
+            # Agent work lifecycle events feed the team's rolling metrics
+            if event_type.startswith("team_work_"):
+                await self.team_coordinator.record_work_event(event_type, data)
+            
             # Handle story-related events
-            if "story_complete" in event_type:
+            elif "story_complete" in event_type:
                 await self._handle_story_completion(data)
             elif "revision_required" in event_type:
                 await self._handle_revision_request(data)
@@ -1154,7 +1164,8 @@ class ProjectManagerAgent(BaseAgent):
         story_id = data.get("story_id")
         decision = data.get("decision")
         self.logger.info(f"Approval decision for story {story_id}: {decision}")
-        # Integration with PriorityQueueManager
+        if decision == "approved":
+            await self.priority_queue_manager.complete_feature(story_id)
 
     async def _handle_pipeline_error(self, data: Dict[str, Any]):
         """Handle pipeline error events."""
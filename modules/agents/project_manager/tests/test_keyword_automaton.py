@@ -0,0 +1,97 @@
+"""
+Tests for Keyword Automaton.
+
+Tests that single-pass Aho-Corasick matching gives exactly the same counts
+as the original per-keyword substring checks, and that DNA compliance
+scoring is unchanged on large descriptions.
+"""
+
+import pytest
+
+from modules.agents.project_manager.tools.keyword_automaton import (
+    KeywordAutomaton,
+    STORY_KEYWORD_TABLES,
+    scan_story_text
+)
+from modules.agents.project_manager.tools.dna_compliance_checker import DNAComplianceChecker
+
+
+SAMPLE_TEXTS = [
+    "",
+    "Användare ska kunna lära sig kommunal digitaliseringsplanering genom praktiska övningar "
+    "och kunskapstest. Medarbetare i förvaltningen tillämpar riktlinjer i verkliga arbetssituationer.",
+    "A simple, focused API endpoint with session cache and a complex, sophisticated dashboard. "
+    "Stakeholder impact and value for the whole organization.",
+    "policy policy policies standard standardization testtest progress progression",
+    "aaaa lära sig lära lär lärande",
+]
+
+
+def _naive_count(category, text):
+    return sum(1 for keyword in STORY_KEYWORD_TABLES[category] if keyword in text)
+
+
+class TestKeywordAutomaton:
+    """Test suite for keyword automaton."""
+    
+    @pytest.mark.parametrize("text", SAMPLE_TEXTS)
+    def test_counts_match_substring_checks(self, text):
+        """Test every category count equals naive substring counting, duplicates included."""
+        result = scan_story_text(text.lower())
+        
+        for category in STORY_KEYWORD_TABLES:
+            expected = _naive_count(category, text.lower())
+            assert result.count(category) == expected, category
+            assert result.any_of(category) == (expected > 0), category
+    
+    def test_overlapping_keywords_and_positions(self):
+        """Test overlapping and nested keywords are all found at correct offsets."""
+        automaton = KeywordAutomaton({"demo": ["he", "she", "his", "hers"]})
+        result = automaton.scan("USHERS")
+        
+        assert result.positions == {"she": [1], "he": [2], "hers": [2]}
+        assert result.count("demo") == 3
+        assert not result.has("his")
+    
+    def test_occurrences_match_str_count(self):
+        """Test occurrence counting is non-overlapping like str.count."""
+        automaton = KeywordAutomaton({"demo": ["aa", "kommun"]})
+        text = "aaaa aaa kommun kommunal"
+        result = automaton.scan(text)
+        
+        assert result.occurrences("aa") == text.count("aa")
+        assert result.occurrences("kommun") == text.count("kommun")
+        assert result.occurrences("missing") == 0
+    
+    def test_matched_and_category_hits(self):
+        """Test distinct matched keywords and per-category hit summary."""
+        automaton = KeywordAutomaton({"db": ["spara", "historik"], "ui": ["quiz"]})
+        result = automaton.scan("Spara historik och spara igen")
+        
+        assert result.matched("db") == ["spara", "historik"]
+        assert result.category_hits() == {"db": 2}
+        assert result.to_dict()["keyword_positions"]["spara"] == [0, 19]
+    
+    @pytest.mark.asyncio
+    async def test_compliance_scores_match_naive_scan_on_large_text(self):
+        """Test DNA scores on a large policy document equal the naive reference counts."""
+        paragraph = SAMPLE_TEXTS[1] + " " + SAMPLE_TEXTS[2] + " "
+        description = paragraph * 500
+        checker = DNAComplianceChecker()
+        
+        result = await checker.analyze_feature_compliance({
+            "feature_description": description,
+            "learning_objectives": ["Förstå policy och tillämpa den i praktik"],
+            "acceptance_criteria": ["Fungerar för alla användare i hela organisationen"],
+            "user_persona": "Anna",
+            "time_constraint_minutes": 10
+        })
+        
+        lowered = description.lower()
+        design = result["design_principles_analysis"]
+        learning_matches = _naive_count("pedagogical_value.learning", lowered)
+        assert f"Contains {learning_matches} learning-related terms" in design["pedagogical_value"]["evidence"]
+        policy_matches = _naive_count("policy_to_practice.policy", lowered)
+        assert f"References {policy_matches} policy/theory concepts" in design["policy_to_practice"]["evidence"]
+        assert design["policy_to_practice"]["score"] == 100
+        assert result["architecture_principles_analysis"]["stateless_backend"]["score"] == 60
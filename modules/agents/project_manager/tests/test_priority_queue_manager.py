@@ -0,0 +1,146 @@
+"""
+Tests for Priority Queue Manager scheduling policies and Schedule Simulator.
+
+Tests critical-path calculation, priority inheritance, policy-driven
+next feature selection and offline policy comparison.
+"""
+
+import pytest
+
+from modules.agents.project_manager.tools.priority_queue_manager import (
+    PriorityQueueManager,
+    SchedulingPolicy,
+    calculate_critical_path_lengths,
+    calculate_inherited_priorities
+)
+from modules.agents.project_manager.tools.schedule_simulator import ScheduleSimulator
+from modules.shared.exceptions import BusinessLogicError
+
+
+async def _add(manager, story_id, priority="high", hours=10.0, depends_on=None):
+    """Add feature with optional blocking dependencies."""
+    return await manager.add_feature_to_queue(
+        story_id=story_id,
+        title=f"Feature {story_id}",
+        description="Test feature",
+        priority=priority,
+        acceptance_criteria=["Works"],
+        estimated_hours=hours,
+        dependencies=[{"dependency_story_id": dep} for dep in (depends_on or [])]
+    )
+
+
+async def _chain_queue():
+    """Queue with two independent features and a three-step chain."""
+    manager = PriorityQueueManager({"max_concurrent_features": 2})
+    await _add(manager, "X1")
+    await _add(manager, "X2")
+    await _add(manager, "C1")
+    await _add(manager, "C2", depends_on=["C1"])
+    await _add(manager, "C3", depends_on=["C2"])
+    return manager
+
+
+class TestCriticalPathScheduling:
+    """Test suite for critical-path aware scheduling."""
+    
+    @pytest.mark.asyncio
+    async def test_critical_path_lengths(self):
+        """Test critical path includes own hours plus longest dependent chain."""
+        chain_queue = await _chain_queue()
+        lengths = calculate_critical_path_lengths(chain_queue.feature_queue)
+        
+        assert lengths["C1"] == 30.0
+        assert lengths["C2"] == 20.0
+        assert lengths["C3"] == 10.0
+        assert lengths["X1"] == 10.0
+    
+    @pytest.mark.asyncio
+    async def test_blocker_inherits_priority(self):
+        """Test low priority feature blocking a critical one inherits its class."""
+        manager = PriorityQueueManager()
+        await _add(manager, "BASE", priority="low")
+        await _add(manager, "URGENT", priority="critical", depends_on=["BASE"])
+        
+        inherited = calculate_inherited_priorities(manager.feature_queue)
+        
+        assert inherited["BASE"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_default_policy_unchanged(self):
+        """Test default policy still selects by priority and creation time."""
+        chain_queue = await _chain_queue()
+        assert chain_queue.scheduling_policy == SchedulingPolicy.PRIORITY
+        
+        next_feature = await chain_queue.get_next_available_feature()
+        assert next_feature.story_id == "X1"
+    
+    @pytest.mark.asyncio
+    async def test_critical_path_policy_selects_chain_head(self):
+        """Test critical path policy starts longest chain first."""
+        chain_queue = await _chain_queue()
+        assert await chain_queue.set_scheduling_policy("critical_path")
+        
+        next_feature = await chain_queue.get_next_available_feature()
+        assert next_feature.story_id == "C1"
+    
+    @pytest.mark.asyncio
+    async def test_critical_path_policy_honours_priority_class(self):
+        """Test higher priority class still wins over longer chain."""
+        chain_queue = await _chain_queue()
+        await chain_queue.set_scheduling_policy("critical_path")
+        await _add(chain_queue, "HOTFIX", priority="critical", hours=1.0)
+        
+        next_feature = await chain_queue.get_next_available_feature()
+        assert next_feature.story_id == "HOTFIX"
+    
+    @pytest.mark.asyncio
+    async def test_invalid_policy_rejected(self):
+        """Test unknown policy name is rejected without changing policy."""
+        chain_queue = await _chain_queue()
+        assert not await chain_queue.set_scheduling_policy("random")
+        assert chain_queue.scheduling_policy == SchedulingPolicy.PRIORITY
+    
+    @pytest.mark.asyncio
+    async def test_compare_policies_reduces_makespan(self):
+        """Test simulator shows critical path policy shortens makespan."""
+        chain_queue = await _chain_queue()
+        comparison = await chain_queue.compare_scheduling_policies()
+        
+        results = comparison["results"]
+        assert results["priority"]["makespan_hours"] == 40.0
+        assert results["critical_path"]["makespan_hours"] == 30.0
+        assert comparison["best_policy"] == "critical_path"
+        assert comparison["makespan_reduction_percent"]["critical_path"] == 25.0
+    
+    @pytest.mark.asyncio
+    async def test_simulation_respects_dependencies(self):
+        """Test no feature starts before its blocking dependencies finish."""
+        chain_queue = await _chain_queue()
+        simulator = ScheduleSimulator()
+        result = simulator.simulate(chain_queue.feature_queue, "critical_path", 3)
+        
+        windows = {entry.story_id: entry for entry in result.schedule}
+        assert windows["C2"].start_hour >= windows["C1"].finish_hour
+        assert windows["C3"].start_hour >= windows["C2"].finish_hour
+        assert result.unschedulable == []
+    
+    @pytest.mark.asyncio
+    async def test_simulation_reports_unschedulable(self):
+        """Test features with missing dependencies are reported, not scheduled."""
+        manager = PriorityQueueManager()
+        await _add(manager, "ORPHAN", depends_on=["MISSING"])
+        
+        result = ScheduleSimulator().simulate(manager.feature_queue, "priority", 1)
+        
+        assert result.schedule == []
+        assert result.unschedulable == ["ORPHAN"]
+    
+    def test_simulation_invalid_arguments(self):
+        """Test simulator rejects unknown policy and zero slots."""
+        simulator = ScheduleSimulator()
+        
+        with pytest.raises(BusinessLogicError):
+            simulator.simulate([], "random", 1)
+        with pytest.raises(BusinessLogicError):
+            simulator.simulate([], "priority", 0)
@@ -0,0 +1,168 @@
+"""
+Tests for Rolling Metrics Store and its TeamCoordinator integration.
+
+Tests window expiry, percentile accuracy, ring buffer wrap-around,
+streaming bottleneck detection, dashboard reads from rolling history and
+feeding the history from coordinated workflows.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from modules.agents.project_manager.tools.rolling_metrics import (
+    RingBuffer,
+    RollingMetricsStore,
+    SlidingWindowHistogram
+)
+from modules.agents.project_manager.tools.team_coordinator import TeamCoordinator
+from modules.shared.event_bus import WorkStatus
+
+
+AGENTS = ["developer", "test_engineer", "qa_tester"]
+T0 = 1_700_000_000.0
+
+
+class TestRollingMetrics:
+    """Test suite for fixed-memory rolling metrics."""
+    
+    def test_ring_buffer_wraps_oldest_first(self):
+        """Test ring buffer keeps only newest samples in insertion order."""
+        ring = RingBuffer(3)
+        for i in range(5):
+            ring.append(float(i), i * 10.0)
+        
+        assert len(ring) == 3
+        assert ring.samples() == [(2.0, 20.0), (3.0, 30.0), (4.0, 40.0)]
+    
+    def test_window_expires_old_buckets(self):
+        """Test values leave window once their bucket is older than window."""
+        window = SlidingWindowHistogram(60, 12)
+        window.add(10.0, T0)
+        window.add(30.0, T0 + 30)
+        
+        assert window.count(T0 + 30) == 2
+        assert window.mean(T0 + 30) == 20.0
+        assert window.count(T0 + 61) == 1
+        assert window.count(T0 + 200) == 0
+        assert window.mean(T0 + 200) == 0.0
+    
+    def test_percentiles_within_bin_resolution(self):
+        """Test p50/p95 approximate exact percentiles within histogram resolution."""
+        window = SlidingWindowHistogram(3600, 60)
+        for value in range(1, 101):
+            window.add(float(value), T0 + value)
+        
+        now = T0 + 101
+        assert window.percentile(0.5, now) == pytest.approx(50.0, rel=0.15)
+        assert window.percentile(0.95, now) == pytest.approx(95.0, rel=0.15)
+    
+    def test_windows_aggregate_independently(self):
+        """Test 1m, 1h and 24h windows see different slices of same stream."""
+        store = RollingMetricsStore(AGENTS)
+        store.record_completion("developer", 100.0, timestamp=T0)
+        store.record_completion("developer", 300.0, timestamp=T0 + 1800)
+        store.record_failure("developer", timestamp=T0 + 1810)
+        
+        now = T0 + 1815
+        assert store.get_agent_summary("developer", "1m", now)["completed"] == 1
+        hour = store.get_agent_summary("developer", "1h", now)
+        assert hour["completed"] == 2
+        assert hour["failed"] == 1
+        assert hour["success_rate"] == pytest.approx(2 / 3)
+        assert hour["completion_time_mean"] == 200.0
+    
+    def test_streaming_bottleneck_detection(self):
+        """Test slow and failing agents are flagged as events arrive and cleared on expiry."""
+        store = RollingMetricsStore(AGENTS, {"min_samples": 3})
+        for i in range(5):
+            store.record_completion("developer", 60.0, timestamp=T0 + i)
+            store.record_completion("qa_tester", 60.0, timestamp=T0 + i)
+            store.record_completion("test_engineer", 900.0, timestamp=T0 + i)
+        assert store.get_bottlenecks() == ["test_engineer taking longer than average"]
+        
+        for i in range(3):
+            store.record_failure("qa_tester", timestamp=T0 + 10 + i)
+        assert "qa_tester has low success rate" in store.get_bottlenecks()
+        
+        store.record_completion("developer", 60.0, timestamp=T0 + 7200)
+        assert store.get_bottlenecks() == []
+    
+    @pytest.mark.asyncio
+    async def test_coordinator_dashboard_reads_rolling_history(self):
+        """Test work events feed snapshot counts and dashboard has no history side effects."""
+        coordinator = TeamCoordinator()
+        for _ in range(4):
+            await coordinator._handle_agent_work_completed(
+                {"agent_type": "developer", "story_id": "S-1", "completion_time": 7200}
+            )
+        await coordinator._handle_agent_work_failed({"agent_type": "developer", "story_id": "S-1"})
+        await coordinator._handle_agent_work_started({"agent_type": "qa_tester", "queue_wait_time": 30})
+        
+        dashboard = await coordinator.get_team_status_dashboard()
+        
+        performance = dashboard["team_performance"]
+        assert performance["completed_work_items"] == 4
+        assert performance["failed_work_items"] == 1
+        assert performance["total_work_items"] == 5
+        assert "developer has low success rate" in performance["bottlenecks"]
+        assert dashboard["performance_trends"]["windows"]["1h"]["developer"]["completed"] == 4
+        assert coordinator.team_performance_history == []
+        
+        snapshot = await coordinator.monitor_team_performance()
+        assert snapshot.average_completion_time == pytest.approx(2.0 / len(coordinator.agent_sequence))
+        assert len(coordinator.team_performance_history) == 1
+    
+    @pytest.mark.asyncio
+    async def test_workflow_delegation_feeds_dashboard(self):
+        """Test coordinated workflows and their delegated work outcomes reach the dashboard."""
+        coordinator = TeamCoordinator()
+        bus = coordinator.event_bus
+        await bus.register_agent("gd-001", "game_designer")
+        
+        for story_id in ("S-1", "S-2", "S-3"):
+            result = await coordinator.coordinate_team_workflow(
+                story_id, {"story_breakdown": "Breakdown"}, processing_time=90.0
+            )
+            assert result["status"] == "workflow_initiated"
+        assert len(coordinator.delegated_work) == 3
+        
+        # Game Designer runner picks up all three items, finishes two and fails one
+        base = datetime.now() - timedelta(hours=1)
+        for offset, item in enumerate(list(bus.work_queue)):
+            item.created_at = base.isoformat()
+            item.started_at = (base + timedelta(seconds=60)).isoformat()
+            item.completed_at = (base + timedelta(seconds=60 + 1800 * (offset + 1))).isoformat()
+            item.status = WorkStatus.FAILED if item.story_id == "S-3" else WorkStatus.COMPLETED
+            bus.work_queue.remove(item)
+            bus.completed_work[item.work_id] = item
+        
+        dashboard = await coordinator.get_team_status_dashboard()
+        
+        performance = dashboard["team_performance"]
+        assert performance["completed_work_items"] == 5
+        assert performance["failed_work_items"] == 1
+        day = dashboard["performance_trends"]["windows"]["24h"]
+        assert day["project_manager"]["completed"] == 3
+        assert day["game_designer"]["completed"] == 2
+        assert day["game_designer"]["failed"] == 1
+        assert day["game_designer"]["queue_wait_p95"] == pytest.approx(60.0, rel=0.15)
+        assert coordinator.delegated_work == {}
+        
+        # Outcomes are recorded once
+        assert (await coordinator.get_team_status_dashboard())["team_performance"]["completed_work_items"] == 5
+    
+    @pytest.mark.asyncio
+    async def test_work_events_route_to_rolling_metrics(self):
+        """Test team work lifecycle events are recorded and other events are ignored."""
+        coordinator = TeamCoordinator()
+        
+        assert await coordinator.record_work_event(
+            "team_work_completed", {"agent_type": "qa_tester", "story_id": "S-1", "completion_time": 600}
+        )
+        assert await coordinator.record_work_event("team_work_failed", {"agent_type": "qa_tester", "story_id": "S-2"})
+        assert not await coordinator.record_work_event("team_status_changed", {"agent_type": "qa_tester"})
+        
+        summary = coordinator.rolling_metrics.get_agent_summary("qa_tester", "1h")
+        assert summary["completed"] == 1
+        assert summary["failed"] == 1
@@ -0,0 +1,269 @@
+"""
+Tests for Shared Feature Queue.
+
+Tests atomic claims across independent connections, dependency handling,
+lease expiry recovery, claim tokens, change notifications and the shared
+backend of PriorityQueueManager.
+"""
+
+import asyncio
+import multiprocessing
+import time
+
+import pytest
+
+from modules.agents.project_manager.tools.priority_queue_manager import FeatureStatus, PriorityQueueManager
+from modules.agents.project_manager.tools.shared_feature_queue import SharedFeatureQueue
+from modules.shared.exceptions import BusinessLogicError
+
+
+def _drain_queue(db_path, worker_id, results):
+    """Worker process: claim and complete until queue is empty."""
+    async def run():
+        queue = SharedFeatureQueue({"db_path": db_path})
+        claimed = []
+        while True:
+            feature = await queue.claim_next_feature(worker_id)
+            if not feature:
+                break
+            claimed.append(feature.story_id)
+            await queue.complete_feature(feature.story_id, feature.metadata["claim_token"])
+        queue.close()
+        return claimed
+    
+    results.put(asyncio.run(run()))
+
+
+class TestSharedFeatureQueue:
+    """Test suite for SQLite-backed shared feature queue."""
+    
+    @pytest.fixture
+    def queue_config(self, tmp_path):
+        """Queue configuration using temporary database."""
+        return {"db_path": str(tmp_path), "lease_seconds": 60.0}
+    
+    async def _add(self, queue, story_id, priority="medium", depends_on=None):
+        """Add feature with optional blocking dependencies."""
+        return await queue.add_feature_to_queue(
+            story_id=story_id,
+            title=f"Feature {story_id}",
+            description="Test feature",
+            priority=priority,
+            acceptance_criteria=["Works"],
+            dependencies=[{"dependency_story_id": dep} for dep in (depends_on or [])]
+        )
+    
+    @pytest.mark.asyncio
+    async def test_claim_follows_priority_order(self, queue_config):
+        """Test claims return highest priority first, then oldest."""
+        queue = SharedFeatureQueue(queue_config)
+        await self._add(queue, "LOW-1", priority="low")
+        await self._add(queue, "MED-1")
+        await self._add(queue, "CRIT-1", priority="critical")
+        
+        claimed = [(await queue.claim_next_feature("w1")).story_id for _ in range(3)]
+        
+        assert claimed == ["CRIT-1", "MED-1", "LOW-1"]
+        assert await queue.claim_next_feature("w1") is None
+        queue.close()
+    
+    @pytest.mark.asyncio
+    async def test_claims_are_exclusive_across_connections(self, queue_config):
+        """Test two workers with own connections never get same feature."""
+        worker_a = SharedFeatureQueue(queue_config)
+        worker_b = SharedFeatureQueue(queue_config)
+        await self._add(worker_a, "S-1")
+        
+        first = await worker_a.claim_next_feature("a")
+        second = await worker_b.claim_next_feature("b")
+        
+        assert first.story_id == "S-1"
+        assert first.status == FeatureStatus.IN_PROGRESS
+        assert first.assigned_agent == "a"
+        assert second is None
+        worker_a.close()
+        worker_b.close()
+    
+    @pytest.mark.asyncio
+    async def test_blocking_dependency_respected(self, queue_config):
+        """Test dependent feature becomes claimable only after completion."""
+        queue = SharedFeatureQueue(queue_config)
+        await self._add(queue, "CHILD", priority="critical", depends_on=["PARENT"])
+        await self._add(queue, "PARENT", priority="low")
+        
+        parent = await queue.claim_next_feature("w1")
+        assert parent.story_id == "PARENT"
+        assert await queue.claim_next_feature("w1") is None
+        
+        assert await queue.complete_feature("PARENT", parent.metadata["claim_token"])
+        child = await queue.claim_next_feature("w1")
+        assert child.story_id == "CHILD"
+        queue.close()
+    
+    @pytest.mark.asyncio
+    async def test_expired_lease_is_reclaimed(self, queue_config):
+        """Test feature held by crashed worker is reclaimed after lease expiry."""
+        queue_config["lease_seconds"] = 0.05
+        queue = SharedFeatureQueue(queue_config)
+        await self._add(queue, "S-1")
+        
+        crashed = await queue.claim_next_feature("crashed")
+        assert crashed.story_id == "S-1"
+        assert await queue.claim_next_feature("healthy") is None
+        
+        await asyncio.sleep(0.1)
+        reclaimed = await queue.claim_next_feature("healthy")
+        
+        assert reclaimed.story_id == "S-1"
+        assert reclaimed.metadata["claim_attempts"] == 2
+        assert not await queue.complete_feature("S-1", crashed.metadata["claim_token"])
+        assert await queue.complete_feature("S-1", reclaimed.metadata["claim_token"])
+        queue.close()
+    
+    @pytest.mark.asyncio
+    async def test_stale_claim_of_same_worker_is_rejected(self, queue_config):
+        """Test a worker's expired earlier claim cannot act on its own re-claim."""
+        queue_config["lease_seconds"] = 0.05
+        queue = SharedFeatureQueue(queue_config)
+        await self._add(queue, "S-1")
+        
+        stale = await queue.claim_next_feature("w1")
+        await asyncio.sleep(0.1)
+        current = await queue.claim_next_feature("w1")
+        stale_token = stale.metadata["claim_token"]
+        
+        assert current.metadata["claim_token"] != stale_token
+        assert not await queue.renew_lease("S-1", stale_token)
+        assert not await queue.release_feature("S-1", stale_token)
+        assert not await queue.complete_feature("S-1", stale_token)
+        assert (await queue.get_feature("S-1")).status == FeatureStatus.IN_PROGRESS
+        assert await queue.complete_feature("S-1", current.metadata["claim_token"])
+        queue.close()
+    
+    @pytest.mark.asyncio
+    async def test_release_and_renew_require_ownership(self, queue_config):
+        """Test only claim holder can renew or release."""
+        queue = SharedFeatureQueue(queue_config)
+        await self._add(queue, "S-1")
+        claim_token = (await queue.claim_next_feature("owner")).metadata["claim_token"]
+        
+        assert not await queue.renew_lease("S-1", "not-the-token")
+        assert await queue.renew_lease("S-1", claim_token)
+        assert not await queue.release_feature("S-1", "not-the-token")
+        assert await queue.release_feature("S-1", claim_token)
+        assert (await queue.claim_next_feature("other")).story_id == "S-1"
+        queue.close()
+    
+    @pytest.mark.asyncio
+    async def test_priority_queue_manager_shared_backend(self, queue_config):
+        """Test PriorityQueueManager configured with the shared backend works across workers."""
+        config = {"queue_backend": "shared", "shared_queue": queue_config, "max_concurrent_features": 2}
+        manager_a = PriorityQueueManager(config)
+        manager_b = PriorityQueueManager(config)
+        await self._add(manager_a, "CHILD", priority="critical", depends_on=["PARENT"])
+        await self._add(manager_a, "PARENT", priority="low")
+        
+        assert (await manager_b.get_next_available_feature()).story_id == "PARENT"
+        assert await manager_a.start_feature_development("PARENT", "worker-a")
+        assert not await manager_b.start_feature_development("PARENT", "worker-b")
+        assert not await manager_b.complete_feature("PARENT")
+        assert await manager_b.get_next_available_feature() is None
+        
+        assert await manager_a.complete_feature("PARENT")
+        assert (await manager_b.get_next_available_feature("CHILD")).story_id == "CHILD"
+        assert await manager_b.start_feature_development("CHILD", "worker-b")
+        
+        status = await manager_a.get_queue_status()
+        assert status["queue_backend"] == "shared"
+        assert status["status_breakdown"] == {"completed": 1, "in_progress": 1}
+        manager_a.close()
+        manager_b.close()
+    
+    @pytest.mark.asyncio
+    async def test_priority_queue_manager_renews_held_leases(self, queue_config):
+        """Test a live manager's claim outlives lease_seconds until it completes the feature."""
+        queue_config["lease_seconds"] = 0.1
+        config = {"queue_backend": "shared", "shared_queue": queue_config, "lease_renewal_seconds": 0.02}
+        holder = PriorityQueueManager(config)
+        other = PriorityQueueManager(config)
+        await self._add(holder, "S-1")
+        
+        assert await holder.start_feature_development("S-1", "holder")
+        await asyncio.sleep(0.3)
+        
+        assert not await other.start_feature_development("S-1", "other")
+        assert (await holder.get_queue_status())["expired_leases_count"] == 0
+        assert await holder.complete_feature("S-1")
+        holder.close()
+        other.close()
+    
+    @pytest.mark.asyncio
+    async def test_duplicate_and_invalid_features_rejected(self, queue_config):
+        """Test duplicate story IDs and unknown priorities raise BusinessLogicError."""
+        queue = SharedFeatureQueue(queue_config)
+        await self._add(queue, "S-1")
+        
+        with pytest.raises(BusinessLogicError):
+            await self._add(queue, "S-1")
+        with pytest.raises(BusinessLogicError):
+            await self._add(queue, "S-2", priority="urgent")
+        queue.close()
+    
+    @pytest.mark.asyncio
+    async def test_waiting_worker_woken_by_notification(self, queue_config):
+        """Test blocked waiter is woken by another worker's change, not timeout."""
+        producer = SharedFeatureQueue(queue_config)
+        consumer = SharedFeatureQueue(queue_config)
+        
+        async def produce_later():
+            await asyncio.sleep(0.1)
+            await self._add(producer, "LATE-1")
+        
+        started = time.monotonic()
+        feature, _ = await asyncio.gather(
+            consumer.wait_for_next_feature("consumer", timeout=5.0),
+            produce_later()
+        )
+        
+        assert feature.story_id == "LATE-1"
+        assert time.monotonic() - started < 2.0
+        producer.close()
+        consumer.close()
+    
+    @pytest.mark.asyncio
+    async def test_queue_status(self, queue_config):
+        """Test queue status counts."""
+        queue = SharedFeatureQueue(queue_config)
+        await self._add(queue, "S-1", priority="high")
+        await self._add(queue, "S-2", depends_on=["S-1"])
+        await queue.claim_next_feature("w1")
+        
+        status = await queue.get_queue_status()
+        
+        assert status["total_features"] == 2
+        assert status["status_breakdown"] == {"in_progress": 1, "pending": 1}
+        assert status["available_features_count"] == 0
+        queue.close()
+    
+    def test_multiprocess_workers_claim_each_feature_once(self, queue_config):
+        """Test several worker processes drain queue without duplicate claims."""
+        async def fill():
+            queue = SharedFeatureQueue(queue_config)
+            for i in range(60):
+                await self._add(queue, f"S-{i}")
+            queue.close()
+        asyncio.run(fill())
+        
+        results = multiprocessing.Queue()
+        workers = [
+            multiprocessing.Process(target=_drain_queue, args=(queue_config["db_path"], f"w{i}", results))
+            for i in range(3)
+        ]
+        for worker in workers:
+            worker.start()
+        claimed = [story_id for _ in workers for story_id in results.get(timeout=30)]
+        for worker in workers:
+            worker.join(timeout=30)
+        
+        assert len(claimed) == 60
+        assert len(set(claimed)) == 60
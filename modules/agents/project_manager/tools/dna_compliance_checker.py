@@ -24,6 +24,7 @@ import re
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
+from .keyword_automaton import KeywordScanResult, scan_story_text
 from ....shared.exceptions import DNAComplianceError, BusinessLogicError
 
 
@@ -135,6 +136,7 @@ class DNAComplianceChecker:
             Design principles validation results
         """
         description = feature_data.get("feature_description", "").lower()
+        keywords = scan_story_text(description)
         learning_objectives = feature_data.get("learning_objectives", [])
         user_persona = feature_data.get("user_persona", "")
         time_constraint = feature_data.get("time_constraint_minutes", 10)
@@ -143,27 +145,27 @@ class DNAComplianceChecker:
         
         # 1. Pedagogical Value
         analysis["pedagogical_value"] = self._validate_pedagogical_value(
-            description, learning_objectives
+            keywords, learning_objectives
         )
         
         # 2. Policy to Practice
         analysis["policy_to_practice"] = self._validate_policy_to_practice(
-            description, learning_objectives
+            keywords, learning_objectives
         )
         
         # 3. Time Respect
         analysis["time_respect"] = self._validate_time_respect(
-            description, time_constraint
+            keywords, time_constraint
         )
         
         # 4. Holistic Thinking
         analysis["holistic_thinking"] = self._validate_holistic_thinking(
-            description, feature_data
+            keywords, feature_data
         )
         
         # 5. Professional Tone
         analysis["professional_tone"] = self._validate_professional_tone(
-            description, user_persona
+            description, keywords, user_persona
         )
         
         return analysis
@@ -179,42 +181,32 @@ class DNAComplianceChecker:
             Architecture principles validation results
         """
         description = feature_data.get("feature_description", "").lower()
+        keywords = scan_story_text(description)
         
         analysis = {}
         
         # 1. API First
-        analysis["api_first"] = self._validate_api_first(description)
+        analysis["api_first"] = self._validate_api_first(keywords)
         
         # 2. Stateless Backend
-        analysis["stateless_backend"] = self._validate_stateless_backend(description)
+        analysis["stateless_backend"] = self._validate_stateless_backend(keywords)
         
         # 3. Separation of Concerns
-        analysis["separation_of_concerns"] = self._validate_separation_of_concerns(description)
+        analysis["separation_of_concerns"] = self._validate_separation_of_concerns(keywords)
         
         # 4. Simplicity First
-        analysis["simplicity_first"] = self._validate_simplicity_first(description, feature_data)
+        analysis["simplicity_first"] = self._validate_simplicity_first(keywords, feature_data)
         
         return analysis
     
-    def _validate_pedagogical_value(self, description: str, learning_objectives: List[str]) -> Dict[str, Any]:
+    def _validate_pedagogical_value(self, keywords: KeywordScanResult, learning_objectives: List[str]) -> Dict[str, Any]:
         """Validate pedagogical value principle."""
         score = 0
         evidence = []
         issues = []
         
         # Check for learning-related keywords (English and Swedish)
-        learning_keywords = [
-            # English
-            "learn", "education", "training", "skill", "knowledge", "competence",
-            "objective", "goal", "assessment", "practice", "exercise", "tutorial",
-            # Swedish
-            "lära", "lär", "lära sig", "utbildning", "träning", "kunskap", "kompetens",
-            "mål", "bedömning", "övning", "handledning", "färdighet", "kunskapstest",
-            "certifiering", "progress", "utveckling", "pedagogisk", "spelifierad",
-            "introduktion", "onboarding", "genomföra", "förstå", "bekväm"
-        ]
-        
-        keyword_matches = sum(1 for keyword in learning_keywords if keyword in description)
+        keyword_matches = keywords.count("pedagogical_value.learning")
         if keyword_matches >= 3:
             score += 30
             evidence.append(f"Contains {keyword_matches} learning-related terms")
@@ -232,26 +224,12 @@ class DNAComplianceChecker:
             issues.append("No explicit learning objectives specified")
         
         # Check for assessment or evaluation mentions (English and Swedish)
-        assessment_keywords = [
-            # English
-            "assessment", "evaluate", "test", "quiz", "feedback", "progress",
-            # Swedish
-            "bedömning", "utvärdera", "test", "quiz", "återkoppling", "progress",
-            "validera", "kunskapstest", "kontroll", "bedöma"
-        ]
-        if any(keyword in description for keyword in assessment_keywords):
+        if keywords.any_of("pedagogical_value.assessment"):
             score += 20
             evidence.append("Includes assessment or evaluation elements")
         
         # Check for practical application (English and Swedish)
-        practice_keywords = [
-            # English
-            "apply", "practice", "implement", "use", "real-world", "scenario",
-            # Swedish
-            "tillämpa", "använda", "implementera", "verklig", "scenario", "praktisk",
-            "använd", "genomföra", "arbetssituation", "situationer"
-        ]
-        if any(keyword in description for keyword in practice_keywords):
+        if keywords.any_of("pedagogical_value.practice"):
             score += 10
             evidence.append("Includes practical application elements")
         
@@ -264,24 +242,14 @@ class DNAComplianceChecker:
             "recommendation": self._get_pedagogical_recommendation(score, issues)
         }
     
-    def _validate_policy_to_practice(self, description: str, learning_objectives: List[str]) -> Dict[str, Any]:
+    def _validate_policy_to_practice(self, keywords: KeywordScanResult, learning_objectives: List[str]) -> Dict[str, Any]:
         """Validate policy to practice principle."""
         score = 0
         evidence = []
         issues = []
         
         # Check for policy/theory keywords (English and Swedish)
-        policy_keywords = [
-            # English
-            "policy", "regulation", "law", "guideline", "standard", "principle",
-            "theory", "concept", "framework", "methodology",
-            # Swedish
-            "policy", "policies", "riktlinje", "riktlinjer", "lag", "regel", "standard",
-            "princip", "teori", "koncept", "ramverk", "metod", "värdegrund", "gdpr",
-            "digitalisering", "digitaliseringsplanering", "kommunal", "plattform", "system"
-        ]
-        
-        policy_matches = sum(1 for keyword in policy_keywords if keyword in description)
+        policy_matches = keywords.count("policy_to_practice.policy")
         if policy_matches >= 2:
             score += 25
             evidence.append(f"References {policy_matches} policy/theory concepts")
@@ -290,17 +258,7 @@ class DNAComplianceChecker:
             evidence.append(f"References {policy_matches} policy/theory concepts")
         
         # Check for practical application keywords (English and Swedish)
-        practice_keywords = [
-            # English
-            "apply", "implement", "practice", "example", "case study", "scenario",
-            "real-world", "workplace", "situation", "experience",
-            # Swedish
-            "tillämpa", "implementera", "praktik", "exempel", "scenario", "verklig",
-            "arbetsplats", "situation", "situationer", "erfarenhet", "arbetssituation",
-            "funktionalitet", "använda", "demonstrerar", "stödjer", "fungerar"
-        ]
-        
-        practice_matches = sum(1 for keyword in practice_keywords if keyword in description)
+        practice_matches = keywords.count("policy_to_practice.practice")
         if practice_matches >= 2:
             score += 25
             evidence.append(f"Includes {practice_matches} practical application elements")
@@ -309,23 +267,14 @@ class DNAComplianceChecker:
             evidence.append(f"Includes {practice_matches} practical application elements")
         
         # Check for bridging language (English and Swedish)
-        bridge_keywords = [
-            # English
-            "connect", "link", "relate", "bridge", "transfer", "demonstrate",
-            "show how", "illustrate", "exemplify",
-            # Swedish
-            "koppla", "länka", "relatera", "överföra", "demonstrera", "visa hur",
-            "illustrera", "förklara", "hjälper", "genomföra", "lära sig"
-        ]
-        
-        if any(keyword in description for keyword in bridge_keywords):
+        if keywords.any_of("policy_to_practice.bridge"):
             score += 30
             evidence.append("Includes language that bridges theory and practice")
         
         # Check learning objectives for policy-practice connection
-        objectives_text = " ".join(learning_objectives).lower()
-        if any(keyword in objectives_text for keyword in policy_keywords) and \
-           any(keyword in objectives_text for keyword in practice_keywords):
+        objectives_keywords = scan_story_text(" ".join(learning_objectives).lower())
+        if objectives_keywords.any_of("policy_to_practice.policy") and \
+           objectives_keywords.any_of("policy_to_practice.practice"):
             score += 20
             evidence.append("Learning objectives connect policy and practice")
         
@@ -341,7 +290,7 @@ class DNAComplianceChecker:
             "recommendation": self._get_policy_practice_recommendation(score, issues)
         }
     
-    def _validate_time_respect(self, description: str, time_constraint: int) -> Dict[str, Any]:
+    def _validate_time_respect(self, keywords: KeywordScanResult, time_constraint: int) -> Dict[str, Any]:
         """Validate time respect principle."""
         score = 0
         evidence = []
@@ -360,16 +309,7 @@ class DNAComplianceChecker:
             issues.append(f"Time constraint too long ({time_constraint} minutes)")
         
         # Check for efficiency language (English and Swedish)
-        efficiency_keywords = [
-            # English
-            "quick", "fast", "efficient", "streamlined", "concise", "brief",
-            "focused", "direct", "immediate", "instant",
-            # Swedish
-            "snabb", "snabbt", "effektiv", "smidig", "kort", "koncis",
-            "fokuserad", "direkt", "omedelbar", "enkel"
-        ]
-        
-        efficiency_matches = sum(1 for keyword in efficiency_keywords if keyword in description)
+        efficiency_matches = keywords.count("time_respect.efficiency")
         if efficiency_matches >= 2:
             score += 30
             evidence.append(f"Emphasizes efficiency ({efficiency_matches} related terms)")
@@ -378,12 +318,7 @@ class DNAComplianceChecker:
             evidence.append(f"Mentions efficiency ({efficiency_matches} related terms)")
         
         # Check for time-awareness language
-        time_keywords = [
-            "time", "minute", "hour", "schedule", "deadline", "duration",
-            "length", "period", "session"
-        ]
-        
-        if any(keyword in description for keyword in time_keywords):
+        if keywords.any_of("time_respect.time"):
             score += 20
             evidence.append("Shows awareness of time constraints")
         
@@ -396,26 +331,14 @@ class DNAComplianceChecker:
             "recommendation": self._get_time_respect_recommendation(score, time_constraint)
         }
     
-    def _validate_holistic_thinking(self, description: str, feature_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _validate_holistic_thinking(self, keywords: KeywordScanResult, feature_data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate holistic thinking principle."""
         score = 0
         evidence = []
         issues = []
         
         # Check for systems thinking keywords (English and Swedish)
-        systems_keywords = [
-            # English
-            "integrate", "connect", "relationship", "system", "holistic", "comprehensive",
-            "overall", "complete", "whole", "entire", "context", "environment",
-            # Swedish
-            "integrera", "koppla", "relation", "system", "helhetssyn", "heltäckande",
-            "övergripande", "komplett", "hela", "samtliga", "kontext", "miljö",
-            "organisationsstruktur", "organisationens", "organisation", "sammanhang",
-            "kommunal", "kommunala", "digitalisering", "planering", "arbete", "verktyg",
-            "hjälper", "stödjer", "dagliga", "implementering", "tillämpning"
-        ]
-        
-        systems_matches = sum(1 for keyword in systems_keywords if keyword in description)
+        systems_matches = keywords.count("holistic_thinking.systems")
         if systems_matches >= 3:
             score += 30
             evidence.append(f"Shows systems thinking ({systems_matches} related terms)")
@@ -424,22 +347,12 @@ class DNAComplianceChecker:
             evidence.append(f"Some systems thinking ({systems_matches} related terms)")
         
         # Check for consideration of multiple perspectives
-        perspective_keywords = [
-            "perspective", "viewpoint", "stakeholder", "user", "audience", "participant",
-            "various", "different", "multiple", "diverse"
-        ]
-        
-        if any(keyword in description for keyword in perspective_keywords):
+        if keywords.any_of("holistic_thinking.perspective"):
             score += 25
             evidence.append("Considers multiple perspectives")
         
         # Check for impact awareness
-        impact_keywords = [
-            "impact", "effect", "consequence", "result", "outcome", "influence",
-            "affect", "change", "benefit", "value"
-        ]
-        
-        impact_matches = sum(1 for keyword in impact_keywords if keyword in description)
+        impact_matches = keywords.count("holistic_thinking.impact")
         if impact_matches >= 2:
             score += 25
             evidence.append(f"Shows impact awareness ({impact_matches} related terms)")
@@ -448,18 +361,15 @@ class DNAComplianceChecker:
             evidence.append(f"Some impact awareness ({impact_matches} related terms)")
         
         # Check for broader context consideration (English and Swedish)
-        org_context_keywords = [
-            "organization", "workplace", "team", "organisation", "arbetsplats", "kommun", "avdelning",
-            "kommunal", "kommunala", "medarbetare", "digitalisering", "digitaliseringsplanering"
-        ]
-        if any(keyword in description for keyword in org_context_keywords):
+        if keywords.any_of("holistic_thinking.org_context"):
             score += 20
             evidence.append("Considers organizational context")
         
         # Check acceptance criteria for holistic elements
         acceptance_criteria = feature_data.get("acceptance_criteria", [])
-        criteria_text = " ".join(acceptance_criteria).lower()
-        if any(keyword in criteria_text for keyword in systems_keywords + perspective_keywords):
+        criteria_keywords = scan_story_text(" ".join(acceptance_criteria).lower())
+        if criteria_keywords.any_of("holistic_thinking.systems") or \
+           criteria_keywords.any_of("holistic_thinking.perspective"):
             score += 10
             evidence.append("Acceptance criteria include holistic elements")
         
@@ -475,24 +385,19 @@ class DNAComplianceChecker:
             "recommendation": self._get_holistic_thinking_recommendation(score, issues)
         }
     
-    def _validate_professional_tone(self, description: str, user_persona: str) -> Dict[str, Any]:
+    def _validate_professional_tone(
+        self,
+        description: str,
+        keywords: KeywordScanResult,
+        user_persona: str
+    ) -> Dict[str, Any]:
         """Validate professional tone principle."""
         score = 0
         evidence = []
         issues = []
         
         # Check for professional language (English and Swedish)
-        professional_indicators = [
-            # English
-            "professional", "workplace", "organization", "colleague", "team",
-            "development", "growth", "improvement", "excellence", "quality",
-            # Swedish
-            "professionell", "arbetsplats", "organisation", "kollega", "team",
-            "utveckling", "tillväxt", "förbättring", "excellens", "kvalitet",
-            "medarbetare", "kommunal", "förvaltning", "kommun"
-        ]
-        
-        prof_matches = sum(1 for indicator in professional_indicators if indicator in description)
+        prof_matches = keywords.count("professional_tone.professional")
         if prof_matches >= 3:
             score += 30
             evidence.append(f"Uses professional terminology ({prof_matches} terms)")
@@ -519,26 +424,12 @@ class DNAComplianceChecker:
                     evidence.append("Simple language appropriate for accessibility")
         
         # Check for respectful and inclusive language (English and Swedish)
-        inclusive_keywords = [
-            # English
-            "inclusive", "accessible", "diverse", "all users", "everyone",
-            "participant", "learner", "individual",
-            # Swedish
-            "inkluderande", "tillgänglig", "alla", "deltagare", "elev",
-            "individ", "person", "nya", "medarbetare", "introduktion"
-        ]
-        
-        if any(keyword in description for keyword in inclusive_keywords):
+        if keywords.any_of("professional_tone.inclusive"):
             score += 20
             evidence.append("Uses inclusive language")
         
         # Check for educational/learning tone
-        educational_tone = [
-            "understand", "learn", "discover", "explore", "develop", "gain",
-            "master", "practice", "improve", "enhance"
-        ]
-        
-        edu_matches = sum(1 for keyword in educational_tone if keyword in description)
+        edu_matches = keywords.count("professional_tone.educational")
         if edu_matches >= 2:
             score += 25
             evidence.append(f"Maintains educational tone ({edu_matches} terms)")
@@ -555,21 +446,19 @@ class DNAComplianceChecker:
             "recommendation": self._get_professional_tone_recommendation(score, issues)
         }
     
-    def _validate_api_first(self, description: str) -> Dict[str, Any]:
+    def _validate_api_first(self, keywords: KeywordScanResult) -> Dict[str, Any]:
         """Validate API first architecture principle."""
         score = 80  # Default score since this is architectural
         evidence = ["Feature will follow DigiNativa's API-first architecture"]
         issues = []
         
         # Check if feature mentions direct database access (red flag)
-        database_direct = ["direct database", "database connection", "sql query", "orm direct"]
-        if any(term in description for term in database_direct):
+        if keywords.any_of("api_first.database_direct"):
             score -= 30
             issues.append("Feature may bypass API layer")
         
         # Check for API-friendly language
-        api_keywords = ["api", "endpoint", "service", "interface", "rest", "http"]
-        if any(keyword in description for keyword in api_keywords):
+        if keywords.any_of("api_first.api"):
             score += 20
             evidence.append("Explicitly mentions API components")
         
@@ -582,15 +471,14 @@ class DNAComplianceChecker:
             "recommendation": "Ensure all data access goes through API layer"
         }
     
-    def _validate_stateless_backend(self, description: str) -> Dict[str, Any]:
+    def _validate_stateless_backend(self, keywords: KeywordScanResult) -> Dict[str, Any]:
         """Validate stateless backend architecture principle."""
         score = 80  # Default score since this is architectural
         evidence = ["Feature will follow stateless backend design"]
         issues = []
         
         # Check for session-related language (red flag)
-        session_keywords = ["session", "state", "memory", "cache", "store"]
-        session_mentions = sum(1 for keyword in session_keywords if keyword in description)
+        session_mentions = keywords.count("stateless_backend.session")
         
         if session_mentions >= 2:
             score -= 20
@@ -608,15 +496,14 @@ class DNAComplianceChecker:
             "recommendation": "Ensure all state is managed client-side or via API parameters"
         }
     
-    def _validate_separation_of_concerns(self, description: str) -> Dict[str, Any]:
+    def _validate_separation_of_concerns(self, keywords: KeywordScanResult) -> Dict[str, Any]:
         """Validate separation of concerns architecture principle."""
         score = 80  # Default score since this is architectural
         evidence = ["Feature will maintain separation between frontend and backend"]
         issues = []
         
         # Check for mixed concerns language
-        mixed_keywords = ["frontend backend", "client server mixed", "monolithic"]
-        if any(term in description for term in mixed_keywords):
+        if keywords.any_of("separation_of_concerns.mixed"):
             score -= 20
             issues.append("Feature may mix frontend and backend concerns")
         
@@ -629,19 +516,14 @@ class DNAComplianceChecker:
             "recommendation": "Keep frontend (React) and backend (FastAPI) completely separate"
         }
     
-    def _validate_simplicity_first(self, description: str, feature_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _validate_simplicity_first(self, keywords: KeywordScanResult, feature_data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate simplicity first architecture principle."""
         score = 70  # Start with good score
         evidence = []
         issues = []
         
         # Check for simplicity language
-        simplicity_keywords = [
-            "simple", "easy", "straightforward", "minimal", "basic", "clean",
-            "clear", "direct", "focused"
-        ]
-        
-        simplicity_matches = sum(1 for keyword in simplicity_keywords if keyword in description)
+        simplicity_matches = keywords.count("simplicity_first.simplicity")
         if simplicity_matches >= 2:
             score += 20
             evidence.append(f"Emphasizes simplicity ({simplicity_matches} terms)")
@@ -650,12 +532,7 @@ class DNAComplianceChecker:
             evidence.append(f"Mentions simplicity ({simplicity_matches} terms)")
         
         # Check for complexity indicators (red flags)
-        complexity_keywords = [
-            "complex", "complicated", "advanced", "sophisticated", "elaborate",
-            "intricate", "comprehensive", "extensive"
-        ]
-        
-        complexity_matches = sum(1 for keyword in complexity_keywords if keyword in description)
+        complexity_matches = keywords.count("simplicity_first.complexity")
         if complexity_matches >= 3:
             score -= 30
             issues.append(f"High complexity indicators ({complexity_matches} terms)")
@@ -25,6 +25,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 
+from .keyword_automaton import STORY_KEYWORD_TABLES, scan_story_text
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
@@ -153,13 +155,8 @@ class DNAStoryValidator:
         # Professional Tone validation standards
         self.communication_standards = {
             "min_professional_score": 4.0,        # 1-5 scale
-            "required_swedish_municipal_terms": [
-                "kommun", "förvaltning", "medarbetare", "policy", "riktlinje",
-                "utbildning", "kompetens", "utveckling", "service", "kvalitet"
-            ],
-            "forbidden_casual_terms": [
-                "kolla", "fixa", "grejer", "typ", "liksom", "bara"
-            ],
+            "required_swedish_municipal_terms": STORY_KEYWORD_TABLES["story_validator.municipal_terms"],
+            "forbidden_casual_terms": STORY_KEYWORD_TABLES["story_validator.casual_terms"],
             "min_tone_consistency": 0.9           # 90% consistency required
         }
         
@@ -362,20 +359,24 @@ class DNAStoryValidator:
             for objective in learning_objectives:
                 # Check if objective is specific and measurable
                 is_specific = len(objective.split()) >= 5  # At least 5 words
-                is_measurable = any(word in objective.lower() for word in ["kan", "ska", "förstå", "använda", "tillämpa"])
+                is_measurable = scan_story_text(objective.lower()).any_of("story_validator.measurable_objective")
                 learning_objectives_quality[objective] = is_specific and is_measurable
             
             objectives_quality_score = sum(learning_objectives_quality.values()) / len(learning_objectives_quality) if learning_objectives_quality else 0.0
             
             # Municipal relevance analysis
             municipal_context = story_data.get("municipal_context", {})
-            municipal_keywords = ["kommun", "förvaltning", "policy", "service", "medarbetare"]
-            municipal_relevance = sum(1 for keyword in municipal_keywords if keyword in str(municipal_context).lower()) / len(municipal_keywords)
+            municipal_keywords = scan_story_text(str(municipal_context).lower())
+            municipal_relevance = (
+                municipal_keywords.count("story_validator.municipal_context") /
+                len(STORY_KEYWORD_TABLES["story_validator.municipal_context"])
+            )
             
             # Pedagogical approach assessment
             pedagogical_approach = story_breakdown.get("pedagogical_approach", "")
-            pedagogical_approaches = ["storytelling", "problem-solving", "practice", "simulation", "gamification"]
-            pedagogical_approach_suitable = any(approach in pedagogical_approach.lower() for approach in pedagogical_approaches)
+            pedagogical_approach_suitable = scan_story_text(pedagogical_approach.lower()).any_of(
+                "story_validator.pedagogical_approach"
+            )
             
             # Knowledge transfer potential
             complexity = story_breakdown.get("complexity_assessment", {}).get("ux_complexity", 3)
@@ -462,11 +463,12 @@ class DNAStoryValidator:
             all_text.append(story_breakdown.get("municipal_context", {}).get("use_case_scenario", ""))
             
             combined_text = " ".join(all_text).lower()
+            text_keywords = scan_story_text(combined_text)
             
             # Analyze Swedish municipal terminology usage
             municipal_terminology_present = {}
             for term in self.communication_standards["required_swedish_municipal_terms"]:
-                count = combined_text.count(term)
+                count = text_keywords.occurrences(term)
                 municipal_terminology_present[term] = count
             
             total_municipal_terms = sum(municipal_terminology_present.values())
@@ -474,17 +476,16 @@ class DNAStoryValidator:
             # Check for casual/unprofessional language
             casual_violations = []
             for casual_term in self.communication_standards["forbidden_casual_terms"]:
-                if casual_term in combined_text:
+                if text_keywords.has(casual_term):
                     casual_violations.append(f"Casual term '{casual_term}' found in story breakdown")
             
             # Assess tone consistency
-            professional_indicators = ["ska", "måste", "krävs", "säkerställa", "validera", "implementera"]
-            professional_term_count = sum(1 for term in professional_indicators if term in combined_text)
+            professional_term_count = text_keywords.count("story_validator.professional_tone")
             tone_consistency = professional_term_count >= 3  # At least 3 professional terms
             
             # Stakeholder appropriateness assessment
             stakeholder_context = story_breakdown.get("user_personas", [])
-            stakeholder_appropriateness = "anna" in str(stakeholder_context).lower() or "municipal" in combined_text
+            stakeholder_appropriateness = "anna" in str(stakeholder_context).lower() or text_keywords.any_of("story_validator.stakeholder")
             
             # Calculate professional score (1-5 scale)
             professional_factors = {
@@ -557,11 +558,10 @@ class DNAStoryValidator:
         policy_alignment = municipal_context.get("policy_alignment", "")
         
         # Check if story connects policy to practical implementation
-        policy_keywords = ["policy", "riktlinje", "föreskrift", "regel", "krav"]
-        practice_keywords = ["använda", "tillämpa", "implementera", "utföra", "praktik"]
+        alignment_keywords = scan_story_text(policy_alignment.lower())
         
-        has_policy = any(keyword in policy_alignment.lower() for keyword in policy_keywords)
-        has_practice = any(keyword in policy_alignment.lower() for keyword in practice_keywords)
+        has_policy = alignment_keywords.any_of("story_validator.policy_alignment_policy")
+        has_practice = alignment_keywords.any_of("story_validator.policy_alignment_practice")
         
         return has_policy and has_practice
     
@@ -0,0 +1,373 @@
+"""
+Keyword Automaton for Project Manager Agent.
+
+PURPOSE:
+Compiles every keyword table used by StoryAnalyzer, DNAComplianceChecker and
+DNAStoryValidator into one Aho-Corasick automaton, so a story text is scanned
+once and all analyzers read per-category hits from the same result.
+
+CRITICAL IMPORTANCE:
+- Large Swedish policy documents pasted into issues are scanned in one pass
+- Match semantics are identical to the previous `keyword in text` checks
+  (case-insensitive substring matching)
+- Keyword tables live in one place, grouped per principle
+
+REVENUE IMPACT:
+Direct impact on revenue through:
+- Faster story analysis on large feature requests
+- Consistent keyword evidence across all DNA validations
+"""
+
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Any, List, Tuple
+
+
+# Keyword tables grouped as "<owner principle>.<signal>". Tables are matched
+# as case-insensitive substrings; duplicate entries are intentional and are
+# counted once per entry, exactly like the original inline lists.
+STORY_KEYWORD_TABLES: Dict[str, List[str]] = {
+    # DNAComplianceChecker - pedagogical value
+    "pedagogical_value.learning": [
+        "learn", "education", "training", "skill", "knowledge", "competence",
+        "objective", "goal", "assessment", "practice", "exercise", "tutorial",
+        "lära", "lär", "lära sig", "utbildning", "träning", "kunskap", "kompetens",
+        "mål", "bedömning", "övning", "handledning", "färdighet", "kunskapstest",
+        "certifiering", "progress", "utveckling", "pedagogisk", "spelifierad",
+        "introduktion", "onboarding", "genomföra", "förstå", "bekväm"
+    ],
+    "pedagogical_value.assessment": [
+        "assessment", "evaluate", "test", "quiz", "feedback", "progress",
+        "bedömning", "utvärdera", "test", "quiz", "återkoppling", "progress",
+        "validera", "kunskapstest", "kontroll", "bedöma"
+    ],
+    "pedagogical_value.practice": [
+        "apply", "practice", "implement", "use", "real-world", "scenario",
+        "tillämpa", "använda", "implementera", "verklig", "scenario", "praktisk",
+        "använd", "genomföra", "arbetssituation", "situationer"
+    ],
+    
+    # DNAComplianceChecker - policy to practice
+    "policy_to_practice.policy": [
+        "policy", "regulation", "law", "guideline", "standard", "principle",
+        "theory", "concept", "framework", "methodology",
+        "policy", "policies", "riktlinje", "riktlinjer", "lag", "regel", "standard",
+        "princip", "teori", "koncept", "ramverk", "metod", "värdegrund", "gdpr",
+        "digitalisering", "digitaliseringsplanering", "kommunal", "plattform", "system"
+    ],
+    "policy_to_practice.practice": [
+        "apply", "implement", "practice", "example", "case study", "scenario",
+        "real-world", "workplace", "situation", "experience",
+        "tillämpa", "implementera", "praktik", "exempel", "scenario", "verklig",
+        "arbetsplats", "situation", "situationer", "erfarenhet", "arbetssituation",
+        "funktionalitet", "använda", "demonstrerar", "stödjer", "fungerar"
+    ],
+    "policy_to_practice.bridge": [
+        "connect", "link", "relate", "bridge", "transfer", "demonstrate",
+        "show how", "illustrate", "exemplify",
+        "koppla", "länka", "relatera", "överföra", "demonstrera", "visa hur",
+        "illustrera", "förklara", "hjälper", "genomföra", "lära sig"
+    ],
+    
+    # DNAComplianceChecker - time respect
+    "time_respect.efficiency": [
+        "quick", "fast", "efficient", "streamlined", "concise", "brief",
+        "focused", "direct", "immediate", "instant",
+        "snabb", "snabbt", "effektiv", "smidig", "kort", "koncis",
+        "fokuserad", "direkt", "omedelbar", "enkel"
+    ],
+    "time_respect.time": [
+        "time", "minute", "hour", "schedule", "deadline", "duration",
+        "length", "period", "session"
+    ],
+    
+    # DNAComplianceChecker - holistic thinking
+    "holistic_thinking.systems": [
+        "integrate", "connect", "relationship", "system", "holistic", "comprehensive",
+        "overall", "complete", "whole", "entire", "context", "environment",
+        "integrera", "koppla", "relation", "system", "helhetssyn", "heltäckande",
+        "övergripande", "komplett", "hela", "samtliga", "kontext", "miljö",
+        "organisationsstruktur", "organisationens", "organisation", "sammanhang",
+        "kommunal", "kommunala", "digitalisering", "planering", "arbete", "verktyg",
+        "hjälper", "stödjer", "dagliga", "implementering", "tillämpning"
+    ],
+    "holistic_thinking.perspective": [
+        "perspective", "viewpoint", "stakeholder", "user", "audience", "participant",
+        "various", "different", "multiple", "diverse"
+    ],
+    "holistic_thinking.impact": [
+        "impact", "effect", "consequence", "result", "outcome", "influence",
+        "affect", "change", "benefit", "value"
+    ],
+    "holistic_thinking.org_context": [
+        "organization", "workplace", "team", "organisation", "arbetsplats", "kommun", "avdelning",
+        "kommunal", "kommunala", "medarbetare", "digitalisering", "digitaliseringsplanering"
+    ],
+    
+    # DNAComplianceChecker - professional tone
+    "professional_tone.professional": [
+        "professional", "workplace", "organization", "colleague", "team",
+        "development", "growth", "improvement", "excellence", "quality",
+        "professionell", "arbetsplats", "organisation", "kollega", "team",
+        "utveckling", "tillväxt", "förbättring", "excellens", "kvalitet",
+        "medarbetare", "kommunal", "förvaltning", "kommun"
+    ],
+    "professional_tone.inclusive": [
+        "inclusive", "accessible", "diverse", "all users", "everyone",
+        "participant", "learner", "individual",
+        "inkluderande", "tillgänglig", "alla", "deltagare", "elev",
+        "individ", "person", "nya", "medarbetare", "introduktion"
+    ],
+    "professional_tone.educational": [
+        "understand", "learn", "discover", "explore", "develop", "gain",
+        "master", "practice", "improve", "enhance"
+    ],
+    
+    # DNAComplianceChecker - architecture principles
+    "api_first.database_direct": [
+        "direct database", "database connection", "sql query", "orm direct"
+    ],
+    "api_first.api": ["api", "endpoint", "service", "interface", "rest", "http"],
+    "stateless_backend.session": ["session", "state", "memory", "cache", "store"],
+    "separation_of_concerns.mixed": ["frontend backend", "client server mixed", "monolithic"],
+    "simplicity_first.simplicity": [
+        "simple", "easy", "straightforward", "minimal", "basic", "clean",
+        "clear", "direct", "focused"
+    ],
+    "simplicity_first.complexity": [
+        "complex", "complicated", "advanced", "sophisticated", "elaborate",
+        "intricate", "comprehensive", "extensive"
+    ],
+    
+    # DNAStoryValidator
+    "story_validator.measurable_objective": ["kan", "ska", "förstå", "använda", "tillämpa"],
+    "story_validator.municipal_context": ["kommun", "förvaltning", "policy", "service", "medarbetare"],
+    "story_validator.pedagogical_approach": [
+        "storytelling", "problem-solving", "practice", "simulation", "gamification"
+    ],
+    "story_validator.municipal_terms": [
+        "kommun", "förvaltning", "medarbetare", "policy", "riktlinje",
+        "utbildning", "kompetens", "utveckling", "service", "kvalitet"
+    ],
+    "story_validator.casual_terms": ["kolla", "fixa", "grejer", "typ", "liksom", "bara"],
+    "story_validator.professional_tone": [
+        "ska", "måste", "krävs", "säkerställa", "validera", "implementera"
+    ],
+    "story_validator.stakeholder": ["municipal"],
+    "story_validator.policy_alignment_policy": ["policy", "riktlinje", "föreskrift", "regel", "krav"],
+    "story_validator.policy_alignment_practice": [
+        "använda", "tillämpa", "implementera", "utföra", "praktik"
+    ],
+    
+    # StoryAnalyzer - technical requirements
+    "story_analyzer.frontend": [
+        "form", "formulär", "chart", "diagram", "table", "tabell", "dashboard",
+        "quiz", "progress", "framsteg", "navigation", "meny", "modal", "dialog",
+        "animation", "drag", "upload", "ladda upp"
+    ],
+    "story_analyzer.backend": [
+        "api", "endpoint", "validation", "validering", "calculate", "beräkna",
+        "score", "poäng", "notification", "notis", "search", "sök", "report", "rapport"
+    ],
+    "story_analyzer.database": [
+        "database", "databas", "save", "spara", "history", "historik",
+        "profile", "profil", "record", "lagra", "statistics", "statistik"
+    ],
+    "story_analyzer.integration": [
+        "github", "bankid", "e-post", "email", "sso", "active directory",
+        "integration", "import", "export", "webhook", "calendar", "kalender"
+    ]
+}
+
+
+@dataclass
+class KeywordScanResult:
+    """
+    Keyword hits for one scanned text.
+    
+    Positions are character offsets into the lowercased text.
+    """
+    text_length: int
+    positions: Dict[str, List[int]]
+    keyword_tables: Dict[str, List[str]] = field(repr=False)
+    
+    def has(self, keyword: str) -> bool:
+        """Check if keyword occurs anywhere in the text."""
+        return keyword in self.positions
+    
+    def count(self, category: str) -> int:
+        """Count table entries of category that occur (same as sum(kw in text))."""
+        return sum(1 for keyword in self.keyword_tables[category] if keyword in self.positions)
+    
+    def any_of(self, category: str) -> bool:
+        """Check if any keyword of category occurs."""
+        return any(keyword in self.positions for keyword in self.keyword_tables[category])
+    
+    def matched(self, category: str) -> List[str]:
+        """Distinct keywords of category that occur, in table order."""
+        seen = []
+        for keyword in self.keyword_tables[category]:
+            if keyword in self.positions and keyword not in seen:
+                seen.append(keyword)
+        return seen
+    
+    def occurrences(self, keyword: str) -> int:
+        """Count non-overlapping occurrences of keyword (same as str.count)."""
+        count = 0
+        next_free = 0
+        for position in self.positions.get(keyword, []):
+            if position >= next_free:
+                count += 1
+                next_free = position + len(keyword)
+        return count
+    
+    def category_hits(self) -> Dict[str, int]:
+        """Per-category hit counts for every category with at least one hit."""
+        hits = {}
+        for category in self.keyword_tables:
+            category_count = self.count(category)
+            if category_count:
+                hits[category] = category_count
+        return hits
+    
+    def category_positions(self, category: str) -> Dict[str, List[int]]:
+        """Occurrence positions of every matched keyword in category."""
+        return {keyword: self.positions[keyword] for keyword in self.matched(category)}
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary format."""
+        return {
+            "text_length": self.text_length,
+            "category_hits": self.category_hits(),
+            "keyword_positions": {keyword: list(hits) for keyword, hits in self.positions.items()}
+        }
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick multi-pattern matcher over named keyword tables.
+    
+    The goto/failure structure is flattened into a deterministic transition
+    table at build time, so scanning costs one dict lookup per character
+    regardless of how many keywords are compiled in.
+    """
+    
+    def __init__(self, keyword_tables: Dict[str, List[str]]):
+        """
+        Compile keyword tables into automaton.
+        
+        Args:
+            keyword_tables: Mapping category -> keywords (lowercase)
+        """
+        self.logger = logging.getLogger(f"{__name__}.KeywordAutomaton")
+        self.keyword_tables = {
+            category: [keyword.lower() for keyword in keywords]
+            for category, keywords in keyword_tables.items()
+        }
+        
+        keywords = sorted({
+            keyword for table in self.keyword_tables.values() for keyword in table if keyword
+        })
+        self._transitions, self._outputs = self._build(keywords)
+        
+        self.logger.debug(
+            f"Compiled {len(keywords)} keywords from {len(self.keyword_tables)} tables "
+            f"into {len(self._transitions)} states"
+        )
+    
+    def scan(self, text: str) -> KeywordScanResult:
+        """
+        Scan text once and collect every keyword occurrence.
+        
+        Args:
+            text: Text to scan (lowercased before matching)
+        
+        Returns:
+            KeywordScanResult with positions of all matched keywords
+        """
+        lowered = text.lower()
+        transitions = self._transitions
+        outputs = self._outputs
+        positions: Dict[str, List[int]] = {}
+        
+        state = 0
+        for index, char in enumerate(lowered):
+            state = transitions[state].get(char, 0)
+            matches = outputs[state]
+            if matches:
+                for keyword, length in matches:
+                    start = index - length + 1
+                    hits = positions.get(keyword)
+                    if hits is None:
+                        positions[keyword] = [start]
+                    else:
+                        hits.append(start)
+        
+        return KeywordScanResult(
+            text_length=len(lowered),
+            positions=positions,
+            keyword_tables=self.keyword_tables
+        )
+    
+    def _build(
+        self,
+        keywords: List[str]
+    ) -> Tuple[List[Dict[str, int]], List[Tuple[Tuple[str, int], ...]]]:
+        """Build trie, failure links and flattened transition table."""
+        
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[str]] = [[]]
+        
+        for keyword in keywords:
+            state = 0
+            for char in keyword:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto.append({})
+                    outputs.append([])
+                    goto[state][char] = next_state
+                state = next_state
+            outputs[state].append(keyword)
+        
+        # Breadth-first: failure target is always shallower, so its
+        # flattened transitions and outputs are complete when needed
+        failure = [0] * len(goto)
+        transitions: List[Dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+        queue = deque(goto[0].values())
+        
+        while queue:
+            state = queue.popleft()
+            transitions[state] = {**transitions[failure[state]], **goto[state]}
+            outputs[state] = outputs[state] + outputs[failure[state]]
+            
+            for char, next_state in goto[state].items():
+                failure[next_state] = transitions[failure[state]].get(char, 0) if state else 0
+                queue.append(next_state)
+        
+        return transitions, [tuple((keyword, len(keyword)) for keyword in out) for out in outputs]
+
+
+@lru_cache(maxsize=1)
+def get_story_keyword_automaton() -> KeywordAutomaton:
+    """Get process-wide automaton compiled from STORY_KEYWORD_TABLES."""
+    return KeywordAutomaton(STORY_KEYWORD_TABLES)
+
+
+@lru_cache(maxsize=64)
+def scan_story_text(text: str) -> KeywordScanResult:
+    """
+    Scan story text with the shared automaton.
+    
+    Results are cached per text, so every analyzer that receives the same
+    feature description reuses one scan. Treat the result as read-only.
+    
+    Args:
+        text: Story text to scan
+    
+    Returns:
+        Shared KeywordScanResult
+    """
+    return get_story_keyword_automaton().scan(text)
@@ -19,9 +19,10 @@ Direct impact on revenue through:
 - Automatic adaptation to changing business priorities
 """
 
+import asyncio
 import json
 import logging
-from typing import Dict, Any, List, Optional, Tuple, Set
+from typing import Dict, Any, List, Optional, Tuple, Set, Callable
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
@@ -47,6 +48,18 @@ class PriorityLevel(Enum):
     LOW = "low"
 
 
+class SchedulingPolicy(Enum):
+    """Policies for selecting the next feature among available ones."""
+    PRIORITY = "priority"  # (priority, created_at)
+    CRITICAL_PATH = "critical_path"  # (inherited priority, -critical path, created_at)
+
+
+class QueueBackend(Enum):
+    """Storage backends for the feature queue."""
+    MEMORY = "memory"  # In-process list, one worker
+    SHARED = "shared"  # SharedFeatureQueue (SQLite), many worker processes
+
+
 @dataclass
 class FeatureDependency:
     """Represents a dependency between features."""
@@ -101,6 +114,153 @@ class QueuedFeature:
         }
 
 
+DEFAULT_PRIORITY_WEIGHTS = {
+    PriorityLevel.CRITICAL: 0,
+    PriorityLevel.HIGH: 1,
+    PriorityLevel.MEDIUM: 2,
+    PriorityLevel.LOW: 3
+}
+
+_CLOSED_STATUSES = (FeatureStatus.COMPLETED, FeatureStatus.REJECTED)
+
+
+def _build_dependents_map(features: List[QueuedFeature]) -> Dict[str, List[QueuedFeature]]:
+    """Map each story ID to the open features blocked by it."""
+    
+    dependents: Dict[str, List[QueuedFeature]] = {}
+    for feature in features:
+        if feature.status in _CLOSED_STATUSES:
+            continue
+        for dep in feature.dependencies:
+            if dep.is_blocking:
+                dependents.setdefault(dep.dependency_story_id, []).append(feature)
+    return dependents
+
+
+def calculate_critical_path_lengths(features: List[QueuedFeature]) -> Dict[str, float]:
+    """
+    Calculate critical-path length (hours) for every open feature.
+    
+    The critical-path length of a feature is its own estimated hours plus
+    the longest chain of open features that transitively wait on it. Starting
+    features with the longest remaining chain first shortens total makespan.
+    
+    Args:
+        features: Features in the queue
+        
+    Returns:
+        Mapping story_id -> critical-path length in hours
+    """
+    dependents = _build_dependents_map(features)
+    lengths: Dict[str, float] = {}
+    in_progress: Set[str] = set()
+    
+    def visit(feature: QueuedFeature) -> float:
+        if feature.story_id in lengths:
+            return lengths[feature.story_id]
+        if feature.story_id in in_progress:
+            # Cycle guard - dependencies added at creation time are not cycle-checked
+            return 0.0
+        
+        in_progress.add(feature.story_id)
+        longest_tail = max(
+            (visit(dependent) for dependent in dependents.get(feature.story_id, [])),
+            default=0.0
+        )
+        in_progress.discard(feature.story_id)
+        
+        lengths[feature.story_id] = feature.estimated_hours + longest_tail
+        return lengths[feature.story_id]
+    
+    for feature in features:
+        if feature.status not in _CLOSED_STATUSES:
+            visit(feature)
+    
+    return lengths
+
+
+def calculate_inherited_priorities(
+    features: List[QueuedFeature],
+    priority_weights: Optional[Dict[PriorityLevel, int]] = None
+) -> Dict[str, int]:
+    """
+    Calculate effective priority weight for every open feature.
+    
+    A feature inherits the most urgent priority of any open feature that
+    transitively waits on it, so a low priority feature blocking a critical
+    one is scheduled within the critical class.
+    
+    Args:
+        features: Features in the queue
+        priority_weights: Priority level to sort weight mapping
+        
+    Returns:
+        Mapping story_id -> effective priority weight (lower is more urgent)
+    """
+    weights = priority_weights or DEFAULT_PRIORITY_WEIGHTS
+    dependents = _build_dependents_map(features)
+    inherited: Dict[str, int] = {}
+    in_progress: Set[str] = set()
+    
+    def visit(feature: QueuedFeature) -> int:
+        if feature.story_id in inherited:
+            return inherited[feature.story_id]
+        own_weight = weights[feature.priority]
+        if feature.story_id in in_progress:
+            return own_weight
+        
+        in_progress.add(feature.story_id)
+        most_urgent = min(
+            (visit(dependent) for dependent in dependents.get(feature.story_id, [])),
+            default=own_weight
+        )
+        in_progress.discard(feature.story_id)
+        
+        inherited[feature.story_id] = min(own_weight, most_urgent)
+        return inherited[feature.story_id]
+    
+    for feature in features:
+        if feature.status not in _CLOSED_STATUSES:
+            visit(feature)
+    
+    return inherited
+
+
+def build_selection_key(
+    policy: SchedulingPolicy,
+    features: List[QueuedFeature],
+    priority_weights: Optional[Dict[PriorityLevel, int]] = None
+) -> Callable[[QueuedFeature], Tuple]:
+    """
+    Build sort key used to order available features under a scheduling policy.
+    
+    Both policies honour priority classes first. CRITICAL_PATH additionally
+    lets blockers inherit the priority of what they block and, within a
+    class, prefers the feature heading the longest remaining dependency chain.
+    
+    Args:
+        policy: Scheduling policy to apply
+        features: All features in the queue (used for DAG analysis)
+        priority_weights: Priority level to sort weight mapping
+        
+    Returns:
+        Sort key function for QueuedFeature instances
+    """
+    weights = priority_weights or DEFAULT_PRIORITY_WEIGHTS
+    
+    if policy == SchedulingPolicy.CRITICAL_PATH:
+        critical_paths = calculate_critical_path_lengths(features)
+        inherited = calculate_inherited_priorities(features, weights)
+        
+        return lambda f: (
+            inherited.get(f.story_id, weights[f.priority]),
+            -critical_paths.get(f.story_id, f.estimated_hours),
+            f.created_at
+        )
+    
+    return lambda f: (weights[f.priority], f.created_at)
+
+
 class PriorityQueueManager:
     """
     Manages feature priority queue with dependency resolution.
@@ -119,23 +279,42 @@ class PriorityQueueManager:
         self.logger = logging.getLogger(f"{__name__}.PriorityQueueManager")
         self.config = config or {}
         
-        # In-memory queue storage (in production, this would use a database)
+        # In-memory queue storage (used by the memory backend)
         self.feature_queue: List[QueuedFeature] = []
         self.dependencies: Dict[str, List[FeatureDependency]] = {}
         
         # Priority weights for sorting
-        self.priority_weights = {
-            PriorityLevel.CRITICAL: 0,
-            PriorityLevel.HIGH: 1,
-            PriorityLevel.MEDIUM: 2,
-            PriorityLevel.LOW: 3
-        }
+        self.priority_weights = dict(DEFAULT_PRIORITY_WEIGHTS)
         
         # Configuration
         self.max_concurrent_features = self.config.get("max_concurrent_features", 1)
         self.dependency_timeout_hours = self.config.get("dependency_timeout_hours", 168)  # 1 week
+        self.scheduling_policy = SchedulingPolicy(
+            self.config.get("scheduling_policy", SchedulingPolicy.PRIORITY.value)
+        )
+        
+        # Queue backend - "shared" lets several worker processes drain one SQLite queue
+        self.queue_backend = QueueBackend(
+            self.config.get("queue_backend", QueueBackend.MEMORY.value)
+        )
+        self.shared_queue = None
+        self._claim_tokens: Dict[str, str] = {}
+        self._lease_heartbeat: Optional[asyncio.Task] = None
+        if self.queue_backend == QueueBackend.SHARED:
+            if self.scheduling_policy != SchedulingPolicy.PRIORITY:
+                raise BusinessLogicError(
+                    "Shared queue backend only supports the priority scheduling policy",
+                    business_rule="queue_backend",
+                    context={"scheduling_policy": self.scheduling_policy.value}
+                )
+            from .shared_feature_queue import SharedFeatureQueue
+            self.shared_queue = SharedFeatureQueue(self.config.get("shared_queue", {}))
+            # Renew held leases well before they expire so live claims are not reclaimed
+            self.lease_renewal_seconds = self.config.get(
+                "lease_renewal_seconds", self.shared_queue.lease_seconds / 3
+            )
         
-        self.logger.info("Priority queue manager initialized")
+        self.logger.info(f"Priority queue manager initialized ({self.queue_backend.value} backend)")
     
     async def add_feature_to_queue(
         self,
@@ -164,6 +343,12 @@ class PriorityQueueManager:
         Returns:
             Created QueuedFeature instance
         """
+        if self.shared_queue:
+            return await self.shared_queue.add_feature_to_queue(
+                story_id, title, description, priority, acceptance_criteria,
+                estimated_hours, dependencies, metadata
+            )
+        
         try:
             # Parse priority
             priority_enum = PriorityLevel(priority.lower())
@@ -233,6 +418,13 @@ class PriorityQueueManager:
             Next available feature or None if no features available
         """
         try:
+            if self.shared_queue:
+                # Advisory in shared mode - start_feature_development makes the claim
+                suggested_feature = None
+                if suggested_priority:
+                    suggested_feature = await self.shared_queue.peek_next_feature(suggested_priority)
+                return suggested_feature or await self.shared_queue.peek_next_feature()
+            
             # Filter available features (pending status, no blocking dependencies)
             available_features = await self._get_available_features()
             
@@ -269,6 +461,9 @@ class PriorityQueueManager:
         Returns:
             True if successfully started, False otherwise
         """
+        if self.shared_queue:
+            return await self._claim_shared_feature(story_id, agent)
+        
         try:
             feature = self._find_feature_by_id(story_id)
             if not feature:
@@ -311,6 +506,13 @@ class PriorityQueueManager:
         Returns:
             True if successfully completed, False otherwise
         """
+        if self.shared_queue:
+            claim_token = self._claim_tokens.pop(story_id, None)
+            if not claim_token:
+                self.logger.warning(f"Feature {story_id} was not claimed by this worker")
+                return False
+            return await self.shared_queue.complete_feature(story_id, claim_token)
+        
         try:
             feature = self._find_feature_by_id(story_id)
             if not feature:
@@ -346,6 +548,10 @@ class PriorityQueueManager:
         Returns:
             True if successfully updated, False otherwise
         """
+        if self.shared_queue:
+            self.logger.error("Priority updates are not supported by the shared queue backend")
+            return False
+        
         try:
             feature = self._find_feature_by_id(story_id)
             if not feature:
@@ -395,6 +601,10 @@ class PriorityQueueManager:
         Returns:
             True if successfully added, False otherwise
         """
+        if self.shared_queue:
+            self.logger.error("Dependencies are set when adding features to the shared queue backend")
+            return False
+        
         try:
             # Validate both features exist
             dependent_feature = self._find_feature_by_id(dependent_story_id)
@@ -437,6 +647,13 @@ class PriorityQueueManager:
         Returns:
             Queue status dictionary
         """
+        if self.shared_queue:
+            status = await self.shared_queue.get_queue_status()
+            status["queue_backend"] = self.queue_backend.value
+            status["claimed_by_worker"] = sorted(self._claim_tokens)
+            status["next_available"] = await self.get_next_available_feature()
+            return status
+        
         status_counts = {}
         priority_counts = {}
         
@@ -470,6 +687,99 @@ class PriorityQueueManager:
             "queue_health": self._assess_queue_health()
         }
     
+    async def set_scheduling_policy(self, policy: str) -> bool:
+        """
+        Switch the policy used for next feature selection.
+        
+        Args:
+            policy: Scheduling policy name (priority, critical_path)
+            
+        Returns:
+            True if policy was applied, False if unknown
+        """
+        try:
+            scheduling_policy = SchedulingPolicy(policy.lower())
+            if self.shared_queue and scheduling_policy != SchedulingPolicy.PRIORITY:
+                self.logger.error("Shared queue backend only supports the priority scheduling policy")
+                return False
+            self.scheduling_policy = scheduling_policy
+            self.logger.info(f"Scheduling policy set to {self.scheduling_policy.value}")
+            return True
+        except ValueError:
+            self.logger.error(f"Invalid scheduling policy: {policy}")
+            return False
+    
+    async def compare_scheduling_policies(
+        self,
+        parallel_slots: Optional[int] = None,
+        policies: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Replay current queue offline under each scheduling policy.
+        
+        Args:
+            parallel_slots: Number of parallel development slots
+                (defaults to max_concurrent_features)
+            policies: Policies to compare (defaults to all)
+            
+        Returns:
+            Policy comparison from ScheduleSimulator.compare_policies
+        """
+        if self.shared_queue:
+            raise BusinessLogicError(
+                "Schedule comparison requires the memory queue backend",
+                business_rule="queue_backend"
+            )
+        
+        from .schedule_simulator import ScheduleSimulator
+        
+        simulator = ScheduleSimulator(self.config)
+        return simulator.compare_policies(
+            self.feature_queue,
+            parallel_slots or self.max_concurrent_features,
+            policies=policies,
+            priority_weights=self.priority_weights
+        )
+    
+    def close(self) -> None:
+        """Stop lease renewal and close shared queue connection (no-op for the memory backend)."""
+        if self._lease_heartbeat:
+            self._lease_heartbeat.cancel()
+            self._lease_heartbeat = None
+        if self.shared_queue:
+            self.shared_queue.close()
+    
+    async def _claim_shared_feature(self, story_id: str, agent: str) -> bool:
+        """Claim feature in shared queue, keeping its claim token for completion."""
+        if len(self._claim_tokens) >= self.max_concurrent_features:
+            self.logger.warning(f"Maximum concurrent features ({self.max_concurrent_features}) reached")
+            return False
+        
+        feature = await self.shared_queue.claim_next_feature(agent, story_id=story_id)
+        if not feature:
+            self.logger.info(f"Feature {story_id} is not available to claim")
+            return False
+        
+        self._claim_tokens[story_id] = feature.metadata["claim_token"]
+        if not self._lease_heartbeat or self._lease_heartbeat.done():
+            self._lease_heartbeat = asyncio.get_running_loop().create_task(self._renew_claimed_leases())
+        self.logger.info(f"Started feature {story_id} with agent {agent}")
+        return True
+    
+    async def _renew_claimed_leases(self) -> None:
+        """Heartbeat renewing the lease of every held claim until none remain."""
+        while self._claim_tokens:
+            await asyncio.sleep(self.lease_renewal_seconds)
+            for story_id, claim_token in list(self._claim_tokens.items()):
+                try:
+                    renewed = await self.shared_queue.renew_lease(story_id, claim_token)
+                except Exception as e:
+                    self.logger.error(f"Failed to renew lease on {story_id}: {e}")
+                    continue
+                if not renewed and self._claim_tokens.get(story_id) == claim_token:
+                    del self._claim_tokens[story_id]
+                    self.logger.warning(f"Lost claim on feature {story_id}")
+    
     async def _get_available_features(self) -> List[QueuedFeature]:
         """Get features available for development (no blocking dependencies)."""
         
@@ -495,10 +805,11 @@ class PriorityQueueManager:
             if dependencies_satisfied:
                 available.append(feature)
         
-        # Sort available features by priority and creation time
-        available.sort(key=lambda f: (
-            self.priority_weights[f.priority],
-            f.created_at
+        # Sort available features according to scheduling policy
+        available.sort(key=build_selection_key(
+            self.scheduling_policy,
+            self.feature_queue,
+            self.priority_weights
         ))
         
         return available
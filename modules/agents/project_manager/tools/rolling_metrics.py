@@ -0,0 +1,392 @@
+"""
+Rolling Metrics Store for Project Manager Agent.
+
+PURPOSE:
+Keeps per-agent time series of completion times, failures and queue waits
+in fixed, preallocated ring buffers so TeamCoordinator can answer windowed
+questions (last minute, hour, day) without rebuilding metrics per request.
+
+CRITICAL IMPORTANCE:
+- Memory use is fixed at construction, independent of event rate
+- Recording an event and reading a window aggregate are both O(1)
+- Bottlenecks are detected as events stream in, not on dashboard reads
+
+REVENUE IMPACT:
+Direct impact on revenue through:
+- Real performance history instead of placeholder metrics
+- Earlier bottleneck detection keeping feature delivery on schedule
+- Cheap dashboard reads even under heavy team activity
+"""
+
+import logging
+import math
+import time
+from array import array
+from typing import Dict, Any, List, Optional, Tuple
+
+
+# Window name -> (window length seconds, number of buckets)
+DEFAULT_WINDOWS: Dict[str, Tuple[int, int]] = {
+    "1m": (60, 12),
+    "1h": (3600, 60),
+    "24h": (86400, 48)
+}
+
+# Log-scale histogram bins for durations: 1 ms up to ~44 hours, ~14% resolution
+HISTOGRAM_MIN_VALUE = 0.001
+HISTOGRAM_GROWTH = 1.3
+HISTOGRAM_BINS = 72
+
+
+class RingBuffer:
+    """Fixed-capacity (timestamp, value) buffer backed by preallocated arrays."""
+    
+    def __init__(self, capacity: int):
+        """
+        Initialize ring buffer.
+        
+        Args:
+            capacity: Maximum number of samples kept
+        """
+        self.capacity = max(1, capacity)
+        self.timestamps = array("d", [0.0]) * self.capacity
+        self.values = array("d", [0.0]) * self.capacity
+        self._next = 0
+        self._size = 0
+    
+    def append(self, timestamp: float, value: float) -> None:
+        """Append sample, overwriting oldest when full."""
+        self.timestamps[self._next] = timestamp
+        self.values[self._next] = value
+        self._next = (self._next + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+    
+    def samples(self) -> List[Tuple[float, float]]:
+        """Samples oldest first."""
+        start = (self._next - self._size) % self.capacity
+        return [
+            (self.timestamps[(start + i) % self.capacity], self.values[(start + i) % self.capacity])
+            for i in range(self._size)
+        ]
+    
+    def __len__(self) -> int:
+        return self._size
+
+
+class SlidingWindowHistogram:
+    """
+    Bucketed sliding window with running totals.
+    
+    The window is split into bucket_count time buckets. Each bucket keeps a
+    count, a sum and a log-scale histogram; running totals over all live
+    buckets are updated on insert and when a bucket expires, so count, mean
+    and percentiles never scan individual samples. The window slides in
+    whole buckets, i.e. with window_seconds / bucket_count granularity.
+    """
+    
+    def __init__(self, window_seconds: int, bucket_count: int, bin_count: int = HISTOGRAM_BINS):
+        """
+        Initialize sliding window.
+        
+        Args:
+            window_seconds: Window length in seconds
+            bucket_count: Number of time buckets in window
+            bin_count: Number of histogram bins (1 for plain counters)
+        """
+        self.window_seconds = window_seconds
+        self.bucket_count = bucket_count
+        self.bucket_seconds = window_seconds / bucket_count
+        self.bin_count = max(1, bin_count)
+        
+        self._counts = array("l", [0]) * bucket_count
+        self._sums = array("d", [0.0]) * bucket_count
+        self._bins = array("l", [0]) * (bucket_count * self.bin_count)
+        self._total_bins = array("l", [0]) * self.bin_count
+        self._total_count = 0
+        self._total_sum = 0.0
+        self._epoch: Optional[int] = None
+    
+    def add(self, value: float, timestamp: float) -> None:
+        """Add value observed at timestamp (seconds since epoch)."""
+        epoch = int(timestamp // self.bucket_seconds)
+        self._advance(epoch)
+        
+        if epoch <= self._epoch - self.bucket_count:
+            return  # Older than window
+        
+        bucket = epoch % self.bucket_count
+        bin_index = self._bin_index(value)
+        
+        self._counts[bucket] += 1
+        self._sums[bucket] += value
+        self._bins[bucket * self.bin_count + bin_index] += 1
+        self._total_count += 1
+        self._total_sum += value
+        self._total_bins[bin_index] += 1
+    
+    def count(self, now: float) -> int:
+        """Number of values in window."""
+        self._advance(int(now // self.bucket_seconds))
+        return self._total_count
+    
+    def total(self, now: float) -> float:
+        """Sum of values in window."""
+        self._advance(int(now // self.bucket_seconds))
+        return self._total_sum
+    
+    def mean(self, now: float) -> float:
+        """Mean of values in window (0.0 when empty)."""
+        count = self.count(now)
+        return self._total_sum / count if count else 0.0
+    
+    def percentile(self, fraction: float, now: float) -> float:
+        """
+        Approximate percentile from log-scale histogram.
+        
+        Args:
+            fraction: Percentile as fraction (0.5 for p50)
+            now: Current timestamp
+        
+        Returns:
+            Representative value of bin holding the percentile (0.0 when empty)
+        """
+        count = self.count(now)
+        if not count:
+            return 0.0
+        
+        target = max(1, math.ceil(fraction * count))
+        cumulative = 0
+        for bin_index in range(self.bin_count):
+            cumulative += self._total_bins[bin_index]
+            if cumulative >= target:
+                return self._bin_value(bin_index)
+        return self._bin_value(self.bin_count - 1)
+    
+    def _advance(self, epoch: int) -> None:
+        """Expire buckets that fell out of window."""
+        if self._epoch is None:
+            self._epoch = epoch
+            return
+        if epoch <= self._epoch:
+            return
+        
+        for step in range(1, min(epoch - self._epoch, self.bucket_count) + 1):
+            self._clear_bucket((self._epoch + step) % self.bucket_count)
+        self._epoch = epoch
+    
+    def _clear_bucket(self, bucket: int) -> None:
+        if not self._counts[bucket]:
+            return
+        
+        self._total_count -= self._counts[bucket]
+        self._total_sum -= self._sums[bucket]
+        offset = bucket * self.bin_count
+        for bin_index in range(self.bin_count):
+            hits = self._bins[offset + bin_index]
+            if hits:
+                self._total_bins[bin_index] -= hits
+                self._bins[offset + bin_index] = 0
+        self._counts[bucket] = 0
+        self._sums[bucket] = 0.0
+        
+        if not self._total_count:
+            self._total_sum = 0.0  # Drop accumulated float error
+    
+    def _bin_index(self, value: float) -> int:
+        if self.bin_count == 1 or value < HISTOGRAM_MIN_VALUE:
+            return 0
+        index = 1 + int(math.log(value / HISTOGRAM_MIN_VALUE) / math.log(HISTOGRAM_GROWTH))
+        return min(index, self.bin_count - 1)
+    
+    def _bin_value(self, bin_index: int) -> float:
+        if bin_index == 0:
+            return 0.0
+        # Geometric midpoint of [min * g^(i-1), min * g^i)
+        return HISTOGRAM_MIN_VALUE * HISTOGRAM_GROWTH ** (bin_index - 0.5)
+
+
+class AgentRollingMetrics:
+    """Windowed completion time, queue wait and failure series for one agent."""
+    
+    def __init__(self, agent_type: str, windows: Dict[str, Tuple[int, int]], sample_capacity: int):
+        """
+        Initialize agent series.
+        
+        Args:
+            agent_type: Agent type
+            windows: Window name -> (seconds, buckets)
+            sample_capacity: Raw completion samples kept for trend analysis
+        """
+        self.agent_type = agent_type
+        self.completion_times = {
+            name: SlidingWindowHistogram(seconds, buckets) for name, (seconds, buckets) in windows.items()
+        }
+        self.queue_waits = {
+            name: SlidingWindowHistogram(seconds, buckets) for name, (seconds, buckets) in windows.items()
+        }
+        self.failures = {
+            name: SlidingWindowHistogram(seconds, buckets, bin_count=1)
+            for name, (seconds, buckets) in windows.items()
+        }
+        self.recent_completions = RingBuffer(sample_capacity)
+        self.last_activity: Optional[float] = None
+    
+    def summary(self, window: str, now: float) -> Dict[str, Any]:
+        """Aggregates for one window."""
+        completions = self.completion_times[window]
+        waits = self.queue_waits[window]
+        completed = completions.count(now)
+        failed = self.failures[window].count(now)
+        attempts = completed + failed
+        
+        return {
+            "completed": completed,
+            "failed": failed,
+            "success_rate": completed / attempts if attempts else 1.0,
+            "completion_time_mean": completions.mean(now),
+            "completion_time_p50": completions.percentile(0.5, now),
+            "completion_time_p95": completions.percentile(0.95, now),
+            "queue_wait_mean": waits.mean(now),
+            "queue_wait_p50": waits.percentile(0.5, now),
+            "queue_wait_p95": waits.percentile(0.95, now)
+        }
+
+
+class RollingMetricsStore:
+    """
+    Fixed-memory per-agent metrics store with streaming bottleneck detection.
+    
+    All durations are in seconds. Timestamps default to time.time() and may
+    be passed explicitly when replaying events.
+    """
+    
+    def __init__(
+        self,
+        agent_types: List[str],
+        config: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize rolling metrics store.
+        
+        Args:
+            agent_types: Agents to preallocate series for
+            config: Configuration dictionary
+        """
+        self.logger = logging.getLogger(f"{__name__}.RollingMetricsStore")
+        self.config = config or {}
+        
+        self.windows = self.config.get("windows", DEFAULT_WINDOWS)
+        self.bottleneck_window = self.config.get("bottleneck_window", "1h")
+        self.slow_factor = self.config.get("slow_factor", 1.5)
+        self.min_success_rate = self.config.get("min_success_rate", 0.95)
+        self.min_samples = self.config.get("min_samples", 3)
+        sample_capacity = self.config.get("sample_capacity", 256)
+        
+        self.agents: Dict[str, AgentRollingMetrics] = {
+            agent_type: AgentRollingMetrics(agent_type, self.windows, sample_capacity)
+            for agent_type in agent_types
+        }
+        self._sample_capacity = sample_capacity
+        self._bottlenecks: Dict[str, List[str]] = {}
+    
+    def record_completion(self, agent_type: str, duration: float, timestamp: Optional[float] = None) -> None:
+        """Record completed work item and its duration."""
+        now = self._now(timestamp)
+        agent = self._agent(agent_type)
+        for series in agent.completion_times.values():
+            series.add(duration, now)
+        agent.recent_completions.append(now, duration)
+        agent.last_activity = now
+        self._refresh_bottlenecks(now)
+    
+    def record_failure(self, agent_type: str, timestamp: Optional[float] = None) -> None:
+        """Record failed work item."""
+        now = self._now(timestamp)
+        agent = self._agent(agent_type)
+        for series in agent.failures.values():
+            series.add(0.0, now)
+        agent.last_activity = now
+        self._refresh_bottlenecks(now)
+    
+    def record_queue_wait(self, agent_type: str, wait: float, timestamp: Optional[float] = None) -> None:
+        """Record time a work item waited before agent started it."""
+        now = self._now(timestamp)
+        agent = self._agent(agent_type)
+        for series in agent.queue_waits.values():
+            series.add(wait, now)
+        agent.last_activity = now
+    
+    def get_agent_summary(self, agent_type: str, window: str, now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Get windowed aggregates for one agent.
+        
+        Args:
+            agent_type: Agent type
+            window: Window name ("1m", "1h" or "24h" by default)
+            now: Evaluation timestamp
+        
+        Returns:
+            Counts, success rate and mean/p50/p95 of completion time and queue wait
+        """
+        return self._agent(agent_type).summary(window, self._now(now))
+    
+    def get_team_summary(self, window: str, now: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """Get windowed aggregates for every agent."""
+        timestamp = self._now(now)
+        return {agent_type: agent.summary(window, timestamp) for agent_type, agent in self.agents.items()}
+    
+    def get_bottlenecks(self) -> List[str]:
+        """Bottlenecks detected from the event stream so far."""
+        return [reason for reasons in self._bottlenecks.values() for reason in reasons]
+    
+    def get_recent_completions(self, agent_type: str) -> List[Tuple[float, float]]:
+        """Raw (timestamp, duration) completion samples, oldest first."""
+        return self._agent(agent_type).recent_completions.samples()
+    
+    def last_activity(self, agent_type: str) -> Optional[float]:
+        """Timestamp of agent's latest recorded event."""
+        return self._agent(agent_type).last_activity
+    
+    def _refresh_bottlenecks(self, now: float) -> None:
+        """Re-evaluate bottlenecks against team aggregate in bottleneck window."""
+        window = self.bottleneck_window
+        team_count = 0
+        team_total = 0.0
+        for agent in self.agents.values():
+            series = agent.completion_times[window]
+            team_count += series.count(now)
+            team_total += series.total(now)
+        team_mean = team_total / team_count if team_count else 0.0
+        
+        bottlenecks: Dict[str, List[str]] = {}
+        for agent_type, agent in self.agents.items():
+            reasons = []
+            completions = agent.completion_times[window]
+            completed = completions.count(now)
+            failed = agent.failures[window].count(now)
+            
+            if completed >= self.min_samples and team_mean > 0 and \
+               completions.mean(now) > team_mean * self.slow_factor:
+                reasons.append(f"{agent_type} taking longer than average")
+            
+            attempts = completed + failed
+            if attempts >= self.min_samples and completed / attempts < self.min_success_rate:
+                reasons.append(f"{agent_type} has low success rate")
+            
+            if reasons:
+                bottlenecks[agent_type] = reasons
+        
+        newly_detected = set(bottlenecks) - set(self._bottlenecks)
+        if newly_detected:
+            self.logger.warning(f"Bottlenecks detected: {', '.join(sorted(newly_detected))}")
+        self._bottlenecks = bottlenecks
+    
+    def _agent(self, agent_type: str) -> AgentRollingMetrics:
+        agent = self.agents.get(agent_type)
+        if agent is None:
+            agent = AgentRollingMetrics(agent_type, self.windows, self._sample_capacity)
+            self.agents[agent_type] = agent
+        return agent
+    
+    def _now(self, timestamp: Optional[float]) -> float:
+        return time.time() if timestamp is None else timestamp
@@ -0,0 +1,292 @@
+"""
+Schedule Simulator for Project Manager Agent.
+
+PURPOSE:
+Replays a feature queue offline against N parallel development slots and
+compares scheduling policies (plain priority vs critical-path aware) on
+makespan and delivery throughput.
+
+CRITICAL IMPORTANCE:
+- Makes the effect of a scheduling policy measurable before switching it
+- Shows how much delivery time long dependency chains cost
+- Keeps priority classes visible in the comparison
+
+REVENUE IMPACT:
+Direct impact on revenue through:
+- More features delivered per week with the same team
+- Data-driven choice of queue scheduling policy
+"""
+
+import heapq
+import logging
+from typing import Dict, Any, List, Optional, Set
+from dataclasses import dataclass, field
+
+from .priority_queue_manager import (
+    QueuedFeature,
+    FeatureStatus,
+    PriorityLevel,
+    SchedulingPolicy,
+    DEFAULT_PRIORITY_WEIGHTS,
+    build_selection_key
+)
+from ....shared.exceptions import BusinessLogicError
+
+
+@dataclass
+class ScheduledFeature:
+    """Simulated execution window of one feature."""
+    story_id: str
+    priority: str
+    slot: int
+    start_hour: float
+    finish_hour: float
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary format."""
+        return {
+            "story_id": self.story_id,
+            "priority": self.priority,
+            "slot": self.slot,
+            "start_hour": round(self.start_hour, 2),
+            "finish_hour": round(self.finish_hour, 2)
+        }
+
+
+@dataclass
+class ScheduleSimulationResult:
+    """Outcome of replaying a queue under one scheduling policy."""
+    policy: str
+    parallel_slots: int
+    makespan_hours: float
+    average_completion_hours: float
+    completion_hours_by_priority: Dict[str, float]
+    features_per_week: float
+    schedule: List[ScheduledFeature] = field(default_factory=list)
+    unschedulable: List[str] = field(default_factory=list)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary format."""
+        return {
+            "policy": self.policy,
+            "parallel_slots": self.parallel_slots,
+            "makespan_hours": round(self.makespan_hours, 2),
+            "average_completion_hours": round(self.average_completion_hours, 2),
+            "completion_hours_by_priority": {
+                priority: round(hours, 2)
+                for priority, hours in self.completion_hours_by_priority.items()
+            },
+            "features_per_week": round(self.features_per_week, 2),
+            "schedule": [entry.to_dict() for entry in self.schedule],
+            "unschedulable": self.unschedulable
+        }
+
+
+class ScheduleSimulator:
+    """
+    Offline discrete-event simulator for feature queue scheduling.
+    
+    Uses estimated_hours as task duration and blocking dependencies as
+    precedence constraints. Completed features count as done at hour 0,
+    in-progress features occupy slots first, and rejected features are ignored.
+    """
+    
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize schedule simulator.
+        
+        Args:
+            config: Configuration dictionary
+        """
+        self.logger = logging.getLogger(f"{__name__}.ScheduleSimulator")
+        self.config = config or {}
+        
+        # Team working hours per week, used for throughput figures
+        self.hours_per_week = self.config.get("hours_per_week", 40.0)
+    
+    def simulate(
+        self,
+        features: List[QueuedFeature],
+        policy: str,
+        parallel_slots: int,
+        priority_weights: Optional[Dict[PriorityLevel, int]] = None
+    ) -> ScheduleSimulationResult:
+        """
+        Replay queue under one scheduling policy.
+        
+        Args:
+            features: Queued features to replay
+            policy: Scheduling policy name
+            parallel_slots: Number of features that can run concurrently
+            priority_weights: Priority level to sort weight mapping
+        
+        Returns:
+            ScheduleSimulationResult with makespan and per-feature schedule
+        """
+        try:
+            scheduling_policy = SchedulingPolicy(policy)
+        except ValueError:
+            raise BusinessLogicError(
+                f"Unknown scheduling policy: {policy}",
+                business_rule="scheduling_policy_validation",
+                context={"policy": policy}
+            )
+        
+        if parallel_slots < 1:
+            raise BusinessLogicError(
+                f"Parallel slots must be at least 1: {parallel_slots}",
+                business_rule="scheduling_capacity",
+                context={"parallel_slots": parallel_slots}
+            )
+        
+        sort_key = build_selection_key(
+            scheduling_policy, features, priority_weights or DEFAULT_PRIORITY_WEIGHTS
+        )
+        
+        done: Set[str] = {f.story_id for f in features if f.status == FeatureStatus.COMPLETED}
+        waiting = [
+            f for f in features
+            if f.status not in (FeatureStatus.COMPLETED, FeatureStatus.REJECTED, FeatureStatus.IN_PROGRESS)
+        ]
+        already_running = sorted(
+            (f for f in features if f.status == FeatureStatus.IN_PROGRESS), key=sort_key
+        )
+        
+        free_slots = list(range(parallel_slots))
+        running: List[tuple] = []  # heap of (finish_hour, sequence, story_id, slot)
+        schedule: List[ScheduledFeature] = []
+        now = 0.0
+        sequence = 0
+        
+        def start(feature: QueuedFeature) -> None:
+            nonlocal sequence
+            slot = free_slots.pop(0)
+            finish = now + max(feature.estimated_hours, 0.0)
+            heapq.heappush(running, (finish, sequence, feature.story_id, slot))
+            sequence += 1
+            schedule.append(ScheduledFeature(
+                story_id=feature.story_id,
+                priority=feature.priority.value,
+                slot=slot,
+                start_hour=now,
+                finish_hour=finish
+            ))
+        
+        # In-progress work keeps its slot; overflow waits like pending work
+        for feature in already_running:
+            if free_slots:
+                start(feature)
+            else:
+                waiting.append(feature)
+        
+        while True:
+            if free_slots and waiting:
+                ready = [
+                    f for f in waiting
+                    if all(dep.dependency_story_id in done for dep in f.dependencies if dep.is_blocking)
+                ]
+                ready.sort(key=sort_key)
+                for feature in ready[:len(free_slots)]:
+                    waiting.remove(feature)
+                    start(feature)
+            
+            if not running:
+                break
+            
+            # Advance to next completion and release every slot finishing then
+            now, _, story_id, slot = heapq.heappop(running)
+            done.add(story_id)
+            free_slots.append(slot)
+            while running and running[0][0] == now:
+                _, _, story_id, slot = heapq.heappop(running)
+                done.add(story_id)
+                free_slots.append(slot)
+            free_slots.sort()
+        
+        return self._build_result(scheduling_policy, parallel_slots, schedule, waiting)
+    
+    def compare_policies(
+        self,
+        features: List[QueuedFeature],
+        parallel_slots: int,
+        policies: Optional[List[str]] = None,
+        priority_weights: Optional[Dict[PriorityLevel, int]] = None
+    ) -> Dict[str, Any]:
+        """
+        Replay queue under several policies and compare outcomes.
+        
+        Args:
+            features: Queued features to replay
+            parallel_slots: Number of features that can run concurrently
+            policies: Policy names to compare (defaults to all)
+            priority_weights: Priority level to sort weight mapping
+        
+        Returns:
+            Comparison dictionary with per-policy results and best policy
+        """
+        policy_names = policies or [policy.value for policy in SchedulingPolicy]
+        
+        results = {
+            name: self.simulate(features, name, parallel_slots, priority_weights)
+            for name in policy_names
+        }
+        
+        best_policy = min(
+            results.values(),
+            key=lambda r: (len(r.unschedulable), r.makespan_hours, r.average_completion_hours)
+        ).policy
+        
+        baseline = results.get(SchedulingPolicy.PRIORITY.value)
+        makespan_reduction = {}
+        if baseline and baseline.makespan_hours > 0:
+            for name, result in results.items():
+                reduction = (baseline.makespan_hours - result.makespan_hours) / baseline.makespan_hours
+                makespan_reduction[name] = round(reduction * 100, 2)
+        
+        self.logger.info(
+            f"Compared {len(results)} scheduling policies over {len(features)} features "
+            f"with {parallel_slots} slots, best: {best_policy}"
+        )
+        
+        return {
+            "parallel_slots": parallel_slots,
+            "feature_count": len(features),
+            "results": {name: result.to_dict() for name, result in results.items()},
+            "best_policy": best_policy,
+            "makespan_reduction_percent": makespan_reduction
+        }
+    
+    def _build_result(
+        self,
+        policy: SchedulingPolicy,
+        parallel_slots: int,
+        schedule: List[ScheduledFeature],
+        unschedulable: List[QueuedFeature]
+    ) -> ScheduleSimulationResult:
+        """Summarize simulated schedule."""
+        
+        makespan = max((entry.finish_hour for entry in schedule), default=0.0)
+        average_completion = (
+            sum(entry.finish_hour for entry in schedule) / len(schedule) if schedule else 0.0
+        )
+        
+        by_priority: Dict[str, List[float]] = {}
+        for entry in schedule:
+            by_priority.setdefault(entry.priority, []).append(entry.finish_hour)
+        
+        features_per_week = 0.0
+        if makespan > 0:
+            features_per_week = len(schedule) / makespan * self.hours_per_week
+        
+        return ScheduleSimulationResult(
+            policy=policy.value,
+            parallel_slots=parallel_slots,
+            makespan_hours=makespan,
+            average_completion_hours=average_completion,
+            completion_hours_by_priority={
+                priority: sum(hours) / len(hours) for priority, hours in by_priority.items()
+            },
+            features_per_week=features_per_week,
+            schedule=schedule,
+            unschedulable=[f.story_id for f in unschedulable]
+        )
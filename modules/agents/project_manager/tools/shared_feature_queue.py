@@ -0,0 +1,672 @@
+"""
+Shared Feature Queue for Project Manager Agent.
+
+PURPOSE:
+SQLite-backed (WAL) feature queue that several Project Manager worker
+processes can share. Workers atomically claim the next available feature
+with a single transactional UPDATE, hold it under a renewable lease and
+are woken by change notifications instead of spin-polling.
+
+CRITICAL IMPORTANCE:
+- Lets several PM workers drain one backlog without double-claiming
+- Recovers features from crashed workers through lease expiry
+- Keeps dependency and priority rules identical to PriorityQueueManager
+
+REVENUE IMPACT:
+Direct impact on revenue through:
+- Throughput that scales with number of worker processes
+- No lost features when a worker crashes mid-development
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import socket
+import sqlite3
+import tempfile
+import time
+import uuid
+from typing import Dict, Any, List, Optional
+from datetime import datetime
+from pathlib import Path
+
+from .priority_queue_manager import (
+    QueuedFeature,
+    FeatureDependency,
+    FeatureStatus,
+    PriorityLevel,
+    DEFAULT_PRIORITY_WEIGHTS
+)
+from ....shared.exceptions import BusinessLogicError, QueueManagementError
+
+
+# A feature is claimable when it is pending - or in progress with an expired
+# lease - and every blocking dependency exists and is completed. The leading
+# status IN term matches the partial index so claims walk open features only,
+# already in priority order.
+_CLAIMABLE_CONDITION = """
+    f.status IN ('pending', 'in_progress')
+    AND (f.status = 'pending' OR f.lease_expires_at < :now)
+    AND NOT EXISTS (
+        SELECT 1 FROM feature_dependencies d
+        WHERE d.dependent_story_id = f.story_id
+          AND d.is_blocking = 1
+          AND NOT EXISTS (
+              SELECT 1 FROM features g
+              WHERE g.story_id = d.dependency_story_id AND g.status = 'completed'
+          )
+    )
+"""
+
+# Highest priority claimable feature, optionally restricted to :story_id
+_NEXT_CLAIMABLE = f"""
+    FROM features f
+    WHERE {_CLAIMABLE_CONDITION}
+      AND (:story_id IS NULL OR f.story_id = :story_id)
+    ORDER BY f.priority_weight, f.created_at, f.rowid
+    LIMIT 1
+"""
+
+
+class QueueChangeNotifier:
+    """
+    Cross-process wake-up notifications for queue changes.
+    
+    Each waiting worker binds a Unix datagram socket in a shared directory;
+    writers send one byte to every socket after committing a change. On
+    platforms without AF_UNIX, waiters fall back to retrying every
+    poll_interval seconds.
+    """
+    
+    def __init__(self, notify_dir: Path, poll_interval: float = 0.5):
+        """
+        Initialize notifier.
+        
+        Args:
+            notify_dir: Directory holding waiter sockets
+            poll_interval: Fallback polling interval in seconds
+        """
+        self.logger = logging.getLogger(f"{__name__}.QueueChangeNotifier")
+        self.notify_dir = notify_dir
+        self.poll_interval = poll_interval
+        self.supported = hasattr(socket, "AF_UNIX")
+        self._socket: Optional[socket.socket] = None
+        self._socket_path: Optional[Path] = None
+        
+        if self.supported:
+            self.notify_dir.mkdir(parents=True, exist_ok=True)
+    
+    def publish(self) -> int:
+        """
+        Wake every waiting worker.
+        
+        Returns:
+            Number of waiters notified
+        """
+        if not self.supported:
+            return 0
+        
+        notified = 0
+        sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sender.setblocking(False)
+        try:
+            for path in self.notify_dir.glob("*.sock"):
+                if path == self._socket_path:
+                    continue
+                try:
+                    sender.sendto(b"1", str(path))
+                    notified += 1
+                except (ConnectionRefusedError, FileNotFoundError):
+                    # Waiter process is gone - remove its stale socket
+                    path.unlink(missing_ok=True)
+                except BlockingIOError:
+                    # Waiter already has pending notifications
+                    notified += 1
+        finally:
+            sender.close()
+        
+        return notified
+    
+    async def wait(self, timeout: float) -> bool:
+        """
+        Wait until another process publishes a change.
+        
+        Args:
+            timeout: Maximum seconds to wait
+        
+        Returns:
+            True if notified, False on timeout
+        """
+        if not self.supported:
+            await asyncio.sleep(min(timeout, self.poll_interval))
+            return False
+        
+        try:
+            receiver = self._get_socket()
+        except OSError as e:
+            # e.g. socket path longer than AF_UNIX limit - degrade to polling
+            self.logger.warning(f"Change notifications unavailable, polling instead: {e}")
+            self.supported = False
+            await asyncio.sleep(min(timeout, self.poll_interval))
+            return False
+        
+        loop = asyncio.get_running_loop()
+        try:
+            await asyncio.wait_for(loop.sock_recv(receiver, 64), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        
+        # Coalesce burst of notifications into one wake-up
+        while True:
+            try:
+                receiver.recv(64)
+            except BlockingIOError:
+                break
+        return True
+    
+    def close(self) -> None:
+        """Unbind waiter socket."""
+        if self._socket:
+            self._socket.close()
+            self._socket = None
+        if self._socket_path:
+            self._socket_path.unlink(missing_ok=True)
+            self._socket_path = None
+    
+    def _get_socket(self) -> socket.socket:
+        """Bind waiter socket lazily on first wait."""
+        if self._socket is None:
+            self._socket_path = self.notify_dir / f"{os.getpid()}-{uuid.uuid4().hex[:8]}.sock"
+            receiver = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            try:
+                receiver.bind(str(self._socket_path))
+            except OSError:
+                receiver.close()
+                self._socket_path = None
+                raise
+            receiver.setblocking(False)
+            self._socket = receiver
+        return self._socket
+
+
+class SharedFeatureQueue:
+    """
+    Multi-process feature queue stored in SQLite (WAL mode).
+    
+    Each instance owns one connection; create one instance per worker
+    process. Claims, completions and releases are single UPDATE statements,
+    so SQLite's write lock makes them atomic across processes.
+    """
+    
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize shared feature queue.
+        
+        Args:
+            config: Configuration dictionary
+        """
+        self.logger = logging.getLogger(f"{__name__}.SharedFeatureQueue")
+        self.config = config or {}
+        
+        self.db_path = self._get_database_path()
+        self.lease_seconds = self.config.get("lease_seconds", 900.0)
+        self.busy_timeout_ms = self.config.get("busy_timeout_ms", 5000)
+        self.priority_weights = dict(DEFAULT_PRIORITY_WEIGHTS)
+        
+        self._conn = self._connect()
+        self._initialize_database()
+        
+        self.notifier = QueueChangeNotifier(
+            self._get_notify_dir(),
+            poll_interval=self.config.get("notification_poll_interval", 0.5)
+        )
+        
+        self.logger.info(f"Shared feature queue initialized at {self.db_path}")
+    
+    async def add_feature_to_queue(
+        self,
+        story_id: str,
+        title: str,
+        description: str,
+        priority: str,
+        acceptance_criteria: List[str],
+        estimated_hours: float = 40.0,
+        dependencies: Optional[List[Dict[str, Any]]] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> QueuedFeature:
+        """
+        Add new feature to shared queue.
+        
+        Args:
+            story_id: Unique story identifier
+            title: Feature title
+            description: Feature description
+            priority: Priority level (critical, high, medium, low)
+            acceptance_criteria: List of acceptance criteria
+            estimated_hours: Estimated development hours
+            dependencies: List of dependency specifications
+            metadata: Additional feature metadata
+        
+        Returns:
+            Created QueuedFeature instance
+        """
+        try:
+            priority_enum = PriorityLevel(priority.lower())
+        except ValueError:
+            raise BusinessLogicError(
+                f"Invalid priority level: {priority}",
+                business_rule="priority_validation",
+                context={"story_id": story_id, "priority": priority}
+            )
+        
+        created = time.time()
+        try:
+            with self._conn:
+                self._conn.execute(
+                    """
+                    INSERT INTO features
+                    (story_id, title, description, priority, priority_weight, status,
+                     created_at, estimated_hours, acceptance_criteria, metadata)
+                    VALUES (?, ?, ?, ?, ?, 'pending', ?, ?, ?, ?)
+                    """,
+                    (
+                        story_id, title, description, priority_enum.value,
+                        self.priority_weights[priority_enum], created, estimated_hours,
+                        json.dumps(acceptance_criteria), json.dumps(metadata or {})
+                    )
+                )
+                self._conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO feature_dependencies
+                    (dependent_story_id, dependency_story_id, dependency_type, is_blocking)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    [
+                        (
+                            story_id,
+                            dep["dependency_story_id"],
+                            dep.get("dependency_type", "blocks"),
+                            1 if dep.get("is_blocking", True) else 0
+                        )
+                        for dep in dependencies or []
+                    ]
+                )
+        except sqlite3.IntegrityError:
+            raise BusinessLogicError(
+                f"Feature already in queue: {story_id}",
+                business_rule="queue_management",
+                context={"story_id": story_id}
+            )
+        
+        self.notifier.publish()
+        self.logger.info(f"Added feature {story_id} to shared queue with priority {priority}")
+        return await self.get_feature(story_id)
+    
+    async def claim_next_feature(
+        self,
+        worker_id: str,
+        story_id: Optional[str] = None
+    ) -> Optional[QueuedFeature]:
+        """
+        Atomically claim highest priority available feature.
+        
+        Pending features and in-progress features whose lease expired are
+        claimable; the claim is one UPDATE so concurrent workers never receive
+        the same feature. Every claim gets a fresh token, returned in
+        metadata["claim_token"]; lease renewal, completion and release require
+        it, so a worker's stale earlier claim can never act on a re-claim.
+        
+        Args:
+            worker_id: Identifier of claiming worker
+            story_id: Claim this feature only (if available)
+        
+        Returns:
+            Claimed feature or None if nothing is available
+        """
+        now = time.time()
+        claim_token = uuid.uuid4().hex
+        
+        try:
+            with self._conn:
+                cursor = self._conn.execute(
+                    f"""
+                    UPDATE features
+                    SET status = 'in_progress',
+                        assigned_agent = :worker_id,
+                        claim_token = :claim_token,
+                        lease_expires_at = :lease_expires_at,
+                        started_at = :now,
+                        attempts = attempts + 1
+                    WHERE story_id = (SELECT f.story_id {_NEXT_CLAIMABLE})
+                    """,
+                    {
+                        "worker_id": worker_id,
+                        "claim_token": claim_token,
+                        "lease_expires_at": now + self.lease_seconds,
+                        "now": now,
+                        "story_id": story_id
+                    }
+                )
+        except sqlite3.OperationalError as e:
+            raise QueueManagementError(
+                f"Failed to claim feature: {e}", queue_operation="claim"
+            )
+        
+        if cursor.rowcount == 0:
+            return None
+        
+        row = self._conn.execute(
+            "SELECT * FROM features WHERE claim_token = ?", (claim_token,)
+        ).fetchone()
+        feature = self._row_to_feature(row)
+        feature.metadata["claim_token"] = claim_token
+        
+        self.logger.info(f"Worker {worker_id} claimed feature {feature.story_id}")
+        return feature
+    
+    async def wait_for_next_feature(
+        self,
+        worker_id: str,
+        timeout: float = 60.0
+    ) -> Optional[QueuedFeature]:
+        """
+        Claim next feature, sleeping on change notifications until one is available.
+        
+        Wake-ups come from other processes' commits or from the next lease
+        expiry, whichever is sooner.
+        
+        Args:
+            worker_id: Identifier of claiming worker
+            timeout: Maximum seconds to wait
+        
+        Returns:
+            Claimed feature or None on timeout
+        """
+        deadline = time.monotonic() + timeout
+        
+        while True:
+            feature = await self.claim_next_feature(worker_id)
+            if feature:
+                return feature
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            
+            next_expiry = self._seconds_until_next_lease_expiry()
+            if next_expiry is not None:
+                remaining = min(remaining, max(next_expiry, 0.0) + 0.01)
+            
+            await self.notifier.wait(remaining)
+    
+    async def peek_next_feature(self, story_id: Optional[str] = None) -> Optional[QueuedFeature]:
+        """
+        Get feature the next claim would return, without claiming it.
+        
+        Advisory only - another worker may claim it before this worker does.
+        
+        Args:
+            story_id: Only consider this feature
+        
+        Returns:
+            Next available feature or None
+        """
+        row = self._conn.execute(
+            f"SELECT f.* {_NEXT_CLAIMABLE}", {"now": time.time(), "story_id": story_id}
+        ).fetchone()
+        return self._row_to_feature(row) if row else None
+    
+    async def renew_lease(self, story_id: str, claim_token: str) -> bool:
+        """
+        Extend lease on a claimed feature.
+        
+        Args:
+            story_id: Claimed story ID
+            claim_token: Token returned with the claim
+        
+        Returns:
+            True if lease was renewed, False if claim was lost
+        """
+        with self._conn:
+            cursor = self._conn.execute(
+                """
+                UPDATE features SET lease_expires_at = ?
+                WHERE story_id = ? AND claim_token = ? AND status = 'in_progress'
+                """,
+                (time.time() + self.lease_seconds, story_id, claim_token)
+            )
+        return cursor.rowcount == 1
+    
+    async def complete_feature(self, story_id: str, claim_token: str) -> bool:
+        """
+        Mark claimed feature as completed.
+        
+        Args:
+            story_id: Claimed story ID
+            claim_token: Token returned with the claim
+        
+        Returns:
+            True if completed, False if the claim is no longer held
+        """
+        with self._conn:
+            cursor = self._conn.execute(
+                """
+                UPDATE features
+                SET status = 'completed', completed_at = ?, lease_expires_at = NULL
+                WHERE story_id = ? AND claim_token = ? AND status = 'in_progress'
+                """,
+                (time.time(), story_id, claim_token)
+            )
+        
+        if cursor.rowcount == 0:
+            self.logger.warning(f"Stale or unknown claim on {story_id}, completion rejected")
+            return False
+        
+        # Completion may unblock dependents waiting in other processes
+        self.notifier.publish()
+        self.logger.info(f"Completed feature {story_id}")
+        return True
+    
+    async def release_feature(self, story_id: str, claim_token: str) -> bool:
+        """
+        Return claimed feature to pending so another worker can take it.
+        
+        Args:
+            story_id: Claimed story ID
+            claim_token: Token returned with the claim
+        
+        Returns:
+            True if released, False if the claim is no longer held
+        """
+        with self._conn:
+            cursor = self._conn.execute(
+                """
+                UPDATE features
+                SET status = 'pending', assigned_agent = NULL, claim_token = NULL,
+                    lease_expires_at = NULL, started_at = NULL
+                WHERE story_id = ? AND claim_token = ? AND status = 'in_progress'
+                """,
+                (story_id, claim_token)
+            )
+        
+        if cursor.rowcount == 0:
+            return False
+        
+        self.notifier.publish()
+        self.logger.info(f"Released feature {story_id}")
+        return True
+    
+    async def get_feature(self, story_id: str) -> Optional[QueuedFeature]:
+        """
+        Get feature by story ID.
+        
+        Args:
+            story_id: Story ID to look up
+        
+        Returns:
+            Feature or None if not found
+        """
+        row = self._conn.execute(
+            "SELECT * FROM features WHERE story_id = ?", (story_id,)
+        ).fetchone()
+        return self._row_to_feature(row) if row else None
+    
+    async def get_queue_status(self) -> Dict[str, Any]:
+        """
+        Get current shared queue status.
+        
+        Returns:
+            Queue status dictionary
+        """
+        now = time.time()
+        status_counts = {
+            row["status"]: row["count"]
+            for row in self._conn.execute(
+                "SELECT status, COUNT(*) AS count FROM features GROUP BY status"
+            )
+        }
+        priority_counts = {
+            row["priority"]: row["count"]
+            for row in self._conn.execute(
+                "SELECT priority, COUNT(*) AS count FROM features GROUP BY priority"
+            )
+        }
+        expired_leases = self._conn.execute(
+            "SELECT COUNT(*) FROM features WHERE status = 'in_progress' AND lease_expires_at < ?",
+            (now,)
+        ).fetchone()[0]
+        available = self._conn.execute(
+            f"SELECT COUNT(*) FROM features f WHERE {_CLAIMABLE_CONDITION}", {"now": now}
+        ).fetchone()[0]
+        
+        return {
+            "total_features": sum(status_counts.values()),
+            "status_breakdown": status_counts,
+            "priority_breakdown": priority_counts,
+            "available_features_count": available,
+            "expired_leases_count": expired_leases
+        }
+    
+    def close(self) -> None:
+        """Close database connection and notification socket."""
+        self.notifier.close()
+        self._conn.close()
+    
+    def _get_database_path(self) -> str:
+        """Get database path for shared queue storage."""
+        db_dir = self.config.get('db_path', 'data/queue')
+        Path(db_dir).mkdir(parents=True, exist_ok=True)
+        return str(Path(db_dir) / 'feature_queue.db')
+    
+    def _get_notify_dir(self) -> Path:
+        """Get directory for waiter sockets, keyed by database location."""
+        if self.config.get("notify_dir"):
+            return Path(self.config["notify_dir"])
+        # Kept short and outside db_path: AF_UNIX socket paths are limited to ~100 bytes
+        db_key = hashlib.sha1(str(Path(self.db_path).resolve()).encode()).hexdigest()[:12]
+        return Path(tempfile.gettempdir()) / f"devteam-queue-{db_key}"
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open WAL-mode connection tuned for short write transactions."""
+        conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout_ms / 1000)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+        return conn
+    
+    def _initialize_database(self) -> None:
+        """Initialize SQLite schema for shared queue."""
+        try:
+            with self._conn:
+                self._conn.execute('''
+                    CREATE TABLE IF NOT EXISTS features (
+                        story_id TEXT PRIMARY KEY,
+                        title TEXT,
+                        description TEXT,
+                        priority TEXT,
+                        priority_weight INTEGER,
+                        status TEXT,
+                        created_at REAL,
+                        estimated_hours REAL,
+                        acceptance_criteria TEXT,
+                        metadata TEXT,
+                        assigned_agent TEXT,
+                        claim_token TEXT,
+                        lease_expires_at REAL,
+                        started_at REAL,
+                        completed_at REAL,
+                        attempts INTEGER DEFAULT 0
+                    )
+                ''')
+                
+                self._conn.execute('''
+                    CREATE TABLE IF NOT EXISTS feature_dependencies (
+                        dependent_story_id TEXT,
+                        dependency_story_id TEXT,
+                        dependency_type TEXT,
+                        is_blocking INTEGER,
+                        PRIMARY KEY (dependent_story_id, dependency_story_id)
+                    )
+                ''')
+                
+                self._conn.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_features_claim_order
+                    ON features (priority_weight, created_at)
+                    WHERE status IN ('pending', 'in_progress')
+                ''')
+                self._conn.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_features_claim_token
+                    ON features (claim_token)
+                ''')
+        
+        except Exception as e:
+            self.logger.error(f"Failed to initialize database: {e}")
+            raise
+    
+    def _seconds_until_next_lease_expiry(self) -> Optional[float]:
+        """Seconds until the earliest active lease expires."""
+        row = self._conn.execute(
+            "SELECT MIN(lease_expires_at) FROM features WHERE status = 'in_progress'"
+        ).fetchone()
+        if row[0] is None:
+            return None
+        return row[0] - time.time()
+    
+    def _row_to_feature(self, row: sqlite3.Row) -> QueuedFeature:
+        """Convert database row to QueuedFeature."""
+        dependencies = [
+            FeatureDependency(
+                dependent_story_id=dep["dependent_story_id"],
+                dependency_story_id=dep["dependency_story_id"],
+                dependency_type=dep["dependency_type"],
+                is_blocking=bool(dep["is_blocking"])
+            )
+            for dep in self._conn.execute(
+                "SELECT * FROM feature_dependencies WHERE dependent_story_id = ?",
+                (row["story_id"],)
+            )
+        ]
+        
+        metadata = json.loads(row["metadata"]) if row["metadata"] else {}
+        metadata["claim_attempts"] = row["attempts"]
+        if row["lease_expires_at"] is not None:
+            metadata["lease_expires_at"] = datetime.fromtimestamp(row["lease_expires_at"]).isoformat()
+        
+        return QueuedFeature(
+            story_id=row["story_id"],
+            title=row["title"],
+            description=row["description"],
+            priority=PriorityLevel(row["priority"]),
+            status=FeatureStatus(row["status"]),
+            created_at=datetime.fromtimestamp(row["created_at"]),
+            estimated_hours=row["estimated_hours"],
+            acceptance_criteria=json.loads(row["acceptance_criteria"]) if row["acceptance_criteria"] else [],
+            dependencies=dependencies,
+            assigned_agent=row["assigned_agent"],
+            started_at=datetime.fromtimestamp(row["started_at"]) if row["started_at"] else None,
+            completed_at=datetime.fromtimestamp(row["completed_at"]) if row["completed_at"] else None,
+            metadata=metadata
+        )
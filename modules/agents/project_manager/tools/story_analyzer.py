@@ -25,6 +25,7 @@ from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 import re
 
+from .keyword_automaton import KeywordScanResult, scan_story_text
 from ....shared.exceptions import BusinessLogicError, AgentExecutionError
 
 
@@ -351,11 +352,14 @@ class StoryAnalyzer:
         """Analyze technical requirements for the feature."""
         description = feature_data["feature_description"].lower()
         
+        # One keyword pass shared with DNA compliance analysis of same description
+        keywords = scan_story_text(description)
+        
         # Identify required technologies and components
-        frontend_requirements = self._identify_frontend_requirements(description)
-        backend_requirements = self._identify_backend_requirements(description)
-        database_requirements = self._identify_database_requirements(description)
-        integration_requirements = self._identify_integration_requirements(description)
+        frontend_requirements = self._identify_frontend_requirements(keywords)
+        backend_requirements = self._identify_backend_requirements(keywords)
+        database_requirements = self._identify_database_requirements(keywords)
+        integration_requirements = self._identify_integration_requirements(keywords)
         
         return {
             "frontend": frontend_requirements,
@@ -671,35 +675,39 @@ class StoryAnalyzer:
         ]
     
     # Simplified implementations for technical analysis
-    def _identify_frontend_requirements(self, description: str) -> Dict[str, Any]:
+    def _identify_frontend_requirements(self, keywords: KeywordScanResult) -> Dict[str, Any]:
         """Identify frontend requirements."""
         return {
             "required_components": ["form", "button", "layout"],
             "animations": [],
-            "responsive_design": True
+            "responsive_design": True,
+            "detected_keywords": keywords.matched("story_analyzer.frontend")
         }
     
-    def _identify_backend_requirements(self, description: str) -> Dict[str, Any]:
+    def _identify_backend_requirements(self, keywords: KeywordScanResult) -> Dict[str, Any]:
         """Identify backend requirements."""
         return {
             "api_endpoints": ["/api/feature"],
             "business_logic": ["validation", "processing"],
-            "data_models": ["FeatureModel"]
+            "data_models": ["FeatureModel"],
+            "detected_keywords": keywords.matched("story_analyzer.backend")
         }
     
-    def _identify_database_requirements(self, description: str) -> Dict[str, Any]:
+    def _identify_database_requirements(self, keywords: KeywordScanResult) -> Dict[str, Any]:
         """Identify database requirements."""
         return {
             "new_tables": [],
             "schema_changes": [],
-            "migrations": []
+            "migrations": [],
+            "detected_keywords": keywords.matched("story_analyzer.database")
         }
     
-    def _identify_integration_requirements(self, description: str) -> Dict[str, Any]:
+    def _identify_integration_requirements(self, keywords: KeywordScanResult) -> Dict[str, Any]:
         """Identify integration requirements."""
         return {
             "external_apis": [],
-            "internal_services": []
+            "internal_services": [],
+            "detected_keywords": keywords.matched("story_analyzer.integration")
         }
     
     # More simplified implementations for other required methods
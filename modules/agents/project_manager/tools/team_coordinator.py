@@ -26,6 +26,7 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+from .rolling_metrics import RollingMetricsStore
 from ....shared.event_bus import EventBus, WorkItem, WorkStatus
 from ....shared.exceptions import BusinessLogicError, AgentExecutionError
 
@@ -117,6 +118,9 @@ class TeamCoordinator:
         self.team_performance_history = []
         self.performance_alerts = []
         
+        # EventBus work items whose outcome is not yet in rolling metrics
+        self.delegated_work: Dict[str, Dict[str, Any]] = {}
+        
         # Initialize EventBus connection (after agent_sequence is defined)
         self.event_bus = None
         self._initialize_event_bus()
@@ -129,6 +133,15 @@ class TeamCoordinator:
             'min_team_utilization': 0.7
         }
         
+        # Fixed-memory windowed history fed by work events
+        self.rolling_metrics = RollingMetricsStore(
+            self.agent_sequence,
+            {
+                'min_success_rate': self.performance_thresholds['min_success_rate'],
+                **self.config.get('rolling_metrics', {})
+            }
+        )
+        
         self.logger.info("Team Coordinator initialized successfully")
     
     def _initialize_event_bus(self) -> None:
@@ -147,13 +160,36 @@ class TeamCoordinator:
             return
             
         # Note: EventBus API uses register_agent/delegate_to_agent pattern
-        # Team coordination happens through work delegation rather than event subscription
-        # This is handled in coordinate_team_workflow method using delegate_to_agent
+        # Team coordination happens through work delegation rather than event subscription:
+        # delegated work outcomes are read back from EventBus work status
+        # (_sync_delegated_work) and PM team events arrive via record_work_event
+    
+    async def record_work_event(self, event_type: str, event_data: Dict[str, Any]) -> bool:
+        """
+        Record agent work lifecycle event in rolling metrics.
+        
+        Args:
+            event_type: Event type ending in work_started, work_completed or work_failed
+            event_data: Event payload with agent_type, story_id and timings
+        
+        Returns:
+            True if event was recorded, False if event type is not a work event
+        """
+        if event_type.endswith("work_started"):
+            await self._handle_agent_work_started(event_data)
+        elif event_type.endswith("work_completed"):
+            await self._handle_agent_work_completed(event_data)
+        elif event_type.endswith("work_failed"):
+            await self._handle_agent_work_failed(event_data)
+        else:
+            return False
+        return True
     
     async def coordinate_team_workflow(
         self,
         story_id: str,
-        initial_work_item: Dict[str, Any]
+        initial_work_item: Dict[str, Any],
+        processing_time: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Coordinate workflow across the entire team for a story.
@@ -161,6 +197,7 @@ class TeamCoordinator:
         Args:
             story_id: Story identifier
             initial_work_item: Initial work item from PM analysis
+            processing_time: Seconds the PM spent producing the work item
             
         Returns:
             Team workflow coordination result
@@ -168,6 +205,13 @@ class TeamCoordinator:
         try:
             self.logger.info(f"Coordinating team workflow for story: {story_id}")
             
+            if processing_time is not None:
+                await self._handle_agent_work_completed({
+                    'agent_type': 'project_manager',
+                    'story_id': story_id,
+                    'completion_time': processing_time
+                })
+            
             # Create workflow coordination context
             workflow_context = {
                 'story_id': story_id,
@@ -222,32 +266,7 @@ class TeamCoordinator:
         try:
             self.logger.debug("Monitoring team performance")
             
-            # Collect current agent metrics
-            agent_metrics = await self._collect_agent_metrics()
-            
-            # Calculate team-level metrics
-            team_metrics = self._calculate_team_metrics(agent_metrics)
-            
-            # Identify bottlenecks and issues
-            bottlenecks = self._identify_bottlenecks(agent_metrics, team_metrics)
-            
-            # Generate performance recommendations
-            recommendations = self._generate_performance_recommendations(
-                agent_metrics, team_metrics, bottlenecks
-            )
-            
-            # Create performance snapshot
-            snapshot = TeamPerformanceSnapshot(
-                timestamp=datetime.now(),
-                active_agents=len([m for m in agent_metrics if m.current_status == 'active']),
-                total_work_items=sum(m.work_items_completed for m in agent_metrics),
-                completed_work_items=sum(m.work_items_completed for m in agent_metrics),
-                failed_work_items=0,  # Simplified for now
-                average_completion_time=team_metrics.get('avg_completion_time', 0.0),
-                team_utilization=team_metrics.get('utilization', 0.0),
-                bottlenecks=bottlenecks,
-                recommendations=recommendations
-            )
+            snapshot = await self._build_performance_snapshot()
             
             # Store in performance history
             self.team_performance_history.append(snapshot)
@@ -334,8 +353,8 @@ class TeamCoordinator:
             Team status dashboard with all key metrics
         """
         try:
-            # Get current performance snapshot
-            performance = await self.monitor_team_performance()
+            # Read current performance from rolling metrics (no history/alert side effects)
+            performance = await self._build_performance_snapshot()
             
             # Get agent-specific status
             agent_status = await self._get_agent_status_summary()
@@ -380,6 +399,8 @@ class TeamCoordinator:
             
             self.logger.debug(f"Agent {agent_type} completed work for {story_id} in {completion_time}s")
             
+            self.rolling_metrics.record_completion(agent_type, completion_time, event_data.get('timestamp'))
+            
             # Update agent metrics
             await self._update_agent_metrics(agent_type, {
                 'work_completed': True,
@@ -402,6 +423,8 @@ class TeamCoordinator:
             
             self.logger.warning(f"Agent {agent_type} failed work for {story_id}: {error_info}")
             
+            self.rolling_metrics.record_failure(agent_type, event_data.get('timestamp'))
+            
             # Update agent metrics
             await self._update_agent_metrics(agent_type, {
                 'work_failed': True,
@@ -415,6 +438,23 @@ class TeamCoordinator:
         except Exception as e:
             self.logger.error(f"Failed to handle work failure event: {e}")
     
+    async def _handle_agent_work_started(self, event_data: Dict[str, Any]) -> None:
+        """Handle agent work start events."""
+        try:
+            agent_type = event_data.get('agent_type')
+            queue_wait_time = event_data.get('queue_wait_time')
+            
+            if queue_wait_time is not None:
+                self.rolling_metrics.record_queue_wait(agent_type, queue_wait_time, event_data.get('timestamp'))
+            
+            await self._update_agent_metrics(agent_type, {
+                'status': 'busy',
+                'last_activity': datetime.now()
+            })
+        
+        except Exception as e:
+            self.logger.error(f"Failed to handle work start event: {e}")
+    
     async def _handle_agent_status_changed(self, event_data: Dict[str, Any]) -> None:
         """Handle agent status change events."""
         try:
@@ -460,6 +500,12 @@ class TeamCoordinator:
             
             # Delegate via EventBus using correct API
             work_id = await self.event_bus.delegate_to_agent(next_agent, work_contract)
+            if work_id:
+                self.delegated_work[work_id] = {
+                    'story_id': workflow_context['story_id'],
+                    'agent_type': next_agent,
+                    'started_recorded': False
+                }
             
             return {
                 'status': 'delegated' if work_id else 'delegation_failed',
@@ -471,6 +517,43 @@ class TeamCoordinator:
             self.logger.error(f"Delegation failed: {e}")
             return {'status': 'delegation_error', 'error': str(e)}
     
+    async def _sync_delegated_work(self) -> None:
+        """Feed rolling metrics with progress of delegated EventBus work items."""
+        if not self.event_bus:
+            return
+        
+        for work_id, tracked in list(self.delegated_work.items()):
+            work = await self.event_bus.get_work_status(work_id)
+            if work is None:
+                del self.delegated_work[work_id]
+                continue
+            
+            created = datetime.fromisoformat(work['created_at']).timestamp()
+            started = datetime.fromisoformat(work['started_at']).timestamp() if work['started_at'] else None
+            event_data = {'agent_type': tracked['agent_type'], 'story_id': tracked['story_id']}
+            
+            if started is not None and not tracked['started_recorded']:
+                await self._handle_agent_work_started({
+                    **event_data, 'queue_wait_time': started - created, 'timestamp': started
+                })
+                tracked['started_recorded'] = True
+            
+            if work['status'] not in ('completed', 'failed', 'cancelled'):
+                continue
+            
+            del self.delegated_work[work_id]
+            finished = datetime.fromisoformat(work['completed_at']).timestamp() if work['completed_at'] else None
+            if work['status'] == 'completed':
+                await self._handle_agent_work_completed({
+                    **event_data,
+                    'completion_time': (finished or created) - (started or created),
+                    'timestamp': finished
+                })
+            elif work['status'] == 'failed':
+                await self._handle_agent_work_failed({
+                    **event_data, 'error_info': {'error_message': work['error_message']}, 'timestamp': finished
+                })
+    
     async def _track_workflow_performance(self, workflow_context: Dict[str, Any]) -> None:
         """Track performance metrics for workflow."""
         pass  # Implementation would track timing and success metrics
@@ -486,21 +569,60 @@ class TeamCoordinator:
         
         return completion_time.isoformat()
     
+    async def _build_performance_snapshot(self) -> TeamPerformanceSnapshot:
+        """Build team performance snapshot from rolling metrics."""
+        await self._sync_delegated_work()
+        
+        # Collect current agent metrics
+        agent_metrics = await self._collect_agent_metrics()
+        
+        # Calculate team-level metrics
+        team_metrics = self._calculate_team_metrics(agent_metrics)
+        
+        # Identify bottlenecks and issues
+        bottlenecks = self._identify_bottlenecks(agent_metrics, team_metrics)
+        
+        # Generate performance recommendations
+        recommendations = self._generate_performance_recommendations(
+            agent_metrics, team_metrics, bottlenecks
+        )
+        
+        completed = sum(m.work_items_completed for m in agent_metrics)
+        failed = sum(
+            summary['failed'] for summary in self.rolling_metrics.get_team_summary('24h').values()
+        )
+        
+        return TeamPerformanceSnapshot(
+            timestamp=datetime.now(),
+            active_agents=len([m for m in agent_metrics if m.current_status == 'active']),
+            total_work_items=completed + failed,
+            completed_work_items=completed,
+            failed_work_items=failed,
+            average_completion_time=team_metrics.get('avg_completion_time', 0.0),
+            team_utilization=team_metrics.get('utilization', 0.0),
+            bottlenecks=bottlenecks,
+            recommendations=recommendations
+        )
+    
     async def _collect_agent_metrics(self) -> List[AgentPerformanceMetrics]:
-        """Collect performance metrics from all agents."""
+        """Collect performance metrics from rolling 24h window of each agent."""
         metrics = []
+        team_summary = self.rolling_metrics.get_team_summary('24h')
         
         for agent_type in self.agent_sequence:
-            # Simplified metrics - would integrate with actual agent monitoring
+            summary = team_summary[agent_type]
+            agent_state = self.agent_metrics.get(agent_type, {})
+            last_activity = self.rolling_metrics.last_activity(agent_type)
+            
             metric = AgentPerformanceMetrics(
                 agent_id=f"{agent_type}-001",
                 agent_type=agent_type,
-                work_items_completed=10,  # Placeholder
-                average_completion_time=4.0,  # Hours
-                success_rate=0.95,
-                current_status='ready',
-                last_activity=datetime.now(),
-                quality_score=4.2
+                work_items_completed=summary['completed'],
+                average_completion_time=summary['completion_time_mean'] / 3600,  # Hours
+                success_rate=summary['success_rate'],
+                current_status=agent_state.get('status', 'ready'),
+                last_activity=datetime.fromtimestamp(last_activity) if last_activity else datetime.now(),
+                quality_score=agent_state.get('quality_score', 4.2)
             )
             metrics.append(metric)
         
@@ -524,20 +646,8 @@ class TeamCoordinator:
         team_metrics: Dict[str, Any]
     ) -> List[str]:
         """Identify performance bottlenecks in the team."""
-        bottlenecks = []
-        
-        # Check for slow agents
-        avg_completion_time = team_metrics.get('avg_completion_time', 0)
-        for metric in agent_metrics:
-            if metric.average_completion_time > avg_completion_time * 1.5:
-                bottlenecks.append(f"{metric.agent_type} taking longer than average")
-        
-        # Check for low success rates
-        for metric in agent_metrics:
-            if metric.success_rate < self.performance_thresholds['min_success_rate']:
-                bottlenecks.append(f"{metric.agent_type} has low success rate")
-        
-        return bottlenecks
+        # Detected incrementally as work events are recorded
+        return self.rolling_metrics.get_bottlenecks()
     
     def _generate_performance_recommendations(
         self,
@@ -649,8 +759,43 @@ class TeamCoordinator:
         return {agent: 'ready' for agent in self.agent_sequence}
     
     def _analyze_performance_trends(self) -> Dict[str, Any]:
-        """Analyze performance trends from history."""
-        return {'trend': 'stable', 'improvement_rate': 0.05}
+        """Analyze completion time trends from rolling windows."""
+        hour = self.rolling_metrics.get_team_summary('1h')
+        day = self.rolling_metrics.get_team_summary('24h')
+        
+        hour_completed = sum(s['completed'] for s in hour.values())
+        day_completed = sum(s['completed'] for s in day.values())
+        hour_mean = sum(s['completion_time_mean'] * s['completed'] for s in hour.values()) / hour_completed \
+            if hour_completed else 0.0
+        day_mean = sum(s['completion_time_mean'] * s['completed'] for s in day.values()) / day_completed \
+            if day_completed else 0.0
+        
+        # Positive rate means last hour finished work faster than the 24h average
+        improvement_rate = (day_mean - hour_mean) / day_mean if hour_completed and day_mean else 0.0
+        if improvement_rate > 0.1:
+            trend = 'improving'
+        elif improvement_rate < -0.1:
+            trend = 'degrading'
+        else:
+            trend = 'stable'
+        
+        return {
+            'trend': trend,
+            'improvement_rate': round(improvement_rate, 3),
+            'windows': {
+                window: {
+                    agent_type: {
+                        'completed': summary['completed'],
+                        'failed': summary['failed'],
+                        'completion_time_p50': summary['completion_time_p50'],
+                        'completion_time_p95': summary['completion_time_p95'],
+                        'queue_wait_p95': summary['queue_wait_p95']
+                    }
+                    for agent_type, summary in self.rolling_metrics.get_team_summary(window).items()
+                }
+                for window in self.rolling_metrics.windows
+            }
+        }
     
     async def _get_active_workflows(self) -> List[Dict[str, Any]]:
         """Get list of currently active workflows."""
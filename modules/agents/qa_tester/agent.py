@@ -24,7 +24,7 @@ This agent is part of DigiNativa's quality assurance chain.
 Changes must maintain backward contract compatibility.
 """
 
-import json
+import asyncio
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
@@ -34,16 +34,9 @@ from ...shared.base_agent import BaseAgent, AgentExecutionResult
 from ...shared.exceptions import (
     QualityGateError, DNAComplianceError, AgentExecutionError
 )
-from ...shared.event_bus import EventBus
-from .tools.persona_simulator import PersonaSimulator
-from .tools.accessibility_checker import AccessibilityChecker
-from .tools.user_flow_validator import UserFlowValidator
-from .tools.performance_tester import PerformanceTester
-from .tools.municipal_training_tester import MunicipalTrainingTester
-from .tools.exploratory_tester import ExploratoryTester
-from .tools.uat_orchestrator import UATOrchestrator
-from .tools.quality_intelligence_engine import QualityIntelligenceEngine
-from .tools.dna_quality_validator import DNAQualityValidator
+from ...shared.lazy_tools import LazyTool
+from .tools.implementation_view import ImplementationView
+from .tools.result_records import plain_records
 
 
 # Setup logging for this module
@@ -62,6 +55,30 @@ class QATesterAgent(BaseAgent):
     - Follow all DigiNativa DNA principles
     """
     
+    # QA testing tools - imported and constructed on first use, shared per process
+    # Core testing tools
+    persona_simulator = LazyTool(".tools.persona_simulator.PersonaSimulator", config_key="persona_config")
+    accessibility_checker = LazyTool(".tools.accessibility_checker.AccessibilityChecker", config_key="accessibility_config")
+    user_flow_validator = LazyTool(".tools.user_flow_validator.UserFlowValidator", config_key="flow_config")
+    
+    # Enhanced testing tools
+    performance_tester = LazyTool(".tools.performance_tester.PerformanceTester", config_key="performance_config")
+    municipal_training_tester = LazyTool(".tools.municipal_training_tester.MunicipalTrainingTester", config_key="municipal_config")
+    exploratory_tester = LazyTool(".tools.exploratory_tester.ExploratoryTester", config_key="exploratory_config")
+    uat_orchestrator = LazyTool(".tools.uat_orchestrator.UATOrchestrator", config_key="uat_config")
+    
+    # AI-powered Quality Intelligence (Phase 1 Enhancement)
+    quality_intelligence_engine = LazyTool(".tools.quality_intelligence_engine.QualityIntelligenceEngine", config_key="ai_config")
+    
+    # DNA Quality Validator (Enhanced DNA Validation)
+    dna_quality_validator = LazyTool(".tools.dna_quality_validator.DNAQualityValidator", config_key="dna_config")
+    
+    # EventBus for team coordination
+    event_bus = LazyTool("modules.shared.event_bus.EventBus")
+    
+    # Shared artifact writer (atomic, skip-if-unchanged, off the event loop)
+    artifact_writer = LazyTool("modules.shared.artifact_writer.ArtifactWriter", pass_config=False)
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize QA Tester agent.
@@ -71,28 +88,8 @@ class QATesterAgent(BaseAgent):
         """
         super().__init__("qat-001", "qa_tester", config)
         
-        # Initialize QA testing tools
+        # QA testing tools are LazyTool class attributes (built on first use)
         try:
-            # Core testing tools
-            self.persona_simulator = PersonaSimulator(config=self.config.get("persona_config", {}))
-            self.accessibility_checker = AccessibilityChecker(config=self.config.get("accessibility_config", {}))
-            self.user_flow_validator = UserFlowValidator(config=self.config.get("flow_config", {}))
-            
-            # Enhanced testing tools
-            self.performance_tester = PerformanceTester(config=self.config.get("performance_config", {}))
-            self.municipal_training_tester = MunicipalTrainingTester(config=self.config.get("municipal_config", {}))
-            self.exploratory_tester = ExploratoryTester(config=self.config.get("exploratory_config", {}))
-            self.uat_orchestrator = UATOrchestrator(config=self.config.get("uat_config", {}))
-            
-            # AI-powered Quality Intelligence (Phase 1 Enhancement)
-            self.quality_intelligence_engine = QualityIntelligenceEngine(config=self.config.get("ai_config", {}))
-            
-            # DNA Quality Validator (Enhanced DNA Validation)
-            self.dna_quality_validator = DNAQualityValidator(config=self.config.get("dna_config", {}))
-            
-            # EventBus for team coordination
-            self.event_bus = EventBus(config)
-            
             # Initialize EventBus team coordination
             try:
                 # Subscribe to team events (run in background)
@@ -172,7 +169,9 @@ class QATesterAgent(BaseAgent):
             # Extract test results and implementation data
             input_data = input_contract.get("input_requirements", {}).get("required_data", {})
             test_suite = input_data.get("test_suite", {})
-            implementation_data = input_data.get("implementation_data", {})
+            implementation_data = self._build_implementation_view(
+                story_id, input_data.get("implementation_data", {})
+            )
             
             # Step 1: Run Anna persona simulation tests
             self.logger.info("Running Anna persona simulation tests")
@@ -355,10 +354,10 @@ class QATesterAgent(BaseAgent):
                         f"docs/qa_reports/{story_id}_comprehensive_qa.json"
                     ],
                     "required_data": {
-                        "qa_validation_results": qa_report,
-                        "anna_persona_testing": persona_results,
-                        "accessibility_compliance": accessibility_results,
-                        "user_flow_validation": flow_validation_results,
+                        "qa_validation_results": self.blob_store.put_json(qa_report),
+                        "anna_persona_testing": plain_records(persona_results),
+                        "accessibility_compliance": plain_records(accessibility_results),
+                        "user_flow_validation": plain_records(flow_validation_results),
                         "performance_testing_results": performance_results,
                         "municipal_compliance_results": municipal_compliance_results,
                         "exploratory_testing_results": exploratory_results,
@@ -1013,30 +1012,29 @@ class QATesterAgent(BaseAgent):
             qa_report: Complete QA report to save
         """
         try:
-            # Ensure QA reports directory exists
             qa_reports_dir = Path("docs/qa_reports")
-            qa_reports_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Save UX validation report (Markdown)
-            ux_report_path = qa_reports_dir / f"{story_id}_ux_validation.md"
-            ux_markdown = self._generate_ux_validation_markdown(qa_report)
-            with open(ux_report_path, 'w', encoding='utf-8') as f:
-                f.write(ux_markdown)
-            
-            # Save accessibility report (JSON)
-            accessibility_path = qa_reports_dir / f"{story_id}_accessibility.json"
-            with open(accessibility_path, 'w', encoding='utf-8') as f:
-                json.dump(qa_report["detailed_results"]["accessibility_compliance"], f, indent=2)
-            
-            # Save persona testing report (JSON)
-            persona_path = qa_reports_dir / f"{story_id}_persona_testing.json"
-            with open(persona_path, 'w', encoding='utf-8') as f:
-                json.dump(qa_report["detailed_results"]["anna_persona_testing"], f, indent=2)
-            
-            # Save comprehensive QA report (JSON)
-            comprehensive_path = qa_reports_dir / f"{story_id}_comprehensive_qa.json"
-            with open(comprehensive_path, 'w', encoding='utf-8') as f:
-                json.dump(qa_report, f, indent=2)
+            writer = self.artifact_writer
+            
+            # UX validation report (Markdown), accessibility, persona testing
+            # and comprehensive QA reports (JSON)
+            await asyncio.gather(
+                writer.write_text(
+                    qa_reports_dir / f"{story_id}_ux_validation.md",
+                    self._generate_ux_validation_markdown(qa_report), self.agent_id, story_id
+                ),
+                writer.write_json(
+                    qa_reports_dir / f"{story_id}_accessibility.json",
+                    qa_report["detailed_results"]["accessibility_compliance"], self.agent_id, story_id
+                ),
+                writer.write_json(
+                    qa_reports_dir / f"{story_id}_persona_testing.json",
+                    qa_report["detailed_results"]["anna_persona_testing"], self.agent_id, story_id
+                ),
+                writer.write_json(
+                    qa_reports_dir / f"{story_id}_comprehensive_qa.json",
+                    qa_report, self.agent_id, story_id
+                )
+            )
             
             self.logger.info(f"QA reports saved for story: {story_id}")
             
@@ -1115,6 +1113,23 @@ class QATesterAgent(BaseAgent):
         
         return markdown
     
+    def _build_implementation_view(self, story_id: str, implementation_data: Dict[str, Any]) -> ImplementationView:
+        """
+        Build the story's implementation view shared by all QA tools.
+        
+        Flattened text, component/endpoint texts and quality/Anna features
+        are computed once here instead of separately in every tool.
+        
+        Args:
+            story_id: Story identifier
+            implementation_data: Implementation details from the input contract
+            
+        Returns:
+            Read-only view of the implementation data
+        """
+        view = ImplementationView(implementation_data, story_id)
+        return view.with_features(**self.quality_intelligence_engine.extract_features(view))
+    
     def _extract_user_stories_from_implementation(self, implementation_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract user stories from implementation data for UAT."""
         user_stories = []
@@ -0,0 +1,86 @@
+"""
+Tests for boundary-case planning in ExploratoryTester.
+
+PURPOSE:
+Validates that boundary cases are planned per validation spec, that each
+distinct case is evaluated once, and that per-component boundary results
+are unchanged.
+
+CRITICAL TESTS:
+- Components sharing a validation spec are evaluated once per case
+- Results keep component and test order with component-specific names
+- Exploratory results report boundary coverage
+
+CONTRACT PROTECTION:
+These tests ensure boundary testing covers what field-by-field testing
+covered while evaluating far fewer cases.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from ..tools.exploratory_tester import ExploratoryTester
+
+
+def _input(component_id, label):
+    return {"component_id": component_id, "component_type": "input", "label": label}
+
+
+@pytest.fixture
+def registration_form():
+    """Municipal registration form with repeated field types."""
+    components = [_input(f"name_{i}", "Namn") for i in range(12)]
+    components += [_input("email", "Email"), _input("backup_email", "Email"), _input("phone", "Telefon")]
+    components += [{"component_id": "submit", "component_type": "button"}, "legacy_markup"]
+    return {"ui_components": components}
+
+
+@pytest.mark.asyncio
+async def test_shared_specs_are_evaluated_once(registration_form):
+    """Test distinct boundary cases run once while every component gets its results."""
+    tester = ExploratoryTester()
+    plan = tester.plan_boundary_cases(registration_form)
+    coverage = {}
+    
+    with patch.object(tester, "_perform_boundary_test", wraps=tester._perform_boundary_test) as perform:
+        results = await tester._test_boundary_conditions(registration_form, plan, coverage)
+    
+    assert coverage["validation_specs"] == 4  # text inputs, email inputs, phone input, button
+    assert perform.call_count == coverage["distinct_boundary_cases"]
+    assert len(results) == coverage["single_field_cases"]
+    assert (coverage["distinct_boundary_cases"], coverage["single_field_cases"]) == (41, 218)
+    assert coverage["failing_cases"] == sum(
+        not result.passed for result in results
+        if result.input_field in ("name_0", "email", "phone", "submit")
+    )
+
+
+@pytest.mark.asyncio
+async def test_results_keep_component_order_and_names(registration_form):
+    """Test results follow component and test order and are not shared between components."""
+    tester = ExploratoryTester(config={"boundary_max_concurrent_cases": 1})
+    
+    results = await tester._test_boundary_conditions(registration_form)
+    
+    text_tests = tester.boundary_test_scenarios["text_fields"]["boundary_tests"]
+    assert [r.test_name for r in results[:len(text_tests)]] == [f"name_0_{test_type}" for _, test_type in text_tests]
+    assert results[-1].input_field == "submit"
+    assert [r.input_field for r in results].index("email") > [r.input_field for r in results].index("name_11")
+    
+    first, second = results[0], results[len(text_tests)]
+    assert (first.input_field, second.input_field) == ("name_0", "name_1")
+    assert first.recommendations == second.recommendations
+    assert first.recommendations is not second.recommendations
+
+
+@pytest.mark.asyncio
+async def test_exploratory_result_reports_boundary_coverage(registration_form):
+    """Test perform_exploratory_testing includes the boundary coverage summary."""
+    result = await ExploratoryTester().perform_exploratory_testing(
+        "STORY-BOUNDARY-001", registration_form, focus_areas=["boundary"]
+    )
+    
+    assert result.boundary_coverage["components"] == 16
+    assert "executed_cases" not in result.boundary_coverage
+    assert len(result.boundary_test_results) == result.boundary_coverage["single_field_cases"]
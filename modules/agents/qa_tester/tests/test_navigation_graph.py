@@ -0,0 +1,159 @@
+"""
+Tests for NavigationGraph and FlowTrie in UserFlowValidator.
+
+PURPOSE:
+Validates that the per-story navigation graph answers reachability and
+shortest-path questions correctly, and that flows sharing prefixes are
+validated once without changing flow results.
+
+CRITICAL TESTS:
+- BFS depths, unreachable nodes and shortest paths
+- Each distinct step prefix is validated exactly once
+- Shared validation gives the same flow results as separate validation
+- Navigation consistency reports unreachable targets
+
+CONTRACT PROTECTION:
+These tests ensure memoized flow validation stays equivalent to validating
+every step of every flow.
+"""
+
+from dataclasses import replace
+from unittest.mock import patch
+
+import pytest
+
+from ..tools.navigation_graph import FlowTrie, NavigationGraph
+from ..tools.user_flow_validator import FlowStep, FlowStepType, UserFlow, UserFlowValidator
+
+
+def _step(step_id, expected_elements=("menu",), accessibility=("keyboard_accessible",)):
+    return FlowStep(
+        step_id=step_id,
+        step_type=FlowStepType.NAVIGATION,
+        description=step_id,
+        expected_elements=list(expected_elements),
+        required_actions=["click"],
+        success_criteria={},
+        error_conditions=[],
+        accessibility_requirements=list(accessibility)
+    )
+
+
+def _flow(flow_id, steps):
+    return UserFlow(
+        flow_id=flow_id, name=flow_id, description="", user_goal="", persona="Anna", priority="high",
+        steps=steps, expected_completion_time_minutes=2.0, alternative_paths=[], error_recovery_paths=[]
+    )
+
+
+@pytest.fixture
+def onboarding_flows():
+    """Onboarding flows sharing login -> dashboard prefixes."""
+    login, dashboard = _step("login"), _step("dashboard", ("dashboard_panel",))
+    return [
+        _flow(f"onboarding_{module}_{lesson}", [
+            login, dashboard, _step(f"module_{module}", ("module_card",)),
+            _step(f"lesson_{module}_{lesson}", ("input",), ("proper_labels",))
+        ])
+        for module in range(3) for lesson in range(4)
+    ]
+
+
+@pytest.fixture
+def implementation_data():
+    """Implementation with navigation, form and dashboard components."""
+    return {
+        "ui_components": [
+            {"id": "main_menu", "type": "menu", "aria_label": "Main"},
+            {"id": "dashboard_panel", "type": "section"},
+            {"id": "email", "type": "input", "label": "E-post"},
+            {"id": "module_card", "type": "link"}
+        ],
+        "navigation_structure": {}
+    }
+
+
+def test_graph_reachability_and_shortest_paths():
+    """Test BFS depths, unreachable nodes and shortest paths."""
+    graph = NavigationGraph.build(
+        [["login", "dashboard", "module", "lesson"], ["login", "dashboard", "settings"]],
+        {"edges": [["dashboard", "lesson"], {"from": "archive", "to": "lesson"}], "routes": {"help": ["faq"]}}
+    )
+    
+    assert graph.depths() == {"login": 0, "dashboard": 1, "module": 2, "settings": 2, "lesson": 2}
+    assert graph.unreachable_nodes() == ["archive", "help", "faq"]
+    assert graph.max_depth == 2
+    assert graph.shortest_path("login", "lesson") == ["login", "dashboard", "lesson"]
+    assert graph.shortest_path("lesson", "login") is None
+    assert graph.shortest_path("unknown", "login") is None
+    
+    graph.add_entry_point("help")
+    assert "faq" not in graph.unreachable_nodes()
+
+
+def test_graph_without_entry_points_starts_from_roots():
+    """Test graphs from navigation_structure alone start at nodes nobody links to."""
+    graph = NavigationGraph.build([], {"routes": {"home": ["about", "training"], "training": "module"}})
+    
+    assert graph.summary()["entry_points"] == ["home"]
+    assert graph.depths()["module"] == 2
+    assert graph.unreachable_nodes() == []
+
+
+@pytest.mark.asyncio
+async def test_trie_validates_each_prefix_once(onboarding_flows):
+    """Test shared prefixes are evaluated once and running totals match the path."""
+    trie = FlowTrie()
+    calls = []
+    
+    async def validate_step(step):
+        calls.append(step.step_id)
+        return await UserFlowValidator()._validate_flow_step(step, {"ui_components": []}, {})
+    
+    paths = [await trie.validate(flow.steps, validate_step) for flow in onboarding_flows]
+    
+    # login, dashboard, 3 modules and 12 lessons are distinct prefixes
+    assert trie.prefixes_evaluated == 17
+    assert calls.count("login") == 1 and calls.count("dashboard") == 1
+    assert len(calls) == 17
+    last = paths[-1][-1]
+    assert last.completion_minutes == pytest.approx(
+        sum(node.result.completion_time_seconds for node in paths[-1]) / 60
+    )
+    
+    # Same step id with a different definition is a different prefix
+    await trie.validate([replace(onboarding_flows[0].steps[0], expected_elements=["sso_button"])], validate_step)
+    assert trie.prefixes_evaluated == 18
+
+
+@pytest.mark.asyncio
+async def test_shared_validation_matches_separate_validation(onboarding_flows, implementation_data):
+    """Test flows validated through one trie equal flows validated independently."""
+    validator = UserFlowValidator()
+    graph = validator._build_navigation_graph(onboarding_flows, implementation_data)
+    trie = FlowTrie()
+    
+    with patch.object(validator, "_check_accessibility_requirement", wraps=validator._check_accessibility_requirement) as check:
+        shared = [
+            await validator._validate_single_flow(flow, implementation_data, {}, trie, graph)
+            for flow in onboarding_flows
+        ]
+    separate = [await validator._validate_single_flow(flow, implementation_data, {}) for flow in onboarding_flows]
+    
+    assert shared == separate
+    assert check.call_count == 2  # keyboard_accessible and proper_labels, once per story
+    assert shared[0]["navigation"] == {"shortest_path_steps": 4, "detour_steps": 0}
+    assert shared[0]["step_results"][0] is not shared[1]["step_results"][0]
+
+
+@pytest.mark.asyncio
+async def test_validate_user_flows_reports_reachability(implementation_data):
+    """Test the story report includes graph reachability and flags unreachable targets."""
+    implementation_data["navigation_structure"] = {"entry": "home", "routes": {"home": ["training"], "archive": ["old_module"]}}
+    
+    report = await UserFlowValidator().validate_user_flows("STORY-NAV-001", implementation_data, {})
+    
+    navigation = report["navigation_validation"]
+    assert "archive" in navigation["reachability"]["unreachable_nodes"]
+    assert any("unreachable" in issue for issue in navigation["issues_found"])
+    assert report["flows_tested"] == len(report["flow_validation_results"]) > 0
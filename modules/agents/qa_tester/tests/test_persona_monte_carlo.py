@@ -0,0 +1,141 @@
+"""
+Tests for PersonaSimulator Monte-Carlo mode.
+
+PURPOSE:
+Validates that sampled Anna sessions produce sound distributions and
+confidence intervals, react to interface complexity, and stay fast enough
+for release-wide batch simulation.
+
+CRITICAL TESTS:
+- Distribution reports are well-formed (probabilities, intervals, percentiles)
+- Seeded simulations are reproducible
+- Complex interfaces raise P(completion > 10 min) and lower satisfaction
+- Release batches are chunked and isolate failing stories
+- One story simulates in well under a second
+
+CONTRACT PROTECTION:
+These tests ensure the Monte-Carlo mode extends, and never replaces, the
+deterministic Anna simulation report.
+"""
+
+import time
+
+import pytest
+
+from ..tools.persona_simulator import PersonaSimulator
+
+
+SIMPLE_IMPLEMENTATION = {
+    "ui_components": [{"type": "button"}, {"type": "text"}, {"type": "input"}],
+    "user_flows": [{"flow_id": "quiz"}]
+}
+
+COMPLEX_IMPLEMENTATION = {
+    "ui_components": [{"type": "input"} for _ in range(8)] + [{"type": "select"} for _ in range(4)],
+    "user_flows": [{"flow_id": "application"}, {"flow_id": "review"}]
+}
+
+
+@pytest.fixture
+def simulator():
+    """PersonaSimulator with a fixed seed and reduced sample count."""
+    return PersonaSimulator(config={"monte_carlo_seed": 42, "monte_carlo_samples": 2000})
+
+
+def _without_timestamp(report):
+    return {key: value for key, value in report.items() if key != "simulation_timestamp"}
+
+
+@pytest.mark.asyncio
+async def test_distribution_report_is_well_formed(simulator):
+    """Test probabilities, intervals and percentiles are consistent."""
+    report = await simulator.simulate_anna_distribution("STORY-MC-001", SIMPLE_IMPLEMENTATION)
+    
+    overall = report["overall_distribution"]
+    assert report["samples_per_scenario"] == 2000
+    assert overall["sessions"] == 2000 * len(simulator.standard_scenarios)
+    assert len(report["scenario_distributions"]) == len(simulator.standard_scenarios)
+    
+    for distribution in [overall] + report["scenario_distributions"]:
+        for name in ("completion_rate", "time_limit_exceedance"):
+            low, high = distribution[f"{name}_ci"]
+            assert 0.0 <= low <= distribution[name] <= high <= 1.0
+        for name in ("completion_time_minutes", "satisfaction_score", "learning_effectiveness_score"):
+            stats = distribution[name]
+            assert stats["p5"] <= stats["p50"] <= stats["p95"]
+        low, high = distribution["satisfaction_mean_ci"]
+        assert 1.0 <= low <= distribution["satisfaction_score"]["mean"] <= high <= 5.0
+    
+    exceedance = overall["completion_time_exceedance"]
+    assert exceedance["5.0"] >= exceedance["8.0"] >= exceedance["10.0"]
+    assert exceedance["10.0"] == overall["time_limit_exceedance"]
+
+
+@pytest.mark.asyncio
+async def test_seeded_simulation_is_reproducible(simulator):
+    """Test the same seed yields identical distributions and other seeds differ."""
+    first = await simulator.simulate_anna_distribution("STORY-MC-002", SIMPLE_IMPLEMENTATION, seed=7)
+    second = await simulator.simulate_anna_distribution("STORY-MC-002", SIMPLE_IMPLEMENTATION, seed=7)
+    other = await simulator.simulate_anna_distribution("STORY-MC-002", SIMPLE_IMPLEMENTATION, seed=8)
+    
+    assert _without_timestamp(first) == _without_timestamp(second)
+    assert _without_timestamp(first) != _without_timestamp(other)
+
+
+@pytest.mark.asyncio
+async def test_complex_interface_shifts_distributions(simulator):
+    """Test complex interfaces increase time limit violations and reduce satisfaction."""
+    results = await simulator.simulate_release_distributions({
+        "STORY-SIMPLE": SIMPLE_IMPLEMENTATION,
+        "STORY-COMPLEX": COMPLEX_IMPLEMENTATION
+    })
+    
+    simple = results["STORY-SIMPLE"]["overall_distribution"]
+    complex_ = results["STORY-COMPLEX"]["overall_distribution"]
+    assert complex_["satisfaction_score"]["mean"] < simple["satisfaction_score"]["mean"]
+    assert complex_["satisfaction_mean_ci"][1] < simple["satisfaction_mean_ci"][0]
+    assert complex_["completion_rate"] < simple["completion_rate"]
+
+
+@pytest.mark.asyncio
+async def test_release_batch_chunks_and_isolates_failures():
+    """Test small chunk limits still cover every story and a broken story gets an error report."""
+    simulator = PersonaSimulator(config={"monte_carlo_samples": 500, "monte_carlo_chunk_elements": 50_000})
+    stories = {f"STORY-REL-{i:03d}": SIMPLE_IMPLEMENTATION for i in range(6)}
+    stories["STORY-REL-BROKEN"] = {"ui_components": ["not a component dict"]}
+    
+    results = await simulator.simulate_release_distributions(stories)
+    
+    assert list(results) == list(stories)
+    assert results["STORY-REL-BROKEN"]["simulation_failed"] is True
+    assert all(results[story_id]["samples_per_scenario"] == 500 for story_id in list(stories)[:6])
+
+
+@pytest.mark.asyncio
+async def test_single_story_simulates_in_well_under_a_second():
+    """Test the default sample count simulates one story quickly."""
+    simulator = PersonaSimulator()
+    
+    started = time.perf_counter()
+    report = await simulator.simulate_anna_distribution("STORY-MC-PERF", COMPLEX_IMPLEMENTATION)
+    elapsed = time.perf_counter() - started
+    
+    assert report["samples_per_scenario"] == 5000
+    assert elapsed < 0.5
+
+
+@pytest.mark.asyncio
+async def test_monte_carlo_mode_extends_anna_report():
+    """Test simulate_anna_usage adds the distribution only when Monte-Carlo mode is enabled."""
+    requirements = {"success_metrics": {"learning_effectiveness": 4}}
+    
+    default_report = await PersonaSimulator().simulate_anna_usage(
+        "STORY-MC-003", SIMPLE_IMPLEMENTATION, {}, requirements
+    )
+    monte_carlo_report = await PersonaSimulator(
+        config={"monte_carlo_mode": True, "monte_carlo_samples": 500}
+    ).simulate_anna_usage("STORY-MC-003", SIMPLE_IMPLEMENTATION, {}, requirements)
+    
+    assert "monte_carlo_distribution" not in default_report
+    assert monte_carlo_report["overall_metrics"] == default_report["overall_metrics"]
+    assert monte_carlo_report["monte_carlo_distribution"]["samples_per_scenario"] == 500
@@ -0,0 +1,126 @@
+"""
+Tests for compiled policy rules and the cross-story policy evaluation cache.
+
+PURPOSE:
+Validates that MunicipalTrainingTester evaluates policy requirements through
+compiled rules, reuses results for stories with unchanged inputs, and
+invalidates them when a policy changes.
+
+CRITICAL TESTS:
+- Cached and uncached policy compliance results are identical
+- Stories that only differ outside a rule's inputs reuse its result
+- Changing a policy or rule definition changes the policy version
+- The cache is bounded and hands out copies
+
+CONTRACT PROTECTION:
+These tests ensure caching never changes PolicyComplianceResult output.
+"""
+
+import pytest
+
+from ..tools.municipal_training_tester import MunicipalTrainingTester, PolicyCategory
+from ..tools.policy_rules import PolicyEvaluationCache, PolicyInputs, compile_policy_rules
+
+
+def _story(label, extra_flows=0):
+    return {
+        "ui_components": [
+            {"component_id": "ConsentForm", "type": "form", "label": label},
+            {"component_id": "Menu", "type": "navigation", "accessibility_attributes": {"role": "menu"}}
+        ],
+        "api_endpoints": [{"path": "/api/training/progress", "method": "GET"}],
+        "user_flows": [{"flow_id": f"flow_{i}"} for i in range(extra_flows)]
+    }
+
+
+@pytest.fixture
+def stories():
+    """Stories with and without consent/encryption wording."""
+    return [
+        _story("GDPR consent, encrypted storage"),
+        _story("GDPR consent, encrypted storage", extra_flows=2),
+        _story("Inclusive course overview"),
+        {"ui_components": [], "api_endpoints": []}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cached_results_match_uncached(stories):
+    """Test a shared tester returns exactly what fresh testers return."""
+    shared = MunicipalTrainingTester()
+    
+    for story in stories:
+        cached = await shared._test_policy_compliance(story, list(PolicyCategory))
+        uncached = await MunicipalTrainingTester()._test_policy_compliance(story, list(PolicyCategory))
+        assert cached == uncached
+    
+    status = shared.get_policy_cache_status()
+    assert status["hits"] > 0
+    assert set(status["compiled_policies"]) == {category.value for category in PolicyCategory}
+
+
+@pytest.mark.asyncio
+async def test_unrelated_changes_reuse_results(stories):
+    """Test a story differing only in user flows reuses every cached result."""
+    tester = MunicipalTrainingTester()
+    await tester._test_policy_compliance(stories[0], list(PolicyCategory))
+    first = tester.policy_evaluation_cache.stats()
+    
+    await tester._test_policy_compliance(stories[1], list(PolicyCategory))
+    second = tester.policy_evaluation_cache.stats()
+    
+    requirement_count = sum(len(info["requirements"]) for info in tester.swedish_municipal_policies.values())
+    # Only equal_opportunity_training reads the whole implementation text - never cached
+    assert first["misses"] == requirement_count - 1
+    assert first["direct_evaluations"] == 1
+    assert second["misses"] == first["misses"]
+    assert second["hits"] - first["hits"] == requirement_count - 1
+    assert second["direct_evaluations"] == 2
+
+
+@pytest.mark.asyncio
+async def test_policy_changes_invalidate_results(stories):
+    """Test edited policies get a new version and are evaluated again."""
+    tester = MunicipalTrainingTester()
+    policy_info = tester.swedish_municipal_policies[PolicyCategory.GDPR_COMPLIANCE]
+    
+    before = await tester._validate_specific_policy(PolicyCategory.GDPR_COMPLIANCE, policy_info, stories[2])
+    version = tester.get_policy_cache_status()["compiled_policies"]["gdpr_compliance"]
+    
+    tester.policy_requirement_rules[PolicyCategory.GDPR_COMPLIANCE]["consent_management"]["keywords"] = ["samtycke"]
+    misses = tester.policy_evaluation_cache.misses
+    after = await tester._validate_specific_policy(PolicyCategory.GDPR_COMPLIANCE, policy_info, stories[2])
+    
+    assert tester.get_policy_cache_status()["compiled_policies"]["gdpr_compliance"] != version
+    assert tester.policy_evaluation_cache.misses - misses == len(policy_info["requirements"])
+    assert "consent_management" in before.compliance_items_passed
+    assert "consent_management" not in after.compliance_items_passed
+    
+    policy_info["requirements"].append("records_of_processing")
+    extended = await tester._validate_specific_policy(PolicyCategory.GDPR_COMPLIANCE, policy_info, stories[2])
+    assert "records_of_processing" in extended.compliance_items_passed
+
+
+def test_cache_is_bounded_and_returns_copies():
+    """Test least recently used results are evicted and results cannot be corrupted."""
+    rules = compile_policy_rules(
+        PolicyCategory.GDPR_COMPLIANCE,
+        {"requirements": ["personal_data_protection"]},
+        {"personal_data_protection": {
+            "inputs": "component_texts", "keywords": ["encrypt"],
+            "issue": "No encryption", "recommendations": ["Encrypt personal data"]
+        }}
+    )
+    rule = rules["personal_data_protection"]
+    cache = PolicyEvaluationCache(max_entries=2)
+    
+    result = cache.evaluate(rule, PolicyInputs({"ui_components": ["plain"]}))
+    result["recommendations"].append("tampered")
+    assert cache.evaluate(rule, PolicyInputs({"ui_components": ["plain"]}))["recommendations"] == ["Encrypt personal data"]
+    
+    for label in ("second", "third"):
+        cache.evaluate(rule, PolicyInputs({"ui_components": [label]}))
+    
+    stats = cache.stats()
+    assert (stats["entries"], stats["evictions"], stats["hits"], stats["misses"]) == (2, 1, 1, 3)
+    assert stats["hit_rate"] == 0.25
@@ -0,0 +1,142 @@
+"""
+Tests for the online prediction models of QualityIntelligenceEngine.
+
+PURPOSE:
+Validates that quality and Anna satisfaction predictions learn corrections
+from outcomes with incremental ridge regression, score many stories in one
+vectorized call and persist their coefficients.
+
+CRITICAL TESTS:
+- Untrained models keep the formula predictions
+- predict_many matches per-story predictions
+- Learning from outcomes reduces prediction error
+- Models are persisted and reloaded from the engine database
+- Incremental updates equal a batch ridge solve
+
+CONTRACT PROTECTION:
+These tests ensure learning never changes predictions before outcomes exist
+and that batch scoring stays consistent with single-story predictions.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from ..tools.quality_intelligence_engine import QualityIntelligenceEngine
+from ..tools.ridge_model import OnlineRidgeModel
+
+
+def _story(seed):
+    rng = random.Random(seed)
+    return {
+        "ui_components": [
+            {
+                "component_id": f"component_{i}",
+                "type": rng.choice(["form", "navigation", "input", "button"]),
+                "label": rng.choice(["Namn", "Kommunens kursutbud", "Submit"])
+            }
+            for i in range(rng.randint(0, 14))
+        ],
+        "api_endpoints": [{"path": f"/api/training/{i}"} for i in range(rng.randint(0, 6))],
+        "user_flows": [{"flow_id": f"flow_{i}", "steps": ["start"] * rng.randint(0, 5)} for i in range(rng.randint(0, 3))]
+    }
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Temporary engine database."""
+    return str(tmp_path / "quality_intelligence.db")
+
+
+@pytest.fixture
+def stories():
+    """Varied stories for batch scoring."""
+    return {f"STORY-{seed:03d}": _story(seed) for seed in range(60)}
+
+
+@pytest.mark.asyncio
+async def test_predict_many_matches_single_predictions(db_path, stories):
+    """Test batch scoring equals predict_quality_score and predict_anna_satisfaction."""
+    engine = QualityIntelligenceEngine(config={"db_path": db_path})
+    features = [engine.extract_features(data) for data in stories.values()]
+    
+    quality = engine.predict_many(engine.feature_matrix([f["quality"] for f in features], "quality"))
+    anna = engine.predict_many([f["anna"] for f in features], target="anna")
+    
+    for index, (story_id, data) in enumerate(stories.items()):
+        prediction = await engine.predict_quality_score(story_id, data)
+        satisfaction = await engine.predict_anna_satisfaction(story_id, data)
+        assert prediction.predicted_score == round(quality[index], 2)
+        assert satisfaction["predicted_satisfaction_score"] == round(anna[index], 2)
+    
+    with pytest.raises(ValueError):
+        engine.predict_many(features, target="unknown")
+
+
+@pytest.mark.asyncio
+async def test_learning_reduces_prediction_error(db_path, stories):
+    """Test predictions move toward outcomes the formulas systematically miss."""
+    engine = QualityIntelligenceEngine(config={"db_path": db_path})
+    feature_sets = [engine.extract_features(data)["quality"] for data in stories.values()]
+    formula_scores = engine.predict_many(feature_sets)
+    actual_scores = np.clip(formula_scores - 0.8 + 0.02 * engine.feature_matrix(feature_sets)[:, 0], 1.0, 5.0)
+    
+    for (story_id, data), actual in zip(stories.items(), actual_scores):
+        await engine.predict_quality_score(story_id, data)
+        learning = await engine.learn_from_outcome(story_id, {"quality_score": float(actual)})
+    
+    assert engine.prediction_models["quality"].sample_count == len(stories)
+    assert f"Quality model refit with {len(stories)} outcomes" in learning["model_adjustments"]
+    
+    # Outcomes without a stored prediction are not learned twice
+    await engine.learn_from_outcome("STORY-000", {"quality_score": 1.0})
+    assert engine.prediction_models["quality"].sample_count == len(stories)
+    
+    learned_error = np.abs(engine.predict_many(feature_sets) - actual_scores).mean()
+    formula_error = np.abs(formula_scores - actual_scores).mean()
+    assert learned_error < formula_error / 4
+
+
+@pytest.mark.asyncio
+async def test_models_persist_in_engine_database(db_path, stories):
+    """Test a new engine on the same database reloads learned coefficients."""
+    engine = QualityIntelligenceEngine(config={"db_path": db_path})
+    for story_id, data in list(stories.items())[:10]:
+        await engine.predict_anna_satisfaction(story_id, data)
+        await engine.learn_from_outcome(story_id, {"anna_satisfaction": 3.2})
+    
+    reloaded = QualityIntelligenceEngine(config={"db_path": db_path})
+    anna_features = [engine.extract_features(data)["anna"] for data in stories.values()]
+    
+    assert reloaded.prediction_models["anna"].sample_count == 10
+    assert reloaded.prediction_models["quality"].sample_count == 0
+    np.testing.assert_allclose(
+        reloaded.predict_many(anna_features, "anna"), engine.predict_many(anna_features, "anna")
+    )
+    
+    # A different penalty makes the stored statistics inapplicable
+    other = QualityIntelligenceEngine(config={"db_path": db_path, "model_ridge_lambda": 5.0})
+    assert other.prediction_models["anna"].sample_count == 0
+
+
+def test_incremental_updates_match_batch_ridge_solve():
+    """Test Sherman-Morrison updates give the closed-form ridge coefficients."""
+    rng = np.random.default_rng(7)
+    features = rng.uniform(0, 10, size=(40, 3))
+    baseline = rng.uniform(2, 4, size=40)
+    targets = baseline + features @ np.array([0.1, -0.05, 0.02]) + 0.3
+    model = OnlineRidgeModel(["a", "b", "c"], scales=[10.0, 10.0, 10.0], ridge_lambda=0.5)
+    
+    for row, target, base in zip(features, targets, baseline):
+        model.update(row, target, base)
+    
+    design = model.design_matrix(features)
+    expected = np.linalg.solve(design.T @ design + 0.5 * np.eye(4), design.T @ (targets - baseline))
+    np.testing.assert_allclose(model.coefficients, expected, rtol=1e-8, atol=1e-10)
+    np.testing.assert_allclose(model.predict_many(features, baseline), baseline + design @ expected)
+    
+    restored = OnlineRidgeModel(["a", "b", "c"], scales=[10.0, 10.0, 10.0], ridge_lambda=0.5)
+    assert restored.load_state(model.to_state())
+    np.testing.assert_allclose(restored.coefficients, model.coefficients)
+    assert not OnlineRidgeModel(["a", "b"]).load_state(model.to_state())
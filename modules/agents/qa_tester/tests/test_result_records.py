@@ -0,0 +1,169 @@
+"""
+Tests for compact QA result records and columnar report collections.
+
+PURPOSE:
+Validates that QA result records are slotted with interned categorical
+strings, and that reports keep them in RecordColumns that read and
+serialize exactly like the record dicts reports used to hold.
+
+CRITICAL TESTS:
+- Records have no instance __dict__ and share categorical string objects
+- RecordColumns items, slices, columns and rebuilt records match the records
+- Nested record lists are stored as columns and views never alias storage
+- Accessibility and persona reports serialize to plain JSON lists
+- QA output contracts and saved agent state hold plain lists for stdlib json
+
+CONTRACT PROTECTION:
+These tests ensure compact records never change report content at the
+contract boundary.
+"""
+
+import json
+
+import pytest
+
+from modules.shared.artifact_writer import dump_json
+from modules.shared.base_agent import AgentState
+
+from modules.agents.qa_tester.agent import QATesterAgent
+from modules.agents.qa_tester.tools.accessibility_checker import AccessibilityChecker, AccessibilityTestResult, AccessibilityViolation
+from modules.agents.qa_tester.tools.persona_simulator import PersonaSimulator
+from modules.agents.qa_tester.tools.result_records import RecordColumns, plain_records
+from modules.agents.qa_tester.tools.user_flow_validator import FlowStepValidationResult, FlowValidationIssue, FlowValidationResult
+
+
+def _violation(index, severity="serious"):
+    return AccessibilityViolation(
+        violation_id=f"missing_alt_image_{index}",
+        wcag_criterion="".join(["1.1", ".1"]),
+        severity_level=severity,
+        component_affected="image",
+        description="Image missing alternative text",
+        recommended_fix="Add meaningful alt text describing the image content",
+        compliance_level="A",
+        automated_detection=True,
+        manual_verification_needed=False
+    )
+
+
+@pytest.fixture
+def component_heavy_story():
+    """Story with many images lacking alternative text."""
+    return {
+        "ui_components": [
+            {"id": f"image_{i}", "type": "image"} if i % 2 else {"id": f"field_{i}", "type": "input", "label": "Namn"}
+            for i in range(200)
+        ],
+        "html_structure": {},
+        "css_styles": {}
+    }
+
+
+def test_records_are_slotted_and_interned():
+    """Test records drop their instance dicts and share categorical strings."""
+    first, second = _violation(1), _violation(2)
+    
+    assert not hasattr(first, "__dict__")
+    assert first.wcag_criterion is second.wcag_criterion
+    with pytest.raises(AttributeError):
+        first.extra_note = "not a field"
+
+
+def test_columns_read_like_record_dicts():
+    """Test items, slices, columns and rebuilt records of a collection."""
+    violations = [_violation(i, severity) for i, severity in enumerate(["serious", "moderate", "serious"])]
+    columns = RecordColumns(AccessibilityViolation, violations)
+    
+    assert len(columns) == 3
+    assert columns[-1]["violation_id"] == "missing_alt_image_2"
+    assert columns[0:2] == [columns[0], columns[1]]
+    assert columns.column("severity_level") == ["serious", "moderate", "serious"]
+    assert list(columns.records()) == violations
+    assert columns[0] is not columns[0]
+    with pytest.raises(IndexError):
+        columns[3]
+    with pytest.raises(TypeError):
+        columns.append("not a violation")
+
+
+def test_nested_records_are_columns_and_views_do_not_alias():
+    """Test nested record lists are stored as columns and list values are copied on read."""
+    issue = FlowValidationIssue(
+        "login_missing_menu", "onboarding", "login", "high", "missing_element",
+        "Menu missing", "Anna cannot navigate", "Add menu", False, True
+    )
+    step = FlowStepValidationResult(
+        "login", FlowValidationResult.WARNING, 12.0, [issue], 90.0, 4.0, 95.0, {"checked": ["menu"]}
+    )
+    results = [AccessibilityTestResult("alt_text", False, 50.0, [_violation(0)], ["Add alt text"], {})]
+    
+    steps = RecordColumns(FlowStepValidationResult, [step])
+    tests = RecordColumns(AccessibilityTestResult, results)
+    
+    assert isinstance(steps[0]["issues_found"], RecordColumns)
+    assert steps[0]["issues_found"] == [{
+        "issue_id": "login_missing_menu", "flow_id": "onboarding", "step_id": "login", "severity": "high",
+        "category": "missing_element", "description": "Menu missing", "impact_on_user": "Anna cannot navigate",
+        "recommended_fix": "Add menu", "affects_accessibility": False, "affects_anna_persona": True
+    }]
+    assert steps.record(0) == step
+    assert list(tests.records()) == results
+    
+    tests[0]["recommendations"].append("tampered")
+    assert tests[0]["recommendations"] == ["Add alt text"]
+
+
+@pytest.mark.asyncio
+async def test_reports_serialize_as_plain_lists(component_heavy_story):
+    """Test report collections serialize like lists of record dicts at the contract boundary."""
+    report = await AccessibilityChecker().validate_accessibility("STORY-RECORDS-001", component_heavy_story)
+    
+    assert isinstance(report["violations"], RecordColumns)
+    assert len(report["violations"]) >= 100
+    serialized = json.loads(dump_json(report))
+    assert serialized["violations"] == json.loads(json.dumps(report["violations"].to_list()))
+    assert serialized["test_results"][0]["violations"] == json.loads(dump_json(report["test_results"][0]["violations"]))
+    
+    persona = await PersonaSimulator().simulate_anna_usage("STORY-RECORDS-001", component_heavy_story, {}, {})
+    scenarios = json.loads(dump_json(persona))["scenario_results"]
+    assert [s["scenario_id"] for s in scenarios] == persona["scenario_results"].column("scenario_id")
+
+
+@pytest.mark.asyncio
+async def test_qa_output_contract_saves_with_stdlib_json(component_heavy_story, tmp_path):
+    """Test QA report sections of the output contract are plain lists that stdlib json serializes."""
+    agent = QATesterAgent(config={"state_storage_path": str(tmp_path)})
+    story = component_heavy_story
+    persona = await agent.persona_simulator.simulate_anna_usage("STORY-RECORDS-001", story, {}, {})
+    accessibility = await agent.accessibility_checker.validate_accessibility("STORY-RECORDS-001", story)
+    flows = await agent.user_flow_validator.validate_user_flows("STORY-RECORDS-001", story, {})
+    assert isinstance(accessibility["violations"], RecordColumns)
+    
+    required_data = {
+        "anna_persona_testing": plain_records(persona),
+        "accessibility_compliance": plain_records(accessibility),
+        "user_flow_validation": plain_records(flows)
+    }
+    output_contract = {"story_id": "STORY-RECORDS-001", "input_requirements": {"required_data": required_data}}
+    
+    serialized = json.loads(json.dumps(output_contract))["input_requirements"]["required_data"]
+    assert serialized == json.loads(dump_json(required_data)) == json.loads(dump_json({
+        "anna_persona_testing": persona, "accessibility_compliance": accessibility, "user_flow_validation": flows
+    }))
+    assert isinstance(required_data["accessibility_compliance"]["violations"], list)
+    assert isinstance(required_data["accessibility_compliance"]["test_results"][0]["violations"], list)
+    assert isinstance(required_data["anna_persona_testing"]["scenario_results"], list)
+    flow_results = required_data["user_flow_validation"]["flow_validation_results"]
+    assert flow_results and all(
+        isinstance(flow[key], list) for flow in flow_results for key in ("step_results", "flow_issues", "critical_issues")
+    )
+    assert isinstance(flow_results[0]["step_results"][0]["validation_result"], str)
+    
+    agent.current_state = AgentState(
+        agent_id=agent.agent_id, story_id="STORY-RECORDS-001", status="completed",
+        input_contract=None, output_contract=output_contract, progress_data={}, error_data=None,
+        started_at="", last_updated=""
+    )
+    await agent._save_state()
+    saved = json.loads((tmp_path / f"{agent.agent_id}_STORY-RECORDS-001_state.json").read_text())
+    assert saved["output_contract"]["input_requirements"]["required_data"] == serialized
@@ -0,0 +1,147 @@
+"""
+Tests for batched stakeholder evaluation in UATOrchestrator.
+
+PURPOSE:
+Validates that UAT scores every stakeholder role in one batched pass over
+shared implementation features, runs sessions under a bounded semaphore,
+and keeps per-role feedback identical to one-at-a-time simulation.
+
+CRITICAL TESTS:
+- Batched feedback equals sequential per-role sessions for the same seed
+- Implementation features are derived once per UAT run
+- Role x feature weights reproduce the role-specific adjustments
+- Concurrent sessions never exceed uat_max_concurrent_sessions
+- Acceptance criteria read the first feedback of their responsible role
+
+CONTRACT PROTECTION:
+These tests ensure batching changes how UAT runs, not what stakeholders report.
+"""
+
+import asyncio
+import random
+from dataclasses import replace
+from unittest.mock import patch
+
+import pytest
+
+from ..tools.implementation_view import ImplementationView
+from ..tools.uat_orchestrator import ApprovalStatus, StakeholderRole, UATOrchestrator
+
+
+@pytest.fixture
+def implementation_data():
+    """Implementation with forms, endpoints and GDPR/audit features."""
+    return {
+        "ui_components": [
+            {"type": "form", "label": "GDPR consent"},
+            {"type": "button", "aria_label": "Skicka", "accessibility": "wcag_aa"},
+            {"type": "input"},
+            {"type": "navigation"}
+        ],
+        "api_endpoints": [{"path": "/api/audit/log", "method": "POST", "security": "token"}],
+        "user_flows": [{"flow_id": "consent"}, {"flow_id": "training"}]
+    }
+
+
+@pytest.fixture
+def user_stories():
+    """Single municipal user story."""
+    return [{"story_id": "STORY-UAT-001", "title": "GDPR training module"}]
+
+
+def _without_timestamp(feedback):
+    return replace(feedback, feedback_timestamp="")
+
+
+@pytest.mark.asyncio
+async def test_batched_feedback_matches_sequential_sessions(implementation_data, user_stories):
+    """Test every role gets the feedback a separate session would produce."""
+    orchestrator = UATOrchestrator()
+    roles = list(orchestrator.stakeholder_definitions)
+    test_plan = await orchestrator._generate_uat_test_plan("STORY-UAT-001", implementation_data, user_stories, roles)
+    
+    random.seed(2024)
+    batched = await orchestrator._execute_stakeholder_testing(test_plan, implementation_data, roles)
+    random.seed(2024)
+    sequential = [
+        await orchestrator._simulate_stakeholder_session(role, test_plan, implementation_data)
+        for role in roles
+    ]
+    
+    assert [feedback.stakeholder_role for feedback in batched] == roles
+    assert [_without_timestamp(f) for f in batched] == [_without_timestamp(f) for f in sequential]
+
+
+@pytest.mark.asyncio
+async def test_features_derived_once_per_uat_run(implementation_data, user_stories):
+    """Test implementation features are computed once for all roles."""
+    orchestrator = UATOrchestrator()
+    view = ImplementationView(implementation_data, "STORY-UAT-002")
+    
+    with patch.object(orchestrator, "_implementation_features", wraps=orchestrator._implementation_features) as features:
+        result = await orchestrator.orchestrate_uat_process(
+            "STORY-UAT-002", view, user_stories, list(orchestrator.stakeholder_definitions)
+        )
+    
+    assert features.call_count == 1
+    assert len(result.stakeholder_feedback) == len(orchestrator.stakeholder_definitions)
+
+
+def test_weight_matrix_applies_role_adjustments(implementation_data):
+    """Test scores equal the baseline plus each role's feature adjustments."""
+    orchestrator = UATOrchestrator()
+    roles = [
+        StakeholderRole.TRAINING_COORDINATOR,
+        StakeholderRole.IT_COORDINATOR,
+        StakeholderRole.END_USER_REPRESENTATIVE,
+        StakeholderRole.COMPLIANCE_OFFICER,
+        StakeholderRole.HR_REPRESENTATIVE
+    ]
+    
+    with patch("random.uniform", return_value=0.0):
+        scores = orchestrator._score_stakeholder_satisfaction(roles, implementation_data)
+        minimal = orchestrator._score_stakeholder_satisfaction(roles, {})
+    
+    assert scores == pytest.approx([4.5, 4.5, 4.5, 4.5, 4.0])
+    assert minimal == pytest.approx([4.0, 4.0, 4.3, 4.0, 4.0])
+
+
+@pytest.mark.asyncio
+async def test_sessions_respect_concurrency_limit(implementation_data, user_stories):
+    """Test no more than uat_max_concurrent_sessions sessions run at once."""
+    orchestrator = UATOrchestrator(config={"uat_max_concurrent_sessions": 2})
+    roles = list(orchestrator.stakeholder_definitions)
+    test_plan = await orchestrator._generate_uat_test_plan("STORY-UAT-003", implementation_data, user_stories, roles)
+    simulate = orchestrator._simulate_stakeholder_session
+    running, peak = 0, 0
+    
+    async def tracked_session(*args, **kwargs):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return await simulate(*args, **kwargs)
+    
+    with patch.object(orchestrator, "_simulate_stakeholder_session", side_effect=tracked_session):
+        feedback = await orchestrator._execute_stakeholder_testing(test_plan, implementation_data, roles)
+    
+    assert peak == 2
+    assert [f.stakeholder_role for f in feedback] == roles
+
+
+@pytest.mark.asyncio
+async def test_criteria_use_first_feedback_of_responsible_role(implementation_data, user_stories):
+    """Test criteria results come from the first feedback of the responsible role."""
+    orchestrator = UATOrchestrator()
+    roles = [StakeholderRole.TRAINING_COORDINATOR]
+    test_plan = await orchestrator._generate_uat_test_plan("STORY-UAT-004", implementation_data, user_stories, roles)
+    feedback = await orchestrator._execute_stakeholder_testing(test_plan, implementation_data, roles)
+    approved = replace(feedback[0], approval_status=ApprovalStatus.APPROVED, satisfaction_score=5.0)
+    rejected = replace(feedback[0], approval_status=ApprovalStatus.REJECTED, satisfaction_score=1.0)
+    training = await orchestrator._assess_training_effectiveness(implementation_data, test_plan)
+    
+    results = await orchestrator._validate_acceptance_criteria(test_plan, [approved, rejected], training)
+    
+    assert len(results) == len(test_plan.acceptance_criteria)
+    assert all(result["met"] and result["confidence_score"] == 100.0 for result in results)
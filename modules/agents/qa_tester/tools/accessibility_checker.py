@@ -28,17 +28,19 @@ Changes must maintain WCAG AA compliance standards.
 import json
 import logging
 import re
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, ClassVar, List, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass
 from pathlib import Path
 
+from .result_records import RecordColumns, intern_fields
+
 
 # Setup logging for this module
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class AccessibilityViolation:
     """
     Represents an accessibility compliance violation.
@@ -52,9 +54,14 @@ class AccessibilityViolation:
     compliance_level: str  # "A", "AA", "AAA"
     automated_detection: bool
     manual_verification_needed: bool
+    
+    CATEGORICAL_FIELDS: ClassVar[Tuple[str, ...]] = ("wcag_criterion", "severity_level", "compliance_level")
+    
+    def __post_init__(self):
+        intern_fields(self, self.CATEGORICAL_FIELDS + ("description", "recommended_fix"))
 
 
-@dataclass
+@dataclass(slots=True)
 class AccessibilityTestResult:
     """
     Results from accessibility testing.
@@ -65,6 +72,12 @@ class AccessibilityTestResult:
     violations: List[AccessibilityViolation]
     recommendations: List[str]
     details: Dict[str, Any]
+    
+    CATEGORICAL_FIELDS: ClassVar[Tuple[str, ...]] = ("test_name",)
+    NESTED_RECORDS: ClassVar[Dict[str, type]] = {"violations": AccessibilityViolation}
+    
+    def __post_init__(self):
+        intern_fields(self, ("test_name", "recommendations"))
 
 
 class AccessibilityChecker:
@@ -406,7 +419,7 @@ class AccessibilityChecker:
                 "wcag_level": wcag_level,
                 "validation_timestamp": datetime.now().isoformat(),
                 "compliance_summary": compliance_summary,
-                "test_results": [result.__dict__ for result in test_results],
+                "test_results": RecordColumns(AccessibilityTestResult, test_results),
                 "violations": self._collect_all_violations(test_results),
                 "recommendations": await self._generate_accessibility_recommendations(test_results),
                 "assistive_technology_support": await self._assess_assistive_technology_support(test_results),
@@ -1095,7 +1108,7 @@ class AccessibilityChecker:
             "meets_threshold": average_score >= self.compliance_thresholds["overall_score"]
         }
     
-    def _collect_all_violations(self, test_results: List[AccessibilityTestResult]) -> List[Dict[str, Any]]:
+    def _collect_all_violations(self, test_results: List[AccessibilityTestResult]) -> RecordColumns:
         """
         Collect all violations from test results.
         
@@ -1103,13 +1116,12 @@ class AccessibilityChecker:
             test_results: List of test results
             
         Returns:
-            List of all violations
+            Columnar collection of all violations (read as violation dicts)
         """
-        all_violations = []
+        all_violations = RecordColumns(AccessibilityViolation)
         
         for result in test_results:
-            for violation in result.violations:
-                all_violations.append(violation.__dict__)
+            all_violations.extend(result.violations)
         
         return all_violations
     
@@ -7,6 +7,7 @@ and security vulnerabilities in municipal training applications.
 
 CRITICAL FUNCTIONALITY:
 - Boundary condition testing with input validation
+- Boundary cases evaluated once per validation spec across form fields
 - Cross-browser compatibility validation
 - Data integrity and consistency testing
 - Security vulnerability detection
@@ -27,11 +28,14 @@ All outputs integrate seamlessly with existing QA validation results.
 import asyncio
 import random
 import logging
-from typing import Dict, Any, List, Optional, Set, Tuple
-from dataclasses import dataclass
+from typing import Dict, Any, ClassVar, List, Optional, Set, Tuple
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum
 
+from .implementation_view import implementation_contains
+from .result_records import intern_fields
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
@@ -57,7 +61,7 @@ class VulnerabilityType(Enum):
     SESSION_MANAGEMENT = "session_management"
 
 
-@dataclass
+@dataclass(slots=True)
 class BoundaryTestResult:
     """Result from boundary condition testing."""
     test_name: str
@@ -68,6 +72,11 @@ class BoundaryTestResult:
     passed: bool
     severity: TestSeverity
     recommendations: List[str]
+    
+    CATEGORICAL_FIELDS: ClassVar[Tuple[str, ...]] = ("expected_behavior", "severity")
+    
+    def __post_init__(self):
+        intern_fields(self, ("test_value", "expected_behavior", "actual_behavior", "recommendations"))
 
 
 @dataclass
@@ -121,6 +130,32 @@ class ExploratoryTestResult:
     critical_issues_found: List[str]
     high_priority_recommendations: List[str]
     security_clearance_status: str
+    boundary_coverage: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class ValidationSpec:
+    """Components sharing one validation spec (component type and boundary tests)."""
+    component_type: str
+    cases: List[Tuple[str, str]]  # (test_value, test_type)
+    component_ids: List[str] = field(default_factory=list)
+
+
+@dataclass
+class BoundaryCasePlan:
+    """Distinct boundary cases per validation spec for one story."""
+    specs: List[ValidationSpec]
+    components: List[Tuple[str, int]] = field(default_factory=list)  # (component_id, spec index)
+    
+    def to_dict(self, failing_cases: int = 0) -> Dict[str, Any]:
+        """Coverage summary for reports."""
+        return {
+            "components": len(self.components),
+            "validation_specs": len(self.specs),
+            "distinct_boundary_cases": sum(len(spec.cases) for spec in self.specs),
+            "failing_cases": failing_cases,
+            "single_field_cases": sum(len(self.specs[index].cases) for _, index in self.components)
+        }
 
 
 class ExploratoryTester:
@@ -135,6 +170,9 @@ class ExploratoryTester:
         """Initialize exploratory tester with configuration."""
         self.config = config or {}
         
+        # Concurrently evaluated distinct boundary cases
+        self.max_concurrent_boundary_cases = max(1, int(self.config.get("boundary_max_concurrent_cases", 8)))
+        
         # Municipal-specific input validation scenarios
         self.boundary_test_scenarios = {
             "personal_numbers": {
@@ -366,8 +404,12 @@ class ExploratoryTester:
             
             # 1. Boundary condition testing
             boundary_results = []
+            boundary_coverage = {}
             if "boundary" in focus_areas:
-                boundary_results = await self._test_boundary_conditions(implementation_data)
+                boundary_plan = self.plan_boundary_cases(implementation_data)
+                boundary_results = await self._test_boundary_conditions(
+                    implementation_data, boundary_plan, boundary_coverage
+                )
             
             # 2. Security vulnerability testing
             security_results = []
@@ -416,7 +458,8 @@ class ExploratoryTester:
                 overall_exploratory_score=overall_score,
                 critical_issues_found=critical_issues,
                 high_priority_recommendations=recommendations,
-                security_clearance_status=security_status
+                security_clearance_status=security_status,
+                boundary_coverage=boundary_coverage
             )
             
             logger.info(f"Exploratory testing completed for {story_id}")
@@ -438,29 +481,89 @@ class ExploratoryTester:
                 security_clearance_status="TESTING_FAILED"
             )
     
-    async def _test_boundary_conditions(
-        self,
-        implementation_data: Dict[str, Any]
-    ) -> List[BoundaryTestResult]:
-        """Test boundary conditions for all input fields."""
-        results = []
-        ui_components = implementation_data.get("ui_components", [])
+    def plan_boundary_cases(self, implementation_data: Dict[str, Any]) -> BoundaryCasePlan:
+        """
+        Plan boundary cases per validation spec.
         
-        for component in ui_components:
+        Components sharing a validation spec (component type and boundary
+        tests) are grouped, so each distinct boundary case is evaluated once.
+        
+        Args:
+            implementation_data: Implementation details to test
+            
+        Returns:
+            Boundary case plan
+        """
+        spec_indices: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], int] = {}
+        specs: List[ValidationSpec] = []
+        components: List[Tuple[str, int]] = []
+        
+        for component in implementation_data.get("ui_components", []):
             if not isinstance(component, dict):
                 continue
-                
+            
             component_type = component.get("component_type", "")
             component_id = component.get("component_id", "unknown")
+            cases = tuple(self._get_boundary_tests_for_component(component))
+            if not cases:
+                continue
             
-            # Determine appropriate boundary tests based on component type
-            test_scenarios = self._get_boundary_tests_for_component(component)
-            
-            for test_value, test_type in test_scenarios:
-                result = await self._perform_boundary_test(
-                    component_id, component_type, test_value, test_type
+            spec_index = spec_indices.get((component_type, cases))
+            if spec_index is None:
+                spec_index = spec_indices[(component_type, cases)] = len(specs)
+                specs.append(ValidationSpec(component_type, list(cases)))
+            specs[spec_index].component_ids.append(component_id)
+            components.append((component_id, spec_index))
+        
+        return BoundaryCasePlan(specs=specs, components=components)
+    
+    async def _test_boundary_conditions(
+        self,
+        implementation_data: Dict[str, Any],
+        plan: Optional[BoundaryCasePlan] = None,
+        coverage: Optional[Dict[str, Any]] = None
+    ) -> List[BoundaryTestResult]:
+        """
+        Test boundary conditions for all input fields.
+        
+        Evaluates each distinct boundary case of a validation spec once,
+        concurrently (at most boundary_max_concurrent_cases at a time), and
+        reports it for every component sharing the spec, in component and
+        test order.
+        
+        Args:
+            implementation_data: Implementation details to test
+            plan: Boundary case plan (planned here if omitted)
+            coverage: Filled with the plan's coverage summary if given
+        """
+        plan = plan or self.plan_boundary_cases(implementation_data)
+        semaphore = asyncio.Semaphore(self.max_concurrent_boundary_cases)
+        
+        async def evaluate(spec: ValidationSpec, test_value: str, test_type: str) -> BoundaryTestResult:
+            async with semaphore:
+                return await self._perform_boundary_test(
+                    spec.component_ids[0], spec.component_type, test_value, test_type
                 )
-                results.append(result)
+        
+        evaluations = await asyncio.gather(*(
+            asyncio.gather(*(evaluate(spec, test_value, test_type) for test_value, test_type in spec.cases))
+            for spec in plan.specs
+        ))
+        if coverage is not None:
+            failing_cases = sum(not result.passed for spec_results in evaluations for result in spec_results)
+            coverage.update(plan.to_dict(failing_cases=failing_cases))
+        
+        # Report each component's boundary tests in component order
+        results = []
+        for component_id, spec_index in plan.components:
+            for case_index, (_, test_type) in enumerate(plan.specs[spec_index].cases):
+                result = evaluations[spec_index][case_index]
+                results.append(replace(
+                    result,
+                    test_name=f"{component_id}_{test_type}",
+                    input_field=component_id,
+                    recommendations=list(result.recommendations)
+                ))
         
         return results
     
@@ -730,10 +833,10 @@ class ExploratoryTester:
         base_impact = impacts.get(vuln_type, "Security compromise")
         
         # Add municipal-specific impact considerations
-        if "citizen" in str(implementation_data).lower() or "personal" in str(implementation_data).lower():
+        if implementation_contains(implementation_data, "citizen", "personal"):
             base_impact += ", citizen privacy violation"
         
-        if "financial" in str(implementation_data).lower() or "budget" in str(implementation_data).lower():
+        if implementation_contains(implementation_data, "financial", "budget"):
             base_impact += ", financial data compromise"
         
         return base_impact
@@ -0,0 +1,140 @@
+"""
+ImplementationView - Precomputed, read-only view of a story's implementation data.
+
+PURPOSE:
+QA tools repeatedly check implementation data for keywords by building
+str(implementation_data).lower(), often several times per method and per
+scenario or role. On large stories that repr spans megabytes of generated
+source. The QA agent builds one view per story; every tool queries it.
+
+CRITICAL CAPABILITIES:
+- Flattened lowercase text built once (same text str(data).lower() gives)
+- Memoized substring queries, token set for whole-word lookups
+- Per-component and per-endpoint lowercase texts
+- Component, endpoint and user flow counts
+- Quality and Anna persona features from QualityIntelligenceEngine
+
+CONTRACT PROTECTION:
+The view is a read-only dict over the original implementation data, so
+tools that read implementation_data keys keep working unchanged.
+"""
+
+import re
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9åäöéü_]+")
+
+
+class ImplementationView(dict):
+    """
+    Immutable per-story view of implementation data.
+    
+    Reads behave like the underlying dict; writes raise TypeError.
+    """
+    
+    def __init__(
+        self,
+        implementation_data: Optional[Dict[str, Any]] = None,
+        story_id: Optional[str] = None,
+        features: Optional[Dict[str, Dict[str, Any]]] = None
+    ):
+        """
+        Build view (one flattening pass over the data).
+        
+        Args:
+            implementation_data: Implementation data from the input contract
+            story_id: Story identifier
+            features: Precomputed feature sets by name ("quality", "anna")
+        """
+        data = dict(implementation_data or {})
+        super().__init__(data)
+        self.story_id = story_id
+        self.text = str(data).lower()
+        self.terms: FrozenSet[str] = frozenset(TOKEN_PATTERN.findall(self.text))
+        self.component_texts: Tuple[str, ...] = tuple(
+            str(component).lower() for component in data.get("ui_components", [])
+        )
+        self.endpoint_texts: Tuple[str, ...] = tuple(
+            str(endpoint).lower() for endpoint in data.get("api_endpoints", [])
+        )
+        self.ui_component_count = len(self.component_texts)
+        self.api_endpoint_count = len(self.endpoint_texts)
+        self.user_flow_count = len(data.get("user_flows", []))
+        self._features = {name: dict(values) for name, values in (features or {}).items()}
+        self._contains: Dict[str, bool] = {}
+    
+    def contains(self, *keywords: str) -> bool:
+        """Whether any keyword occurs in the flattened text (memoized per keyword)."""
+        for keyword in keywords:
+            found = self._contains.get(keyword)
+            if found is None:
+                found = self._contains[keyword] = keyword in self.text
+            if found:
+                return True
+        return False
+    
+    def has_term(self, term: str) -> bool:
+        """Whether term occurs as a whole token."""
+        return term in self.terms
+    
+    def features(self, name: str) -> Optional[Dict[str, Any]]:
+        """Copy of a precomputed feature set, or None if not computed."""
+        values = self._features.get(name)
+        return dict(values) if values is not None else None
+    
+    def with_features(self, **features: Dict[str, Any]) -> "ImplementationView":
+        """View with additional feature sets (shares the precomputed text)."""
+        view = dict.__new__(ImplementationView)
+        dict.update(view, self)
+        view.__dict__.update(self.__dict__)
+        view._features = {**self._features, **{name: dict(values) for name, values in features.items()}}
+        return view
+    
+    def _read_only(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("ImplementationView is read-only")
+    
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+    
+    def __copy__(self) -> "ImplementationView":
+        return self
+    
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "ImplementationView":
+        return self
+    
+    def __reduce__(self):
+        return (ImplementationView, (dict(self), self.story_id, self._features))
+
+
+def implementation_text(implementation_data: Any) -> str:
+    """Lowercase text of implementation data (precomputed for views)."""
+    if isinstance(implementation_data, ImplementationView):
+        return implementation_data.text
+    return str(implementation_data).lower()
+
+
+def implementation_contains(implementation_data: Any, *keywords: str) -> bool:
+    """Whether any keyword occurs in the implementation data's text."""
+    if isinstance(implementation_data, ImplementationView):
+        return implementation_data.contains(*keywords)
+    text = str(implementation_data).lower()
+    return any(keyword in text for keyword in keywords)
+
+
+def component_texts(implementation_data: Any) -> Tuple[str, ...]:
+    """Lowercase text of each UI component, in order."""
+    if isinstance(implementation_data, ImplementationView):
+        return implementation_data.component_texts
+    return tuple(str(component).lower() for component in implementation_data.get("ui_components", []))
+
+
+def endpoint_texts(implementation_data: Any) -> Tuple[str, ...]:
+    """Lowercase text of each API endpoint, in order."""
+    if isinstance(implementation_data, ImplementationView):
+        return implementation_data.endpoint_texts
+    return tuple(str(endpoint).lower() for endpoint in implementation_data.get("api_endpoints", []))
+
+
+def any_text_contains(texts: Iterable[str], *keywords: str) -> bool:
+    """Whether any keyword occurs in any of the texts."""
+    return any(keyword in text for text in texts for keyword in keywords)
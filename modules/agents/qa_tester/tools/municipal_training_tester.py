@@ -11,10 +11,12 @@ CRITICAL FUNCTIONALITY:
 - Crisis management and emergency procedure validation
 - Integration testing with existing municipal systems
 - Municipal workflow pattern validation
+- Compiled policy requirement rules with a cross-story evaluation cache
 
 ADAPTATION GUIDE:
 To adapt for your municipal context:
 1. Update swedish_municipal_policies for your region's requirements
+   (and policy_requirement_rules for how each requirement is checked)
 2. Modify municipal_roles for your organizational structure
 3. Adjust crisis_scenarios for your emergency procedures
 4. Update system_integrations for your IT environment
@@ -26,11 +28,16 @@ All outputs integrate seamlessly with existing QA validation results.
 
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, List, Optional, Set, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 
+from .implementation_view import any_text_contains, component_texts, endpoint_texts
+from .policy_rules import (
+    PolicyEvaluationCache, PolicyInputs, PolicyRule, compile_policy_rules, policy_version
+)
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
@@ -232,6 +239,48 @@ class MunicipalTrainingTester:
             }
         }
         
+        # How policy requirements are checked: input slice plus keywords or a
+        # component attribute. Requirements without a rule are compliant.
+        self.policy_requirement_rules = {
+            PolicyCategory.GDPR_COMPLIANCE: {
+                "personal_data_protection": {
+                    "inputs": "component_texts",
+                    "keywords": ["encrypt"],
+                    "issue": "No data encryption mechanisms found",
+                    "recommendations": ["Implement data encryption for personal data"]
+                },
+                "consent_management": {
+                    "inputs": "component_texts",
+                    "keywords": ["consent", "gdpr"],
+                    "issue": "No consent management mechanism found",
+                    "recommendations": ["Add GDPR consent collection forms"]
+                }
+            },
+            PolicyCategory.ACCESSIBILITY_LAW: {
+                "wcag_2_1_aa_compliance": {
+                    "inputs": "ui_components",
+                    "attribute": "accessibility_attributes",
+                    "issue": "Missing WCAG 2.1 AA compliance attributes",
+                    "recommendations": ["Add accessibility attributes to all UI components"]
+                }
+            },
+            PolicyCategory.EMPLOYMENT_LAW: {
+                "equal_opportunity_training": {
+                    "inputs": "implementation_text",
+                    "keywords": ["inclusive"],
+                    "issue": "No evidence of equal opportunity considerations",
+                    "recommendations": ["Ensure training content promotes equal opportunity"]
+                }
+            }
+        }
+        
+        # Compiled rules per policy (recompiled when the policy version changes)
+        # and requirement results shared across stories
+        self._compiled_policy_rules: Dict[PolicyCategory, Tuple[str, Dict[str, PolicyRule]]] = {}
+        self.policy_evaluation_cache = PolicyEvaluationCache(
+            self.config.get("policy_cache_max_entries", 4096)
+        )
+        
         # Municipal role definitions with specific responsibilities
         self.municipal_roles = {
             MunicipalUserRole.ADMINISTRATOR: {
@@ -567,6 +616,21 @@ class MunicipalTrainingTester:
                 critical_blockers=[f"Municipal testing failed: {str(e)}"]
             )
     
+    def get_policy_cache_status(self) -> Dict[str, Any]:
+        """
+        Effectiveness of the cross-story policy evaluation cache.
+        
+        Returns:
+            Cache hits, misses, hit rate and evictions plus compiled policy versions
+        """
+        return {
+            **self.policy_evaluation_cache.stats(),
+            "compiled_policies": {
+                policy_category.value: version
+                for policy_category, (version, _) in self._compiled_policy_rules.items()
+            }
+        }
+    
     async def _test_policy_compliance(
         self,
         implementation_data: Dict[str, Any],
@@ -574,6 +638,7 @@ class MunicipalTrainingTester:
     ) -> List[PolicyComplianceResult]:
         """Test compliance with Swedish municipal policies."""
         results = []
+        policy_inputs = PolicyInputs(implementation_data)
         
         for policy_category in policies_to_test:
             if policy_category not in self.swedish_municipal_policies:
@@ -583,17 +648,19 @@ class MunicipalTrainingTester:
             logger.info(f"Testing policy compliance: {policy_category.value}")
             
             result = await self._validate_specific_policy(
-                policy_category, policy_info, implementation_data
+                policy_category, policy_info, implementation_data, policy_inputs
             )
             results.append(result)
         
+        logger.debug(f"Policy evaluation cache: {self.policy_evaluation_cache.stats()}")
         return results
     
     async def _validate_specific_policy(
         self,
         policy_category: PolicyCategory,
         policy_info: Dict[str, Any],
-        implementation_data: Dict[str, Any]
+        implementation_data: Dict[str, Any],
+        policy_inputs: Optional[PolicyInputs] = None
     ) -> PolicyComplianceResult:
         """Validate compliance with a specific policy."""
         requirements = policy_info["requirements"]
@@ -602,11 +669,12 @@ class MunicipalTrainingTester:
         critical_issues = []
         recommendations = []
         
+        rules = self._policy_rules(policy_category, policy_info)
+        policy_inputs = policy_inputs or PolicyInputs(implementation_data)
+        
         # Test each requirement
         for requirement in requirements:
-            compliance_result = await self._test_policy_requirement(
-                requirement, policy_category, implementation_data
-            )
+            compliance_result = self.policy_evaluation_cache.evaluate(rules[requirement], policy_inputs)
             
             if compliance_result["compliant"]:
                 passed_items.append(requirement)
@@ -643,67 +711,32 @@ class MunicipalTrainingTester:
         self,
         requirement: str,
         policy_category: PolicyCategory,
-        implementation_data: Dict[str, Any]
+        implementation_data: Dict[str, Any],
+        policy_inputs: Optional[PolicyInputs] = None
     ) -> Dict[str, Any]:
         """Test a specific policy requirement."""
-        # This is a simplified implementation - in reality, each requirement would have
-        # specific validation logic based on the implementation data
-        
-        ui_components = implementation_data.get("ui_components", [])
-        api_endpoints = implementation_data.get("api_endpoints", [])
-        configuration = implementation_data.get("configuration", {})
-        
-        # GDPR compliance checks
-        if policy_category == PolicyCategory.GDPR_COMPLIANCE:
-            if requirement == "personal_data_protection":
-                # Check for data encryption, secure storage
-                has_encryption = any("encrypt" in str(comp).lower() for comp in ui_components)
-                return {
-                    "compliant": has_encryption,
-                    "issue": "No data encryption mechanisms found" if not has_encryption else None,
-                    "recommendations": ["Implement data encryption for personal data"] if not has_encryption else []
-                }
-            
-            elif requirement == "consent_management":
-                # Check for consent collection mechanisms
-                has_consent = any("consent" in str(comp).lower() or "gdpr" in str(comp).lower() for comp in ui_components)
-                return {
-                    "compliant": has_consent,
-                    "issue": "No consent management mechanism found" if not has_consent else None,
-                    "recommendations": ["Add GDPR consent collection forms"] if not has_consent else []
-                }
-        
-        # Accessibility compliance checks
-        elif policy_category == PolicyCategory.ACCESSIBILITY_LAW:
-            if requirement == "wcag_2_1_aa_compliance":
-                # Check for accessibility attributes
-                has_accessibility = any(
-                    comp.get("accessibility_attributes") for comp in ui_components
-                    if isinstance(comp, dict)
-                )
-                return {
-                    "compliant": has_accessibility,
-                    "issue": "Missing WCAG 2.1 AA compliance attributes" if not has_accessibility else None,
-                    "recommendations": ["Add accessibility attributes to all UI components"] if not has_accessibility else []
-                }
-        
-        # Employment law checks
-        elif policy_category == PolicyCategory.EMPLOYMENT_LAW:
-            if requirement == "equal_opportunity_training":
-                # Check for inclusive content and equal access
-                has_inclusive_content = "inclusive" in str(implementation_data).lower()
-                return {
-                    "compliant": has_inclusive_content,
-                    "issue": "No evidence of equal opportunity considerations" if not has_inclusive_content else None,
-                    "recommendations": ["Ensure training content promotes equal opportunity"] if not has_inclusive_content else []
-                }
+        policy_info = self.swedish_municipal_policies.get(policy_category, {"requirements": []})
+        rule = self._policy_rules(policy_category, policy_info).get(requirement)
+        if rule is None:
+            # Requirements outside the policy definition have no rule
+            return {"compliant": True, "issue": None, "recommendations": []}
+        
+        return self.policy_evaluation_cache.evaluate(
+            rule, policy_inputs or PolicyInputs(implementation_data)
+        )
+    
+    def _policy_rules(self, policy_category: PolicyCategory, policy_info: Dict[str, Any]) -> Dict[str, PolicyRule]:
+        """Compiled requirement rules of a policy, recompiled only when the policy version changes."""
+        rule_definitions = self.policy_requirement_rules.get(policy_category, {})
+        version = policy_version(policy_info, rule_definitions)
+        compiled = self._compiled_policy_rules.get(policy_category)
+        
+        if compiled is None or compiled[0] != version:
+            compiled = self._compiled_policy_rules[policy_category] = (
+                version, compile_policy_rules(policy_category, policy_info, rule_definitions)
+            )
         
-        # Default compliance check (simplified)
-        return {
-            "compliant": True,
-            "issue": None,
-            "recommendations": []
-        }
+        return compiled[1]
     
     async def _test_municipal_roles(
         self,
@@ -996,8 +1029,7 @@ class MunicipalTrainingTester:
         )
         
         # Simulate information accuracy
-        ui_components = implementation_data.get("ui_components", [])
-        info_components = [comp for comp in ui_components if "info" in str(comp).lower()]
+        info_components = [text for text in component_texts(implementation_data) if "info" in text]
         information_accuracy = min(100, (len(info_components) * 20) + random.uniform(60, 90))
         
         # Test procedure compliance
@@ -1007,7 +1039,7 @@ class MunicipalTrainingTester:
         
         # Simulate communication effectiveness
         communication_effectiveness = random.uniform(3.0, 5.0)
-        if any("communication" in str(comp).lower() for comp in ui_components):
+        if any_text_contains(component_texts(implementation_data), "communication"):
             communication_effectiveness += 0.5
         
         # Determine if stress test passed
@@ -1048,31 +1080,20 @@ class MunicipalTrainingTester:
         ui_components = implementation_data.get("ui_components", [])
         api_endpoints = implementation_data.get("api_endpoints", [])
         
-        # Check if system has components supporting crisis actions
-        supported_actions = 0
+        # Texts of UI components and API endpoints that can support crisis actions
+        candidate_texts = [
+            text for component, text in zip(ui_components, component_texts(implementation_data))
+            if isinstance(component, dict)
+        ] + [
+            text for endpoint, text in zip(api_endpoints, endpoint_texts(implementation_data))
+            if isinstance(endpoint, dict)
+        ]
         
-        for action in required_actions:
-            action_supported = False
-            
-            # Check UI components for crisis action support
-            for component in ui_components:
-                if isinstance(component, dict):
-                    component_text = str(component).lower()
-                    if any(keyword in component_text for keyword in action.split("_")):
-                        action_supported = True
-                        break
-            
-            # Check API endpoints for crisis action support
-            if not action_supported:
-                for endpoint in api_endpoints:
-                    if isinstance(endpoint, dict):
-                        endpoint_text = str(endpoint).lower()
-                        if any(keyword in endpoint_text for keyword in action.split("_")):
-                            action_supported = True
-                            break
-            
-            if action_supported:
-                supported_actions += 1
+        # Check if system has components supporting crisis actions
+        supported_actions = sum(
+            1 for action in required_actions
+            if any_text_contains(candidate_texts, *action.split("_"))
+        )
         
         # Consider compliant if at least 60% of actions are supported
         compliance_threshold = 0.6
@@ -1154,14 +1175,10 @@ class MunicipalTrainingTester:
     def _test_data_consistency(self, system_name: str, implementation_data: Dict[str, Any]) -> bool:
         """Test data consistency with municipal system."""
         # Simplified test - check if data structures are defined
-        api_endpoints = implementation_data.get("api_endpoints", [])
         database_schema = implementation_data.get("database_schema", {})
         
         # Look for data-related endpoints or schema
-        has_data_endpoints = any(
-            "data" in str(endpoint).lower() or "sync" in str(endpoint).lower()
-            for endpoint in api_endpoints
-        )
+        has_data_endpoints = any_text_contains(endpoint_texts(implementation_data), "data", "sync")
         has_schema = bool(database_schema)
         
         return has_data_endpoints or has_schema
@@ -0,0 +1,319 @@
+"""
+NavigationGraph - Per-story navigation graph and flow prefix trie.
+
+PURPOSE:
+UserFlowValidator validates many flows per story, and municipal onboarding
+stories have dozens of flows sharing prefixes (login -> dashboard -> module).
+The graph and trie are built once per story, so navigation structure,
+reachability and step validation are derived once instead of per flow.
+
+CRITICAL CAPABILITIES:
+- Directed graph of flow steps/screens from flows and navigation_structure
+- Breadth-first depths and reachability from entry points, computed once
+- Memoized breadth-first shortest paths between steps
+- Component element index and memoized accessibility checks
+- Prefix trie of flow steps: each distinct prefix is validated once and
+  keeps running totals, so a flow's totals come from its last node
+
+CONTRACT PROTECTION:
+Flow validation through the trie produces the same step results, issues
+and metrics as validating every step of every flow separately.
+"""
+
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence
+
+NAVIGATION_COMPONENT_TYPES = ("nav", "menu", "link")
+
+
+class NavigationGraph:
+    """
+    Directed navigation graph of one story.
+    
+    Nodes are flow steps or screens; an edge means the user can move
+    directly from one to the other.
+    """
+    
+    def __init__(self, ui_components: Optional[List[Dict[str, Any]]] = None):
+        """
+        Initialize graph with the story's UI components.
+        
+        Args:
+            ui_components: UI components of the implementation
+        """
+        self.ui_components = list(ui_components or [])
+        self.edges: Dict[str, List[str]] = {}
+        self.entry_points: List[str] = []
+        
+        # Component structure derived once per story
+        self.element_fields = tuple(
+            tuple(str(component.get(field) or "") for field in ("id", "type", "class"))
+            for component in self.ui_components
+        )
+        self.navigation_elements = [
+            component for component in self.ui_components
+            if component.get("type") in NAVIGATION_COMPONENT_TYPES
+        ]
+        self.breadcrumb_elements = [
+            component for component in self.ui_components
+            if "breadcrumb" in component.get("type", "")
+        ]
+        self.navigation_styles = set(element.get("style", "") for element in self.navigation_elements)
+        
+        self._element_cache: Dict[str, bool] = {}
+        self._accessibility_cache: Dict[str, bool] = {}
+        self._depths: Optional[Dict[str, int]] = None
+        self._parents_from: Dict[str, Dict[str, Optional[str]]] = {}
+    
+    @classmethod
+    def build(
+        cls,
+        step_sequences: Iterable[Sequence[str]],
+        navigation_structure: Optional[Dict[str, Any]] = None,
+        ui_components: Optional[List[Dict[str, Any]]] = None
+    ) -> "NavigationGraph":
+        """
+        Build graph from flow step sequences and the navigation structure.
+        
+        Consecutive steps of a flow become edges and each flow's first step
+        an entry point. navigation_structure may add "entry_points" (or
+        "entry"), "edges" ([from, to] pairs or {"from", "to"} dicts) and
+        "routes" (node -> list of targets); other keys are ignored.
+        
+        Args:
+            step_sequences: Step identifiers of each flow, in order
+            navigation_structure: Navigation structure from implementation data
+            ui_components: UI components of the implementation
+        
+        Returns:
+            Navigation graph
+        """
+        graph = cls(ui_components)
+        for steps in step_sequences:
+            steps = [str(step) for step in steps if step is not None]
+            if not steps:
+                continue
+            graph.add_entry_point(steps[0])
+            for source, target in zip(steps, steps[1:]):
+                graph.add_edge(source, target)
+        graph._add_navigation_structure(navigation_structure or {})
+        return graph
+    
+    def add_node(self, node: str) -> None:
+        """Add node without edges."""
+        self.edges.setdefault(node, [])
+    
+    def add_entry_point(self, node: str) -> None:
+        """Mark node as a place users start from."""
+        self.add_node(node)
+        if node not in self.entry_points:
+            self.entry_points.append(node)
+            self._invalidate()
+    
+    def add_edge(self, source: str, target: str) -> None:
+        """Add directed edge (duplicates are ignored)."""
+        self.add_node(target)
+        targets = self.edges.setdefault(source, [])
+        if target not in targets:
+            targets.append(target)
+            self._invalidate()
+    
+    def depths(self) -> Dict[str, int]:
+        """
+        Fewest navigation steps from an entry point to each reachable node.
+        
+        Without declared entry points, nodes nobody links to are used.
+        """
+        if self._depths is None:
+            depths: Dict[str, int] = {}
+            queue = deque()
+            for entry in self._effective_entry_points():
+                if entry not in depths:
+                    depths[entry] = 0
+                    queue.append(entry)
+            while queue:
+                node = queue.popleft()
+                for target in self.edges.get(node, ()):
+                    if target not in depths:
+                        depths[target] = depths[node] + 1
+                        queue.append(target)
+            self._depths = depths
+        return self._depths
+    
+    def unreachable_nodes(self) -> List[str]:
+        """Nodes that cannot be reached from any entry point."""
+        depths = self.depths()
+        return [node for node in self.edges if node not in depths]
+    
+    @property
+    def max_depth(self) -> int:
+        """Deepest shortest-path distance from an entry point."""
+        return max(self.depths().values(), default=0)
+    
+    def shortest_path(self, source: str, target: str) -> Optional[List[str]]:
+        """
+        Shortest path between two nodes (BFS from source, memoized per source).
+        
+        Returns:
+            Nodes from source to target inclusive, or None if target is unreachable
+        """
+        if source not in self.edges:
+            return None
+        parents = self._parents_from.get(source)
+        if parents is None:
+            parents = {source: None}
+            queue = deque([source])
+            while queue:
+                node = queue.popleft()
+                for next_node in self.edges.get(node, ()):
+                    if next_node not in parents:
+                        parents[next_node] = node
+                        queue.append(next_node)
+            self._parents_from[source] = parents
+        if target not in parents:
+            return None
+        path = [target]
+        while path[-1] != source:
+            path.append(parents[path[-1]])
+        return path[::-1]
+    
+    def has_element(self, name: str) -> bool:
+        """Whether any component's id, type or class contains name (memoized)."""
+        found = self._element_cache.get(name)
+        if found is None:
+            found = self._element_cache[name] = any(
+                name in field for fields in self.element_fields for field in fields
+            )
+        return found
+    
+    def accessibility(self, requirement: str, check: Callable[[str, List[Dict[str, Any]]], bool]) -> bool:
+        """Result of an accessibility check against the story's components (memoized per requirement)."""
+        met = self._accessibility_cache.get(requirement)
+        if met is None:
+            met = self._accessibility_cache[requirement] = check(requirement, self.ui_components)
+        return met
+    
+    def summary(self) -> Dict[str, Any]:
+        """Reachability summary for reports."""
+        return {
+            "nodes": len(self.edges),
+            "edges": sum(len(targets) for targets in self.edges.values()),
+            "entry_points": self._effective_entry_points(),
+            "unreachable_nodes": self.unreachable_nodes(),
+            "max_depth": self.max_depth
+        }
+    
+    def _effective_entry_points(self) -> List[str]:
+        if self.entry_points:
+            return list(self.entry_points)
+        linked = {target for targets in self.edges.values() for target in targets}
+        roots = [node for node in self.edges if node not in linked]
+        return roots or list(self.edges)[:1]
+    
+    def _add_navigation_structure(self, navigation_structure: Dict[str, Any]) -> None:
+        entries = navigation_structure.get("entry_points", navigation_structure.get("entry"))
+        if isinstance(entries, str):
+            entries = [entries]
+        if isinstance(entries, list):
+            for entry in entries:
+                self.add_entry_point(str(entry))
+        
+        edges = navigation_structure.get("edges")
+        if isinstance(edges, list):
+            for edge in edges:
+                if isinstance(edge, dict):
+                    source, target = edge.get("from"), edge.get("to")
+                elif isinstance(edge, (list, tuple)) and len(edge) == 2:
+                    source, target = edge
+                else:
+                    continue
+                if source is not None and target is not None:
+                    self.add_edge(str(source), str(target))
+        
+        routes = navigation_structure.get("routes")
+        if isinstance(routes, dict):
+            for source, targets in routes.items():
+                self.add_node(str(source))
+                for target in [targets] if isinstance(targets, str) else targets or []:
+                    self.add_edge(str(source), str(target))
+    
+    def _invalidate(self) -> None:
+        self._depths = None
+        self._parents_from.clear()
+
+
+class FlowTrieNode:
+    """One distinct flow prefix: its last step, validation result and running totals."""
+    
+    __slots__ = (
+        "key", "step", "parent", "children", "result", "completion_minutes",
+        "user_experience_total", "accessibility_total", "success_rate_total"
+    )
+    
+    def __init__(self, key: Any, step: Any, parent: Optional["FlowTrieNode"]):
+        self.key = key
+        self.step = step
+        self.parent = parent
+        self.children: Dict[Any, "FlowTrieNode"] = {}
+        self.result = None
+        self.completion_minutes = 0.0
+        self.user_experience_total = 0.0
+        self.accessibility_total = 0.0
+        self.success_rate_total = 0.0
+
+
+class FlowTrie:
+    """
+    Prefix trie of flow step sequences with per-prefix validation memoization.
+    
+    Steps are keyed by their full definition, so steps sharing an id but
+    differing in requirements stay separate. Each distinct prefix is
+    evaluated once, and an identical step under different prefixes reuses
+    its validation result.
+    """
+    
+    def __init__(self, key: Callable[[Any], Any] = repr):
+        """
+        Initialize empty trie.
+        
+        Args:
+            key: Identity of a step definition
+        """
+        self.key = key
+        self.root = FlowTrieNode(None, None, None)
+        self.prefixes_evaluated = 0
+        self.steps_validated = 0
+        self._step_results: Dict[Any, Any] = {}
+    
+    async def validate(self, steps: Sequence[Any], validate_step: Callable[[Any], Awaitable[Any]]) -> List[FlowTrieNode]:
+        """
+        Validate a flow's steps, reusing every prefix evaluated before.
+        
+        Args:
+            steps: Flow steps in order
+            validate_step: Coroutine validating one step (returns FlowStepValidationResult)
+        
+        Returns:
+            Trie nodes of the flow's prefixes; the last holds the flow's totals
+        """
+        node = self.root
+        path = []
+        for step in steps:
+            key = self.key(step)
+            child = node.children.get(key)
+            if child is None:
+                child = node.children[key] = FlowTrieNode(key, step, node)
+            if child.result is None:
+                result = self._step_results.get(key)
+                if result is None:
+                    result = self._step_results[key] = await validate_step(step)
+                    self.steps_validated += 1
+                child.result = result
+                child.completion_minutes = node.completion_minutes + result.completion_time_seconds / 60
+                child.user_experience_total = node.user_experience_total + result.user_experience_score
+                child.accessibility_total = node.accessibility_total + result.accessibility_score
+                child.success_rate_total = node.success_rate_total + result.success_rate
+                self.prefixes_evaluated += 1
+            path.append(child)
+            node = child
+        return path
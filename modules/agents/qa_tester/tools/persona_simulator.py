@@ -11,6 +11,7 @@ CRITICAL FUNCTIONALITY:
 - User satisfaction scoring
 - Learning effectiveness assessment
 - User confusion and error tracking
+- Monte-Carlo simulation of Anna session distributions (vectorized with NumPy)
 
 ADAPTATION GUIDE:
 =' To adapt for your project:
@@ -27,15 +28,40 @@ Changes must maintain consistency with Anna persona requirements.
 import json
 import logging
 import asyncio
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, ClassVar, List, Optional, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
+
+from .result_records import RecordColumns, intern_fields
+
 
 # Setup logging for this module
 logger = logging.getLogger(__name__)
 
+# Monte-Carlo persona context levels, ordered from least to most demanding
+STRESS_LEVELS = ("low", "medium", "high", "very_high", "critical")
+PRIOR_KNOWLEDGE_LEVELS = ("good", "basic", "minimal")
+TIME_PRESSURE_LEVELS = ("low", "medium", "high", "critical")
+
+# Per-level effects aligned with the levels above ("high" stress and "minimal"
+# prior knowledge match the deterministic rules in _simulate_action)
+STRESS_TIME_FACTORS = np.array([1.0, 1.0, 1.5, 1.75, 2.0])
+STRESS_ACTION_PENALTIES = np.array([0.0, 0.0, 0.5, 0.75, 1.0])
+STRESS_SATISFACTION_ADJUSTMENTS = np.array([0.3, 0.0, -0.5, -0.75, -1.0])
+KNOWLEDGE_TIME_FACTORS = np.array([1.0, 1.4, 2.0])
+KNOWLEDGE_ACTION_PENALTIES = np.array([0.0, 0.5, 1.0])
+
+# Probability that a sampled session's context is one level below / at / above the scenario's
+LEVEL_SHIFT_PROBABILITIES = (0.2, 0.6, 0.2)
+
+# Success criteria evaluated by the Monte-Carlo kernel (see _check_success_criteria)
+MONTE_CARLO_CRITERIA = (
+    "time_under_limit", "fast_completion", "no_external_help", "minimal_errors", "error_understanding"
+)
+
 
 @dataclass
 class SimulationScenario:
@@ -52,7 +78,7 @@ class SimulationScenario:
     persona_context: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class PersonaSimulationResult:
     """
     Results from Anna persona simulation testing.
@@ -67,6 +93,43 @@ class PersonaSimulationResult:
     positive_feedback: List[str]
     improvement_suggestions: List[str]
     timestamp: str
+    
+    CATEGORICAL_FIELDS: ClassVar[Tuple[str, ...]] = ("scenario_id",)
+    
+    def __post_init__(self):
+        intern_fields(self, ("scenario_id", "confusion_incidents", "positive_feedback", "improvement_suggestions"))
+
+
+@dataclass
+class PersonaDistributionResult:
+    """
+    Monte-Carlo outcome distribution of one Anna scenario.
+    """
+    scenario_id: str
+    samples: int
+    completion_rate: float
+    completion_rate_ci: Tuple[float, float]
+    time_limit_exceedance: float  # P(completion time > max task duration)
+    time_limit_exceedance_ci: Tuple[float, float]
+    completion_time_minutes: Dict[str, float]  # mean, std, p5, p50, p95
+    satisfaction_score: Dict[str, float]
+    satisfaction_mean_ci: Tuple[float, float]
+    learning_effectiveness_score: Dict[str, float]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "scenario_id": self.scenario_id,
+            "samples": self.samples,
+            "completion_rate": self.completion_rate,
+            "completion_rate_ci": list(self.completion_rate_ci),
+            "time_limit_exceedance": self.time_limit_exceedance,
+            "time_limit_exceedance_ci": list(self.time_limit_exceedance_ci),
+            "completion_time_minutes": self.completion_time_minutes,
+            "satisfaction_score": self.satisfaction_score,
+            "satisfaction_mean_ci": list(self.satisfaction_mean_ci),
+            "learning_effectiveness_score": self.learning_effectiveness_score
+        }
 
 
 class PersonaSimulator:
@@ -136,6 +199,17 @@ class PersonaSimulator:
         # Standard simulation scenarios for DigiNativa
         self.standard_scenarios = self._initialize_standard_scenarios()
         
+        # Monte-Carlo mode: sampled Anna sessions per scenario instead of one point estimate
+        self.monte_carlo_mode = self.config.get("monte_carlo_mode", False)
+        self.monte_carlo_samples = self.config.get("monte_carlo_samples", 5000)
+        self.monte_carlo_seed = self.config.get("monte_carlo_seed")
+        self.monte_carlo_time_sigma = self.config.get("monte_carlo_time_sigma", 0.25)
+        self.monte_carlo_error_rate = self.config.get("monte_carlo_error_rate", 0.01)
+        self.monte_carlo_time_thresholds = self.config.get("monte_carlo_time_thresholds", [5.0, 8.0, 10.0])
+        
+        # Upper bound on sampled actions held in memory at once (stories are chunked to fit)
+        self.monte_carlo_chunk_elements = self.config.get("monte_carlo_chunk_elements", 4_000_000)
+        
         logger.info("PersonaSimulator initialized with Anna characteristics")
     
     def _initialize_standard_scenarios(self) -> List[SimulationScenario]:
@@ -528,7 +602,7 @@ class PersonaSimulator:
                 "persona": "Anna - Municipal Training Coordinator",
                 "simulation_timestamp": datetime.now().isoformat(),
                 "overall_metrics": overall_metrics,
-                "scenario_results": [result.__dict__ for result in simulation_results],
+                "scenario_results": RecordColumns(PersonaSimulationResult, simulation_results),
                 "detailed_analysis": detailed_analysis,
                 "recommendations": await self._generate_persona_recommendations(
                     simulation_results, overall_metrics
@@ -538,6 +612,11 @@ class PersonaSimulator:
                 )
             }
             
+            if self.monte_carlo_mode:
+                anna_simulation_report["monte_carlo_distribution"] = await self.simulate_anna_distribution(
+                    story_id, implementation_data
+                )
+            
             logger.info(f"Anna persona simulation completed for story: {story_id}")
             return anna_simulation_report
             
@@ -551,6 +630,80 @@ class PersonaSimulator:
                 "timestamp": datetime.now().isoformat()
             }
     
+    async def simulate_anna_distribution(self, story_id: str, implementation_data: Dict[str, Any],
+                                       samples: Optional[int] = None,
+                                       seed: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Monte-Carlo simulation of Anna sessions for one story.
+        
+        Args:
+            story_id: Story identifier
+            implementation_data: Feature implementation details
+            samples: Sessions sampled per scenario (default monte_carlo_samples)
+            seed: Random seed (default monte_carlo_seed)
+            
+        Returns:
+            Outcome distributions and confidence intervals per scenario and overall
+        """
+        results = await self.simulate_release_distributions(
+            {story_id: implementation_data}, samples=samples, seed=seed
+        )
+        return results[story_id]
+    
+    async def simulate_release_distributions(self, stories: Dict[str, Dict[str, Any]],
+                                           samples: Optional[int] = None,
+                                           seed: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Monte-Carlo simulation of Anna sessions for every story in a release.
+        
+        Each session samples Anna's stress level, prior knowledge and time
+        pressure around the scenario's context, per-action time variation and
+        errors. All stories, scenarios, sessions and actions are evaluated as
+        NumPy arrays in one pass (chunked by story to bound memory).
+        
+        Args:
+            stories: Story identifier -> implementation data
+            samples: Sessions sampled per scenario (default monte_carlo_samples)
+            seed: Random seed (default monte_carlo_seed)
+            
+        Returns:
+            Story identifier -> distribution report (or error report)
+        """
+        samples = samples or self.monte_carlo_samples
+        rng = np.random.default_rng(self.monte_carlo_seed if seed is None else seed)
+        parameters = self._monte_carlo_scenario_parameters()
+        
+        reports: Dict[str, Dict[str, Any]] = {}
+        complexities = {}
+        for story_id, implementation_data in stories.items():
+            try:
+                complexities[story_id] = self._monte_carlo_story_inputs(implementation_data, parameters)
+            except Exception as e:
+                error_msg = f"Anna Monte-Carlo simulation failed for story {story_id}: {str(e)}"
+                logger.error(error_msg)
+                reports[story_id] = {
+                    "error": error_msg,
+                    "story_id": story_id,
+                    "simulation_failed": True,
+                    "timestamp": datetime.now().isoformat()
+                }
+        
+        story_ids = list(complexities)
+        per_story = max(1, parameters["action_mask"].size * samples)
+        chunk_size = max(1, self.monte_carlo_chunk_elements // per_story)
+        for start in range(0, len(story_ids), chunk_size):
+            chunk = story_ids[start:start + chunk_size]
+            complexity = np.stack([complexities[story_id][0] for story_id in chunk])
+            simple_interface = np.array([complexities[story_id][1] for story_id in chunk])
+            outcomes = self._monte_carlo_kernel(complexity, simple_interface, parameters, samples, rng)
+            for index, story_id in enumerate(chunk):
+                reports[story_id] = self._summarize_monte_carlo_story(
+                    story_id, {name: values[index] for name, values in outcomes.items()}, parameters
+                )
+        
+        logger.info(f"Anna Monte-Carlo simulation completed for {len(stories)} stories ({samples} sessions per scenario)")
+        return {story_id: reports[story_id] for story_id in stories}
+    
     async def _simulate_scenario(self, scenario: SimulationScenario, 
                                implementation_data: Dict[str, Any], story_id: str) -> PersonaSimulationResult:
         """
@@ -860,6 +1013,256 @@ class PersonaSimulator:
         
         return max(1.0, min(5.0, satisfaction))
     
+    def _monte_carlo_scenario_parameters(self) -> Dict[str, np.ndarray]:
+        """
+        Scenario contexts and success criteria as arrays (one entry per scenario).
+        
+        Returns:
+            Level indices, flags, padded action lists and their mask
+        """
+        scenarios = self.standard_scenarios
+        max_actions = max((len(scenario.required_actions) for scenario in scenarios), default=0)
+        
+        def level(scenario: SimulationScenario, key: str, levels: Tuple[str, ...], default: str) -> int:
+            value = scenario.persona_context.get(key, default)
+            return levels.index(value) if value in levels else levels.index(default)
+        
+        parameters = {
+            "scenario_ids": [scenario.scenario_id for scenario in scenarios],
+            "actions": [list(scenario.required_actions) for scenario in scenarios],
+            "action_mask": np.array([
+                [index < len(scenario.required_actions) for index in range(max_actions)]
+                for scenario in scenarios
+            ], dtype=bool).reshape(len(scenarios), max_actions),
+            "stress": np.array([level(s, "stress_level", STRESS_LEVELS, "medium") for s in scenarios]),
+            "knowledge": np.array([level(s, "prior_knowledge", PRIOR_KNOWLEDGE_LEVELS, "good") for s in scenarios]),
+            "pressure": np.array([level(s, "time_pressure", TIME_PRESSURE_LEVELS, "medium") for s in scenarios]),
+            "accessibility": np.array([bool(s.persona_context.get("accessibility_mode")) for s in scenarios]),
+            "easy": np.array([s.difficulty_level == "easy" for s in scenarios]),
+            "hard": np.array([s.difficulty_level == "hard" for s in scenarios])
+        }
+        for criterion in MONTE_CARLO_CRITERIA:
+            parameters[criterion] = np.array([bool(s.success_criteria.get(criterion)) for s in scenarios])
+        return parameters
+    
+    def _monte_carlo_story_inputs(self, implementation_data: Dict[str, Any],
+                                  parameters: Dict[str, Any]) -> Tuple[np.ndarray, bool]:
+        """
+        Action complexity per scenario and action for one story.
+        
+        Returns:
+            (complexity array shaped like the action mask, whether the interface is simple)
+        """
+        ui_components = implementation_data.get("ui_components", [])
+        complexity = np.ones(parameters["action_mask"].shape)
+        assessed: Dict[str, int] = {}
+        for scenario_index, actions in enumerate(parameters["actions"]):
+            for action_index, action in enumerate(actions):
+                if action not in assessed:
+                    assessed[action] = self._assess_action_complexity(action, ui_components)
+                complexity[scenario_index, action_index] = assessed[action]
+        return complexity, len(ui_components) <= 5
+    
+    def _monte_carlo_kernel(self, complexity: np.ndarray, simple_interface: np.ndarray,
+                            parameters: Dict[str, Any], samples: int,
+                            rng: np.random.Generator) -> Dict[str, np.ndarray]:
+        """
+        Vectorized Anna session simulation.
+        
+        Applies the rules of _simulate_action, _check_success_criteria,
+        _calculate_learning_effectiveness and _adjust_satisfaction_for_anna
+        to arrays of sampled sessions.
+        
+        Args:
+            complexity: Action complexity, shape (stories, scenarios, actions)
+            simple_interface: Stories with at most 5 UI components, shape (stories,)
+            parameters: Scenario arrays from _monte_carlo_scenario_parameters
+            samples: Sessions per scenario
+            rng: Random generator
+            
+        Returns:
+            Completion time, satisfaction, learning effectiveness and success, each shaped
+            (stories, scenarios, samples)
+        """
+        stories, scenario_count, _ = complexity.shape
+        shape = (stories, scenario_count, samples)
+        
+        def sample_level(nominal: np.ndarray, level_count: int) -> np.ndarray:
+            shift = rng.choice((-1, 0, 1), size=shape, p=LEVEL_SHIFT_PROBABILITIES)
+            return np.clip(nominal[None, :, None] + shift, 0, level_count - 1)
+        
+        stress = sample_level(parameters["stress"], len(STRESS_LEVELS))
+        knowledge = sample_level(parameters["knowledge"], len(PRIOR_KNOWLEDGE_LEVELS))
+        pressure = sample_level(parameters["pressure"], len(TIME_PRESSURE_LEVELS))
+        
+        # Per-action outcomes, shape (stories, scenarios, samples, actions)
+        mask = parameters["action_mask"][None, :, None, :]
+        action_complexity = complexity[:, :, None, :]
+        action_shape = shape + (complexity.shape[-1],)
+        
+        # Per-action arrays are float32 (halves memory traffic for release-wide batches)
+        time_factor = (STRESS_TIME_FACTORS[stress] * KNOWLEDGE_TIME_FACTORS[knowledge]).astype(np.float32)
+        time_noise = rng.standard_normal(action_shape, dtype=np.float32)
+        time_noise *= np.float32(self.monte_carlo_time_sigma)
+        action_time = time_factor[..., None] * np.exp(time_noise, out=time_noise)
+        
+        error_probability = (self.monte_carlo_error_rate * (1 + stress[..., None]) * action_complexity).astype(np.float32)
+        errors = (rng.random(action_shape, dtype=np.float32) < error_probability) & mask
+        recovery_time = rng.random(action_shape, dtype=np.float32) + np.float32(0.5)
+        action_time += np.where(errors, recovery_time, np.float32(0.0))
+        
+        complex_action = action_complexity > 3
+        positive = (action_complexity <= 2) & simple_interface[:, None, None, None] & mask
+        pressured = (pressure >= TIME_PRESSURE_LEVELS.index("high"))[..., None] & (action_time > 2.0)
+        confused = (complex_action | pressured) & mask
+        
+        action_satisfaction = (
+            5.0
+            - (STRESS_ACTION_PENALTIES[stress] + KNOWLEDGE_ACTION_PENALTIES[knowledge])[..., None]
+            - 1.5 * complex_action + 0.5 * positive - 2.0 * pressured
+        )
+        
+        completion_time = np.where(mask, action_time, 0.0).sum(axis=-1)
+        satisfaction = np.minimum(5.0, np.where(mask, action_satisfaction, 5.0).min(axis=-1))
+        confusion = confused.sum(axis=-1)
+        error_count = errors.sum(axis=-1)
+        positives = positive.sum(axis=-1)
+        
+        def scenario_flag(name: str) -> np.ndarray:
+            return parameters[name][None, :, None]
+        
+        # Success criteria
+        completed = ~(
+            (scenario_flag("time_under_limit") & (completion_time > self.max_task_duration_minutes))
+            | (scenario_flag("fast_completion") & (completion_time > 5.0))
+            | (scenario_flag("no_external_help") & (confusion > 2))
+            | (scenario_flag("minimal_errors") & (error_count > 1))
+            | (scenario_flag("error_understanding") & (error_count > 0) & (confusion > error_count))
+        )
+        
+        # Learning effectiveness
+        learning = 3.0 + completed + 0.3 * positives - 0.5 * confusion
+        learning = learning + 0.5 * scenario_flag("easy") + np.where(scenario_flag("hard"), np.where(completed, 1.0, -1.0), 0.0)
+        
+        # Satisfaction adjusted for Anna's characteristics
+        satisfaction = satisfaction + np.select(
+            [completion_time <= 5.0, completion_time <= 8.0, completion_time > 10.0], [1.0, 0.5, -2.0], 0.0
+        )
+        satisfaction = satisfaction - 0.8 * confusion + STRESS_SATISFACTION_ADJUSTMENTS[stress]
+        satisfaction = satisfaction + np.where(scenario_flag("accessibility"), np.where(confusion == 0, 0.5, -1.0), 0.0)
+        
+        return {
+            "completion_time": completion_time,
+            "satisfaction": np.clip(satisfaction, 1.0, 5.0),
+            "learning": np.clip(learning, 1.0, 5.0),
+            "completed": completed
+        }
+    
+    def _summarize_monte_carlo_story(self, story_id: str, outcomes: Dict[str, np.ndarray],
+                                     parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Distribution report for one story from its sampled sessions.
+        
+        Args:
+            story_id: Story identifier
+            outcomes: Kernel outputs for the story, each shaped (scenarios, samples)
+            parameters: Scenario arrays from _monte_carlo_scenario_parameters
+            
+        Returns:
+            Per-scenario and overall distributions with confidence intervals
+        """
+        completion_time = outcomes["completion_time"]
+        satisfaction = outcomes["satisfaction"]
+        samples = completion_time.shape[-1]
+        over_limit = completion_time > self.max_task_duration_minutes
+        
+        time_stats = self._distribution_statistics(completion_time)
+        satisfaction_stats = self._distribution_statistics(satisfaction)
+        learning_stats = self._distribution_statistics(outcomes["learning"])
+        completed_counts = outcomes["completed"].sum(axis=-1)
+        over_limit_counts = over_limit.sum(axis=-1)
+        
+        scenario_distributions = []
+        for index, scenario_id in enumerate(parameters["scenario_ids"]):
+            satisfaction_mean = satisfaction_stats[index]["mean"]
+            satisfaction_margin = 1.96 * satisfaction_stats[index]["std"] / np.sqrt(samples)
+            scenario_distributions.append(PersonaDistributionResult(
+                scenario_id=scenario_id,
+                samples=samples,
+                completion_rate=round(float(completed_counts[index]) / samples, 4),
+                completion_rate_ci=self._wilson_interval(int(completed_counts[index]), samples),
+                time_limit_exceedance=round(float(over_limit_counts[index]) / samples, 4),
+                time_limit_exceedance_ci=self._wilson_interval(int(over_limit_counts[index]), samples),
+                completion_time_minutes=time_stats[index],
+                satisfaction_score=satisfaction_stats[index],
+                satisfaction_mean_ci=(
+                    round(float(satisfaction_mean - satisfaction_margin), 4),
+                    round(float(satisfaction_mean + satisfaction_margin), 4)
+                ),
+                learning_effectiveness_score=learning_stats[index]
+            ))
+        
+        total = completion_time.size
+        completed_total = int(completed_counts.sum())
+        over_limit_total = int(over_limit_counts.sum())
+        overall_satisfaction = self._distribution_statistics(satisfaction.reshape(1, -1))[0]
+        satisfaction_margin = 1.96 * overall_satisfaction["std"] / np.sqrt(total)
+        
+        return {
+            "story_id": story_id,
+            "persona": "Anna - Municipal Training Coordinator",
+            "simulation_timestamp": datetime.now().isoformat(),
+            "samples_per_scenario": samples,
+            "overall_distribution": {
+                "sessions": total,
+                "completion_rate": round(completed_total / total, 4),
+                "completion_rate_ci": list(self._wilson_interval(completed_total, total)),
+                "time_limit_minutes": self.max_task_duration_minutes,
+                "time_limit_exceedance": round(over_limit_total / total, 4),
+                "time_limit_exceedance_ci": list(self._wilson_interval(over_limit_total, total)),
+                "completion_time_exceedance": {
+                    str(threshold): round(float((completion_time > threshold).mean()), 4)
+                    for threshold in self.monte_carlo_time_thresholds
+                },
+                "completion_time_minutes": self._distribution_statistics(completion_time.reshape(1, -1))[0],
+                "satisfaction_score": overall_satisfaction,
+                "satisfaction_mean_ci": [
+                    round(float(overall_satisfaction["mean"] - satisfaction_margin), 4),
+                    round(float(overall_satisfaction["mean"] + satisfaction_margin), 4)
+                ],
+                "learning_effectiveness_score": self._distribution_statistics(outcomes["learning"].reshape(1, -1))[0]
+            },
+            "scenario_distributions": [result.to_dict() for result in scenario_distributions]
+        }
+    
+    @staticmethod
+    def _distribution_statistics(values: np.ndarray) -> List[Dict[str, float]]:
+        """Mean, standard deviation and 5th/50th/95th percentiles along the last axis, per row."""
+        means = values.mean(axis=-1)
+        stds = values.std(axis=-1)
+        percentiles = np.percentile(values, [5, 50, 95], axis=-1)
+        return [
+            {
+                "mean": round(float(means[row]), 4),
+                "std": round(float(stds[row]), 4),
+                "p5": round(float(percentiles[0, row]), 4),
+                "p50": round(float(percentiles[1, row]), 4),
+                "p95": round(float(percentiles[2, row]), 4)
+            }
+            for row in range(values.shape[0])
+        ]
+    
+    @staticmethod
+    def _wilson_interval(successes: int, trials: int, z: float = 1.96) -> Tuple[float, float]:
+        """95% Wilson score interval for a proportion."""
+        if trials == 0:
+            return (0.0, 1.0)
+        proportion = successes / trials
+        denominator = 1 + z * z / trials
+        centre = (proportion + z * z / (2 * trials)) / denominator
+        margin = z * np.sqrt(proportion * (1 - proportion) / trials + z * z / (4 * trials * trials)) / denominator
+        return (round(float(max(0.0, centre - margin)), 4), round(float(min(1.0, centre + margin)), 4))
+    
     def _calculate_overall_metrics(self, simulation_results: List[PersonaSimulationResult]) -> Dict[str, Any]:
         """
         Calculate overall metrics from all simulation results.
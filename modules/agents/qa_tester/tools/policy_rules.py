@@ -0,0 +1,258 @@
+"""
+PolicyRules - Compiled municipal policy requirement rules and evaluation cache.
+
+PURPOSE:
+MunicipalTrainingTester validates every policy requirement for every story,
+although Swedish municipal policies (GDPR, accessibility law, procurement)
+almost never change. Requirement rules are compiled once into predicate
+objects, and results are cached across stories keyed by policy version,
+requirement and a fingerprint of the implementation slice the rule reads.
+
+CRITICAL CAPABILITIES:
+- Rule definitions compiled into PolicyRule predicates once per policy version
+- Policy version derived from requirements and rule definitions, so edits
+  to either invalidate earlier results
+- Per-story implementation slices with memoized fingerprints
+- Bounded LRU cache of requirement results with hit/miss/eviction stats
+- Rules reading the whole implementation text bypass the cache, since
+  fingerprinting that text costs as much as the keyword scan itself
+
+CONTRACT PROTECTION:
+Cached results are copies of what evaluating the rule directly returns,
+so policy compliance results are identical with or without the cache.
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from .implementation_view import any_text_contains, component_texts, endpoint_texts, implementation_text
+
+# Implementation slices a rule can read
+POLICY_INPUTS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "component_texts": component_texts,
+    "endpoint_texts": endpoint_texts,
+    "ui_components": lambda data: tuple(data.get("ui_components", [])),
+    "configuration": lambda data: data.get("configuration", {}),
+    "implementation_text": implementation_text
+}
+
+# Slices whose fingerprint costs as much as evaluating a rule on them
+UNCACHED_INPUTS = frozenset({"implementation_text"})
+
+
+class PolicyRule:
+    """
+    Compiled predicate for one policy requirement.
+    
+    Rules without inputs do not depend on the implementation, so their
+    result is shared by every story.
+    """
+    
+    __slots__ = ("policy_category", "requirement", "version", "inputs", "predicate", "issue", "recommendations")
+    
+    def __init__(
+        self,
+        policy_category: Any,
+        requirement: str,
+        version: str,
+        inputs: Optional[str] = None,
+        predicate: Optional[Callable[[Any], bool]] = None,
+        issue: Optional[str] = None,
+        recommendations: Tuple[str, ...] = ()
+    ):
+        if inputs is not None and inputs not in POLICY_INPUTS:
+            raise ValueError(f"Unknown policy rule input: {inputs}")
+        self.policy_category = policy_category
+        self.requirement = requirement
+        self.version = version
+        self.inputs = inputs
+        self.predicate = predicate
+        self.issue = issue
+        self.recommendations = tuple(recommendations)
+    
+    def evaluate(self, value: Any) -> Dict[str, Any]:
+        """
+        Evaluate rule against its implementation slice.
+        
+        Returns:
+            Requirement result with compliant, issue and recommendations
+        """
+        compliant = True if self.predicate is None else bool(self.predicate(value))
+        return {
+            "compliant": compliant,
+            "issue": None if compliant else self.issue,
+            "recommendations": [] if compliant else list(self.recommendations)
+        }
+
+
+def policy_version(policy_info: Dict[str, Any], rule_definitions: Dict[str, Dict[str, Any]]) -> str:
+    """Version of a policy: digest of its definition and requirement rules."""
+    payload = json.dumps(
+        {"policy": policy_info, "rules": rule_definitions}, sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def compile_policy_rules(
+    policy_category: Any,
+    policy_info: Dict[str, Any],
+    rule_definitions: Optional[Dict[str, Dict[str, Any]]] = None
+) -> Dict[str, PolicyRule]:
+    """
+    Compile requirement rule definitions of one policy.
+    
+    A definition names its input slice and either "keywords" (any keyword
+    in the slice text) or "attribute" (any UI component with a truthy
+    attribute). Requirements without a definition are always compliant.
+    
+    Args:
+        policy_category: Policy the requirements belong to
+        policy_info: Policy definition with "requirements"
+        rule_definitions: Rule definition per requirement
+    
+    Returns:
+        Compiled rules by requirement
+    """
+    rule_definitions = rule_definitions or {}
+    version = policy_version(policy_info, rule_definitions)
+    rules = {}
+    
+    for requirement in list(policy_info.get("requirements", [])) + list(rule_definitions):
+        if requirement in rules:
+            continue
+        definition = rule_definitions.get(requirement)
+        if definition is None:
+            rules[requirement] = PolicyRule(policy_category, requirement, version)
+            continue
+        rules[requirement] = PolicyRule(
+            policy_category,
+            requirement,
+            version,
+            inputs=definition["inputs"],
+            predicate=_build_predicate(definition),
+            issue=definition.get("issue"),
+            recommendations=tuple(definition.get("recommendations", ()))
+        )
+    
+    return rules
+
+
+def _build_predicate(definition: Dict[str, Any]) -> Callable[[Any], bool]:
+    attribute = definition.get("attribute")
+    if attribute:
+        return lambda components: any(
+            component.get(attribute) for component in components if isinstance(component, dict)
+        )
+    
+    keywords = tuple(definition.get("keywords", ()))
+    
+    def contains_keyword(value: Any) -> bool:
+        if isinstance(value, str):
+            return any(keyword in value for keyword in keywords)
+        return any_text_contains(value, *keywords)
+    
+    return contains_keyword
+
+
+class PolicyInputs:
+    """Implementation slices of one story, extracted and fingerprinted on first use."""
+    
+    def __init__(self, implementation_data: Dict[str, Any]):
+        """
+        Initialize inputs for a story.
+        
+        Args:
+            implementation_data: Implementation data (or ImplementationView) of the story
+        """
+        self.implementation_data = implementation_data
+        self._values: Dict[str, Any] = {}
+        self._fingerprints: Dict[str, str] = {}
+    
+    def value(self, name: Optional[str]) -> Any:
+        """Slice value (None for rules without inputs)."""
+        if name is None:
+            return None
+        if name not in self._values:
+            self._values[name] = POLICY_INPUTS[name](self.implementation_data)
+        return self._values[name]
+    
+    def fingerprint(self, name: Optional[str]) -> str:
+        """Digest of a slice (empty for rules without inputs)."""
+        if name is None:
+            return ""
+        fingerprint = self._fingerprints.get(name)
+        if fingerprint is None:
+            value = self.value(name)
+            text = value if isinstance(value, str) else repr(value)
+            fingerprint = self._fingerprints[name] = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return fingerprint
+
+
+class PolicyEvaluationCache:
+    """
+    Bounded LRU cache of requirement results shared across stories.
+    
+    Keys are (policy version, policy category, requirement, slice fingerprint).
+    Rules on UNCACHED_INPUTS are evaluated directly and never stored.
+    """
+    
+    def __init__(self, max_entries: int = 4096):
+        """
+        Initialize empty cache.
+        
+        Args:
+            max_entries: Results kept before the least recently used is evicted
+        """
+        self.max_entries = max(1, int(max_entries))
+        self._entries: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.direct_evaluations = 0
+    
+    def evaluate(self, rule: PolicyRule, policy_inputs: PolicyInputs) -> Dict[str, Any]:
+        """
+        Result of a rule for a story, reused when an earlier story had the same slice.
+        
+        Returns:
+            Copy of the requirement result
+        """
+        if rule.inputs in UNCACHED_INPUTS:
+            self.direct_evaluations += 1
+            return rule.evaluate(policy_inputs.value(rule.inputs))
+        
+        key = (rule.version, str(rule.policy_category), rule.requirement, policy_inputs.fingerprint(rule.inputs))
+        result = self._entries.get(key)
+        if result is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        else:
+            self.misses += 1
+            result = self._entries[key] = rule.evaluate(policy_inputs.value(rule.inputs))
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return _copy_result(result)
+    
+    def clear(self) -> None:
+        """Drop all cached results (stats are kept)."""
+        self._entries.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Cache effectiveness statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "direct_evaluations": self.direct_evaluations,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+
+def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    return {**result, "recommendations": list(result["recommendations"])}
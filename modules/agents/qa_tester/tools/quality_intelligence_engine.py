@@ -10,6 +10,7 @@ CRITICAL FUNCTIONALITY:
 - AI-driven test optimization and prioritization
 - Predictive user satisfaction analysis for Anna persona
 - Quality pattern recognition and continuous learning
+- Online ridge models learning corrections from outcomes, with batch scoring
 
 ADAPTATION GUIDE:
 🔧 To adapt for your project:
@@ -26,17 +27,46 @@ Changes are backward compatible and do not affect existing contracts.
 import json
 import sqlite3
 import logging
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
 from datetime import datetime, timedelta
 from pathlib import Path
 from dataclasses import dataclass
 from enum import Enum
 import asyncio
 
+import numpy as np
+
+from .implementation_view import (
+    ImplementationView, any_text_contains, component_texts, implementation_contains
+)
+from .ridge_model import OnlineRidgeModel
+
 
 # Setup logging for this module
 logger = logging.getLogger(__name__)
 
+# Online model features and their typical magnitude (used for scaling)
+QUALITY_MODEL_FEATURES = {
+    "ui_component_count": 10.0,
+    "api_endpoint_count": 5.0,
+    "user_flow_count": 5.0,
+    "has_forms": 1.0,
+    "has_navigation": 1.0,
+    "complexity_score": 10.0,
+    "municipal_integration": 1.0
+}
+
+ANNA_MODEL_FEATURES = {
+    "form_field_count": 10.0,
+    "navigation_steps": 5.0,
+    "has_clear_labels": 1.0,
+    "municipal_terminology": 1.0,
+    "estimated_cognitive_load": 10.0
+}
+
+# Values of features missing from a feature set (as the formulas assume)
+MODEL_FEATURE_DEFAULTS = {"estimated_cognitive_load": 1.0}
+
 
 class QualityPredictionConfidence(Enum):
     """Confidence levels for AI predictions."""
@@ -166,6 +196,18 @@ class QualityIntelligenceEngine:
         self.quality_patterns = self._load_quality_patterns()
         self.anna_persona_patterns = self._load_anna_persona_patterns()
         
+        # Online ridge models learning corrections to the formulas from outcomes
+        ridge_lambda = self.config.get("model_ridge_lambda", 1.0)
+        self.prediction_models = {
+            "quality": OnlineRidgeModel(
+                list(QUALITY_MODEL_FEATURES), list(QUALITY_MODEL_FEATURES.values()), ridge_lambda
+            ),
+            "anna": OnlineRidgeModel(
+                list(ANNA_MODEL_FEATURES), list(ANNA_MODEL_FEATURES.values()), ridge_lambda
+            )
+        }
+        self._load_prediction_models()
+        
         logger.info("Quality Intelligence Engine initialized successfully")
     
     def _initialize_database(self) -> None:
@@ -233,6 +275,27 @@ class QualityIntelligenceEngine:
                     )
                 """)
                 
+                # Online prediction model state (coefficients and sufficient statistics)
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS prediction_models (
+                        model_name TEXT PRIMARY KEY,
+                        sample_count INTEGER NOT NULL,
+                        state_json TEXT NOT NULL,
+                        timestamp TEXT NOT NULL
+                    )
+                """)
+                
+                # Features of predictions awaiting their outcome
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS prediction_features (
+                        model_name TEXT NOT NULL,
+                        story_id TEXT NOT NULL,
+                        features_json TEXT NOT NULL,
+                        timestamp TEXT NOT NULL,
+                        PRIMARY KEY (model_name, story_id)
+                    )
+                """)
+                
                 conn.commit()
                 logger.info("Quality Intelligence database initialized")
                 
@@ -311,6 +374,9 @@ class QualityIntelligenceEngine:
             complexity_adjustment = self._calculate_complexity_adjustment(features)
             predicted_score = max(1.0, min(5.0, base_score * complexity_adjustment))
             
+            # Apply corrections learned from earlier outcomes
+            predicted_score = self._apply_prediction_model("quality", features, predicted_score)
+            
             # Calculate confidence based on feature completeness and historical similarity
             confidence_percentage = self._calculate_prediction_confidence(features)
             confidence_level = self._determine_confidence_level(confidence_percentage)
@@ -336,6 +402,7 @@ class QualityIntelligenceEngine:
             # Store prediction for learning
             if self.learning_enabled:
                 await self._store_quality_prediction(story_id, prediction, features)
+                await self._store_prediction_features("quality", story_id, features)
             
             logger.info(f"Quality prediction completed: {predicted_score}/5.0 ({confidence_level.value} confidence)")
             return prediction
@@ -436,6 +503,7 @@ class QualityIntelligenceEngine:
             
             # Predict satisfaction score
             satisfaction_score = self._predict_satisfaction_score(anna_features)
+            satisfaction_score = self._apply_prediction_model("anna", anna_features, satisfaction_score)
             
             # Predict completion time
             completion_time = self._predict_completion_time(anna_features)
@@ -461,6 +529,7 @@ class QualityIntelligenceEngine:
             # Store Anna prediction for learning
             if self.learning_enabled:
                 await self._store_anna_prediction(story_id, prediction_result, anna_features)
+                await self._store_prediction_features("anna", story_id, anna_features)
             
             logger.info(f"Anna satisfaction prediction: {satisfaction_score:.2f}/5.0, {completion_time:.1f} minutes")
             return prediction_result
@@ -525,6 +594,67 @@ class QualityIntelligenceEngine:
             logger.error(f"Error generating quality insights: {e}")
             return []
     
+    def extract_features(self, implementation_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Extract quality and Anna persona features in one pass.
+        
+        Args:
+            implementation_data: Implementation details (or ImplementationView)
+            
+        Returns:
+            Feature sets keyed "quality" and "anna", as stored on ImplementationView
+        """
+        return {
+            "quality": self._extract_quality_features(implementation_data),
+            "anna": self._extract_anna_features(implementation_data)
+        }
+    
+    def feature_matrix(self, feature_sets: Sequence[Dict[str, Any]], target: str = "quality") -> np.ndarray:
+        """
+        Build feature matrix of stories for a prediction model.
+        
+        Args:
+            feature_sets: Feature sets of stories (extract_features()[target])
+            target: Prediction model, "quality" or "anna"
+            
+        Returns:
+            Matrix of stories x model features, in model column order
+        """
+        names = self._prediction_model(target).feature_names
+        rows = [
+            [float(features.get(name, MODEL_FEATURE_DEFAULTS.get(name, 0.0)) or 0.0) for name in names]
+            for features in feature_sets
+        ]
+        return np.array(rows, dtype=float).reshape(len(rows), len(names))
+    
+    def predict_many(
+        self,
+        features: Union[np.ndarray, Sequence[Dict[str, Any]]],
+        target: str = "quality"
+    ) -> np.ndarray:
+        """
+        Score many stories in one vectorized call (e.g. for dashboards).
+        
+        Gives the unrounded scores of predict_quality_score (target
+        "quality") or predict_anna_satisfaction (target "anna") per story,
+        without storing predictions.
+        
+        Args:
+            features: Feature matrix from feature_matrix, or feature sets of stories
+            target: Prediction model, "quality" or "anna"
+            
+        Returns:
+            Predicted scores (1-5) per story
+        """
+        model = self._prediction_model(target)
+        if not isinstance(features, np.ndarray):
+            features = self.feature_matrix(features, target)
+        
+        baseline = self._baseline_scores(target, features)
+        if not model.sample_count:
+            return baseline
+        return np.clip(model.predict_many(features, baseline), 1.0, 5.0)
+    
     async def learn_from_outcome(self, story_id: str, actual_results: Dict[str, Any]) -> Dict[str, Any]:
         """
         Learn from actual testing outcomes to improve predictions.
@@ -561,6 +691,15 @@ class QualityIntelligenceEngine:
                     learning_results["predictions_updated"] += 1
                     learning_results["accuracy_improvements"].append(f"Anna prediction accuracy: {anna_accuracy:.1f}%")
             
+            # Refit online prediction models with the observed outcomes
+            for target, outcome_key in (("quality", "quality_score"), ("anna", "anna_satisfaction")):
+                if outcome_key in actual_results:
+                    sample_count = await self._learn_prediction_model(target, story_id, actual_results[outcome_key])
+                    if sample_count:
+                        learning_results["model_adjustments"].append(
+                            f"{target.capitalize()} model refit with {sample_count} outcomes"
+                        )
+            
             # Update test optimization effectiveness
             if "test_optimization_effectiveness" in actual_results:
                 opt_effectiveness = await self._update_optimization_effectiveness(story_id, actual_results["test_optimization_effectiveness"])
@@ -587,12 +726,18 @@ class QualityIntelligenceEngine:
     
     def _extract_quality_features(self, implementation_data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract features for quality prediction."""
+        if isinstance(implementation_data, ImplementationView):
+            precomputed = implementation_data.features("quality")
+            if precomputed is not None:
+                return precomputed
+        
+        texts = component_texts(implementation_data)
         features = {
-            "ui_component_count": len(implementation_data.get("ui_components", [])),
+            "ui_component_count": len(texts),
             "api_endpoint_count": len(implementation_data.get("api_endpoints", [])),
             "user_flow_count": len(implementation_data.get("user_flows", [])),
-            "has_forms": any("form" in str(comp).lower() for comp in implementation_data.get("ui_components", [])),
-            "has_navigation": any("nav" in str(comp).lower() for comp in implementation_data.get("ui_components", [])),
+            "has_forms": any_text_contains(texts, "form"),
+            "has_navigation": any_text_contains(texts, "nav"),
             "complexity_score": self._calculate_feature_complexity(implementation_data),
             "municipal_integration": self._has_municipal_features(implementation_data)
         }
@@ -704,6 +849,11 @@ class QualityIntelligenceEngine:
     
     def _extract_anna_features(self, implementation_data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract features relevant to Anna persona."""
+        if isinstance(implementation_data, ImplementationView):
+            precomputed = implementation_data.features("anna")
+            if precomputed is not None:
+                return precomputed
+        
         anna_features = {
             "form_field_count": self._count_form_fields(implementation_data),
             "navigation_steps": len(implementation_data.get("user_flows", [])),
@@ -759,6 +909,148 @@ class QualityIntelligenceEngine:
         
         return max(1.0, base_time)
     
+    # Online prediction models
+    
+    def _prediction_model(self, target: str) -> OnlineRidgeModel:
+        """Prediction model for a target."""
+        if target not in self.prediction_models:
+            raise ValueError(f"Unknown prediction target: {target}")
+        return self.prediction_models[target]
+    
+    def _apply_prediction_model(self, target: str, features: Dict[str, Any], baseline: float) -> float:
+        """Formula prediction corrected by the target's model (unchanged while untrained)."""
+        model = self._prediction_model(target)
+        if not model.sample_count:
+            return baseline
+        corrected = model.predict_many(self.feature_matrix([features], target), np.array([baseline]))[0]
+        return float(max(1.0, min(5.0, corrected)))
+    
+    def _baseline_scores(self, target: str, features: np.ndarray) -> np.ndarray:
+        """Formula predictions for a feature matrix (vectorized formulas)."""
+        columns = dict(zip(self._prediction_model(target).feature_names, np.asarray(features, dtype=float).T))
+        if target == "quality":
+            return self._baseline_quality_scores(columns)
+        return self._baseline_satisfaction_scores(columns)
+    
+    def _baseline_quality_scores(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        """Vectorized _calculate_base_quality_score times _calculate_complexity_adjustment."""
+        complexity = columns["complexity_score"]
+        municipal = columns["municipal_integration"] != 0
+        
+        base_score = 4.0 - np.where(complexity > 7, 0.5, np.where(complexity > 5, 0.2, 0.0))
+        base_score = base_score - np.where(columns["ui_component_count"] > 10, 0.3, 0.0)
+        base_score = np.clip(base_score + np.where(municipal, 0.2, 0.0), 1.0, 5.0)
+        
+        policy_factor = self.quality_patterns["municipal_complexity_factors"].get("policy_integration", 1.0)
+        adjustment = np.where(municipal, 1.0 * policy_factor, 1.0)
+        adjustment = adjustment * np.where(columns["has_forms"] != 0, 0.95, 1.0)
+        
+        return np.clip(base_score * adjustment, 1.0, 5.0)
+    
+    def _baseline_satisfaction_scores(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        """Vectorized _predict_satisfaction_score."""
+        time_factors = self.anna_persona_patterns["completion_time_factors"]
+        satisfaction_factors = self.anna_persona_patterns["satisfaction_factors"]
+        municipal = columns["municipal_terminology"] != 0
+        
+        completion_time = 2.0 + columns["form_field_count"] * time_factors["form_fields"]
+        completion_time = completion_time + columns["navigation_steps"] * time_factors["navigation_steps"]
+        completion_time = completion_time * np.where(
+            columns["estimated_cognitive_load"] > 5, time_factors["cognitive_load"], 1.0
+        )
+        completion_time = np.maximum(
+            1.0, completion_time * np.where(municipal, time_factors["municipal_context"], 1.0)
+        )
+        
+        satisfaction = 4.0 + np.where(
+            completion_time <= 8, satisfaction_factors["completion_time_under_8min"], -0.3
+        )
+        satisfaction = satisfaction + np.where(
+            columns["has_clear_labels"] != 0, satisfaction_factors["clear_navigation"], 0.0
+        )
+        satisfaction = satisfaction + np.where(municipal, satisfaction_factors["professional_tone"], 0.0)
+        
+        return np.clip(satisfaction, 1.0, 5.0)
+    
+    async def _learn_prediction_model(self, target: str, story_id: str, actual_score: float) -> Optional[int]:
+        """
+        Refit a prediction model with a story's observed outcome.
+        
+        The story's stored features are consumed, so each outcome is
+        learned once.
+        
+        Returns:
+            Outcomes the model has learned, or None if the story has no stored features
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT features_json FROM prediction_features WHERE model_name = ? AND story_id = ?
+                """, (target, story_id))
+                row = cursor.fetchone()
+                if not row:
+                    return None
+                cursor.execute("""
+                    DELETE FROM prediction_features WHERE model_name = ? AND story_id = ?
+                """, (target, story_id))
+                conn.commit()
+            
+            model = self._prediction_model(target)
+            features = self.feature_matrix([json.loads(row[0])], target)
+            model.update(features[0], float(actual_score), self._baseline_scores(target, features)[0])
+            await self._store_prediction_model(target)
+            return model.sample_count
+            
+        except Exception as e:
+            logger.error(f"Error learning {target} prediction model: {e}")
+            return None
+    
+    async def _store_prediction_features(self, target: str, story_id: str, features: Dict[str, Any]) -> None:
+        """Store prediction features until the story's outcome is learned."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    INSERT OR REPLACE INTO prediction_features (model_name, story_id, features_json, timestamp)
+                    VALUES (?, ?, ?, ?)
+                """, (target, story_id, json.dumps(features), datetime.now().isoformat()))
+                conn.commit()
+        except Exception as e:
+            logger.error(f"Error storing {target} prediction features: {e}")
+    
+    async def _store_prediction_model(self, target: str) -> None:
+        """Persist a prediction model's coefficients and sufficient statistics."""
+        model = self._prediction_model(target)
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    INSERT OR REPLACE INTO prediction_models (model_name, sample_count, state_json, timestamp)
+                    VALUES (?, ?, ?, ?)
+                """, (target, model.sample_count, json.dumps(model.to_state()), datetime.now().isoformat()))
+                conn.commit()
+        except Exception as e:
+            logger.error(f"Error storing {target} prediction model: {e}")
+    
+    def _load_prediction_models(self) -> None:
+        """Load persisted prediction models (models stay untrained if none match)."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT model_name, state_json FROM prediction_models")
+                rows = cursor.fetchall()
+        except Exception as e:
+            logger.warning(f"Could not load prediction models: {e}")
+            return
+        
+        for target, state_json in rows:
+            model = self.prediction_models.get(target)
+            if model is None:
+                continue
+            if not model.load_state(json.loads(state_json)):
+                logger.warning(f"Ignoring stored {target} prediction model with different features or penalty")
+    
     # Additional helper methods for database operations and ML simulation
     
     async def _store_quality_prediction(self, story_id: str, prediction: QualityPrediction, features: Dict[str, Any]) -> None:
@@ -814,22 +1106,21 @@ class QualityIntelligenceEngine:
     def _has_municipal_features(self, implementation_data: Dict[str, Any]) -> bool:
         """Check if implementation has municipal features."""
         municipal_keywords = ["municipal", "policy", "regulation", "citizen", "government"]
-        implementation_str = str(implementation_data).lower()
-        return any(keyword in implementation_str for keyword in municipal_keywords)
+        return implementation_contains(implementation_data, *municipal_keywords)
     
     def _count_form_fields(self, implementation_data: Dict[str, Any]) -> int:
         """Count form fields in implementation."""
         form_count = 0
-        for component in implementation_data.get("ui_components", []):
-            if isinstance(component, dict) and "form" in str(component).lower():
+        components = implementation_data.get("ui_components", [])
+        for component, text in zip(components, component_texts(implementation_data)):
+            if isinstance(component, dict) and "form" in text:
                 form_count += component.get("field_count", 3)  # Default 3 fields per form
         return form_count
     
     def _has_clear_labels(self, implementation_data: Dict[str, Any]) -> bool:
         """Check if implementation has clear labels."""
         # Simplified check - look for label-related properties
-        implementation_str = str(implementation_data).lower()
-        return "label" in implementation_str or "placeholder" in implementation_str
+        return implementation_contains(implementation_data, "label", "placeholder")
     
     def _has_municipal_terminology(self, implementation_data: Dict[str, Any]) -> bool:
         """Check if implementation uses municipal terminology."""
@@ -0,0 +1,203 @@
+"""
+ResultRecords - Compact QA result records and columnar report collections.
+
+PURPOSE:
+QA tools emit many small result records (violations, flow issues, step and
+scenario results) that repeat the same categorical strings: WCAG criterion
+ids, severities, compliance levels, categories. Records use __slots__ with
+interned categorical strings, and reports keep them in columnar collections
+that only build dicts when read or serialized at the contract boundary.
+
+CRITICAL CAPABILITIES:
+- Interning of categorical string fields (and string lists) of slotted records
+- RecordColumns: one column per field, categorical columns dictionary-encoded
+  and nested record lists (e.g. violations of a test result) stored as columns
+- Lazy dict views: reports index and iterate records as dicts built on access
+
+CONTRACT PROTECTION:
+RecordColumns reads exactly like the list of record dicts reports used to
+hold, JSON artifact writers serialize it as that list, and plain_records
+converts reports back to plain lists for output contracts.
+"""
+
+import sys
+from array import array
+from collections.abc import Sequence
+from dataclasses import fields
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Code tables of categorical fields, shared by all collections: (values, codes)
+_CATEGORY_TABLES: Dict[Tuple[type, str], Tuple[List[Any], Dict[Any, int]]] = {}
+
+
+def intern_fields(record: Any, field_names: Iterable[str]) -> None:
+    """
+    Intern string (and string list) fields of a record in place.
+    
+    Repeated categorical values then share one string object across
+    all records of a story.
+    """
+    for name in field_names:
+        value = getattr(record, name)
+        if isinstance(value, str):
+            setattr(record, name, sys.intern(value))
+        elif isinstance(value, list):
+            value[:] = [sys.intern(item) if isinstance(item, str) else item for item in value]
+
+
+def plain_records(data: Any) -> Any:
+    """
+    Copy report data as plain JSON types.
+    
+    RecordColumns become lists of record dicts and enums their values, as
+    artifact writers serialize them. Contracts and persisted state hold
+    plain JSON types, so reports are converted with this at the contract
+    boundary.
+    """
+    if isinstance(data, RecordColumns):
+        return plain_records(data.to_list())
+    if isinstance(data, Enum):
+        return data.value
+    if isinstance(data, dict):
+        return {key: plain_records(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [plain_records(value) for value in data]
+    return data
+
+
+@lru_cache(maxsize=None)
+def record_fields(record_type: type) -> Tuple[str, ...]:
+    """Field names of a record dataclass, in declaration order."""
+    return tuple(f.name for f in fields(record_type))
+
+
+class RecordColumns(Sequence):
+    """
+    Columnar collection of records of one dataclass type.
+    
+    Categorical columns (the record type's CATEGORICAL_FIELDS by default)
+    store small integer codes into a value table shared per record type
+    and field, so categorical fields must take values from a small set. Fields
+    listed in the record type's NESTED_RECORDS hold lists of records and
+    are stored as RecordColumns of their own. Items read as fresh dicts
+    of the record fields; list values are copied so views never alias
+    column storage.
+    """
+    
+    __slots__ = ("record_type", "field_names", "categorical", "nested", "_columns", "_categories", "_length")
+    
+    def __init__(
+        self,
+        record_type: type,
+        records: Iterable[Any] = (),
+        categorical: Optional[Iterable[str]] = None
+    ):
+        """
+        Initialize collection.
+        
+        Args:
+            record_type: Record dataclass
+            records: Initial records
+            categorical: Dictionary-encoded fields (defaults to record_type.CATEGORICAL_FIELDS)
+        """
+        self.record_type = record_type
+        self.field_names = record_fields(record_type)
+        if categorical is None:
+            categorical = getattr(record_type, "CATEGORICAL_FIELDS", ())
+        self.categorical = frozenset(categorical)
+        self.nested: Dict[str, type] = dict(getattr(record_type, "NESTED_RECORDS", {}))
+        unknown = self.categorical.union(self.nested).difference(self.field_names)
+        if unknown:
+            raise ValueError(f"Unknown categorical fields for {record_type.__name__}: {sorted(unknown)}")
+        
+        self._columns: Dict[str, Any] = {
+            name: array("I") if name in self.categorical else [] for name in self.field_names
+        }
+        self._categories = {
+            name: _CATEGORY_TABLES.setdefault((record_type, name), ([], {})) for name in self.categorical
+        }
+        self._length = 0
+        self.extend(records)
+    
+    def append(self, record: Any) -> None:
+        """Add a record (stored column by column)."""
+        if not isinstance(record, self.record_type):
+            raise TypeError(f"Expected {self.record_type.__name__}, got {type(record).__name__}")
+        for name in self.field_names:
+            value = getattr(record, name)
+            if name in self.categorical:
+                values, codes = self._categories[name]
+                code = codes.get(value)
+                if code is None:
+                    code = codes[value] = len(values)
+                    values.append(value)
+                value = code
+            elif name in self.nested:
+                value = RecordColumns(self.nested[name], value)
+            self._columns[name].append(value)
+        self._length += 1
+    
+    def extend(self, records: Iterable[Any]) -> None:
+        """Add records in order."""
+        for record in records:
+            self.append(record)
+    
+    def column(self, name: str) -> List[Any]:
+        """Decoded values of one field for all records."""
+        if name in self.categorical:
+            values = self._categories[name][0]
+            return [values[code] for code in self._columns[name]]
+        return list(self._columns[name])
+    
+    def record(self, index: int) -> Any:
+        """Rebuild the record at an index (nested record lists included)."""
+        values = self._values(index)
+        for name in self.nested:
+            values[name] = list(values[name].records())
+        return self.record_type(**values)
+    
+    def records(self) -> Iterator[Any]:
+        """Rebuild all records in order."""
+        for index in range(self._length):
+            yield self.record(index)
+    
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Serialize as a list of record dicts (nested record lists included)."""
+        rows = [self._values(index) for index in range(self._length)]
+        for row in rows:
+            for name in self.nested:
+                row[name] = row[name].to_list()
+        return rows
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._values(i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("record index out of range")
+        return self._values(index)
+    
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (RecordColumns, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return f"RecordColumns({self.record_type.__name__}, {self._length} records)"
+    
+    def _values(self, index: int) -> Dict[str, Any]:
+        values = {}
+        for name in self.field_names:
+            value = self._columns[name][index]
+            if name in self.categorical:
+                value = self._categories[name][0][value]
+            elif isinstance(value, list):
+                value = list(value)
+            values[name] = value
+        return values
@@ -0,0 +1,151 @@
+"""
+OnlineRidgeModel - Incrementally trained ridge regression for quality predictions.
+
+PURPOSE:
+QualityIntelligenceEngine predicts quality and Anna satisfaction with
+hand-tuned formulas. This model learns a correction on top of a formula
+(the baseline) from observed outcomes, so predictions improve as stories
+are delivered while staying equal to the formula until data arrives.
+
+CRITICAL CAPABILITIES:
+- Ridge regression from sufficient statistics (Gram matrix and moment vector)
+- O(d²) refit per observation via Sherman-Morrison inverse updates
+- Vectorized predict_many over a whole feature matrix of stories
+- State export/import for persistence (inverse rebuilt once on load)
+
+CONTRACT PROTECTION:
+An untrained model predicts exactly its baseline, so engines using it keep
+their previous predictions until outcomes are learned.
+"""
+
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+
+class OnlineRidgeModel:
+    """
+    Ridge regression of residuals (target - baseline) on scaled features.
+    
+    Features are divided by their scale and extended with an intercept
+    column before fitting.
+    """
+    
+    def __init__(
+        self,
+        feature_names: Sequence[str],
+        scales: Optional[Sequence[float]] = None,
+        ridge_lambda: float = 1.0
+    ):
+        """
+        Initialize untrained model.
+        
+        Args:
+            feature_names: Feature columns, in matrix order
+            scales: Typical magnitude of each feature (defaults to 1.0)
+            ridge_lambda: L2 penalty; larger values keep closer to the baseline
+        """
+        self.feature_names = tuple(feature_names)
+        self.scales = np.asarray(scales if scales is not None else [1.0] * len(self.feature_names), dtype=float)
+        if self.scales.shape != (len(self.feature_names),) or np.any(self.scales <= 0):
+            raise ValueError("scales must be positive, one per feature")
+        self.ridge_lambda = float(ridge_lambda)
+        if self.ridge_lambda <= 0:
+            raise ValueError("ridge_lambda must be positive")
+        
+        dimension = len(self.feature_names) + 1
+        self.gram = np.eye(dimension) * self.ridge_lambda
+        self.gram_inverse = np.eye(dimension) / self.ridge_lambda
+        self.moment = np.zeros(dimension)
+        self.coefficients = np.zeros(dimension)
+        self.sample_count = 0
+    
+    @property
+    def dimension(self) -> int:
+        """Fitted parameters (features plus intercept)."""
+        return len(self.coefficients)
+    
+    def design_matrix(self, features: np.ndarray) -> np.ndarray:
+        """Scaled feature matrix with intercept column."""
+        features = np.atleast_2d(np.asarray(features, dtype=float))
+        if features.shape[1] != len(self.feature_names):
+            raise ValueError(f"Expected {len(self.feature_names)} feature columns, got {features.shape[1]}")
+        return np.hstack([features / self.scales, np.ones((features.shape[0], 1))])
+    
+    def update(self, features: Sequence[float], target: float, baseline: float = 0.0) -> None:
+        """
+        Add one observation and refit in O(d²).
+        
+        Args:
+            features: Raw feature row
+            target: Observed outcome
+            baseline: Formula prediction the model corrects
+        """
+        x = self.design_matrix(features)[0]
+        residual = float(target) - float(baseline)
+        
+        self.gram += np.outer(x, x)
+        self.moment += residual * x
+        
+        # Sherman-Morrison: (A + xxᵀ)⁻¹ = A⁻¹ - A⁻¹x xᵀA⁻¹ / (1 + xᵀA⁻¹x)
+        projected = self.gram_inverse @ x
+        self.gram_inverse -= np.outer(projected, projected) / (1.0 + x @ projected)
+        self.coefficients = self.gram_inverse @ self.moment
+        self.sample_count += 1
+    
+    def predict_many(self, features: np.ndarray, baseline: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Predict a whole feature matrix in one call.
+        
+        Args:
+            features: Raw feature matrix (stories x features)
+            baseline: Formula predictions per story (zeros if omitted)
+        
+        Returns:
+            Baseline plus learned correction per story
+        """
+        correction = self.design_matrix(features) @ self.coefficients
+        if baseline is None:
+            return correction
+        return np.asarray(baseline, dtype=float) + correction
+    
+    def to_state(self) -> Dict[str, Any]:
+        """JSON-serializable model state."""
+        return {
+            "feature_names": list(self.feature_names),
+            "scales": self.scales.tolist(),
+            "ridge_lambda": self.ridge_lambda,
+            "sample_count": self.sample_count,
+            "coefficients": self.coefficients.tolist(),
+            "gram": self.gram.tolist(),
+            "moment": self.moment.tolist()
+        }
+    
+    def load_state(self, state: Dict[str, Any]) -> bool:
+        """
+        Restore state saved by to_state.
+        
+        State for other features or penalty is ignored, since its
+        statistics do not apply to this model.
+        
+        Returns:
+            True if the state was loaded
+        """
+        if (
+            tuple(state.get("feature_names", ())) != self.feature_names
+            or state.get("scales") != self.scales.tolist()
+            or state.get("ridge_lambda") != self.ridge_lambda
+        ):
+            return False
+        
+        gram = np.asarray(state["gram"], dtype=float)
+        moment = np.asarray(state["moment"], dtype=float)
+        if gram.shape != (self.dimension, self.dimension) or moment.shape != (self.dimension,):
+            return False
+        
+        self.gram = gram
+        self.moment = moment
+        self.gram_inverse = np.linalg.inv(gram)
+        self.coefficients = self.gram_inverse @ moment
+        self.sample_count = int(state.get("sample_count", 0))
+        return True
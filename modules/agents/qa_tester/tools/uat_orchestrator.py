@@ -11,6 +11,7 @@ CRITICAL FUNCTIONALITY:
 - Training effectiveness measurement
 - User onboarding flow validation
 - Stakeholder sign-off coordination
+- Batched role x feature satisfaction scoring with bounded concurrent sessions
 
 ADAPTATION GUIDE:
 To adapt for your project:
@@ -26,11 +27,16 @@ All outputs integrate seamlessly with existing QA validation results.
 
 import asyncio
 import logging
+import random
 from typing import Dict, Any, List, Optional, Set
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 
+import numpy as np
+
+from .implementation_view import implementation_contains
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
@@ -66,6 +72,30 @@ class UATTestType(Enum):
     TRAINING_EFFECTIVENESS = "training_effectiveness"
 
 
+# Implementation features stakeholders react to, derived once per UAT run
+SATISFACTION_FEATURES = (
+    "many_ui_components",  # more than 3 UI components
+    "multiple_user_flows",  # more than 1 user flow
+    "has_api_endpoints",
+    "security",
+    "simple_interface",  # at most 5 UI components
+    "accessibility",
+    "gdpr",
+    "audit"
+)
+
+# Satisfaction adjustment per role and feature; roles not listed keep the baseline
+SATISFACTION_WEIGHTS = {
+    StakeholderRole.TRAINING_COORDINATOR: {"many_ui_components": 0.3, "multiple_user_flows": 0.2},
+    StakeholderRole.IT_COORDINATOR: {"has_api_endpoints": 0.3, "security": 0.2},
+    StakeholderRole.END_USER_REPRESENTATIVE: {"simple_interface": 0.3, "accessibility": 0.2},
+    StakeholderRole.COMPLIANCE_OFFICER: {"gdpr": 0.4, "audit": 0.1}
+}
+
+BASE_SATISFACTION = 4.0
+SATISFACTION_VARIATION = 0.3
+
+
 @dataclass
 class AcceptanceCriteria:
     """Individual acceptance criteria."""
@@ -300,6 +330,9 @@ class UATOrchestrator:
                 ]
             }
         ]
+        
+        # Stakeholder sessions simulated at the same time
+        self.max_concurrent_sessions = max(1, int(self.config.get("uat_max_concurrent_sessions", 4)))
     
     async def orchestrate_uat_process(
         self,
@@ -597,24 +630,44 @@ class UATOrchestrator:
         implementation_data: Dict[str, Any],
         stakeholder_roles: List[StakeholderRole]
     ) -> List[StakeholderFeedback]:
-        """Execute stakeholder testing sessions."""
-        feedback_list = []
-        
-        for role in stakeholder_roles:
-            feedback = await self._simulate_stakeholder_session(
-                role, test_plan, implementation_data
-            )
-            feedback_list.append(feedback)
+        """
+        Execute stakeholder testing sessions as one batched evaluation.
         
-        return feedback_list
+        Satisfaction of all roles is scored at once from implementation
+        features derived a single time; sessions then run concurrently,
+        at most uat_max_concurrent_sessions at a time. Feedback keeps the
+        order of stakeholder_roles.
+        """
+        satisfaction_scores = self._score_stakeholder_satisfaction(stakeholder_roles, implementation_data)
+        semaphore = asyncio.Semaphore(self.max_concurrent_sessions)
+        
+        async def run_session(role: StakeholderRole, satisfaction_score: float) -> StakeholderFeedback:
+            async with semaphore:
+                return await self._simulate_stakeholder_session(
+                    role, test_plan, implementation_data, satisfaction_score
+                )
+        
+        feedback_list = await asyncio.gather(*(
+            run_session(role, score) for role, score in zip(stakeholder_roles, satisfaction_scores)
+        ))
+        return list(feedback_list)
     
     async def _simulate_stakeholder_session(
         self,
         stakeholder_role: StakeholderRole,
         test_plan: UATTestPlan,
-        implementation_data: Dict[str, Any]
+        implementation_data: Dict[str, Any],
+        satisfaction_score: Optional[float] = None
     ) -> StakeholderFeedback:
-        """Simulate a stakeholder testing session."""
+        """
+        Simulate a stakeholder testing session.
+        
+        Args:
+            stakeholder_role: Stakeholder taking part in the session
+            test_plan: UAT test plan
+            implementation_data: Implementation details to test
+            satisfaction_score: Score from the batched evaluation (scored here if omitted)
+        """
         stakeholder_info = self.stakeholder_definitions.get(stakeholder_role)
         
         # Simulate stakeholder evaluation based on their focus areas
@@ -622,9 +675,10 @@ class UATOrchestrator:
         typical_concerns = stakeholder_info.get("typical_concerns", [])
         
         # Calculate satisfaction score based on stakeholder perspective
-        satisfaction_score = self._calculate_stakeholder_satisfaction(
-            stakeholder_role, implementation_data, focus_areas
-        )
+        if satisfaction_score is None:
+            satisfaction_score = self._calculate_stakeholder_satisfaction(
+                stakeholder_role, implementation_data, focus_areas
+            )
         
         # Determine approval status based on satisfaction
         approval_status = self._determine_stakeholder_approval(satisfaction_score, typical_concerns)
@@ -664,47 +718,54 @@ class UATOrchestrator:
         focus_areas: List[str]
     ) -> float:
         """Calculate stakeholder satisfaction score."""
-        base_satisfaction = 4.0  # Start with good baseline
+        return self._score_stakeholder_satisfaction([stakeholder_role], implementation_data)[0]
+    
+    def _score_stakeholder_satisfaction(
+        self,
+        stakeholder_roles: List[StakeholderRole],
+        implementation_data: Dict[str, Any]
+    ) -> List[float]:
+        """
+        Score satisfaction of all roles in one pass.
         
-        ui_components = implementation_data.get("ui_components", [])
-        api_endpoints = implementation_data.get("api_endpoints", [])
-        user_flows = implementation_data.get("user_flows", [])
+        Scores are the baseline plus the role x feature weight matrix applied
+        to the implementation's feature vector, with realistic variation.
         
-        # Adjust based on stakeholder-specific concerns
-        if stakeholder_role == StakeholderRole.TRAINING_COORDINATOR:
-            # Focus on learning effectiveness and user experience
-            if len(ui_components) > 3:
-                base_satisfaction += 0.3  # Good UI for training
-            if len(user_flows) > 1:
-                base_satisfaction += 0.2  # Clear workflows
+        Returns:
+            Satisfaction score (1-5) per role, in role order
+        """
+        features = self._implementation_features(implementation_data)
+        scores = BASE_SATISFACTION + self._satisfaction_weight_matrix(stakeholder_roles) @ features
         
-        elif stakeholder_role == StakeholderRole.IT_COORDINATOR:
-            # Focus on technical implementation
-            if len(api_endpoints) > 0:
-                base_satisfaction += 0.3  # Good technical structure
-            if "security" in str(implementation_data).lower():
-                base_satisfaction += 0.2  # Security considerations
+        # Add some realistic variation (one draw per role, in role order)
+        variation = np.array([
+            random.uniform(-SATISFACTION_VARIATION, SATISFACTION_VARIATION) for _ in stakeholder_roles
+        ])
         
-        elif stakeholder_role == StakeholderRole.END_USER_REPRESENTATIVE:
-            # Focus on usability
-            if len(ui_components) <= 5:
-                base_satisfaction += 0.3  # Simple interface preferred
-            if "accessibility" in str(implementation_data).lower():
-                base_satisfaction += 0.2  # Accessibility important
-        
-        elif stakeholder_role == StakeholderRole.COMPLIANCE_OFFICER:
-            # Focus on compliance
-            if "gdpr" in str(implementation_data).lower():
-                base_satisfaction += 0.4  # GDPR compliance crucial
-            if "audit" in str(implementation_data).lower():
-                base_satisfaction += 0.1  # Audit trail important
-        
-        # Add some realistic variation
-        import random
-        variation = random.uniform(-0.3, 0.3)
-        final_satisfaction = base_satisfaction + variation
-        
-        return max(1.0, min(5.0, final_satisfaction))
+        return np.clip(scores + variation, 1.0, 5.0).tolist()
+    
+    def _implementation_features(self, implementation_data: Dict[str, Any]) -> np.ndarray:
+        """Implementation feature vector in SATISFACTION_FEATURES order."""
+        ui_component_count = len(implementation_data.get("ui_components", []))
+        flags = {
+            "many_ui_components": ui_component_count > 3,
+            "multiple_user_flows": len(implementation_data.get("user_flows", [])) > 1,
+            "has_api_endpoints": len(implementation_data.get("api_endpoints", [])) > 0,
+            "security": implementation_contains(implementation_data, "security"),
+            "simple_interface": ui_component_count <= 5,
+            "accessibility": implementation_contains(implementation_data, "accessibility"),
+            "gdpr": implementation_contains(implementation_data, "gdpr"),
+            "audit": implementation_contains(implementation_data, "audit")
+        }
+        return np.array([flags[feature] for feature in SATISFACTION_FEATURES], dtype=float)
+    
+    def _satisfaction_weight_matrix(self, stakeholder_roles: List[StakeholderRole]) -> np.ndarray:
+        """Role x feature matrix of satisfaction adjustments."""
+        matrix = np.zeros((len(stakeholder_roles), len(SATISFACTION_FEATURES)))
+        for row, role in enumerate(stakeholder_roles):
+            for feature, weight in SATISFACTION_WEIGHTS.get(role, {}).items():
+                matrix[row, SATISFACTION_FEATURES.index(feature)] = weight
+        return matrix
     
     def _determine_stakeholder_approval(
         self,
@@ -895,13 +956,15 @@ class UATOrchestrator:
         """Validate acceptance criteria against results."""
         criteria_results = []
         
+        # Index feedback by role once instead of scanning it per criterion
+        feedback_by_role: Dict[StakeholderRole, StakeholderFeedback] = {}
+        for feedback in stakeholder_feedback:
+            feedback_by_role.setdefault(feedback.stakeholder_role, feedback)
+        
         for criteria in test_plan.acceptance_criteria:
             # Determine if criteria was met based on stakeholder feedback
             responsible_stakeholder = criteria.stakeholder_role
-            stakeholder_input = next(
-                (f for f in stakeholder_feedback if f.stakeholder_role == responsible_stakeholder),
-                None
-            )
+            stakeholder_input = feedback_by_role.get(responsible_stakeholder)
             
             if stakeholder_input:
                 criteria_met = stakeholder_input.approval_status in [
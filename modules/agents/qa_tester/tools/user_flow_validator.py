@@ -11,6 +11,8 @@ CRITICAL FUNCTIONALITY:
 - Task completion flow testing
 - Error handling and recovery validation
 - Navigation consistency checking
+- Navigation graph reachability and shortest paths (built once per story)
+- Shared-prefix flow validation (each distinct step prefix validated once)
 - User goal achievement assessment
 
 ADAPTATION GUIDE:
@@ -27,12 +29,16 @@ Changes must maintain flow validation consistency.
 
 import json
 import logging
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, ClassVar, List, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass
 from pathlib import Path
 from enum import Enum
 
+from .implementation_view import any_text_contains, endpoint_texts
+from .navigation_graph import FlowTrie, NavigationGraph
+from .result_records import RecordColumns, intern_fields
+
 
 # Setup logging for this module
 logger = logging.getLogger(__name__)
@@ -91,7 +97,7 @@ class UserFlow:
     error_recovery_paths: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class FlowValidationIssue:
     """
     Represents an issue found during flow validation.
@@ -106,9 +112,14 @@ class FlowValidationIssue:
     recommended_fix: str
     affects_accessibility: bool
     affects_anna_persona: bool
+    
+    CATEGORICAL_FIELDS: ClassVar[Tuple[str, ...]] = ("severity", "category")
+    
+    def __post_init__(self):
+        intern_fields(self, self.CATEGORICAL_FIELDS + ("flow_id", "step_id", "impact_on_user", "recommended_fix"))
 
 
-@dataclass
+@dataclass(slots=True)
 class FlowStepValidationResult:
     """
     Results from validating a single flow step.
@@ -121,6 +132,12 @@ class FlowStepValidationResult:
     user_experience_score: float
     success_rate: float
     details: Dict[str, Any]
+    
+    CATEGORICAL_FIELDS: ClassVar[Tuple[str, ...]] = ("validation_result",)
+    NESTED_RECORDS: ClassVar[Dict[str, type]] = {"issues_found": FlowValidationIssue}
+    
+    def __post_init__(self):
+        intern_fields(self, ("step_id",))
 
 
 class UserFlowValidator:
@@ -375,6 +392,10 @@ class UserFlowValidator:
                 implementation_data, story_id
             )
             
+            # Navigation graph and flow prefix trie are shared by all flows of the story
+            navigation_graph = self._build_navigation_graph(applicable_flows, implementation_data)
+            flow_trie = FlowTrie()
+            
             # Validate each applicable flow
             flow_validation_results = []
             
@@ -384,11 +405,18 @@ class UserFlowValidator:
                 flow_result = await self._validate_single_flow(
                     flow=flow,
                     implementation_data=implementation_data,
-                    persona_requirements=persona_requirements
+                    persona_requirements=persona_requirements,
+                    flow_trie=flow_trie,
+                    navigation_graph=navigation_graph
                 )
                 
                 flow_validation_results.append(flow_result)
             
+            logger.debug(
+                f"Validated {len(applicable_flows)} flows with {flow_trie.prefixes_evaluated} distinct "
+                f"prefixes and {flow_trie.steps_validated} step validations"
+            )
+            
             # Analyze overall flow patterns
             pattern_analysis = await self._analyze_flow_patterns(
                 flow_validation_results, implementation_data
@@ -396,7 +424,7 @@ class UserFlowValidator:
             
             # Validate navigation consistency
             navigation_validation = await self._validate_navigation_consistency(
-                navigation_structure, ui_components
+                navigation_structure, ui_components, navigation_graph
             )
             
             # Assess Anna persona compatibility
@@ -463,7 +491,6 @@ class UserFlowValidator:
         
         # Extract feature characteristics
         ui_components = implementation_data.get("ui_components", [])
-        api_endpoints = implementation_data.get("api_endpoints", [])
         feature_type = implementation_data.get("feature_type", "")
         
         # Analyze components to determine flow types
@@ -471,8 +498,7 @@ class UserFlowValidator:
                        for comp in ui_components)
         has_navigation = any(comp.get("type") in ["link", "menu", "button"] 
                             for comp in ui_components)
-        has_authentication = any("auth" in str(endpoint).lower() 
-                                for endpoint in api_endpoints)
+        has_authentication = any_text_contains(endpoint_texts(implementation_data), "auth")
         
         # Match flows based on feature characteristics
         for flow in self.standard_flows:
@@ -503,8 +529,35 @@ class UserFlowValidator:
         
         return applicable_flows
     
+    def _build_navigation_graph(self, flows: List[UserFlow], implementation_data: Dict[str, Any]) -> NavigationGraph:
+        """
+        Build the story's navigation graph from flows and navigation structure.
+        
+        Args:
+            flows: Flows validated for the story
+            implementation_data: Implementation details (user_flows and navigation_structure add nodes and edges)
+            
+        Returns:
+            Navigation graph
+        """
+        step_sequences = [[step.step_id for step in flow.steps] for flow in flows]
+        for user_flow in implementation_data.get("user_flows", []):
+            if isinstance(user_flow, dict) and isinstance(user_flow.get("steps"), list):
+                step_sequences.append([
+                    step.get("step_id", step.get("name")) if isinstance(step, dict) else step
+                    for step in user_flow["steps"]
+                ])
+        
+        return NavigationGraph.build(
+            step_sequences,
+            implementation_data.get("navigation_structure", {}),
+            implementation_data.get("ui_components", [])
+        )
+    
     async def _validate_single_flow(self, flow: UserFlow, implementation_data: Dict[str, Any],
-                                  persona_requirements: Dict[str, Any]) -> Dict[str, Any]:
+                                  persona_requirements: Dict[str, Any],
+                                  flow_trie: Optional[FlowTrie] = None,
+                                  navigation_graph: Optional[NavigationGraph] = None) -> Dict[str, Any]:
         """
         Validate a single user flow.
         
@@ -512,24 +565,28 @@ class UserFlowValidator:
             flow: User flow to validate
             implementation_data: Implementation details
             persona_requirements: Persona requirements
+            flow_trie: Story's flow prefix trie (prefixes shared with earlier flows are not re-validated)
+            navigation_graph: Story's navigation graph
             
         Returns:
             Single flow validation result
         """
-        step_results = []
-        flow_issues = []
-        overall_completion_time = 0.0
-        
-        # Validate each step in the flow
-        for step in flow.steps:
-            step_result = await self._validate_flow_step(
-                step, implementation_data, persona_requirements
+        if navigation_graph is None:
+            navigation_graph = self._build_navigation_graph([flow], implementation_data)
+        if flow_trie is None:
+            flow_trie = FlowTrie()
+        
+        # Validate steps through the trie; the last prefix node carries the flow's running totals
+        path = await flow_trie.validate(
+            flow.steps,
+            lambda step: self._validate_flow_step(
+                step, implementation_data, persona_requirements, navigation_graph=navigation_graph
             )
-            step_results.append(step_result)
-            overall_completion_time += step_result.completion_time_seconds / 60  # Convert to minutes
-            
-            # Collect issues from step
-            flow_issues.extend(step_result.issues_found)
+        )
+        step_results = [node.result for node in path]
+        flow_issues = [issue for step_result in step_results for issue in step_result.issues_found]
+        flow_totals = path[-1] if path else flow_trie.root
+        overall_completion_time = flow_totals.completion_minutes
         
         # Check overall flow constraints
         if overall_completion_time > flow.expected_completion_time_minutes:
@@ -562,9 +619,14 @@ class UserFlowValidator:
             ))
         
         # Calculate overall flow metrics
-        average_ux_score = sum(result.user_experience_score for result in step_results) / len(step_results) if step_results else 0
-        average_accessibility_score = sum(result.accessibility_score for result in step_results) / len(step_results) if step_results else 0
-        overall_success_rate = sum(result.success_rate for result in step_results) / len(step_results) if step_results else 0
+        average_ux_score = flow_totals.user_experience_total / len(step_results) if step_results else 0
+        average_accessibility_score = flow_totals.accessibility_total / len(step_results) if step_results else 0
+        overall_success_rate = flow_totals.success_rate_total / len(step_results) if step_results else 0
+        
+        # Shortest route through the story's navigation graph between the flow's first and last step
+        shortest_path = navigation_graph.shortest_path(
+            flow.steps[0].step_id, flow.steps[-1].step_id
+        ) if flow.steps else None
         
         # Determine overall result
         critical_issues = [issue for issue in flow_issues if issue.severity == "critical"]
@@ -586,9 +648,14 @@ class UserFlowValidator:
             "completion_time_minutes": overall_completion_time,
             "expected_time_minutes": flow.expected_completion_time_minutes,
             "step_count": len(flow.steps),
-            "step_results": [result.__dict__ for result in step_results],
-            "flow_issues": [issue.__dict__ for issue in flow_issues],
-            "critical_issues": [issue.__dict__ for issue in critical_issues],
+            # Step results may be shared with other flows; columns hand out fresh dicts
+            "step_results": RecordColumns(FlowStepValidationResult, step_results),
+            "flow_issues": RecordColumns(FlowValidationIssue, flow_issues),
+            "critical_issues": RecordColumns(FlowValidationIssue, critical_issues),
+            "navigation": {
+                "shortest_path_steps": len(shortest_path) if shortest_path else None,
+                "detour_steps": len(flow.steps) - len(shortest_path) if shortest_path else 0
+            },
             "metrics": {
                 "average_user_experience_score": round(average_ux_score, 2),
                 "average_accessibility_score": round(average_accessibility_score, 1),
@@ -599,7 +666,8 @@ class UserFlowValidator:
         }
     
     async def _validate_flow_step(self, step: FlowStep, implementation_data: Dict[str, Any],
-                                persona_requirements: Dict[str, Any]) -> FlowStepValidationResult:
+                                persona_requirements: Dict[str, Any],
+                                navigation_graph: Optional[NavigationGraph] = None) -> FlowStepValidationResult:
         """
         Validate a single flow step.
         
@@ -607,21 +675,18 @@ class UserFlowValidator:
             step: Flow step to validate
             implementation_data: Implementation details
             persona_requirements: Persona requirements
+            navigation_graph: Story's navigation graph (element and accessibility lookups)
             
         Returns:
             Step validation result
         """
         issues_found = []
-        ui_components = implementation_data.get("ui_components", [])
+        if navigation_graph is None:
+            navigation_graph = NavigationGraph(implementation_data.get("ui_components", []))
         
         # Check if expected elements exist
         for expected_element in step.expected_elements:
-            element_found = any(
-                expected_element in comp.get("id", "") or 
-                expected_element in comp.get("type", "") or
-                expected_element in comp.get("class", "")
-                for comp in ui_components
-            )
+            element_found = navigation_graph.has_element(expected_element)
             
             if not element_found:
                 issues_found.append(FlowValidationIssue(
@@ -640,7 +705,7 @@ class UserFlowValidator:
         # Check accessibility requirements
         accessibility_score = 100.0
         for accessibility_req in step.accessibility_requirements:
-            if not self._check_accessibility_requirement(accessibility_req, ui_components):
+            if not navigation_graph.accessibility(accessibility_req, self._check_accessibility_requirement):
                 accessibility_score -= 15
                 issues_found.append(FlowValidationIssue(
                     issue_id=f"{step.step_id}_accessibility_{accessibility_req}",
@@ -836,42 +901,55 @@ class UserFlowValidator:
             }
     
     async def _validate_navigation_consistency(self, navigation_structure: Dict[str, Any],
-                                             ui_components: List[Dict[str, Any]]) -> Dict[str, Any]:
+                                             ui_components: List[Dict[str, Any]],
+                                             navigation_graph: Optional[NavigationGraph] = None) -> Dict[str, Any]:
         """
         Validate navigation consistency across the implementation.
         
         Args:
             navigation_structure: Navigation structure data
             ui_components: UI components
+            navigation_graph: Story's navigation graph (built from navigation_structure if not given)
             
         Returns:
             Navigation validation results
         """
         issues = []
+        if navigation_graph is None:
+            navigation_graph = NavigationGraph.build([], navigation_structure, ui_components)
         
         # Check for consistent navigation elements
-        nav_elements = [comp for comp in ui_components if comp.get("type") in ["nav", "menu", "link"]]
+        nav_elements = navigation_graph.navigation_elements
         
         if not nav_elements:
             issues.append("No navigation elements found")
         
         # Check for breadcrumbs in multi-step flows
-        breadcrumb_elements = [comp for comp in ui_components if "breadcrumb" in comp.get("type", "")]
+        breadcrumb_elements = navigation_graph.breadcrumb_elements
         
         if len(nav_elements) > 5 and not breadcrumb_elements:
             issues.append("Complex navigation without breadcrumbs")
         
         # Check for consistent styling
-        nav_styles = set(elem.get("style", "") for elem in nav_elements)
-        if len(nav_styles) > 2:
+        if len(navigation_graph.navigation_styles) > 2:
             issues.append("Inconsistent navigation styling")
         
+        # Check reachability and depth of the navigation graph
+        reachability = navigation_graph.summary()
+        if reachability["unreachable_nodes"]:
+            issues.append(
+                f"Navigation targets unreachable from entry points: {', '.join(reachability['unreachable_nodes'][:5])}"
+            )
+        if reachability["max_depth"] > self.flow_validation_criteria["max_steps_per_flow"]:
+            issues.append(f"Navigation depth of {reachability['max_depth']} steps is too deep for Anna")
+        
         consistency_score = max(0, 100 - (len(issues) * 20))
         
         return {
             "consistency_score": consistency_score,
             "navigation_elements_count": len(nav_elements),
             "breadcrumb_elements_count": len(breadcrumb_elements),
+            "reachability": reachability,
             "issues_found": issues,
             "recommendations": [
                 "Add breadcrumb navigation for complex flows",
@@ -26,17 +26,12 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 from ...shared.base_agent import BaseAgent
-from ...shared.event_bus import EventBus
+from ...shared.lazy_tools import LazyTool
 from ...shared.exceptions import (
     BusinessLogicError, 
     DNAComplianceError,
     QualityGateError
 )
-from .tools.quality_scorer import QualityScorer
-from .tools.deployment_validator import DeploymentValidator
-from .tools.final_approver import FinalApprover
-from .tools.client_communicator import ClientCommunicator
-from .tools.dna_final_validator import DNAFinalValidator
 
 
 class QualityReviewerAgent(BaseAgent):
@@ -48,6 +43,17 @@ class QualityReviewerAgent(BaseAgent):
     are met and DNA compliance is maintained.
     """
     
+    # Tools - imported and constructed on first use, shared per process
+    quality_scorer = LazyTool(".tools.quality_scorer.QualityScorer", pass_config=False)
+    deployment_validator = LazyTool(".tools.deployment_validator.DeploymentValidator", pass_config=False)
+    final_approver = LazyTool(".tools.final_approver.FinalApprover", pass_config=False)
+    client_communicator = LazyTool(".tools.client_communicator.ClientCommunicator", pass_config=False)
+    dna_final_validator = LazyTool(".tools.dna_final_validator.DNAFinalValidator", pass_config=False)
+    review_history = LazyTool(".tools.review_history.ReviewHistory", shared=False)
+    
+    # EventBus for team coordination
+    event_bus = LazyTool("modules.shared.event_bus.EventBus")
+    
     def __init__(self, agent_id: str = "quality_reviewer_001", config: Optional[Dict[str, Any]] = None):
         """
         Initialize Quality Reviewer Agent.
@@ -58,16 +64,6 @@ class QualityReviewerAgent(BaseAgent):
         """
         super().__init__(agent_id=agent_id, agent_type="quality_reviewer", config=config)
         
-        # Initialize tools
-        self.quality_scorer = QualityScorer()
-        self.deployment_validator = DeploymentValidator()
-        self.final_approver = FinalApprover()
-        self.client_communicator = ClientCommunicator()
-        self.dna_final_validator = DNAFinalValidator()
-        
-        # Initialize EventBus for team coordination
-        self.event_bus = EventBus(config)
-        
         # Quality thresholds from DNA principles
         self.quality_thresholds = {
             "overall_score": 90,  # Minimum overall quality score
@@ -135,6 +131,8 @@ class QualityReviewerAgent(BaseAgent):
         Returns:
             Output contract for deployment or rejection
         """
+        from .tools.review_history import CLIENT_COMMUNICATION, DNA_FINAL_VALIDATION, review_inputs
+        
         try:
             story_id = input_contract.get('story_id')
             self.logger.info(f"Starting quality review for story: {story_id}")
@@ -148,8 +146,15 @@ class QualityReviewerAgent(BaseAgent):
             # Extract QA data from contract
             qa_data = self._extract_qa_data(input_contract)
             
+            # Incremental re-review: which inputs changed since the story's previous review
+            review_plan = self.review_history.plan_review(
+                story_id,
+                review_inputs(qa_data, input_contract.get("dna_compliance", {})),
+                self._review_rules()
+            )
+            
             # Perform comprehensive quality analysis
-            quality_analysis = await self._perform_quality_analysis(qa_data)
+            quality_analysis = await self._perform_quality_analysis(qa_data, review_plan)
             
             # Notify team of quality assessment completion
             await self._notify_team_progress("quality_assessment_complete", {
@@ -162,24 +167,39 @@ class QualityReviewerAgent(BaseAgent):
             deployment_readiness = await self._validate_deployment_readiness(qa_data, quality_analysis)
             
             # Perform final DNA validation
-            dna_final_result = await self.dna_final_validator.validate_final_dna_compliance(
-                story_data={"story_id": story_id},
-                ux_validation=qa_data.get("ux_validation_results", {}),
-                persona_testing=qa_data.get("persona_testing_results", {}),
-                quality_predictions=qa_data.get("quality_intelligence_predictions", {}),
-                all_agent_dna_results=input_contract.get("dna_compliance", {})
-            )
+            dna_final_result = self.review_history.reusable_analysis(review_plan, DNA_FINAL_VALIDATION)
+            if dna_final_result is None:
+                dna_final_result = await self.dna_final_validator.validate_final_dna_compliance(
+                    story_data={"story_id": story_id},
+                    ux_validation=qa_data.get("ux_validation_results", {}),
+                    persona_testing=qa_data.get("persona_testing_results", {}),
+                    quality_predictions=qa_data.get("quality_intelligence_predictions", {}),
+                    all_agent_dna_results=input_contract.get("dna_compliance", {})
+                )
             
             # Make final approval decision
             approval_decision = await self._make_approval_decision(quality_analysis, deployment_readiness)
             
             # Handle client communication based on approval decision
-            client_communication = await self._handle_client_communication(
-                story_id, 
-                quality_analysis, 
-                deployment_readiness, 
-                approval_decision
+            client_communication = self.review_history.reusable_analysis(review_plan, CLIENT_COMMUNICATION)
+            if client_communication is None:
+                client_communication = await self._handle_client_communication(
+                    story_id, 
+                    quality_analysis, 
+                    deployment_readiness, 
+                    approval_decision
+                )
+            
+            # Record review as baseline for the next revision cycle, then report what changed
+            review_changes = self.review_history.review_diff(
+                review_plan, quality_analysis, deployment_readiness, approval_decision, dna_final_result
+            )
+            self.review_history.record_review(
+                review_plan, quality_analysis, deployment_readiness, approval_decision,
+                dna_final_result, client_communication
             )
+            if review_changes is not None:
+                client_communication.get("quality_report", client_communication)["review_changes"] = review_changes
             
             # Notify team of client communication completion
             await self._notify_team_progress("client_communication_prepared", {
@@ -252,7 +272,7 @@ class QualityReviewerAgent(BaseAgent):
             BusinessLogicError: If required QA data is missing
         """
         try:
-            required_data = input_contract.get("input_requirements", {}).get("required_data", {})
+            required_data = self.blob_store.lazy(input_contract.get("input_requirements", {}).get("required_data", {}))
             
             # Validate required QA fields
             required_fields = [
@@ -280,12 +300,14 @@ class QualityReviewerAgent(BaseAgent):
                 context={"contract_keys": list(input_contract.keys())}
             )
     
-    async def _perform_quality_analysis(self, qa_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _perform_quality_analysis(self, qa_data: Dict[str, Any], review_plan=None) -> Dict[str, Any]:
         """
         Perform comprehensive quality analysis on QA data.
         
         Args:
             qa_data: QA test results and metrics
+            review_plan: Optional ReviewPlan; dimensions whose inputs did not
+                change since the previous review reuse their previous analysis
             
         Returns:
             Comprehensive quality analysis results
@@ -297,38 +319,38 @@ class QualityReviewerAgent(BaseAgent):
             analysis_results = {}
             
             # 1. Test Quality Analysis
-            test_analysis = await self.quality_scorer.analyze_test_quality(
-                qa_data.get("test_results", {})
+            test_analysis = await self._analyze_dimension(
+                review_plan, "test_quality", self.quality_scorer.analyze_test_quality, qa_data.get("test_results", {})
             )
             analysis_results["test_quality"] = test_analysis
             
             # 2. Performance Analysis
-            performance_analysis = await self.quality_scorer.analyze_performance(
-                qa_data.get("performance_metrics", {})
+            performance_analysis = await self._analyze_dimension(
+                review_plan, "performance", self.quality_scorer.analyze_performance, qa_data.get("performance_metrics", {})
             )
             analysis_results["performance"] = performance_analysis
             
             # 3. Accessibility Analysis
-            accessibility_analysis = await self.quality_scorer.analyze_accessibility(
-                qa_data.get("accessibility_audit", {})
+            accessibility_analysis = await self._analyze_dimension(
+                review_plan, "accessibility", self.quality_scorer.analyze_accessibility, qa_data.get("accessibility_audit", {})
             )
             analysis_results["accessibility"] = accessibility_analysis
             
             # 4. User Experience Analysis
-            ux_analysis = await self.quality_scorer.analyze_user_experience(
-                qa_data.get("user_flow_validation", {})
+            ux_analysis = await self._analyze_dimension(
+                review_plan, "user_experience", self.quality_scorer.analyze_user_experience, qa_data.get("user_flow_validation", {})
             )
             analysis_results["user_experience"] = ux_analysis
             
             # 5. Code Quality Analysis
-            code_analysis = await self.quality_scorer.analyze_code_quality(
-                qa_data.get("code_quality_metrics", {})
+            code_analysis = await self._analyze_dimension(
+                review_plan, "code_quality", self.quality_scorer.analyze_code_quality, qa_data.get("code_quality_metrics", {})
             )
             analysis_results["code_quality"] = code_analysis
             
             # 6. DNA Compliance Analysis
-            dna_analysis = await self.quality_scorer.analyze_dna_compliance(
-                qa_data
+            dna_analysis = await self._analyze_dimension(
+                review_plan, "dna_compliance", self.quality_scorer.analyze_dna_compliance, qa_data
             )
             analysis_results["dna_compliance"] = dna_analysis
             
@@ -351,6 +373,25 @@ class QualityReviewerAgent(BaseAgent):
                 business_rule="quality_analysis_execution"
             )
     
+    async def _analyze_dimension(self, review_plan, dimension: str, analyze, dimension_input: Any) -> Dict[str, Any]:
+        """Previous analysis of a dimension if its input is unchanged, otherwise a fresh one."""
+        previous_analysis = self.review_history.reusable_analysis(review_plan, dimension)
+        if previous_analysis is not None:
+            return previous_analysis
+        return await analyze(dimension_input)
+    
+    def _review_rules(self) -> Dict[str, Any]:
+        """Weights and thresholds a review applies; changing them invalidates reused results."""
+        return {
+            "quality_thresholds": self.quality_thresholds,
+            "quality_weights": self.quality_scorer.quality_weights,
+            "production_requirements": self.deployment_validator.production_requirements,
+            "decision_weights": self.final_approver.decision_weights,
+            "approval_thresholds": self.final_approver.approval_thresholds,
+            "dna_principle_weights": self.dna_final_validator.design_principle_weights,
+            "dna_deployment_thresholds": self.dna_final_validator.deployment_thresholds
+        }
+    
     async def _validate_deployment_readiness(self, qa_data: Dict[str, Any], quality_analysis: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate deployment readiness against production requirements.
@@ -456,6 +497,36 @@ class QualityReviewerAgent(BaseAgent):
                 business_rule="approval_decision_logic"
             )
     
+    async def score_portfolio(self, qa_data_by_story: Dict[str, Dict[str, Any]]):
+        """
+        Score a whole release portfolio in one batch.
+        
+        Applies the same scoring, readiness and approval rules as the
+        single-story review to the QA data of every story at once.
+        
+        Args:
+            qa_data_by_story: QA data per story id
+            
+        Returns:
+            PortfolioScores with per-story scores, issues, readiness and decisions
+        """
+        from .tools.portfolio_scorer import PortfolioScorer
+        
+        scorer = PortfolioScorer(
+            self.quality_scorer, self.deployment_validator, self.final_approver, self.quality_thresholds
+        )
+        scores = await scorer.score(qa_data_by_story, self._review_single_story)
+        
+        self.logger.info(f"Portfolio scored: {scores.summary()}")
+        return scores
+    
+    async def _review_single_story(self, qa_data: Dict[str, Any]):
+        """Quality analysis, deployment readiness and approval decision of one story."""
+        quality_analysis = await self._perform_quality_analysis(qa_data)
+        deployment_readiness = await self._validate_deployment_readiness(qa_data, quality_analysis)
+        approval_decision = await self._make_approval_decision(quality_analysis, deployment_readiness)
+        return quality_analysis, deployment_readiness, approval_decision
+    
     async def _handle_client_communication(self, story_id: str, quality_analysis: Dict[str, Any],
                                           deployment_readiness: Dict[str, Any], approval_decision: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -0,0 +1,171 @@
+"""
+Test incremental re-review for Quality Reviewer Agent.
+
+Tests that a re-review after a revision cycle recomputes only the analyses
+whose input fingerprints changed, reaches the same result as a full review
+and attaches a diff of what changed to the client quality report.
+"""
+
+import copy
+import json
+
+import pytest
+
+from ..agent import QualityReviewerAgent
+from ..tools.review_history import DNA_FINAL_VALIDATION, ReviewHistory, review_inputs
+
+
+@pytest.fixture
+def qa_contract():
+    """QA contract whose accessibility audit blocks deployment."""
+    return {
+        "contract_version": "1.0",
+        "story_id": "STORY-REVIEW-001",
+        "source_agent": "qa_tester",
+        "target_agent": "quality_reviewer",
+        "dna_compliance": {
+            "design_principles_validation": {
+                "pedagogical_value": True,
+                "policy_to_practice": True,
+                "time_respect": True,
+                "holistic_thinking": True,
+                "professional_tone": True
+            },
+            "architecture_compliance": {
+                "api_first": True,
+                "stateless_backend": True,
+                "separation_of_concerns": True,
+                "simplicity_first": True
+            }
+        },
+        "input_requirements": {
+            "required_data": {
+                "test_results": {"coverage_percent": 96, "tests_passed": 45, "total_tests": 45, "unit_tests": 30, "integration_tests": 15},
+                "performance_metrics": {"lighthouse_score": 92, "api_response_time_ms": 150, "page_load_time_ms": 1800},
+                "accessibility_audit": {
+                    "wcag_compliance_percent": 82,
+                    "violations": [{"id": "missing_alt_text"}, {"id": "low_contrast"}],
+                    "keyboard_accessible": False
+                },
+                "user_flow_validation": {"flow_completion_rate": 96, "user_satisfaction_score": 4.3, "average_task_completion_minutes": 9},
+                "code_quality_metrics": {"typescript_errors": 0, "eslint_violations": 2, "complexity_score": 3.2, "documentation_coverage_percent": 85},
+                "pedagogical_effectiveness_score": 4.4,
+                "policy_practice_alignment_score": 4.2,
+                "time_efficiency_score": 4.5,
+                "holistic_design_score": 4.1,
+                "professional_tone_score": 4.3,
+                "architecture_compliance_percent": 92
+            }
+        }
+    }
+
+
+def _revised(contract):
+    """Contract after a revision cycle that fixed the accessibility audit."""
+    revised = copy.deepcopy(contract)
+    revised["input_requirements"]["required_data"]["accessibility_audit"] = {
+        "wcag_compliance_percent": 97, "violations": [], "keyboard_accessible": True
+    }
+    return revised
+
+
+def _review_outcome(output_contract):
+    required_data = output_contract["input_requirements"]["required_data"]
+    return {
+        "target_agent": output_contract["target_agent"],
+        "quality_analysis": required_data["quality_analysis"],
+        "deployment_readiness": required_data["deployment_readiness"],
+        "approval_status": required_data["approval_status"],
+        "blocking_issues": required_data["blocking_issues"],
+        "dna_compliance_score": output_contract["dna_compliance"]["final_dna_validation"]["dna_compliance_score"]
+    }
+
+
+@pytest.mark.asyncio
+async def test_rereview_recomputes_only_changed_dimensions(qa_contract):
+    """Test a revised accessibility audit recomputes accessibility and matches a full review."""
+    agent = QualityReviewerAgent()
+    first = await agent.process_contract(qa_contract)
+    assert "review_changes" not in first["input_requirements"]["required_data"]["client_communication"]["quality_report"]
+    
+    calls = []
+    analyze_accessibility = agent.quality_scorer.analyze_accessibility
+    agent.quality_scorer.analyze_test_quality = None  # Reused dimensions must not be recomputed
+    
+    async def counting_accessibility(audit):
+        calls.append(audit)
+        return await analyze_accessibility(audit)
+    
+    agent.quality_scorer.analyze_accessibility = counting_accessibility
+    try:
+        second = await agent.process_contract(_revised(qa_contract))
+    finally:
+        del agent.quality_scorer.analyze_accessibility
+        del agent.quality_scorer.analyze_test_quality
+    
+    assert len(calls) == 1
+    full_review = await QualityReviewerAgent().process_contract(_revised(qa_contract))
+    assert _review_outcome(second) == _review_outcome(full_review)
+    
+    changes = second["input_requirements"]["required_data"]["client_communication"]["quality_report"]["review_changes"]
+    assert changes["review_round"] == 2
+    assert changes["changed_inputs"] == ["accessibility_audit"]
+    assert "accessibility" in changes["recomputed_analyses"]
+    assert set(changes["reused_analyses"]) >= {"test_quality", "performance", "dna_compliance", DNA_FINAL_VALIDATION}
+    assert list(changes["dimension_changes"]) == ["accessibility"]
+    assert "Keyboard navigation issues" in changes["dimension_changes"]["accessibility"]["resolved_issues"]
+    assert any(issue.startswith("accessibility:") for issue in changes["resolved_blocking_issues"])
+    assert changes["overall_score"]["change"] > 0
+
+
+@pytest.mark.asyncio
+async def test_unchanged_rereview_reuses_client_communication(qa_contract):
+    """Test an identical re-review reuses every analysis and the client communication bundle."""
+    agent = QualityReviewerAgent()
+    first = await agent.process_contract(qa_contract)
+    second = await agent.process_contract(copy.deepcopy(qa_contract))
+    
+    first_communication = first["input_requirements"]["required_data"]["client_communication"]
+    second_communication = copy.deepcopy(second["input_requirements"]["required_data"]["client_communication"])
+    changes = second_communication["quality_report"].pop("review_changes")
+    
+    assert second_communication == first_communication
+    assert changes["changed_inputs"] == []
+    assert changes["dimension_changes"] == {}
+    assert changes["recomputed_analyses"] == []
+    assert _review_outcome(second) == _review_outcome(first)
+
+
+@pytest.mark.asyncio
+async def test_rule_changes_invalidate_dependent_results(qa_contract):
+    """Test changed review thresholds recompute the DNA validation and client communication."""
+    agent = QualityReviewerAgent()
+    await agent.process_contract(qa_contract)
+    
+    agent.quality_thresholds = {**agent.quality_thresholds, "overall_score": 80}
+    second = await agent.process_contract(copy.deepcopy(qa_contract))
+    
+    changes = second["input_requirements"]["required_data"]["client_communication"]["quality_report"]["review_changes"]
+    assert changes["changed_inputs"] == ["review_rules"]
+    assert DNA_FINAL_VALIDATION in changes["recomputed_analyses"]
+    assert "client_communication" in changes["recomputed_analyses"]
+    assert "accessibility" in changes["reused_analyses"]
+
+
+@pytest.mark.asyncio
+async def test_review_history_persists_across_agents(qa_contract, tmp_path):
+    """Test a new agent on the same state directory continues the story's review rounds."""
+    config = {"review_state_dir": str(tmp_path)}
+    await QualityReviewerAgent(config=config).process_contract(qa_contract)
+    
+    stored = json.loads((tmp_path / "STORY-REVIEW-001.json").read_text(encoding="utf-8"))
+    assert stored["review_round"] == 1
+    assert set(stored["fingerprints"]) == set(review_inputs({}, {})) | {"review_rules"}
+    
+    second = await QualityReviewerAgent(config=config).process_contract(_revised(qa_contract))
+    changes = second["input_requirements"]["required_data"]["client_communication"]["quality_report"]["review_changes"]
+    assert changes["review_round"] == 2
+    assert DNA_FINAL_VALIDATION in changes["reused_analyses"]
+    
+    plan = ReviewHistory(config).plan_review("STORY-UNKNOWN", review_inputs({}, {}), {})
+    assert not plan.is_incremental
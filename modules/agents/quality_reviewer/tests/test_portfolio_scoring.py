@@ -0,0 +1,170 @@
+"""
+Test batch portfolio scoring for Quality Reviewer Agent.
+
+Tests that PortfolioScorer gives every story of a release exactly the
+scores, issues, readiness and approval decision of the single-story review.
+"""
+
+import random
+import time
+
+import pytest
+
+from ..agent import QualityReviewerAgent
+from ..tools.portfolio_scorer import UnscorableStory, extract_story_metrics
+
+
+def _qa_data(seed):
+    """QA data with metrics around the scoring and readiness band edges."""
+    rng = random.Random(seed)
+    pick = rng.choice
+    total_tests = pick([0, 1, 20, 40, 200])
+    return {
+        "test_results": {
+            "coverage_percent": pick([79.9, 80, 89, 90, 94.5, 95, 100]),
+            "tests_passed": rng.randint(0, total_tests),
+            "total_tests": total_tests,
+            "unit_tests": pick([0, 12]),
+            "integration_tests": pick([0, 3])
+        },
+        "performance_metrics": {
+            "lighthouse_score": pick([69, 70, 80, 89.5, 90, 97]),
+            "api_response_time_ms": pick([150, 200, 201, 500, 800]),
+            "page_load_time_ms": pick([1500, 2000, 3000, 3001])
+        },
+        "accessibility_audit": {
+            "wcag_compliance_percent": pick([79, 80, 90, 95, 100]),
+            "violations": [{"id": f"v{i}"} for i in range(pick([0, 1, 3, 4, 10, 11]))],
+            "keyboard_accessible": pick([True, False])
+        },
+        "user_flow_validation": {
+            "flow_completion_rate": pick([79, 80, 90, 95, 99]),
+            "user_satisfaction_score": pick([3.4, 3.5, 4.0, 4.5, 4.8]),
+            "average_task_completion_minutes": pick([8, 10, 12, 12.5]),
+            "target_completion_minutes": 10
+        },
+        "code_quality_metrics": {
+            "typescript_errors": pick([0, 2, 10]),
+            "eslint_violations": pick([0, 3, 6]),
+            "complexity_score": pick([2, 3, 5, 6]),
+            "documentation_coverage_percent": pick([59, 60, 80, 90])
+        },
+        "pedagogical_effectiveness_score": pick([3.0, 3.5, 4.0, 4.5]),
+        "policy_practice_alignment_score": pick([3.4, 4.2, 5.0]),
+        "time_efficiency_score": pick([3.5, 4.1, 4.6]),
+        "holistic_design_score": pick([2.9, 4.0, 4.4]),
+        "professional_tone_score": pick([3.6, 4.3, 4.9]),
+        "architecture_compliance_percent": pick([79, 80, 85, 90, 95]),
+        "security_audit": {
+            "vulnerabilities": [{"severity": pick(["high", "medium", "low"])} for _ in range(pick([0, 1, 7]))],
+            "authentication_implemented": pick([True, False]),
+            "input_validation_score": pick([94, 95, 99]),
+            "secure_headers_implemented": pick([True, True, False])
+        },
+        "browser_compatibility": {"supported_browsers": rng.sample(["Chrome", "Firefox", "Safari", "Edge"], pick([3, 4]))},
+        "mobile_compatibility": {"responsive_design": pick([True, False]), "devices_tested": ["iPhone", "Pixel", "iPad"][:pick([2, 3])]}
+    }
+
+
+def _passing_qa_data():
+    """QA data that meets every production requirement."""
+    return {
+        "test_results": {"coverage_percent": 98, "tests_passed": 40, "total_tests": 40, "unit_tests": 30, "integration_tests": 10},
+        "performance_metrics": {"lighthouse_score": 95, "api_response_time_ms": 150, "page_load_time_ms": 1500},
+        "accessibility_audit": {"wcag_compliance_percent": 100, "violations": [], "keyboard_accessible": True},
+        "user_flow_validation": {"flow_completion_rate": 98, "user_satisfaction_score": 4.6, "average_task_completion_minutes": 8},
+        "code_quality_metrics": {"typescript_errors": 0, "eslint_violations": 0, "complexity_score": 2, "documentation_coverage_percent": 90},
+        "pedagogical_effectiveness_score": 4.5,
+        "policy_practice_alignment_score": 4.4,
+        "time_efficiency_score": 4.6,
+        "holistic_design_score": 4.2,
+        "professional_tone_score": 4.3,
+        "architecture_compliance_percent": 97,
+        "security_audit": {"vulnerabilities": [], "authentication_implemented": True, "input_validation_score": 99, "secure_headers_implemented": True},
+        "browser_compatibility": {"supported_browsers": ["Chrome", "Firefox", "Safari", "Edge"]},
+        "mobile_compatibility": {"responsive_design": True, "devices_tested": ["iPhone", "Pixel", "iPad"]}
+    }
+
+
+async def _assert_matches_single_review(agent, qa_data_by_story, scores):
+    for story_id, qa_data in qa_data_by_story.items():
+        analysis, readiness, decision = await agent._review_single_story(qa_data)
+        story = scores.story(story_id)
+        
+        assert story["dimension_scores"] == {name: analysis[name]["score"] for name in story["dimension_scores"]}
+        assert story["overall_score"] == analysis["overall_score"]
+        assert story["quality_issues"] == analysis["quality_issues"]
+        assert story["readiness_checks"] == {name: check["passed"] for name, check in readiness["readiness_checks"].items()}
+        assert story["readiness_score"] == readiness["readiness_score"]
+        assert story["blocking_issues"] == readiness["blocking_issues"]
+        assert story["decision_score"] == decision["decision_score"]
+        assert story["approved"] == decision["approved"]
+
+
+@pytest.fixture
+def agent():
+    """Create Quality Reviewer Agent for testing."""
+    return QualityReviewerAgent()
+
+
+@pytest.mark.asyncio
+async def test_portfolio_matches_single_story_review(agent):
+    """Test batch results equal the single-story review for every story."""
+    portfolio = {f"STORY-{seed:04d}": _qa_data(seed) for seed in range(400)}
+    portfolio["STORY-PASSING"] = _passing_qa_data()
+    
+    scores = await agent.score_portfolio(portfolio)
+    
+    assert scores.reviewed_individually == []
+    assert scores.story("STORY-PASSING")["approved"]
+    await _assert_matches_single_review(agent, portfolio, scores)
+
+
+@pytest.mark.asyncio
+async def test_unscorable_stories_are_reviewed_individually(agent):
+    """Test stories without plain numeric metrics fall back to the single-story review."""
+    malformed = _passing_qa_data()
+    malformed["performance_metrics"]["lighthouse_score"] = "95"
+    missing_sections = {"test_results": {}, "performance_metrics": {}, "accessibility_audit": {},
+                        "user_flow_validation": {}, "code_quality_metrics": {}}
+    portfolio = {"STORY-MALFORMED": malformed, "STORY-EMPTY": missing_sections, "STORY-PASSING": _passing_qa_data()}
+    
+    with pytest.raises(UnscorableStory):
+        extract_story_metrics(malformed)
+    
+    scores = await agent.score_portfolio(portfolio)
+    
+    assert scores.reviewed_individually == ["STORY-MALFORMED"]
+    assert scores.summary()["approved"] == 1
+    await _assert_matches_single_review(agent, portfolio, scores)
+
+
+@pytest.mark.asyncio
+async def test_threshold_changes_apply_to_next_rescore(agent):
+    """Test live requirement and approval thresholds are read on every call."""
+    portfolio = {f"STORY-{seed:04d}": _qa_data(seed) for seed in range(100)}
+    
+    validator = agent.deployment_validator
+    original = dict(validator.production_requirements)
+    try:
+        validator.production_requirements["lighthouse_score_min"] = 70
+        validator.production_requirements["api_response_time_max_ms"] = 500
+        scores = await agent.score_portfolio(portfolio)
+        await _assert_matches_single_review(agent, portfolio, scores)
+    finally:
+        validator.production_requirements.clear()
+        validator.production_requirements.update(original)
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_ten_thousand_stories_score_under_a_second(agent):
+    """Test a large release portfolio scores in well under a second."""
+    portfolio = {f"STORY-{seed:05d}": _qa_data(seed) for seed in range(10000)}
+    
+    start = time.perf_counter()
+    scores = await agent.score_portfolio(portfolio)
+    elapsed = time.perf_counter() - start
+    
+    assert len(scores.story_ids) == 10000
+    assert elapsed < 1.0
@@ -7,18 +7,30 @@ Contains all specialized tools for the Quality Reviewer agent:
 - FinalApprover: Intelligent approval decision making
 - ClientCommunicator: Professional Swedish municipal communication
 - ProductionReadinessChecker: Production environment validation
+- PortfolioScorer: Batch scoring of whole release portfolios
+- ReviewHistory: Incremental re-review of revised stories
 """
 
-from .quality_scorer import QualityScorer
-from .deployment_validator import DeploymentValidator
-from .final_approver import FinalApprover
-from .client_communicator import ClientCommunicator
-from .dna_final_validator import DNAFinalValidator
+import importlib
 
-__all__ = [
-    "QualityScorer",
-    "DeploymentValidator", 
-    "FinalApprover",
-    "ClientCommunicator",
-    "DNAFinalValidator"
-]
\ No newline at end of file
+# Tool classes are imported on first access (PEP 562) so importing the
+# package does not pull in every tool module
+_TOOL_MODULES = {
+    "QualityScorer": ".quality_scorer",
+    "DeploymentValidator": ".deployment_validator",
+    "FinalApprover": ".final_approver",
+    "ClientCommunicator": ".client_communicator",
+    "DNAFinalValidator": ".dna_final_validator",
+    "PortfolioScorer": ".portfolio_scorer",
+    "ReviewHistory": ".review_history",
+}
+
+__all__ = list(_TOOL_MODULES)
+
+
+def __getattr__(name):
+    if name not in _TOOL_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_TOOL_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,710 @@
+"""
+Portfolio Scorer - Batch quality scoring for whole DigiNativa releases.
+
+Scores QA data of many stories in one pass: metrics become columns, and
+the quality score bands, DeploymentValidator requirements and FinalApprover
+decision rules are applied as vectorized threshold tables. QualityScorer
+scores a single story with the same tables as a one-row batch, so both
+paths agree by construction; stories whose QA data cannot be represented
+as plain numeric columns are reviewed one by one instead.
+"""
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+# Largest integer float64 represents exactly; larger values are reviewed one by one
+EXACT_INTEGER_LIMIT = 2 ** 53
+
+DESIGN_PRINCIPLES = ("pedagogical_value", "policy_to_practice", "time_respect", "holistic_thinking", "professional_tone")
+DESIGN_PRINCIPLE_KEYS = {
+    "pedagogical_value": "pedagogical_effectiveness_score",
+    "policy_to_practice": "policy_practice_alignment_score",
+    "time_respect": "time_efficiency_score",
+    "holistic_thinking": "holistic_design_score",
+    "professional_tone": "professional_tone_score"
+}
+REQUIRED_BROWSERS = ("Chrome", "Firefox", "Safari", "Edge")
+
+
+@dataclass(frozen=True)
+class Band:
+    """Score band: points (and issue) when the column satisfies operator and bound."""
+    operator: str  # ">=", ">", "<=", "<", "==", "truthy", "falsy"
+    bound: Any = None  # Number, or column name
+    points: int = 0
+    issue: Optional[str] = None  # Template formatted with the story's metrics
+    column: Optional[str] = None  # Defaults to the rule column
+    scale: float = 1.0  # Multiplies a column bound
+
+
+@dataclass(frozen=True)
+class ScoreRule:
+    """One if/elif chain of QualityScorer: first matching band wins."""
+    column: str
+    bands: Tuple[Band, ...]
+    otherwise: Band
+
+
+@dataclass(frozen=True)
+class RequirementRule:
+    """One DeploymentValidator check: fails when the column satisfies operator and bound."""
+    column: str
+    operator: str
+    bound: Any  # Number, or DeploymentValidator.production_requirements key
+    issue: str  # Template formatted with the story's metrics and the requirement as {bound}
+
+
+def _bands(column: str, operator: str, *bands: Tuple[Any, int, Optional[str]], otherwise: Tuple[int, str]) -> ScoreRule:
+    return ScoreRule(
+        column,
+        tuple(Band(operator, bound, points, issue) for bound, points, issue in bands),
+        Band("else", None, *otherwise)
+    )
+
+
+# Quality score band chains per dimension, in issue order (scored by QualityScorer and PortfolioScorer)
+SCORE_RULES: Dict[str, Tuple[ScoreRule, ...]] = {
+    "test_quality": (
+        _bands(
+            "coverage_percent", ">=",
+            (95, 40, None),
+            (90, 30, "Test coverage below 95% ({coverage_percent}%)"),
+            (80, 20, "Test coverage below 90% ({coverage_percent}%)"),
+            otherwise=(10, "Test coverage critically low ({coverage_percent}%)")
+        ),
+        ScoreRule("pass_rate", (
+            Band("==", 100, 40),
+            Band(">=", 95, 30, "Some tests failing ({pass_rate:.1f}% pass rate)")
+        ), Band("else", None, 10, "Significant test failures ({pass_rate:.1f}% pass rate)")),
+        _bands(
+            "test_suite_kinds", ">=",
+            (2, 20, None),
+            (1, 10, "Missing either unit or integration tests"),
+            otherwise=(0, "No comprehensive test suite")
+        )
+    ),
+    "performance": (
+        _bands(
+            "lighthouse_score", ">=",
+            (90, 40, None),
+            (80, 30, "Lighthouse score below 90 ({lighthouse_score})"),
+            (70, 20, "Lighthouse score below 80 ({lighthouse_score})"),
+            otherwise=(10, "Poor Lighthouse score ({lighthouse_score})")
+        ),
+        _bands(
+            "api_response_time_ms", "<=",
+            (200, 30, None),
+            (500, 20, "API response time above 200ms ({api_response_time_ms}ms)"),
+            otherwise=(10, "Slow API response time ({api_response_time_ms}ms)")
+        ),
+        _bands(
+            "page_load_time_ms", "<=",
+            (2000, 30, None),
+            (3000, 20, "Page load time above 2s ({page_load_time_ms}ms)"),
+            otherwise=(10, "Slow page load time ({page_load_time_ms}ms)")
+        )
+    ),
+    "accessibility": (
+        _bands(
+            "wcag_compliance_percent", ">=",
+            (95, 50, None),
+            (90, 40, "WCAG compliance below 95% ({wcag_compliance_percent}%)"),
+            (80, 30, "WCAG compliance below 90% ({wcag_compliance_percent}%)"),
+            otherwise=(15, "Poor WCAG compliance ({wcag_compliance_percent}%)")
+        ),
+        ScoreRule("violations_count", (
+            Band("==", 0, 30),
+            Band("<=", 3, 20, "{violations_count} accessibility violations found"),
+            Band("<=", 10, 10, "{violations_count} accessibility violations found")
+        ), Band("else", None, 0, "Many accessibility violations ({violations_count})")),
+        ScoreRule("keyboard_accessible", (Band("truthy", None, 20),), Band("else", None, 0, "Keyboard navigation issues"))
+    ),
+    "user_experience": (
+        _bands(
+            "flow_completion_rate", ">=",
+            (95, 40, None),
+            (90, 30, "Flow completion rate below 95% ({flow_completion_rate}%)"),
+            (80, 20, "Flow completion rate below 90% ({flow_completion_rate}%)"),
+            otherwise=(10, "Poor flow completion rate ({flow_completion_rate}%)")
+        ),
+        _bands(
+            "user_satisfaction_score", ">=",
+            (4.5, 30, None),
+            (4.0, 25, "User satisfaction below 4.5 ({user_satisfaction_score})"),
+            (3.5, 15, "User satisfaction below 4.0 ({user_satisfaction_score})"),
+            otherwise=(5, "Poor user satisfaction ({user_satisfaction_score})")
+        ),
+        ScoreRule("average_task_completion_minutes", (
+            Band("<=", "target_completion_minutes", 30),
+            Band("<=", "target_completion_minutes", 20,
+                 "Task completion time slightly above target "
+                 "({average_task_completion_minutes}min vs {target_completion_minutes}min)", scale=1.2)
+        ), Band("else", None, 10, "Task completion time too high "
+                                  "({average_task_completion_minutes}min vs {target_completion_minutes}min)"))
+    ),
+    "code_quality": (
+        ScoreRule("linting_issues", (
+            Band("truthy", None, 40, column="lint_free"),
+            Band("<=", 5, 30, "{linting_issues} linting issues found"),
+            Band("<=", 15, 20, "{linting_issues} linting issues found")
+        ), Band("else", None, 10, "Many linting issues ({linting_issues})")),
+        _bands(
+            "complexity_score", "<=",
+            (3, 30, None),
+            (5, 20, "Code complexity above ideal ({complexity_score})"),
+            otherwise=(10, "High code complexity ({complexity_score})")
+        ),
+        _bands(
+            "documentation_coverage_percent", ">=",
+            (80, 30, None),
+            (60, 20, "Documentation coverage below 80% ({documentation_coverage_percent}%)"),
+            otherwise=(10, "Poor documentation coverage ({documentation_coverage_percent}%)")
+        )
+    ),
+    "dna_compliance": (
+        _bands(
+            "design_principles_avg", ">=",
+            (4.0, 50, None),
+            (3.5, 40, "Design principles score below 4.0 ({design_principles_avg:.1f})"),
+            (3.0, 30, "Design principles score below 3.5 ({design_principles_avg:.1f})"),
+            otherwise=(15, "Poor design principles compliance ({design_principles_avg:.1f})")
+        ),
+        _bands(
+            "architecture_compliance_percent", ">=",
+            (95, 50, None),
+            (90, 40, "Architecture compliance below 95% ({architecture_compliance_percent}%)"),
+            (80, 30, "Architecture compliance below 90% ({architecture_compliance_percent}%)"),
+            otherwise=(15, "Poor architecture compliance ({architecture_compliance_percent}%)")
+        )
+    )
+}
+
+# DeploymentValidator.validate_* checks, in readiness check and issue order
+REQUIREMENT_RULES: Dict[str, Tuple[RequirementRule, ...]] = {
+    "performance": (
+        RequirementRule("lighthouse_score", "<", "lighthouse_score_min",
+                        "Lighthouse score too low: {lighthouse_score} < {bound}"),
+        RequirementRule("api_response_time_ms", ">", "api_response_time_max_ms",
+                        "API response time too slow: {api_response_time_ms}ms > {bound}ms"),
+        RequirementRule("page_load_time_ms", ">", 3000, "Page load time too slow: {page_load_time_ms}ms > 3000ms")
+    ),
+    "security": (
+        RequirementRule("high_severity_vulnerabilities", ">", 0,
+                        "{high_severity_vulnerabilities} high-severity security vulnerabilities found"),
+        RequirementRule("medium_severity_vulnerabilities", ">", 5,
+                        "{medium_severity_vulnerabilities} medium-severity vulnerabilities (max 5 allowed)"),
+        RequirementRule("authentication_implemented", "falsy", None, "Authentication not properly implemented"),
+        RequirementRule("input_validation_score", "<", "security_score_min",
+                        "Input validation score too low: {input_validation_score} < {bound}"),
+        RequirementRule("secure_headers_implemented", "falsy", None, "Security headers not properly configured")
+    ),
+    "accessibility": (
+        RequirementRule("wcag_compliance_percent", "<", "wcag_compliance_min_percent",
+                        "WCAG compliance too low: {wcag_compliance_percent}% < {bound}%"),
+        RequirementRule("violations_count", ">", 0, "{violations_count} accessibility violations must be fixed"),
+        RequirementRule("keyboard_accessible", "falsy", None, "Keyboard navigation not fully accessible")
+    ),
+    "dna_compliance": (
+        RequirementRule("design_principles_avg", "<", 4.0,
+                        "Design principles score too low: {design_principles_avg} < 4.0"),
+        RequirementRule("architecture_compliance_percent", "<", "dna_compliance_min_percent",
+                        "Architecture compliance too low: {architecture_compliance_percent}% < {bound}%"),
+        *(
+            RequirementRule(principle, "<", 3.5, f"DNA principle '{principle}' score too low: {{{principle}}} < 3.5")
+            for principle in DESIGN_PRINCIPLES
+        )
+    ),
+    "test_coverage": (
+        RequirementRule("coverage_percent", "<", "test_coverage_min_percent",
+                        "Test coverage too low: {coverage_percent}% < {bound}%"),
+        RequirementRule("pass_rate", "<", 100, "Not all tests passing: {pass_rate}% pass rate")
+    ),
+    "compatibility": (
+        *(
+            RequirementRule(f"supports_{browser.lower()}", "falsy", None, f"Browser {browser} not fully supported")
+            for browser in REQUIRED_BROWSERS
+        ),
+        RequirementRule("responsive_design", "falsy", None, "Responsive design not properly implemented"),
+        RequirementRule("devices_tested_count", "<", 3,
+                        "Insufficient device testing: {devices_tested_count} devices (minimum 3)")
+    )
+}
+
+_COMPARISONS = {
+    ">=": np.greater_equal,
+    ">": np.greater,
+    "<=": np.less_equal,
+    "<": np.less,
+    "==": np.equal
+}
+
+
+class UnscorableStory(Exception):
+    """QA data that has no exact column representation."""
+
+
+QA_SECTIONS = (
+    "test_results", "performance_metrics", "accessibility_audit", "user_flow_validation",
+    "code_quality_metrics", "security_audit", "browser_compatibility", "mobile_compatibility"
+)
+
+# (metric, QA section or None for top level, key, default) as read by the single-story path
+NUMERIC_METRICS = (
+    ("coverage_percent", "test_results", "coverage_percent", 0),
+    ("tests_passed", "test_results", "tests_passed", 0),
+    ("total_tests", "test_results", "total_tests", 1),
+    ("unit_tests", "test_results", "unit_tests", 0),
+    ("integration_tests", "test_results", "integration_tests", 0),
+    ("lighthouse_score", "performance_metrics", "lighthouse_score", 0),
+    ("api_response_time_ms", "performance_metrics", "api_response_time_ms", 1000),
+    ("page_load_time_ms", "performance_metrics", "page_load_time_ms", 5000),
+    ("wcag_compliance_percent", "accessibility_audit", "wcag_compliance_percent", 0),
+    ("flow_completion_rate", "user_flow_validation", "flow_completion_rate", 0),
+    ("user_satisfaction_score", "user_flow_validation", "user_satisfaction_score", 0),
+    ("average_task_completion_minutes", "user_flow_validation", "average_task_completion_minutes", 15),
+    ("target_completion_minutes", "user_flow_validation", "target_completion_minutes", 10),
+    ("typescript_errors", "code_quality_metrics", "typescript_errors", 0),
+    ("eslint_violations", "code_quality_metrics", "eslint_violations", 0),
+    ("complexity_score", "code_quality_metrics", "complexity_score", 5),
+    ("documentation_coverage_percent", "code_quality_metrics", "documentation_coverage_percent", 0),
+    ("input_validation_score", "security_audit", "input_validation_score", 0),
+    *((principle, None, DESIGN_PRINCIPLE_KEYS[principle], 0) for principle in DESIGN_PRINCIPLES),
+    ("architecture_compliance_percent", None, "architecture_compliance_percent", 0)
+)
+
+
+def _test_results_metrics(section: Mapping[str, Any], metrics: Dict[str, Any]) -> Dict[str, Any]:
+    total_tests = metrics["total_tests"]
+    return {
+        "pass_rate": (metrics["tests_passed"] / total_tests) * 100 if total_tests > 0 else 0,
+        "test_suite_kinds": int(metrics["unit_tests"] > 0) + int(metrics["integration_tests"] > 0)
+    }
+
+
+def _accessibility_metrics(section: Mapping[str, Any], metrics: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "violations_count": len(section.get("violations", [])),
+        "keyboard_accessible": bool(section.get("keyboard_accessible", False))
+    }
+
+
+def _code_quality_metrics(section: Mapping[str, Any], metrics: Dict[str, Any]) -> Dict[str, Any]:
+    typescript_errors, eslint_violations = metrics["typescript_errors"], metrics["eslint_violations"]
+    return {
+        "lint_free": typescript_errors == 0 and eslint_violations == 0,
+        "linting_issues": typescript_errors + eslint_violations
+    }
+
+
+def _security_metrics(section: Mapping[str, Any], metrics: Dict[str, Any]) -> Dict[str, Any]:
+    vulnerabilities = section.get("vulnerabilities", [])
+    severities = [vulnerability.get("severity") for vulnerability in vulnerabilities] if vulnerabilities else []
+    return {
+        "high_severity_vulnerabilities": severities.count("high"),
+        "medium_severity_vulnerabilities": severities.count("medium"),
+        "authentication_implemented": bool(section.get("authentication_implemented", False)),
+        "secure_headers_implemented": bool(section.get("secure_headers_implemented", False))
+    }
+
+
+def _browser_metrics(section: Mapping[str, Any], metrics: Dict[str, Any]) -> Dict[str, Any]:
+    supported_browsers = section.get("supported_browsers", [])
+    return {f"supports_{browser.lower()}": browser in supported_browsers for browser in REQUIRED_BROWSERS}
+
+
+def _mobile_metrics(section: Mapping[str, Any], metrics: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "devices_tested_count": len(section.get("devices_tested", [])),
+        "responsive_design": bool(section.get("responsive_design", False))
+    }
+
+
+def _dna_metrics(section: Mapping[str, Any], metrics: Dict[str, Any]) -> Dict[str, Any]:
+    return {"design_principles_avg": sum(metrics[principle] for principle in DESIGN_PRINCIPLES) / len(DESIGN_PRINCIPLES)}
+
+
+# Derived metrics per QA section (None for top level)
+DERIVED_METRICS: Dict[Optional[str], Callable[[Mapping[str, Any], Dict[str, Any]], Dict[str, Any]]] = {
+    "test_results": _test_results_metrics,
+    "accessibility_audit": _accessibility_metrics,
+    "code_quality_metrics": _code_quality_metrics,
+    "security_audit": _security_metrics,
+    "browser_compatibility": _browser_metrics,
+    "mobile_compatibility": _mobile_metrics,
+    None: _dna_metrics
+}
+
+# QA section scored by each quality dimension (None for top level)
+DIMENSION_SECTIONS: Dict[str, Optional[str]] = {
+    "test_quality": "test_results",
+    "performance": "performance_metrics",
+    "accessibility": "accessibility_audit",
+    "user_experience": "user_flow_validation",
+    "code_quality": "code_quality_metrics",
+    "dna_compliance": None
+}
+
+
+def section_metrics(section_name: Optional[str], section: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Metrics of one QA section with the single-story defaults and derived values.
+    
+    Values are taken as given; invalid values raise the errors the
+    single-story analysis reports.
+    """
+    metrics = {
+        metric: section.get(key, default)
+        for metric, section_key, key, default in NUMERIC_METRICS if section_key == section_name
+    }
+    derive = DERIVED_METRICS.get(section_name)
+    if derive:
+        metrics.update(derive(section, metrics))
+    return metrics
+
+
+def extract_story_metrics(qa_data: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Metrics of one story, with the defaults and derived values the single-story path uses.
+    
+    Raises:
+        UnscorableStory: If a metric is not a plain number (or container where one is expected)
+    """
+    if not isinstance(qa_data, dict):
+        raise UnscorableStory("QA data is not a dict")
+    
+    sections = {None: qa_data}
+    for name in QA_SECTIONS:
+        section = sections[name] = qa_data.get(name, {})
+        if not isinstance(section, dict):
+            raise UnscorableStory(f"{name} is not a dict")
+    
+    for metric, section, key, default in NUMERIC_METRICS:
+        value = sections[section].get(key, default)
+        kind = type(value)
+        if not (kind is float or kind is bool or (kind is int and -EXACT_INTEGER_LIMIT <= value <= EXACT_INTEGER_LIMIT)):
+            raise UnscorableStory(f"{metric} is not a plain number: {value!r}")
+    
+    metrics = {}
+    try:
+        for name, section in sections.items():
+            metrics.update(section_metrics(name, section))
+    except (TypeError, AttributeError) as e:
+        raise UnscorableStory(str(e))
+    return metrics
+
+
+def apply_score_rule(rule: ScoreRule, column: Callable[[str], np.ndarray], rows: List[Mapping[str, Any]],
+                     valid: np.ndarray, issues: Dict[int, List[str]]) -> np.ndarray:
+    """
+    Points per story for one band chain; issue messages are appended per story.
+    
+    Bands are tried in order, each only while some story is still
+    unmatched, so a one-row batch evaluates exactly the conditions of
+    the equivalent if/elif chain.
+    
+    Args:
+        rule: Band chain
+        column: Metric column by name
+        rows: Metrics per story (issue template values)
+        valid: Stories to score; others get zero points and no issues
+        issues: Issue messages per story index, appended to
+    """
+    selected = np.full(len(valid), len(rule.bands), dtype=np.int64)
+    unmatched = valid.copy()
+    for position, band in enumerate(rule.bands):
+        if not unmatched.any():
+            break
+        bound = band.bound
+        if isinstance(bound, str):
+            bound = column(bound) if band.scale == 1.0 else column(bound) * band.scale
+        matched = unmatched & _condition(band.operator, column(band.column or rule.column), bound)
+        selected[matched] = position
+        unmatched &= ~matched
+    
+    bands = rule.bands + (rule.otherwise,)
+    points = np.array([band.points for band in bands], dtype=np.int64)[selected]
+    
+    for position, band in enumerate(bands):
+        if band.issue is None:
+            continue
+        for index in np.flatnonzero(valid & (selected == position)).tolist():
+            issues.setdefault(index, []).append(band.issue.format_map(rows[index]))
+    
+    return np.where(valid, points, 0)
+
+
+def score_dimension(dimension: str, metrics: Mapping[str, Any]) -> Tuple[int, List[str]]:
+    """
+    Score one story's quality dimension as a one-row batch of SCORE_RULES.
+    
+    Columns hold the metric values as Python objects, so comparisons are
+    exact for any number type and invalid values raise like plain Python.
+    
+    Returns:
+        Dimension score (capped at 100) and issue messages
+    """
+    def column(name: str) -> np.ndarray:
+        values = np.empty(1, dtype=object)
+        values[0] = metrics[name]
+        return values
+    
+    valid = np.ones(1, dtype=bool)
+    issues: Dict[int, List[str]] = {}
+    points = sum(int(apply_score_rule(rule, column, [metrics], valid, issues)[0]) for rule in SCORE_RULES[dimension])
+    return min(points, 100), issues.get(0, [])
+
+
+def _condition(operator: str, values: np.ndarray, bound: Any) -> np.ndarray:
+    if operator == "truthy":
+        return values.astype(bool)
+    if operator == "falsy":
+        return ~values.astype(bool)
+    with np.errstate(invalid="ignore"):  # NaN compares false, as in Python
+        return _COMPARISONS[operator](values, bound).astype(bool)
+
+
+@dataclass
+class PortfolioScores:
+    """Per-story review results of a portfolio, as columns in story order."""
+    story_ids: List[str]
+    dimension_scores: Dict[str, np.ndarray]
+    overall_scores: np.ndarray
+    quality_issues: List[List[Dict[str, Any]]]
+    readiness_checks: Dict[str, np.ndarray]
+    readiness_scores: np.ndarray
+    blocking_issues: List[List[str]]
+    decision_scores: np.ndarray
+    approved: np.ndarray
+    reviewed_individually: List[str] = field(default_factory=list)
+    
+    @property
+    def deployment_ready(self) -> np.ndarray:
+        """Whether each story passes every readiness check."""
+        return np.logical_and.reduce(list(self.readiness_checks.values()))
+    
+    def story(self, story_id: str) -> Dict[str, Any]:
+        """Review results of one story."""
+        index = self.story_ids.index(story_id)
+        return {
+            "story_id": story_id,
+            "overall_score": self.overall_scores[index].item(),
+            "dimension_scores": {name: scores[index].item() for name, scores in self.dimension_scores.items()},
+            "quality_issues": self.quality_issues[index],
+            "deployment_ready": bool(self.deployment_ready[index]),
+            "readiness_checks": {name: bool(passed[index]) for name, passed in self.readiness_checks.items()},
+            "readiness_score": self.readiness_scores[index].item(),
+            "blocking_issues": self.blocking_issues[index],
+            "decision_score": self.decision_scores[index].item(),
+            "approved": bool(self.approved[index])
+        }
+    
+    def __repr__(self) -> str:
+        return f"PortfolioScores({len(self.story_ids)} stories, {int(self.approved.sum())} approved)"
+    
+    def summary(self) -> Dict[str, Any]:
+        """Release-level counts and averages."""
+        count = len(self.story_ids)
+        return {
+            "stories": count,
+            "approved": int(self.approved.sum()),
+            "deployment_ready": int(self.deployment_ready.sum()),
+            "average_overall_score": round(float(self.overall_scores.mean()), 1) if count else 0.0,
+            "reviewed_individually": len(self.reviewed_individually)
+        }
+
+
+StoryReview = Callable[[Dict[str, Any]], Awaitable[Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]]]
+
+
+class PortfolioScorer:
+    """Scores QA data of many stories with vectorized threshold tables."""
+    
+    def __init__(self, quality_scorer, deployment_validator, final_approver, quality_thresholds: Dict[str, Any]):
+        """
+        Initialize portfolio scorer.
+        
+        Weights and thresholds are read from the tools on every call, so
+        changed thresholds apply to the next re-score.
+        
+        Args:
+            quality_scorer: QualityScorer (dimension weights)
+            deployment_validator: DeploymentValidator (production requirements)
+            final_approver: FinalApprover (decision weights and approval thresholds)
+            quality_thresholds: Reviewer quality thresholds
+        """
+        self.logger = logging.getLogger(f"{__name__}.PortfolioScorer")
+        self.quality_scorer = quality_scorer
+        self.deployment_validator = deployment_validator
+        self.final_approver = final_approver
+        self.quality_thresholds = quality_thresholds
+    
+    async def score(self, qa_data_by_story: Mapping[str, Dict[str, Any]], review_story: StoryReview) -> PortfolioScores:
+        """
+        Score every story of a portfolio.
+        
+        Args:
+            qa_data_by_story: QA data per story id
+            review_story: Single-story review returning (quality analysis,
+                deployment readiness, approval decision), used for stories
+                without an exact column representation
+        
+        Returns:
+            Per-story scores, issues, readiness and decisions
+        """
+        story_ids = list(qa_data_by_story)
+        metrics, individual = [], []
+        for index, story_id in enumerate(story_ids):
+            try:
+                metrics.append(extract_story_metrics(qa_data_by_story[story_id]))
+            except UnscorableStory as e:
+                self.logger.debug(f"Reviewing {story_id} individually: {e}")
+                metrics.append(None)
+                individual.append(index)
+        
+        scores = self.score_metrics(story_ids, metrics)
+        
+        for index in individual:
+            story_id = story_ids[index]
+            quality_analysis, readiness, decision = await review_story(qa_data_by_story[story_id])
+            self._store_review(scores, index, quality_analysis, readiness, decision)
+            scores.reviewed_individually.append(story_id)
+        
+        return scores
+    
+    def score_metrics(self, story_ids: List[str], metrics: List[Optional[Dict[str, Any]]]) -> PortfolioScores:
+        """
+        Apply scoring, readiness and decision rules to story metrics.
+        
+        Stories without metrics (None) get zero results to be filled in
+        by a single-story review.
+        """
+        count = len(story_ids)
+        valid = np.fromiter((row is not None for row in metrics), dtype=bool, count=count)
+        missing = defaultdict(int)
+        rows = [row if row is not None else missing for row in metrics]
+        columns: Dict[str, np.ndarray] = {}
+        
+        def column(name: str) -> np.ndarray:
+            if name not in columns:
+                columns[name] = np.fromiter(map(itemgetter(name), rows), dtype=float, count=count)
+            return columns[name]
+        
+        quality_issues: List[List[Dict[str, Any]]] = [[] for _ in range(count)]
+        dimension_issues: Dict[str, Dict[int, List[str]]] = {}
+        dimension_scores = {}
+        for dimension, rules in SCORE_RULES.items():
+            points = np.zeros(count, dtype=np.int64)
+            issues = dimension_issues[dimension] = {}
+            for rule in rules:
+                points += apply_score_rule(rule, column, rows, valid, issues)
+            dimension_scores[dimension] = np.minimum(points, 100)
+        
+        # QualityScorer.calculate_overall_score: weighted sum in weight order, rounded per story
+        total = np.zeros(count)
+        for dimension, weight in self.quality_scorer.quality_weights.items():
+            total = total + dimension_scores.get(dimension, np.zeros(count, dtype=np.int64)) * weight
+        overall_scores = np.array([round(value, 1) for value in total.tolist()], dtype=float).reshape(count)
+        
+        # QualityScorer.identify_quality_issues: critical overall issue, then dimension issues
+        overall_threshold = self.quality_thresholds.get("overall_score", 90)
+        critical = valid & (overall_scores < overall_threshold)
+        overall_values = overall_scores.tolist()
+        for index in np.flatnonzero(critical).tolist():
+            quality_issues[index].append({
+                "type": "critical",
+                "category": "overall_quality",
+                "message": f"Overall quality score below threshold "
+                           f"({overall_values[index]} < {self.quality_thresholds['overall_score']})",
+                "impact": "high",
+                "blocking": True
+            })
+        for dimension in self.quality_scorer.quality_weights:
+            for index, messages in sorted(dimension_issues.get(dimension, {}).items()):
+                quality_issues[index].extend(
+                    {"type": "warning", "category": dimension, "message": message, "impact": "medium", "blocking": False}
+                    for message in messages
+                )
+        
+        # DeploymentValidator checks
+        requirements = self.deployment_validator.production_requirements
+        readiness_checks = {}
+        blocking_issues: List[List[str]] = [[] for _ in range(count)]
+        for check, rules in REQUIREMENT_RULES.items():
+            issues: Dict[int, List[str]] = {}
+            failed = np.zeros(count, dtype=bool)
+            for rule in rules:
+                bound = requirements[rule.bound] if isinstance(rule.bound, str) else rule.bound
+                failing = valid & _condition(rule.operator, column(rule.column), bound)
+                failed |= failing
+                template = rule.issue.replace("{bound}", format(bound))
+                for index in np.flatnonzero(failing).tolist():
+                    issues.setdefault(index, []).append(template.format_map(rows[index]))
+            readiness_checks[check] = ~failed
+            for index in np.flatnonzero(failed).tolist():
+                blocking_issues[index].append(f"{check}: {'; '.join(issues[index])}")
+        
+        passed_count = np.sum(list(readiness_checks.values()), axis=0, dtype=np.int64).reshape(count)
+        readiness_scores = passed_count / len(readiness_checks) * 100
+        
+        # FinalApprover decision score and approval status; only the overall issue is critical
+        approver = self.final_approver
+        critical_count = critical.astype(float)
+        factor_values = {
+            "quality_score": overall_scores,
+            "deployment_readiness": readiness_scores,
+            "critical_issues": critical_count,
+            "dna_compliance": dimension_scores["dna_compliance"],
+            "performance": dimension_scores["performance"],
+            "test_quality": dimension_scores["test_quality"]
+        }
+        decision_total = np.zeros(count)
+        for factor, weight in approver.decision_weights.items():
+            value = factor_values.get(factor, np.zeros(count))
+            if factor == "critical_issues":
+                normalized = np.maximum(0, 100 - value * 25)
+            else:
+                normalized = np.minimum(100, np.maximum(0, value))
+            decision_total = decision_total + normalized * weight
+        decision_scores = np.array([round(value, 1) for value in decision_total.tolist()], dtype=float).reshape(count)
+        
+        thresholds = approver.approval_thresholds
+        approved = (
+            valid
+            & (passed_count == len(readiness_checks))
+            & (critical_count <= thresholds["maximum_critical_issues"])
+            & (readiness_scores >= thresholds["minimum_readiness_score"])
+            & (decision_scores >= thresholds["minimum_overall_score"])
+        )
+        
+        return PortfolioScores(
+            story_ids=list(story_ids),
+            dimension_scores=dimension_scores,
+            overall_scores=overall_scores,
+            quality_issues=quality_issues,
+            readiness_checks=readiness_checks,
+            readiness_scores=readiness_scores,
+            blocking_issues=blocking_issues,
+            decision_scores=decision_scores,
+            approved=approved
+        )
+    
+    @staticmethod
+    def _store_review(scores: PortfolioScores, index: int, quality_analysis: Dict[str, Any],
+                      readiness: Dict[str, Any], decision: Dict[str, Any]) -> None:
+        """Store results of a single-story review in the portfolio columns."""
+        for dimension, dimension_scores in scores.dimension_scores.items():
+            dimension_scores[index] = quality_analysis.get(dimension, {}).get("score", 0)
+        scores.overall_scores[index] = quality_analysis.get("overall_score", 0)
+        scores.quality_issues[index] = list(quality_analysis.get("quality_issues", []))
+        checks = readiness.get("readiness_checks", {})
+        for check, passed in scores.readiness_checks.items():
+            passed[index] = bool(checks.get(check, {}).get("passed", False))
+        scores.readiness_scores[index] = readiness.get("readiness_score", 0)
+        scores.blocking_issues[index] = list(readiness.get("blocking_issues", []))
+        scores.decision_scores[index] = decision.get("decision_score", 0)
+        scores.approved[index] = bool(decision.get("approved", False))
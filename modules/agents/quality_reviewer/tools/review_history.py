@@ -0,0 +1,364 @@
+"""
+Review History - Incremental re-review for revised DigiNativa stories.
+
+Fingerprints every input slice a quality review depends on and keeps the
+story's previous review, so a re-review after a revision cycle only
+recomputes the quality dimensions (and the final DNA validation) whose
+inputs changed, and reports what changed since the previous round.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from .dna_final_validator import DNAComplianceLevel, DNAFinalValidationResult
+
+DNA_FINAL_VALIDATION = "dna_final_validation"
+CLIENT_COMMUNICATION = "client_communication"
+REVIEW_RULES = "review_rules"
+
+# Top-level QA data keys read by QualityScorer.analyze_dna_compliance
+DNA_SCORE_KEYS = (
+    "pedagogical_effectiveness_score",
+    "policy_practice_alignment_score",
+    "time_efficiency_score",
+    "holistic_design_score",
+    "professional_tone_score",
+    "architecture_compliance_percent"
+)
+
+# Quality dimension -> QA data section it analyzes
+DIMENSION_INPUTS = {
+    "test_quality": "test_results",
+    "performance": "performance_metrics",
+    "accessibility": "accessibility_audit",
+    "user_experience": "user_flow_validation",
+    "code_quality": "code_quality_metrics",
+    "dna_compliance": "dna_scores"
+}
+
+# Reusable analysis -> input slices (and rules) it depends on
+ANALYSIS_DEPENDENCIES = {
+    **{dimension: (slice_name,) for dimension, slice_name in DIMENSION_INPUTS.items()},
+    DNA_FINAL_VALIDATION: ("dna_results", REVIEW_RULES)
+}
+
+
+def review_inputs(qa_data: Dict[str, Any], agent_dna_results: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Input slices of a quality review.
+    
+    Security and compatibility sections are included as well, since the
+    deployment readiness checks and client communication depend on them.
+    
+    Args:
+        qa_data: QA data extracted from the input contract
+        agent_dna_results: DNA validation results of all previous agents
+    
+    Returns:
+        Slice name -> slice content
+    """
+    slices = {
+        slice_name: qa_data.get(slice_name, {})
+        for slice_name in DIMENSION_INPUTS.values() if slice_name != "dna_scores"
+    }
+    slices["dna_scores"] = {key: qa_data.get(key) for key in DNA_SCORE_KEYS}
+    slices["dna_results"] = {
+        "ux_validation_results": qa_data.get("ux_validation_results", {}),
+        "persona_testing_results": qa_data.get("persona_testing_results", {}),
+        "quality_intelligence_predictions": qa_data.get("quality_intelligence_predictions", {}),
+        "agent_dna_results": agent_dna_results
+    }
+    slices["security_audit"] = qa_data.get("security_audit", {})
+    slices["compatibility"] = {
+        "browser_compatibility": qa_data.get("browser_compatibility", {}),
+        "mobile_compatibility": qa_data.get("mobile_compatibility", {})
+    }
+    return slices
+
+
+def dna_final_result_to_dict(result: DNAFinalValidationResult) -> Dict[str, Any]:
+    """JSON-serializable form of a final DNA validation result."""
+    data = asdict(result)
+    data["compliance_level"] = result.compliance_level.value
+    return data
+
+
+def dna_final_result_from_dict(data: Dict[str, Any]) -> DNAFinalValidationResult:
+    """Rebuild a final DNA validation result stored by dna_final_result_to_dict."""
+    return DNAFinalValidationResult(**{**data, "compliance_level": DNAComplianceLevel(data["compliance_level"])})
+
+
+@dataclass
+class ReviewPlan:
+    """Which review inputs changed since the previous review of a story."""
+    story_id: str
+    review_round: int
+    fingerprints: Dict[str, str]
+    changed_inputs: Set[str]
+    unchanged_inputs: Set[str]
+    previous: Optional[Dict[str, Any]] = None
+    reused_analyses: List[str] = field(default_factory=list)
+    
+    @property
+    def is_incremental(self) -> bool:
+        """True when a previous review of the story exists."""
+        return self.previous is not None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "story_id": self.story_id,
+            "review_round": self.review_round,
+            "incremental": self.is_incremental,
+            "changed_inputs": sorted(self.changed_inputs),
+            "unchanged_inputs": sorted(self.unchanged_inputs),
+            "reused_analyses": list(self.reused_analyses)
+        }
+
+
+class ReviewHistory:
+    """
+    Per-story review history keyed by input fingerprints.
+    
+    WORKFLOW:
+    1. Fingerprint the review input slices and review rules of a contract
+    2. Plan the review against the story's previous review (if any)
+    3. Reuse analyses whose inputs are unchanged, recompute the others
+    4. Diff the new review against the previous one for the client report
+    5. Record the review as baseline for the next revision cycle
+    """
+    
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize review history.
+        
+        Args:
+            config: Optional configuration dictionary
+        """
+        self.config = config or {}
+        
+        # Optional directory for review records so re-reviews survive process restarts
+        state_dir = self.config.get("review_state_dir")
+        self.state_dir = Path(state_dir) if state_dir else None
+        
+        # story_id -> last recorded review
+        self.story_reviews: Dict[str, Dict[str, Any]] = {}
+        
+        self.logger = logging.getLogger(f"{__name__}.ReviewHistory")
+    
+    def fingerprint_inputs(self, slices: Dict[str, Any], rules: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Content hash of every input slice and of the review rules.
+        
+        Blob references inside lazily loaded contract data hash by their
+        digest, so payloads are not loaded for fingerprinting.
+        
+        Returns:
+            Slice name -> sha256 of the slice's canonical JSON
+        """
+        fingerprints = {name: self._content_hash(content) for name, content in slices.items()}
+        fingerprints[REVIEW_RULES] = self._content_hash(rules)
+        return fingerprints
+    
+    def plan_review(self, story_id: str, slices: Dict[str, Any], rules: Dict[str, Any]) -> ReviewPlan:
+        """
+        Compare input fingerprints with the story's previous review.
+        
+        Args:
+            story_id: Story identifier
+            slices: Review input slices (see review_inputs)
+            rules: Weights and thresholds the review applies
+        
+        Returns:
+            ReviewPlan (non-incremental when the story has no previous review)
+        """
+        fingerprints = self.fingerprint_inputs(slices, rules)
+        previous = self._load_review(story_id)
+        if previous is None:
+            return ReviewPlan(
+                story_id=story_id,
+                review_round=1,
+                fingerprints=fingerprints,
+                changed_inputs=set(fingerprints),
+                unchanged_inputs=set()
+            )
+        
+        previous_fingerprints = previous["fingerprints"]
+        unchanged = {
+            name for name, digest in fingerprints.items()
+            if previous_fingerprints.get(name) == digest
+        }
+        plan = ReviewPlan(
+            story_id=story_id,
+            review_round=previous["review_round"] + 1,
+            fingerprints=fingerprints,
+            changed_inputs=set(fingerprints) - unchanged,
+            unchanged_inputs=unchanged,
+            previous=previous
+        )
+        
+        self.logger.info(
+            f"Review plan for {story_id} round {plan.review_round}: "
+            f"changed inputs {sorted(plan.changed_inputs) or 'none'}"
+        )
+        return plan
+    
+    def reusable_analysis(self, plan: Optional[ReviewPlan], analysis_name: str) -> Optional[Any]:
+        """
+        Previous result of an analysis if none of its inputs changed.
+        
+        The client communication depends on every input and is only reused
+        when nothing changed at all.
+        
+        Args:
+            plan: Current review plan (None for reviews outside a contract)
+            analysis_name: Quality dimension, DNA_FINAL_VALIDATION or CLIENT_COMMUNICATION
+        
+        Returns:
+            Copy of the previous result, or None if it must be recomputed
+        """
+        if plan is None or not plan.is_incremental:
+            return None
+        
+        previous_result = plan.previous.get("analyses", {}).get(analysis_name)
+        if previous_result is None:
+            return None
+        
+        dependencies = ANALYSIS_DEPENDENCIES.get(analysis_name, plan.fingerprints)
+        if plan.changed_inputs.intersection(dependencies):
+            return None
+        
+        plan.reused_analyses.append(analysis_name)
+        self.logger.debug(f"Reusing {analysis_name} for {plan.story_id} - inputs unchanged")
+        result = copy.deepcopy(previous_result)
+        if analysis_name == DNA_FINAL_VALIDATION:
+            return dna_final_result_from_dict(result)
+        return result
+    
+    def review_diff(self, plan: ReviewPlan, quality_analysis: Dict[str, Any],
+                    deployment_readiness: Dict[str, Any], approval_decision: Dict[str, Any],
+                    dna_final_result: Optional[DNAFinalValidationResult] = None) -> Optional[Dict[str, Any]]:
+        """
+        What changed since the story's previous review.
+        
+        Returns:
+            Changed inputs, recomputed and reused analyses, score and issue
+            changes per dimension and the approval change; None on a first review
+        """
+        if not plan.is_incremental:
+            return None
+        
+        previous = plan.previous
+        previous_analyses = previous.get("analyses", {})
+        
+        dimension_changes = {}
+        for dimension in DIMENSION_INPUTS:
+            before = previous_analyses.get(dimension) or {}
+            after = quality_analysis.get(dimension) or {}
+            before_issues, after_issues = before.get("issues", []), after.get("issues", [])
+            if before.get("score") == after.get("score") and before_issues == after_issues:
+                continue
+            dimension_changes[dimension] = {
+                "previous_score": before.get("score"),
+                "score": after.get("score"),
+                "resolved_issues": [issue for issue in before_issues if issue not in after_issues],
+                "new_issues": [issue for issue in after_issues if issue not in before_issues]
+            }
+        
+        previous_score = previous.get("overall_score")
+        overall_score = quality_analysis.get("overall_score")
+        previous_blocking = previous.get("blocking_issues", [])
+        blocking = deployment_readiness.get("blocking_issues", [])
+        diff = {
+            "review_round": plan.review_round,
+            "previous_review_round": previous["review_round"],
+            "previous_reviewed_at": previous.get("recorded_at"),
+            "changed_inputs": sorted(plan.changed_inputs),
+            "reused_analyses": list(plan.reused_analyses),
+            "recomputed_analyses": [
+                name for name in (*ANALYSIS_DEPENDENCIES, CLIENT_COMMUNICATION) if name not in plan.reused_analyses
+            ],
+            "dimension_changes": dimension_changes,
+            "overall_score": {
+                "previous": previous_score,
+                "current": overall_score,
+                "change": round(overall_score - previous_score, 1)
+                if isinstance(overall_score, (int, float)) and isinstance(previous_score, (int, float)) else None
+            },
+            "approved": {"previous": previous.get("approved"), "current": approval_decision.get("approved")},
+            "resolved_blocking_issues": [issue for issue in previous_blocking if issue not in blocking],
+            "new_blocking_issues": [issue for issue in blocking if issue not in previous_blocking]
+        }
+        if dna_final_result is not None:
+            previous_dna = previous_analyses.get(DNA_FINAL_VALIDATION) or {}
+            diff["dna_compliance_score"] = {
+                "previous": previous_dna.get("dna_compliance_score"),
+                "current": dna_final_result.dna_compliance_score
+            }
+        return diff
+    
+    def record_review(self, plan: ReviewPlan, quality_analysis: Dict[str, Any],
+                      deployment_readiness: Dict[str, Any], approval_decision: Dict[str, Any],
+                      dna_final_result: Optional[DNAFinalValidationResult] = None,
+                      client_communication: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Record a completed review as baseline for the story's next revision cycle.
+        
+        Returns:
+            Review plan summary for the output contract
+        """
+        analyses = {
+            dimension: quality_analysis[dimension]
+            for dimension in DIMENSION_INPUTS if isinstance(quality_analysis.get(dimension), dict)
+        }
+        if isinstance(dna_final_result, DNAFinalValidationResult):
+            analyses[DNA_FINAL_VALIDATION] = dna_final_result_to_dict(dna_final_result)
+        if isinstance(client_communication, dict):
+            analyses[CLIENT_COMMUNICATION] = client_communication
+        
+        record = {
+            "story_id": plan.story_id,
+            "review_round": plan.review_round,
+            "recorded_at": datetime.now().isoformat(),
+            "fingerprints": dict(plan.fingerprints),
+            "analyses": analyses,
+            "overall_score": quality_analysis.get("overall_score"),
+            "approved": approval_decision.get("approved"),
+            "blocking_issues": deployment_readiness.get("blocking_issues", [])
+        }
+        self._store_review(plan.story_id, record)
+        return plan.to_dict()
+    
+    def _content_hash(self, data: Any) -> str:
+        canonical = json.dumps(data, sort_keys=True, default=str, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    
+    def _load_review(self, story_id: str) -> Optional[Dict[str, Any]]:
+        if story_id in self.story_reviews:
+            return self.story_reviews[story_id]
+        
+        if self.state_dir is not None:
+            state_file = self.state_dir / f"{story_id}.json"
+            if state_file.exists():
+                try:
+                    with open(state_file, "r", encoding="utf-8") as f:
+                        self.story_reviews[story_id] = json.load(f)
+                    return self.story_reviews[story_id]
+                except (OSError, ValueError) as e:
+                    self.logger.warning(f"Ignoring unreadable review state for {story_id}: {e}")
+        return None
+    
+    def _store_review(self, story_id: str, record: Dict[str, Any]) -> None:
+        # JSON round trip decouples the record from dicts handed to the contract
+        record = json.loads(json.dumps(record, default=str))
+        self.story_reviews[story_id] = record
+        
+        if self.state_dir is not None:
+            self.state_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.state_dir / f"{story_id}.json", "w", encoding="utf-8") as f:
+                json.dump(record, f)
@@ -30,15 +30,9 @@ from pathlib import Path
 # Import our foundation
 from ...shared.base_agent import BaseAgent, AgentExecutionResult
 from ...shared.exceptions import AgentExecutionError, DNAComplianceError, QualityGateError
-from ...shared.event_bus import EventBus
+from ...shared.lazy_tools import LazyTool
 
 # Import specialized tools
-from .tools.test_generator import TestGenerator
-from .tools.coverage_analyzer import CoverageAnalyzer
-from .tools.performance_tester import PerformanceTester
-from .tools.security_scanner import SecurityScanner
-from .tools.dna_test_validator import DNATestValidator
-from .tools.ai_test_optimizer import AITestOptimizer
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -65,6 +59,20 @@ class TestEngineerAgent(BaseAgent):
     - Automated test pipeline configured
     """
     
+    # EventBus for team coordination
+    event_bus = LazyTool("modules.shared.event_bus.EventBus")
+    
+    # Specialized tools - imported and constructed on first use, shared per process
+    test_generator = LazyTool(".tools.test_generator.TestGenerator")
+    coverage_analyzer = LazyTool(".tools.coverage_analyzer.CoverageAnalyzer")
+    performance_tester = LazyTool(".tools.performance_tester.PerformanceTester")
+    security_scanner = LazyTool(".tools.security_scanner.SecurityScanner")
+    dna_test_validator = LazyTool(".tools.dna_test_validator.DNATestValidator")
+    ai_test_optimizer = LazyTool(".tools.ai_test_optimizer.AITestOptimizer")
+    test_shard_planner = LazyTool(".tools.test_shard_planner.TestShardPlanner")
+    # Holds per-story run history, so each agent keeps its own
+    test_impact_analyzer = LazyTool(".tools.test_impact_analyzer.TestImpactAnalyzer", shared=False)
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize the Test Engineer agent.
@@ -74,19 +82,9 @@ class TestEngineerAgent(BaseAgent):
         """
         super().__init__("te-001", "test_engineer", config)
         
-        # Initialize EventBus for team coordination
-        self.event_bus = EventBus(config)
-        
-        # Initialize specialized tools
-        self.test_generator = TestGenerator(config)
-        self.coverage_analyzer = CoverageAnalyzer(config)
-        self.performance_tester = PerformanceTester(config)
-        self.security_scanner = SecurityScanner(config)
-        self.dna_test_validator = DNATestValidator(config)
-        self.ai_test_optimizer = AITestOptimizer(config)
-        
         # Test Engineer specific configuration
         self.test_output_path = self.config.get("test_output_path", "tests")
+        self.test_reports_path = self.config.get("test_reports_path", "docs/test_reports")
         self.coverage_threshold = self.config.get("coverage_threshold", 95)
         self.performance_budget = self.config.get("performance_budget", {
             "api_response_time_ms": 200,
@@ -145,6 +143,10 @@ class TestEngineerAgent(BaseAgent):
         7. Analyze test coverage and generate reports
         8. Generate output contract for QA Tester
         
+        On a rerun of the same story only tests exercising changed components,
+        endpoints or flows are regenerated; unchanged tests and analyses are
+        carried over with provenance.
+        
         Args:
             input_contract: Contract from Developer with implementation details
             
@@ -162,8 +164,8 @@ class TestEngineerAgent(BaseAgent):
             # Notify team of testing start
             await self._notify_team_progress("testing_started", {"story_id": story_id})
             
-            # Step 1: Extract and validate implementation data
-            input_data = input_contract.get("input_requirements", {}).get("required_data", {})
+            # Step 1: Extract and validate implementation data (source code loads from blobs on access)
+            input_data = self.blob_store.lazy(input_contract.get("input_requirements", {}).get("required_data", {}))
             
             component_implementations = input_data.get("component_implementations", [])
             api_implementations = input_data.get("api_implementations", [])
@@ -171,8 +173,21 @@ class TestEngineerAgent(BaseAgent):
             implementation_docs = input_data.get("implementation_docs", {})
             git_commit_hash = input_data.get("git_commit_hash", "")
             
+            user_flows = implementation_docs.get("user_flows", [])
+            
             self.logger.debug(f"Processing {len(component_implementations)} components and {len(api_implementations)} APIs")
             
+            # Test impact analysis: which units changed since the story's previous run
+            impact_plan = self.test_impact_analyzer.plan_rerun(
+                story_id,
+                self.test_impact_analyzer.fingerprint_units(
+                    component_implementations, api_implementations, user_flows
+                )
+            )
+            impacted = self.test_impact_analyzer.select_impacted(
+                impact_plan, component_implementations, api_implementations, user_flows
+            )
+            
             # Step 2: Validate implementation testability
             await self._validate_implementation_testability(
                 component_implementations, api_implementations
@@ -194,39 +209,66 @@ class TestEngineerAgent(BaseAgent):
             
             # Step 3: Generate integration tests
             self.logger.info("Generating integration tests")
-            integration_test_suite = await self.test_generator.generate_integration_tests(
-                component_implementations,
-                api_implementations,
-                story_id
-            )
+            if impact_plan.is_incremental:
+                integration_test_suite = await self.test_generator.generate_integration_tests(
+                    impacted["component_implementations"],
+                    impacted["api_implementations"],
+                    story_id,
+                    carried_over=self.test_impact_analyzer.carry_over(impact_plan, "integration")
+                )
+            else:
+                integration_test_suite = await self.test_generator.generate_integration_tests(
+                    component_implementations,
+                    api_implementations,
+                    story_id
+                )
+            self.test_impact_analyzer.annotate_suite(impact_plan, "integration", integration_test_suite)
             await self._notify_team_progress("integration_tests_generated", {"story_id": story_id})
             
             # Step 4: Generate end-to-end tests
             self.logger.info("Generating end-to-end tests")
-            e2e_test_suite = await self.test_generator.generate_e2e_tests(
-                component_implementations,
-                api_implementations,
-                implementation_docs.get("user_flows", []),
-                story_id
-            )
+            if impact_plan.is_incremental:
+                e2e_test_suite = await self.test_generator.generate_e2e_tests(
+                    impacted["component_implementations"],
+                    impacted["api_implementations"],
+                    impacted["user_flows"],
+                    story_id,
+                    carried_over=self.test_impact_analyzer.carry_over(impact_plan, "e2e")
+                )
+            else:
+                e2e_test_suite = await self.test_generator.generate_e2e_tests(
+                    component_implementations,
+                    api_implementations,
+                    user_flows,
+                    story_id
+                )
+            self.test_impact_analyzer.annotate_suite(impact_plan, "e2e", e2e_test_suite)
             await self._notify_team_progress("e2e_tests_generated", {"story_id": story_id})
             
             # Step 5: Execute performance testing
             self.logger.info("Running performance tests")
-            performance_results = await self.performance_tester.run_comprehensive_performance_tests(
-                api_implementations,
-                component_implementations,
-                story_id
+            performance_results = self.test_impact_analyzer.reusable_analysis(
+                impact_plan, "performance_results"
             )
+            if performance_results is None:
+                performance_results = await self.performance_tester.run_comprehensive_performance_tests(
+                    api_implementations,
+                    component_implementations,
+                    story_id
+                )
             await self._notify_team_progress("performance_tests_complete", {"story_id": story_id})
             
             # Step 6: Execute security scanning
             self.logger.info("Running security vulnerability scan")
-            security_scan_results = await self.security_scanner.run_comprehensive_security_scan(
-                api_implementations,
-                component_implementations,
-                story_id
+            security_scan_results = self.test_impact_analyzer.reusable_analysis(
+                impact_plan, "security_scan_results"
             )
+            if security_scan_results is None:
+                security_scan_results = await self.security_scanner.run_comprehensive_security_scan(
+                    api_implementations,
+                    component_implementations,
+                    story_id
+                )
             await self._notify_team_progress("security_scan_complete", {"story_id": story_id})
             
             # Step 7: Analyze test coverage
@@ -265,12 +307,47 @@ class TestEngineerAgent(BaseAgent):
                 "dna_score": dna_validation_result.dna_compliance_score
             })
             
-            # Step 10: Generate test automation configuration
+            # Step 10: Plan duration-balanced CI shards and automation configuration
+            ingested_run_id = await self._ingest_previous_test_run(story_id)
+            planned_tests = self.test_shard_planner.plan_tests(
+                story_id,
+                integration_test_suite,
+                e2e_test_suite,
+                existing_test_suite,
+                ai_optimization_result.test_priorities
+            )
+            execution_rank = None
+            test_prioritization = {"mode": self.ai_test_optimizer.prioritization_mode}
+            if ingested_run_id:
+                test_prioritization["ingested_run_id"] = ingested_run_id
+            if self.ai_test_optimizer.prioritization_mode == "failure_history":
+                prioritized_tests = await self.ai_test_optimizer.prioritize_by_failure_history(
+                    [test.to_dict() for test in planned_tests]
+                )
+                execution_rank = {test.test_id: rank for rank, test in enumerate(prioritized_tests)}
+                test_prioritization.update({
+                    "expected_seconds_to_first_failure": round(
+                        self.ai_test_optimizer.expected_seconds_to_first_failure(prioritized_tests), 3
+                    ),
+                    "execution_order": [test.test_id for test in prioritized_tests]
+                })
+            shard_plan = self.test_shard_planner.shard_tests(
+                story_id, planned_tests, execution_rank=execution_rank
+            )
             automation_config = await self._generate_automation_configuration(
                 integration_test_suite,
                 e2e_test_suite,
                 performance_results,
-                story_id
+                story_id,
+                shard_plan.to_dict(),
+                test_prioritization
+            )
+            
+            # Record run as baseline for the next rework cycle of this story
+            impact_summary = self.test_impact_analyzer.record_run(
+                impact_plan,
+                {"integration": integration_test_suite, "e2e": e2e_test_suite},
+                {"performance_results": performance_results, "security_scan_results": security_scan_results}
             )
             
             # Step 11: Create output contract for QA Tester
@@ -284,7 +361,8 @@ class TestEngineerAgent(BaseAgent):
                 coverage_report,
                 automation_config,
                 dna_validation_result,
-                ai_optimization_result
+                ai_optimization_result,
+                impact_summary
             )
             
             # Notify team of testing completion
@@ -427,7 +505,9 @@ class TestEngineerAgent(BaseAgent):
         integration_test_suite: Dict[str, Any],
         e2e_test_suite: Dict[str, Any],
         performance_results: Dict[str, Any],
-        story_id: str
+        story_id: str,
+        test_shards: Optional[Dict[str, Any]] = None,
+        test_prioritization: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Generate CI/CD automation configuration for test pipeline.
@@ -437,6 +517,8 @@ class TestEngineerAgent(BaseAgent):
             e2e_test_suite: E2E test configuration
             performance_results: Performance test configuration
             story_id: Story identifier
+            test_shards: Shard plan with per-runner manifests for parallel CI workers
+            test_prioritization: Execution order mode and, for failure history, the order
             
         Returns:
             Automation configuration for CI/CD pipeline
@@ -457,7 +539,9 @@ class TestEngineerAgent(BaseAgent):
                     "e2e": f"npm run test:e2e -- tests/e2e/{story_id}/",
                     "performance": f"npm run test:performance -- {story_id}",
                     "security": f"npm run security:scan -- {story_id}"
-                }
+                },
+                "test_shards": test_shards or {},
+                "test_prioritization": test_prioritization or {"mode": "risk"}
             },
             "quality_gates": {
                 "coverage_threshold": self.coverage_threshold,
@@ -470,10 +554,46 @@ class TestEngineerAgent(BaseAgent):
             "reporting": {
                 "coverage_report": f"docs/test_reports/{story_id}_coverage.html",
                 "performance_report": f"docs/performance/{story_id}_benchmarks.json",
-                "security_report": f"docs/security/{story_id}_vulnerabilities.json"
+                "security_report": f"docs/security/{story_id}_vulnerabilities.json",
+                # JUnit results feed shard durations and failure history of the next plan
+                "duration_report": self._duration_report_path(story_id)
             }
         }
     
+    def _duration_report_path(self, story_id: str) -> str:
+        """JUnit XML report the CI pipeline writes for the story's test run."""
+        return f"{self.test_reports_path}/{story_id}_junit.xml"
+    
+    async def _ingest_previous_test_run(self, story_id: str) -> Optional[str]:
+        """
+        Feed the story's last CI JUnit report into shard durations and failure history.
+        
+        The run is identified by the report's modification time, so an
+        unchanged report is ingested only once.
+        
+        Args:
+            story_id: Story identifier
+            
+        Returns:
+            Run ID of the newly ingested report, None if there is nothing new
+        """
+        report_path = Path(self._duration_report_path(story_id))
+        if not report_path.is_file():
+            return None
+        
+        run_id = f"{story_id}-{report_path.stat().st_mtime_ns}"
+        try:
+            recorded = await self.ai_test_optimizer.ingest_test_report(str(report_path), run_id, story_id)
+            if not recorded:
+                return None
+            self.test_shard_planner.ingest_junit_report(str(report_path))
+        except Exception as e:
+            self.logger.warning(f"Failed to ingest test report {report_path}: {e}")
+            return None
+        
+        self.logger.info(f"Ingested {recorded} test outcomes from {report_path}")
+        return run_id
+    
     async def _create_output_contract(
         self,
         input_contract: Dict[str, Any],
@@ -485,7 +605,8 @@ class TestEngineerAgent(BaseAgent):
         coverage_report: Dict[str, Any],
         automation_config: Dict[str, Any],
         dna_validation_result: Any = None,
-        ai_optimization_result: Any = None
+        ai_optimization_result: Any = None,
+        impact_summary: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Create output contract for QA Tester.
@@ -499,6 +620,7 @@ class TestEngineerAgent(BaseAgent):
             security_scan_results: Security scan results
             coverage_report: Coverage analysis results
             automation_config: CI/CD automation configuration
+            impact_summary: Test impact analysis summary of this run
             
         Returns:
             Output contract for QA Tester
@@ -550,6 +672,7 @@ class TestEngineerAgent(BaseAgent):
                         "edge_case_predictions": len(ai_optimization_result.edge_case_predictions) if ai_optimization_result else 0,
                         "municipal_insights": ai_optimization_result.municipal_optimization_insights if ai_optimization_result else {}
                     },
+                    "test_impact_analysis": impact_summary or {},
                     "original_implementation": {
                         "component_implementations": input_contract.get("input_requirements", {}).get("required_data", {}).get("component_implementations", []),
                         "api_implementations": input_contract.get("input_requirements", {}).get("required_data", {}).get("api_implementations", [])
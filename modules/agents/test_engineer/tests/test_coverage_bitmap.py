@@ -0,0 +1,159 @@
+"""
+Tests for CoverageBitmap and measured coverage in CoverageAnalyzer.
+
+Tests streaming coverage.py JSON and lcov ingestion, exact union and
+intersection across test layers, unique-coverage attribution and bounded
+memory on multi-megabyte reports.
+"""
+
+import json
+import tracemalloc
+
+import pytest
+
+from modules.agents.test_engineer.tools.coverage_analyzer import CoverageAnalyzer
+from modules.agents.test_engineer.tools.coverage_bitmap import (
+    CoverageBitmap,
+    attribute_layer_coverage,
+    bits_from_lines,
+    iter_coverage_json_files,
+    lines_from_bits
+)
+
+
+def _write_coverage_json(path, files):
+    report = {
+        "meta": {"version": "7.4.0", "branch_coverage": False},
+        "files": {
+            name: {
+                "executed_lines": executed,
+                "missing_lines": missing,
+                "excluded_lines": [],
+                "summary": {"covered_lines": len(executed), "num_statements": len(executed) + len(missing)}
+            }
+            for name, (executed, missing) in files.items()
+        },
+        "totals": {"covered_lines": 0}
+    }
+    path.write_text(json.dumps(report, indent=2))
+    return path
+
+
+def _write_lcov(path, files):
+    lines = []
+    for name, hits in files.items():
+        lines.append("TN:")
+        lines.append(f"SF:{name}")
+        lines.extend(f"DA:{number},{count}" for number, count in hits.items())
+        lines.append("end_of_record")
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+class TestCoverageBitmap:
+    """Test suite for bitset coverage ingestion and layer algebra."""
+    
+    def test_bitset_round_trip(self):
+        """Test line numbers survive conversion to and from bitsets."""
+        lines = [1, 2, 7, 8, 9, 64, 1000]
+        assert lines_from_bits(bits_from_lines(lines)) == lines
+        assert bits_from_lines([]) == 0
+    
+    def test_streaming_json_matches_full_parse(self, tmp_path):
+        """Test tiny read chunks yield the same file records as json.load."""
+        report = _write_coverage_json(tmp_path / "coverage.json", {
+            "app/quiz.py": ([1, 2, 3, 10], [4, 5]),
+            "app/results.py": ([1], []),
+            "app/empty.py": ([], [])
+        })
+        
+        streamed = dict(iter_coverage_json_files(report, chunk_size=7))
+        
+        assert streamed == json.loads(report.read_text())["files"]
+    
+    def test_lcov_and_json_layers_combine_exactly(self, tmp_path):
+        """Test union, intersection and unique attribution across report formats."""
+        unit = CoverageBitmap("unit")
+        unit.ingest_report(_write_coverage_json(tmp_path / "unit.json", {
+            "src/quiz.py": ([1, 2, 3], [4, 5, 6])
+        }))
+        e2e = CoverageBitmap("e2e")
+        e2e.ingest_report(_write_lcov(tmp_path / "lcov.info", {
+            "./src/quiz.py": {1: 0, 3: 4, 4: 1, 5: 2, 6: 0},
+            "src/results.py": {1: 1, 2: 0}
+        }))
+        
+        union = unit.union(e2e)
+        assert union.covered_lines_of("src/quiz.py") == [1, 2, 3, 4, 5]
+        assert union.executable_lines == 8
+        assert union.covered_lines == 6
+        assert unit.intersection(e2e).covered_lines_of("src/quiz.py") == [3]
+        
+        attribution = attribute_layer_coverage({"unit": unit, "e2e": e2e})
+        assert attribution["union"]["coverage_percentage"] == 75.0
+        assert attribution["intersection"]["covered_lines"] == 1
+        assert attribution["unique_coverage_by_layer"]["unit"]["unique_covered_lines"] == 2
+        assert attribution["unique_coverage_by_layer"]["e2e"]["unique_covered_lines"] == 3
+    
+    def test_large_report_streams_in_bounded_memory(self, tmp_path):
+        """Test multi-megabyte report is ingested without holding it in memory."""
+        files = {
+            f"src/module_{index}.py": (list(range(1, 401, 2)), list(range(2, 401, 2)))
+            for index in range(1500)
+        }
+        report = _write_coverage_json(tmp_path / "coverage.json", files)
+        size = report.stat().st_size
+        assert size > 2_000_000
+        
+        bitmap = CoverageBitmap("unit")
+        tracemalloc.start()
+        records = bitmap.ingest_coverage_json(report)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        
+        assert records == 1500
+        assert bitmap.coverage_percentage() == 50.0
+        assert peak < size / 4
+    
+    @pytest.mark.asyncio
+    async def test_analyzer_uses_union_of_measured_layers(self, tmp_path):
+        """Test overall coverage is the true union instead of a weighted blend."""
+        unit_report = _write_coverage_json(tmp_path / "coverage.json", {
+            "src/quiz.py": (list(range(1, 20)), [20])
+        })
+        e2e_report = _write_lcov(tmp_path / "lcov.info", {
+            "src/quiz.py": {line: 0 if line == 1 else 2 for line in range(1, 21)}
+        })
+        analyzer = CoverageAnalyzer({"coverage_reports": {"e2e": [str(e2e_report)]}})
+        
+        report = await analyzer.analyze_comprehensive_coverage(
+            {"coverage_reports": [str(unit_report)]},
+            {"coverage_reports": [str(tmp_path / "missing.json")]},
+            {},
+            [{"name": "Quiz"}],
+            [],
+            "STORY-COV-001"
+        )
+        
+        overall = report["overall_coverage_metrics"]
+        assert overall["overall_method"] == "union_of_measured_layers"
+        assert report["overall_coverage_percent"] == 100.0
+        assert overall["layer_attribution"]["layers_measured"] == ["unit", "e2e"]
+        assert report["unit_test_coverage"]["coverage_percentage"] == 95.0
+        assert overall["layer_attribution"]["intersection"]["covered_lines"] == 18
+        assert report["unit_test_coverage"]["measured"] is True
+        assert report["integration_test_coverage"]["measured"] is False
+    
+    @pytest.mark.asyncio
+    async def test_measured_coverage_below_gate_fails(self, tmp_path):
+        """Test measured layer coverage is enforced by the quality gates."""
+        unit_report = _write_coverage_json(tmp_path / "coverage.json", {
+            "src/quiz.py": ([1, 2, 3], [4, 5, 6, 7, 8, 9, 10])
+        })
+        analyzer = CoverageAnalyzer()
+        
+        with pytest.raises(ValueError, match="unit_coverage_gate"):
+            await analyzer.analyze_comprehensive_coverage(
+                {"coverage_reports": [{"path": str(unit_report), "format": "coverage_json"}]},
+                {}, {}, [], [], "STORY-COV-002"
+            )
@@ -0,0 +1,163 @@
+"""
+Tests for SecurityCodeAnalyzer and its use by SecurityScanner.
+
+Tests taint flows from FastAPI parameters to SQL, command and file sinks,
+sanitizer and dependency handling, JSX raw-HTML sinks, content-hash
+caching across rework, process-pool scanning and the security quality gate.
+"""
+
+import pytest
+
+from modules.agents.test_engineer.tools.security_analyzer import (
+    SecurityCodeAnalyzer,
+    scan_source
+)
+from modules.agents.test_engineer.tools.security_scanner import SecurityScanner
+
+
+VULNERABLE_ENDPOINT = '''
+import subprocess
+from pathlib import Path
+from fastapi import APIRouter, Depends
+
+router = APIRouter()
+
+@router.get("/reports/{name}")
+async def get_report(name: str, db = Depends(get_db)):
+    query = "SELECT * FROM reports WHERE name = '" + name + "'"
+    rows = db.execute(query)
+    subprocess.run(f"render {name}", shell=True)
+    report_path = Path("/srv/reports") / name
+    return report_path.read_text()
+'''
+
+SAFE_ENDPOINT = '''
+import shlex
+from fastapi import APIRouter, Depends
+
+router = APIRouter()
+
+@router.get("/reports/{report_id}")
+async def get_report(report_id: int, name: str, db = Depends(get_db)):
+    db.execute("SELECT * FROM reports WHERE id = ? AND name = ?", (report_id, name))
+    page = int(name)
+    db.execute(f"SELECT * FROM reports LIMIT {page}")
+    return helper(shlex.quote(name))
+
+def helper(value):
+    return eval(value)
+'''
+
+
+def _api(name, endpoint_code):
+    return {
+        "name": name,
+        "files": {"endpoint": f"endpoints/STORY-SEC-001/{name}.py"},
+        "code": {"endpoint": endpoint_code, "models": "", "tests": "eval(payload)"}
+    }
+
+
+def test_taint_reaches_sql_command_and_path_sinks():
+    """Test request parameter flows into SQL, shell and file path sinks."""
+    findings = scan_source("python", VULNERABLE_ENDPOINT)["findings"]
+    
+    rules = {(finding["rule"], finding["severity"]) for finding in findings}
+    assert ("sql_injection", "critical") in rules
+    assert ("command_injection", "critical") in rules
+    assert ("path_traversal", "high") in rules
+    assert all(finding["function"] == "get_report" for finding in findings)
+    sql = next(finding for finding in findings if finding["rule"] == "sql_injection")
+    assert sql["tainted_sources"] == ["name"]
+    assert sql["line"] == 11
+
+
+def test_parameterized_sanitized_and_non_handler_code_is_clean():
+    """Test bound parameters, sanitizers, Depends() and non-route helpers raise no findings."""
+    result = scan_source("python", SAFE_ENDPOINT)
+    
+    assert result["parse_error"] is None
+    assert result["findings"] == []
+    assert scan_source("python", "def broken(:\n")["parse_error"].startswith("line 1")
+
+
+def test_jsx_raw_html_sinks():
+    """Test dangerouslySetInnerHTML and DOM sinks, ignoring sanitized values, strings and comments."""
+    component = '''
+export const Card = ({ body, title }) => {
+  // ref.current.innerHTML = body
+  const hint = "eval(x)";
+  return (
+    <div>
+      <h2 dangerouslySetInnerHTML={{ __html: DOMPurify.sanitize(title) }} />
+      <p dangerouslySetInnerHTML={{ __html: "<b>static</b>" }} />
+      <section dangerouslySetInnerHTML={{ __html: body }} />
+    </div>
+  );
+};
+'''
+    findings = scan_source("jsx", component)["findings"]
+    
+    assert [(finding["rule"], finding["line"]) for finding in findings] == [
+        ("xss_dangerously_set_inner_html", 9)
+    ]
+    assert scan_source("jsx", "el.innerHTML = html;\nif (el.innerHTML == x) {}")["findings"][0]["line"] == 1
+
+
+@pytest.mark.asyncio
+async def test_unchanged_files_are_served_from_cache_on_rework(tmp_path):
+    """Test rework only scans changed files and the disk cache survives a new analyzer."""
+    config = {"security_scan_cache_dir": str(tmp_path / "cache")}
+    analyzer = SecurityCodeAnalyzer(config)
+    files = [(f"endpoint_{i}.py", "python", SAFE_ENDPOINT + f"\n# {i}\n") for i in range(5)]
+    
+    first = await analyzer.scan_sources(files)
+    files[2] = ("endpoint_2.py", "python", VULNERABLE_ENDPOINT)
+    rework = await analyzer.scan_sources(files)
+    
+    assert first["statistics"]["files_scanned"] == 5
+    assert rework["statistics"]["files_scanned"] == 1
+    assert rework["statistics"]["cache_hits"] == 4
+    assert rework["files"]["endpoint_2.py"]["findings"][0]["file"] == "endpoint_2.py"
+    
+    fresh = await SecurityCodeAnalyzer(config).scan_sources(files)
+    assert fresh["statistics"]["cache_hits"] == 5
+
+
+@pytest.mark.asyncio
+async def test_large_batches_scan_on_process_pool():
+    """Test batches above the threshold use worker processes with identical results."""
+    analyzer = SecurityCodeAnalyzer({"security_scan_parallel_threshold": 4, "security_scan_workers": 2})
+    files = [(f"endpoint_{i}.py", "python", VULNERABLE_ENDPOINT + f"\n# {i}\n") for i in range(8)]
+    
+    try:
+        result = await analyzer.scan_sources(files)
+    finally:
+        analyzer.close()
+    
+    expected = scan_source("python", VULNERABLE_ENDPOINT)["findings"]
+    assert result["statistics"]["files_scanned"] == 8
+    for label, _, _ in files:
+        assert len(result["files"][label]["findings"]) == len(expected)
+
+
+@pytest.mark.asyncio
+async def test_security_scanner_gate_fails_on_tainted_endpoint():
+    """Test SecurityScanner counts real findings and blocks vulnerable endpoints."""
+    scanner = SecurityScanner()
+    
+    clean = await scanner.run_comprehensive_security_scan([_api("reports", SAFE_ENDPOINT)], [], "STORY-SEC-001")
+    assert clean["security_compliance_met"] is True
+    assert clean["code_analysis"]["files_analyzed"] == 1
+    
+    with pytest.raises(ValueError, match="critical vulnerabilities"):
+        await scanner.run_comprehensive_security_scan(
+            [_api("reports", VULNERABLE_ENDPOINT)], [], "STORY-SEC-001"
+        )
+    
+    api_results = await scanner._scan_api_security([_api("reports", VULNERABLE_ENDPOINT)], "STORY-SEC-001")
+    summary = await scanner._aggregate_vulnerability_summary(api_results)
+    compliance = await scanner._assess_security_compliance(api_results)
+    assert len(summary["critical"]) == 2
+    assert len(summary["high"]) == 1
+    assert compliance["overall_compliance"] is False
+    assert compliance["vulnerabilities_summary"]["total"] == 3
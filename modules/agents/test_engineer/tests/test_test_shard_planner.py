@@ -0,0 +1,164 @@
+"""
+Tests for Test Shard Planner.
+
+Tests longest-processing-time-first balancing, duration sources (history,
+AITestOptimizer complexity, section defaults), JUnit ingestion and the
+per-runner manifests in the Test Engineer automation configuration.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from modules.agents.test_engineer.agent import TestEngineerAgent
+from modules.agents.test_engineer.tools.test_shard_planner import TestShardPlanner
+
+
+STORY_ID = "STORY-SHARD-001"
+
+
+def _integration_suite(component_tests, api_tests=()):
+    return {
+        "component_tests": {"test_cases": [
+            {"test_name": name, "exercises": ["component:Quiz"]} for name in component_tests
+        ]},
+        "api_tests": {"test_cases": [
+            {"test_name": name, "exercises": ["api:score"]} for name in api_tests
+        ]},
+        "contract_validation_tests": {"test_cases": []}
+    }
+
+
+def _e2e_suite(persona, performance):
+    return {
+        "persona_tests": {"scenarios": [{"scenario_name": name, "exercises": ["*"]} for name in persona]},
+        "accessibility_tests": {"scenarios": []},
+        "pedagogical_tests": {"scenarios": []},
+        "performance_tests": {"scenarios": [{"scenario_name": name, "exercises": ["*"]} for name in performance]}
+    }
+
+
+class TestTestShardPlanner:
+    """Test suite for duration-aware shard planning."""
+    
+    def test_lpt_balances_heavy_scenarios_across_shards(self):
+        """Test slow e2e scenarios are spread so the heaviest shard stays near the mean."""
+        planner = TestShardPlanner({"test_shard_count": 3})
+        plan = planner.plan_shards(
+            STORY_ID,
+            _integration_suite([f"Quiz_case_{i}" for i in range(12)]),
+            _e2e_suite(["anna_a", "anna_b", "anna_c"], ["lighthouse", "load"])
+        )
+        
+        loads = sorted(shard.expected_seconds for shard in plan.shards)
+        assert sum(len(shard.tests) for shard in plan.shards) == 17
+        # Five scenarios of 45s+ on three shards: 135s is the best achievable makespan
+        assert loads == [102.0, 102.0, 135.0]
+        heavy_shards = {
+            shard.index for shard in plan.shards
+            for test in shard.tests if test.test_name in ("lighthouse", "load")
+        }
+        assert len(heavy_shards) == 2
+    
+    def test_history_overrides_estimates_and_smooths(self, tmp_path):
+        """Test recorded durations persist, win over defaults and are averaged."""
+        config = {"test_duration_history_path": str(tmp_path / "durations.json"), "duration_smoothing": 0.5}
+        TestShardPlanner(config).record_durations({"test_Quiz_props": 10.0})
+        
+        planner = TestShardPlanner(config)
+        planner.record_durations({"Quiz_props": 20.0})
+        plan = planner.plan_shards(STORY_ID, _integration_suite(["Quiz_props", "Quiz_render"]), shard_count=1)
+        
+        tests = {test.test_name: test for test in plan.shards[0].tests}
+        assert tests["Quiz_props"].expected_seconds == 15.0
+        assert tests["Quiz_props"].duration_source == "history"
+        assert tests["Quiz_render"].duration_source == "section_default"
+    
+    def test_complexity_estimate_fallback(self):
+        """Test AITestOptimizer execution time estimates scale unseen tests."""
+        planner = TestShardPlanner()
+        plan = planner.plan_shards(
+            STORY_ID,
+            _integration_suite(["Quiz_render"], ["score_response"]),
+            test_priorities=[{"test_case_id": "component_Quiz", "estimated_execution_time_minutes": 12.0}],
+            shard_count=1
+        )
+        
+        tests = {test.test_name: test for test in plan.shards[0].tests}
+        assert tests["Quiz_render"].expected_seconds == 6.0
+        assert tests["Quiz_render"].duration_source == "complexity_estimate"
+        assert tests["score_response"].expected_seconds == 1.5
+    
+    def test_junit_report_ingestion(self, tmp_path):
+        """Test JUnit XML durations are recorded under generator test names."""
+        report = tmp_path / "junit.xml"
+        report.write_text(
+            '<testsuites><testsuite name="api">'
+            '<testcase classname="api" name="test_score_response" time="3.25"/>'
+            '<testcase classname="api" name="anna_flow_happy_path" time="61.0"/>'
+            '</testsuite></testsuites>'
+        )
+        planner = TestShardPlanner()
+        
+        assert planner.ingest_junit_report(str(report)) == 2
+        assert planner.duration_history["score_response"]["seconds"] == 3.25
+        assert planner.duration_history["anna_flow_happy_path"]["seconds"] == 61.0
+    
+    def test_manifests_per_runner(self):
+        """Test shard manifests select tests for pytest-xdist, jest and playwright."""
+        planner = TestShardPlanner({"xdist_workers": 4})
+        plan = planner.plan_shards(
+            STORY_ID,
+            _integration_suite(["Quiz_render"], ["score_response"]),
+            _e2e_suite(["anna_quiz_happy_path"], []),
+            shard_count=1
+        )
+        
+        manifests = plan.to_dict()["shards"][0]["manifests"]
+        assert manifests["pytest"]["node_ids"] == [f"tests/integration/{STORY_ID}/api.test.py::test_score_response"]
+        assert manifests["pytest"]["command"][:7] == ["python", "-m", "pytest", "-p", "xdist", "-n", "4"]
+        assert manifests["jest"]["files"] == [f"tests/integration/{STORY_ID}/components.test.tsx"]
+        assert manifests["jest"]["test_name_pattern"] == "^(Quiz_render)$"
+        assert manifests["playwright"]["grep"] == "^(anna_quiz_happy_path)$"
+    
+    @pytest.mark.asyncio
+    async def test_agent_publishes_shard_plan(self):
+        """Test Test Engineer output carries shard plan covering every generated test."""
+        agent = TestEngineerAgent()
+        contract = {
+            "story_id": STORY_ID,
+            "dna_compliance": {},
+            "input_requirements": {"required_data": {
+                "component_implementations": [{
+                    "name": "Quiz", "typescript_errors": 0, "eslint_violations": 0,
+                    "integration_test_passed": True, "code": {"component": "export const Quiz = () => null"}
+                }],
+                "api_implementations": [{
+                    "name": "score", "method": "GET", "path": "/score", "functional_test_passed": True,
+                    "performance_test_passed": True, "estimated_response_time_ms": 50,
+                    "code": {"endpoint": "def score(): pass"}
+                }],
+                "test_suite": {},
+                "implementation_docs": {"user_flows": [{"name": "quiz_flow", "components": ["Quiz"]}]},
+                "git_commit_hash": "abc123"
+            }}
+        }
+        
+        pinned_coverage = {
+            "story_id": STORY_ID,
+            "overall_coverage_percent": 97.0,
+            "integration_coverage_percent": 96.0,
+            "e2e_coverage_percent": 95.0,
+            "coverage_quality_met": True
+        }
+        
+        # Simulated coverage derives from hash(story_id); pin it so the gate is seed-independent
+        with patch.object(agent.coverage_analyzer, "analyze_comprehensive_coverage",
+                          new_callable=AsyncMock, return_value=pinned_coverage):
+            result = await agent.process_contract(contract)
+        
+        data = result["input_requirements"]["required_data"]
+        shards = data["automation_config"]["ci_cd_pipeline"]["test_shards"]
+        generated = data["integration_test_suite"]["total_test_cases"] + data["e2e_test_suite"]["total_test_scenarios"]
+        assert shards["shard_count"] == 4
+        assert shards["total_tests"] == generated
+        assert shards["duration_sources"]["complexity_estimate"] > 0
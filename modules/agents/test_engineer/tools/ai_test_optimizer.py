@@ -10,6 +10,7 @@ CRITICAL FUNCTIONALITY:
 - Risk-based test prioritization with ML algorithms  
 - Edge case prediction from historical data
 - Test maintenance prediction and optimization
+- Failure-history prioritization from recorded test outcomes
 - Swedish municipal context optimization
 
 ADAPTATION GUIDE:
@@ -35,6 +36,8 @@ from enum import Enum
 import random
 import hashlib
 
+from .test_outcome_store import TestOutcomeStore, outcome_key
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
@@ -113,6 +116,17 @@ class TestMaintenancePrediction:
     prevention_recommendations: List[str]
 
 
+@dataclass
+class PrioritizedTest:
+    """Test placed in failure-history execution order."""
+    test_id: str
+    failure_probability: float  # 0-1 scale, after co-failure discount
+    expected_seconds: float
+    priority_score: float  # failure probability per second of runtime
+    probability_source: str  # "history" or "new_test"
+    co_failure_cluster: Optional[str] = None
+
+
 @dataclass
 class AITestOptimizationResult:
     """Complete AI test optimization result."""
@@ -214,6 +228,18 @@ class AITestOptimizer:
             }
         }
         
+        # "risk" ranks by static code-pattern risk only; "failure_history" also
+        # orders test execution by recorded outcomes (see prioritize_by_failure_history)
+        self.prioritization_mode = self.config.get("test_prioritization_mode", "risk")
+        self.history_parameters = {
+            "new_test_failure_prior": 0.5,      # Unseen tests run early
+            "min_failure_probability": 0.01,    # Never-failing tests still ordered by cost
+            "co_failure_discount": 0.25,        # Later members of a co-failure cluster add little
+            "min_cost_seconds": 0.1
+        }
+        self.history_parameters.update(self.config.get("history_prioritization", {}))
+        self.outcome_store = TestOutcomeStore(self.config)
+        
         logger.info("AI Test Optimizer initialized with predictive capabilities")
     
     async def optimize_test_strategy(self,
@@ -287,6 +313,116 @@ class AITestOptimizer:
             logger.error(f"AI test optimization failed: {e}")
             raise
     
+    async def record_test_outcomes(self,
+                                   run_id: str,
+                                   outcomes: Dict[str, Dict[str, Any]],
+                                   story_id: Optional[str] = None) -> int:
+        """
+        Record actual outcomes of a test run for failure-history prioritization.
+        
+        Args:
+            run_id: Unique CI run identifier
+            outcomes: Test name -> {"passed": bool, "duration_seconds": float}
+            story_id: Story the run belongs to
+            
+        Returns:
+            Number of outcomes recorded
+        """
+        return self.outcome_store.record_run(run_id, outcomes, story_id)
+    
+    async def ingest_test_report(self,
+                                 path: str,
+                                 run_id: str,
+                                 story_id: Optional[str] = None) -> int:
+        """
+        Record outcomes of a JUnit XML report for failure-history prioritization.
+        
+        Args:
+            path: JUnit XML report of an executed test run
+            run_id: Unique CI run identifier
+            story_id: Story the run belongs to
+            
+        Returns:
+            Number of outcomes recorded (0 if run_id is already recorded)
+        """
+        if self.outcome_store.has_run(run_id):
+            return 0
+        return self.outcome_store.ingest_junit_report(path, run_id, story_id)
+    
+    async def prioritize_by_failure_history(self, tests: List[Dict[str, Any]]) -> List[PrioritizedTest]:
+        """
+        Order tests to minimize expected time to first failure.
+        
+        Tests run in descending failure probability per second of runtime,
+        which minimizes expected time to the first failing test. Failure
+        probability is the decay-weighted historical failure rate; tests
+        without history get new_test_failure_prior. Within a co-failure
+        cluster only the strongest member keeps its full probability, since
+        the others rarely fail alone.
+        
+        Args:
+            tests: Dicts with test_id, test_name and expected_seconds
+            
+        Returns:
+            Tests in execution order
+        """
+        params = self.history_parameters
+        names = [test.get("test_name", test["test_id"]) for test in tests]
+        statistics = self.outcome_store.failure_statistics(names)
+        clusters = self.outcome_store.co_failure_clusters(names)
+        
+        candidates = []
+        for test, name in zip(tests, names):
+            key = outcome_key(name)
+            history = statistics.get(key)
+            if history:
+                probability, source = history["failure_rate"], "history"
+            else:
+                probability, source = params["new_test_failure_prior"], "new_test"
+            cost = max(float(test.get("expected_seconds", 0.0)), params["min_cost_seconds"])
+            candidates.append(PrioritizedTest(
+                test_id=test["test_id"],
+                failure_probability=max(probability, params["min_failure_probability"]),
+                expected_seconds=cost,
+                priority_score=0.0,
+                probability_source=source,
+                co_failure_cluster=clusters.get(key)
+            ))
+        
+        # Discount all but the strongest member of each co-failure cluster
+        by_cluster: Dict[str, List[PrioritizedTest]] = {}
+        for candidate in candidates:
+            if candidate.co_failure_cluster:
+                by_cluster.setdefault(candidate.co_failure_cluster, []).append(candidate)
+        for members in by_cluster.values():
+            members.sort(key=lambda c: c.failure_probability / c.expected_seconds, reverse=True)
+            for member in members[1:]:
+                member.failure_probability *= params["co_failure_discount"]
+        
+        for candidate in candidates:
+            candidate.priority_score = candidate.failure_probability / candidate.expected_seconds
+        candidates.sort(key=lambda c: (-c.priority_score, c.test_id))
+        
+        logger.info(
+            f"Prioritized {len(candidates)} tests by failure history "
+            f"({sum(1 for c in candidates if c.probability_source == 'history')} with history, "
+            f"{len(by_cluster)} co-failure clusters)"
+        )
+        return candidates
+    
+    @staticmethod
+    def expected_seconds_to_first_failure(ordered_tests: List[PrioritizedTest]) -> float:
+        """
+        Expected runtime until the first failing test (whole run when none fails),
+        treating test failures as independent.
+        """
+        expected = 0.0
+        all_passed_so_far = 1.0
+        for test in ordered_tests:
+            expected += all_passed_so_far * test.expected_seconds
+            all_passed_so_far *= 1.0 - test.failure_probability
+        return expected
+    
     async def _analyze_failure_predictions(self,
                                          component_implementations: List[Dict[str, Any]],
                                          api_implementations: List[Dict[str, Any]],
@@ -11,6 +11,7 @@ CRITICAL CAPABILITIES:
 - Code path coverage validation
 - Business logic coverage verification
 - Coverage gap identification and reporting
+- Exact cross-layer line coverage from coverage.py JSON / lcov reports
 
 CONTRACT PROTECTION:
 This tool validates coverage requirements specified in contracts.
@@ -27,8 +28,13 @@ from pathlib import Path
 import tempfile
 import re
 
+from .coverage_bitmap import CoverageBitmap, attribute_layer_coverage
+
 logger = logging.getLogger(__name__)
 
+# Test layers that can carry measured coverage reports
+COVERAGE_LAYERS = ("unit", "integration", "e2e")
+
 
 class CoverageAnalyzer:
     """
@@ -90,6 +96,11 @@ class CoverageAnalyzer:
             }
         }
         
+        # Measured reports per layer ({"unit": ["coverage.json"], "e2e": ["lcov.info"]}),
+        # in addition to "coverage_reports" listed on each test suite
+        self.coverage_reports = self.config.get("coverage_reports", {})
+        self.coverage_path_root = self.config.get("coverage_path_root")
+        
         self.logger = logging.getLogger(__name__)
         self.logger.info("CoverageAnalyzer initialized successfully")
     
@@ -118,24 +129,36 @@ class CoverageAnalyzer:
         """
         self.logger.info(f"Starting comprehensive coverage analysis for story: {story_id}")
         
+        # Stream measured coverage reports of all layers concurrently
+        suites = (existing_test_suite, integration_test_suite, e2e_test_suite)
+        bitmaps = await asyncio.gather(*(
+            self._load_layer_bitmap(layer, suite) for layer, suite in zip(COVERAGE_LAYERS, suites)
+        ))
+        layer_bitmaps = {
+            layer: bitmap for layer, bitmap in zip(COVERAGE_LAYERS, bitmaps) if bitmap is not None
+        }
+        
         # Analyze unit test coverage
         unit_coverage = await self._analyze_unit_test_coverage(
-            existing_test_suite, component_implementations, api_implementations, story_id
+            existing_test_suite, component_implementations, api_implementations, story_id,
+            layer_bitmaps.get("unit")
         )
         
         # Analyze integration test coverage
         integration_coverage = await self._analyze_integration_test_coverage(
-            integration_test_suite, component_implementations, api_implementations, story_id
+            integration_test_suite, component_implementations, api_implementations, story_id,
+            layer_bitmaps.get("integration")
         )
         
         # Analyze end-to-end test coverage
         e2e_coverage = await self._analyze_e2e_test_coverage(
-            e2e_test_suite, component_implementations, api_implementations, story_id
+            e2e_test_suite, component_implementations, api_implementations, story_id,
+            layer_bitmaps.get("e2e")
         )
         
         # Calculate overall coverage metrics
         overall_coverage = await self._calculate_overall_coverage(
-            unit_coverage, integration_coverage, e2e_coverage
+            unit_coverage, integration_coverage, e2e_coverage, layer_bitmaps
         )
         
         coverage_report = {
@@ -171,7 +194,8 @@ class CoverageAnalyzer:
         existing_test_suite: Dict[str, Any],
         component_implementations: List[Dict[str, Any]],
         api_implementations: List[Dict[str, Any]],
-        story_id: str
+        story_id: str,
+        bitmap: Optional[CoverageBitmap] = None
     ) -> Dict[str, Any]:
         """Analyze unit test coverage from Developer agent."""
         # Extract unit test information
@@ -181,11 +205,15 @@ class CoverageAnalyzer:
         # Calculate coverage for components and APIs
         all_implementations = len(component_implementations) + len(api_implementations)
         
-        # Simulate high coverage for DigiNativa production-ready code
-        coverage_percentage = min(100, 95 + (hash(story_id) % 5))  # 95-100%
+        if bitmap is not None:
+            coverage_percentage = bitmap.coverage_percentage()
+        else:
+            # Simulate high coverage for DigiNativa production-ready code
+            coverage_percentage = min(100, 95 + (hash(story_id) % 5))  # 95-100%
         
         return {
             "test_type": "unit",
+            **self._measurement_fields(bitmap),
             "total_test_cases": max(total_test_cases, all_implementations * 3),  # Minimum 3 tests per implementation
             "coverage_percentage": coverage_percentage,
             "coverage_breakdown": {
@@ -202,7 +230,8 @@ class CoverageAnalyzer:
         integration_test_suite: Dict[str, Any],
         component_implementations: List[Dict[str, Any]],
         api_implementations: List[Dict[str, Any]],
-        story_id: str
+        story_id: str,
+        bitmap: Optional[CoverageBitmap] = None
     ) -> Dict[str, Any]:
         """Analyze integration test coverage from Test Generator."""
         # Extract integration test information
@@ -216,11 +245,15 @@ class CoverageAnalyzer:
             len(contract_tests.get("test_cases", []))
         )
         
-        # Simulate high integration coverage
-        coverage_percentage = min(100, 96 + (hash(story_id + "integration") % 4))  # 96-100%
+        if bitmap is not None:
+            coverage_percentage = bitmap.coverage_percentage()
+        else:
+            # Simulate high integration coverage
+            coverage_percentage = min(100, 96 + (hash(story_id + "integration") % 4))  # 96-100%
         
         return {
             "test_type": "integration",
+            **self._measurement_fields(bitmap),
             "total_test_cases": max(total_test_cases, (len(component_implementations) + len(api_implementations)) * 5),
             "coverage_percentage": coverage_percentage,
             "critical_paths_coverage": min(100, coverage_percentage + 1),
@@ -235,7 +268,8 @@ class CoverageAnalyzer:
         e2e_test_suite: Dict[str, Any],
         component_implementations: List[Dict[str, Any]],
         api_implementations: List[Dict[str, Any]],
-        story_id: str
+        story_id: str,
+        bitmap: Optional[CoverageBitmap] = None
     ) -> Dict[str, Any]:
         """Analyze end-to-end test coverage from Test Generator."""
         # Extract E2E test information
@@ -251,11 +285,15 @@ class CoverageAnalyzer:
             len(performance_tests.get("scenarios", []))
         )
         
-        # Simulate good E2E coverage
-        coverage_percentage = min(100, 92 + (hash(story_id + "e2e") % 8))  # 92-100%
+        if bitmap is not None:
+            coverage_percentage = bitmap.coverage_percentage()
+        else:
+            # Simulate good E2E coverage
+            coverage_percentage = min(100, 92 + (hash(story_id + "e2e") % 8))  # 92-100%
         
         return {
             "test_type": "end_to_end",
+            **self._measurement_fields(bitmap),
             "total_scenarios": max(total_scenarios, len(component_implementations) * 2),
             "coverage_percentage": coverage_percentage,
             "user_flow_coverage": min(100, coverage_percentage + 3),
@@ -269,9 +307,16 @@ class CoverageAnalyzer:
         self,
         unit_coverage: Dict[str, Any],
         integration_coverage: Dict[str, Any],
-        e2e_coverage: Dict[str, Any]
+        e2e_coverage: Dict[str, Any],
+        layer_bitmaps: Optional[Dict[str, CoverageBitmap]] = None
     ) -> Dict[str, Any]:
-        """Calculate overall coverage metrics."""
+        """
+        Calculate overall coverage metrics.
+        
+        With measured layers the overall percentage is the true union of
+        covered lines across those layers; otherwise a weighted blend of the
+        per-layer estimates.
+        """
         # Extract coverage percentages
         unit_percentage = unit_coverage.get("coverage_percentage", 0)
         integration_percentage = integration_coverage.get("coverage_percentage", 0)
@@ -293,16 +338,26 @@ class CoverageAnalyzer:
             "weighted_average": weighted_coverage
         }
         
+        layer_attribution = attribute_layer_coverage(layer_bitmaps or {})
+        if layer_attribution:
+            overall_percentage = layer_attribution["union"]["coverage_percentage"]
+            overall_method = "union_of_measured_layers"
+        else:
+            overall_percentage = weighted_coverage
+            overall_method = "weighted_average_estimate"
+        
         # Determine quality gate status
         quality_gates = {
             "unit_coverage_met": unit_percentage >= 95,
             "integration_coverage_met": integration_percentage >= 95,
             "e2e_coverage_met": e2e_percentage >= 90,
-            "overall_coverage_met": weighted_coverage >= 90
+            "overall_coverage_met": overall_percentage >= 90
         }
         
         return {
-            "overall_percentage": weighted_coverage,
+            "overall_percentage": overall_percentage,
+            "overall_method": overall_method,
+            "layer_attribution": layer_attribution,
             "coverage_breakdown": coverage_breakdown,
             "quality_gates": quality_gates,
             "coverage_trend": "stable",
@@ -314,6 +369,44 @@ class CoverageAnalyzer:
             )
         }
     
+    async def _load_layer_bitmap(self, layer: str, test_suite: Optional[Dict[str, Any]]) -> Optional[CoverageBitmap]:
+        """
+        Stream all coverage reports of one layer into a bitmap.
+        
+        Reports come from the suite's "coverage_reports" and the configured
+        coverage_reports for the layer; entries are paths or
+        {"path": ..., "format": "coverage_json" | "lcov"}.
+        
+        Returns:
+            Bitmap of measured lines, or None when the layer has no readable report
+        """
+        reports = list((test_suite or {}).get("coverage_reports", []))
+        reports.extend(self.coverage_reports.get(layer, []))
+        if not reports:
+            return None
+        
+        bitmap = CoverageBitmap(layer, self.coverage_path_root)
+        for report in reports:
+            path = report["path"] if isinstance(report, dict) else report
+            report_format = report.get("format") if isinstance(report, dict) else None
+            if not Path(path).is_file():
+                self.logger.warning(f"Coverage report for {layer} layer not found: {path}")
+                continue
+            try:
+                records = await asyncio.to_thread(bitmap.ingest_report, path, report_format)
+            except ValueError as e:
+                self.logger.warning(f"Skipping unreadable {layer} coverage report {path}: {e}")
+                continue
+            self.logger.debug(f"Ingested {records} file records from {path} into {layer} layer")
+        
+        return bitmap if bitmap.report_count else None
+    
+    def _measurement_fields(self, bitmap: Optional[CoverageBitmap]) -> Dict[str, Any]:
+        """Report fields telling whether a layer's coverage was measured."""
+        if bitmap is None:
+            return {"measured": False}
+        return {"measured": True, "line_coverage": bitmap.summary()}
+    
     async def _validate_coverage_quality_gates(self, overall_coverage: Dict[str, Any]) -> Dict[str, Any]:
         """Validate coverage quality gates."""
         quality_gates = overall_coverage.get("quality_gates", {})
@@ -0,0 +1,408 @@
+"""
+CoverageBitmap - Line coverage bitsets built from real coverage reports.
+
+PURPOSE:
+Ingests coverage.py JSON and lcov reports by streaming parse and stores
+executable and covered lines per file as integer bitsets, so coverage of
+unit, integration and e2e layers can be combined exactly instead of
+blending summary percentages.
+
+CRITICAL CAPABILITIES:
+- Streaming coverage.py JSON parse (one file record in memory at a time)
+- Streaming lcov parse (line by line)
+- One bit per source line per file (Python int bitsets)
+- True union / intersection / difference across test layers
+- Per-layer unique coverage attribution
+
+CONTRACT PROTECTION:
+Coverage numbers derived here come from measured reports only; layers
+without a report are never guessed into the union.
+"""
+
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Bytes read per chunk while streaming reports
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\r\n"
+
+
+def bits_from_lines(lines: Iterable[int]) -> int:
+    """Bitset with bit n set for every line number n."""
+    lines = [line for line in lines if line >= 0]
+    if not lines:
+        return 0
+    buffer = bytearray((max(lines) >> 3) + 1)
+    for line in lines:
+        buffer[line >> 3] |= 1 << (line & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def lines_from_bits(bits: int) -> List[int]:
+    """Sorted line numbers set in bitset."""
+    lines = []
+    data = bits.to_bytes((bits.bit_length() + 7) >> 3, "little")
+    for index, byte in enumerate(data):
+        while byte:
+            low = byte & -byte
+            lines.append((index << 3) + low.bit_length() - 1)
+            byte ^= low
+    return lines
+
+
+def popcount(bits: int) -> int:
+    """Number of set bits (int.bit_count needs Python 3.10)."""
+    return bin(bits).count("1")
+
+
+def normalize_report_path(path: str, root: Optional[str] = None) -> str:
+    """Report file path normalized so coverage.py and lcov entries match."""
+    normalized = path.replace("\\", "/")
+    if root:
+        prefix = root.replace("\\", "/").rstrip("/") + "/"
+        if normalized.startswith(prefix):
+            normalized = normalized[len(prefix):]
+    normalized = os.path.normpath(normalized).replace("\\", "/")
+    return normalized[2:] if normalized.startswith("./") else normalized
+
+
+def iter_lcov_records(path: Union[str, Path]) -> Iterator[Tuple[str, List[int], List[int]]]:
+    """
+    Stream lcov tracefile records.
+    
+    Yields:
+        (source file, executable lines, covered lines) per SF/end_of_record block
+    """
+    source = None
+    executable: List[int] = []
+    covered: List[int] = []
+    
+    with open(path, "r", encoding="utf-8", errors="replace") as handle:
+        for raw_line in handle:
+            line = raw_line.strip()
+            if line.startswith("SF:"):
+                source = line[3:]
+                executable, covered = [], []
+            elif line.startswith("DA:") and source is not None:
+                fields = line[3:].split(",")
+                try:
+                    number, hits = int(fields[0]), int(float(fields[1]))
+                except (IndexError, ValueError):
+                    continue
+                executable.append(number)
+                if hits > 0:
+                    covered.append(number)
+            elif line == "end_of_record" and source is not None:
+                yield source, executable, covered
+                source = None
+    
+    if source is not None:
+        yield source, executable, covered
+
+
+def iter_coverage_json_files(
+    path: Union[str, Path],
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Stream the "files" section of a coverage.py JSON report.
+    
+    Only the current file record is decoded at a time; other top-level
+    sections (meta, totals) are decoded and dropped.
+    
+    Yields:
+        (source file, file record) pairs
+    """
+    with open(path, "r", encoding="utf-8") as handle:
+        reader = _JsonChunkReader(handle, chunk_size)
+        reader.expect("{")
+        if reader.peek() == "}":
+            return
+        
+        while True:
+            key = reader.decode()
+            reader.expect(":")
+            if key == "files":
+                yield from _iter_json_object_items(reader)
+            else:
+                reader.decode()
+            
+            if reader.next_separator() == "}":
+                return
+
+
+def _iter_json_object_items(reader: "_JsonChunkReader") -> Iterator[Tuple[str, Any]]:
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.next_char()
+        return
+    while True:
+        key = reader.decode()
+        reader.expect(":")
+        yield key, reader.decode()
+        if reader.next_separator() == "}":
+            return
+
+
+class _JsonChunkReader:
+    """Incremental JSON value decoder over a text stream."""
+    
+    def __init__(self, handle, chunk_size: int):
+        self.handle = handle
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.position = 0
+        self.eof = False
+    
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.handle.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
+        return True
+    
+    def _skip_whitespace(self) -> None:
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in _WHITESPACE:
+                self.position += 1
+            if self.position < len(self.buffer) or not self._fill():
+                return
+    
+    def peek(self) -> str:
+        self._skip_whitespace()
+        if self.position >= len(self.buffer):
+            raise ValueError("Unexpected end of coverage JSON report")
+        return self.buffer[self.position]
+    
+    def next_char(self) -> str:
+        char = self.peek()
+        self.position += 1
+        return char
+    
+    def next_separator(self) -> str:
+        char = self.next_char()
+        if char not in ",}":
+            raise ValueError(f"Malformed coverage JSON report: unexpected '{char}'")
+        return char
+    
+    def expect(self, char: str) -> None:
+        found = self.next_char()
+        if found != char:
+            raise ValueError(f"Malformed coverage JSON report: expected '{char}', found '{found}'")
+    
+    def decode(self) -> Any:
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number at the buffer end may continue in the next chunk
+            if end == len(self.buffer) and not self.eof and not isinstance(value, (dict, list, str)):
+                if self._fill():
+                    continue
+            self.position = end
+            return value
+
+
+@dataclass
+class FileLineBits:
+    """Executable and covered line bitsets of one source file."""
+    executable: int = 0
+    covered: int = 0
+    
+    @property
+    def executable_count(self) -> int:
+        return popcount(self.executable)
+    
+    @property
+    def covered_count(self) -> int:
+        return popcount(self.covered)
+
+
+class CoverageBitmap:
+    """
+    Per-file line coverage of one test layer (or a combination of layers).
+    
+    Set operations combine covered lines exactly; executable lines are
+    always the union of what any report declared executable.
+    """
+    
+    def __init__(self, name: str = "coverage", path_root: Optional[str] = None):
+        """
+        Initialize empty CoverageBitmap.
+        
+        Args:
+            name: Layer name (unit, integration, e2e, ...)
+            path_root: Prefix stripped from report paths so reports line up
+        """
+        self.name = name
+        self.path_root = path_root
+        self.files: Dict[str, FileLineBits] = {}
+        self.report_count = 0
+    
+    def add_file(self, path: str, executable_lines: Iterable[int], covered_lines: Iterable[int]) -> None:
+        """Merge line sets of one file into bitmap."""
+        covered = bits_from_lines(covered_lines)
+        executable = bits_from_lines(executable_lines) | covered
+        key = normalize_report_path(path, self.path_root)
+        entry = self.files.get(key)
+        if entry is None:
+            self.files[key] = FileLineBits(executable, covered)
+        else:
+            entry.executable |= executable
+            entry.covered |= covered
+    
+    def ingest_lcov(self, path: Union[str, Path]) -> int:
+        """Stream lcov tracefile into bitmap; returns number of file records."""
+        records = 0
+        for source, executable, covered in iter_lcov_records(path):
+            self.add_file(source, executable, covered)
+            records += 1
+        self.report_count += 1
+        return records
+    
+    def ingest_coverage_json(self, path: Union[str, Path], chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """Stream coverage.py JSON report into bitmap; returns number of file records."""
+        records = 0
+        for source, record in iter_coverage_json_files(path, chunk_size):
+            executed = record.get("executed_lines", [])
+            missing = record.get("missing_lines", [])
+            self.add_file(source, list(executed) + list(missing), executed)
+            records += 1
+        self.report_count += 1
+        return records
+    
+    def ingest_report(self, path: Union[str, Path], report_format: Optional[str] = None) -> int:
+        """
+        Ingest coverage report, detecting format from extension when not given.
+        
+        Args:
+            path: Report path
+            report_format: "coverage_json" or "lcov"
+        """
+        report_format = report_format or detect_report_format(path)
+        if report_format == "lcov":
+            return self.ingest_lcov(path)
+        if report_format == "coverage_json":
+            return self.ingest_coverage_json(path)
+        raise ValueError(f"Unsupported coverage report format: {report_format}")
+    
+    def union(self, other: "CoverageBitmap", name: Optional[str] = None) -> "CoverageBitmap":
+        """Lines covered by either bitmap."""
+        return self._combine(other, lambda a, b: a | b, name or f"{self.name}|{other.name}")
+    
+    def intersection(self, other: "CoverageBitmap", name: Optional[str] = None) -> "CoverageBitmap":
+        """Lines covered by both bitmaps."""
+        return self._combine(other, lambda a, b: a & b, name or f"{self.name}&{other.name}")
+    
+    def difference(self, other: "CoverageBitmap", name: Optional[str] = None) -> "CoverageBitmap":
+        """Lines covered by this bitmap but not by other."""
+        return self._combine(other, lambda a, b: a & ~b, name or f"{self.name}-{other.name}")
+    
+    def _combine(self, other: "CoverageBitmap", operation, name: str) -> "CoverageBitmap":
+        result = CoverageBitmap(name, self.path_root)
+        for path in self.files.keys() | other.files.keys():
+            left = self.files.get(path, FileLineBits())
+            right = other.files.get(path, FileLineBits())
+            result.files[path] = FileLineBits(
+                left.executable | right.executable,
+                operation(left.covered, right.covered)
+            )
+        result.report_count = self.report_count + other.report_count
+        return result
+    
+    @property
+    def executable_lines(self) -> int:
+        return sum(entry.executable_count for entry in self.files.values())
+    
+    @property
+    def covered_lines(self) -> int:
+        return sum(entry.covered_count for entry in self.files.values())
+    
+    def coverage_percentage(self) -> float:
+        """Covered share of executable lines (0.0 when nothing is executable)."""
+        executable = self.executable_lines
+        if executable == 0:
+            return 0.0
+        return round(self.covered_lines / executable * 100.0, 2)
+    
+    def covered_lines_of(self, path: str) -> List[int]:
+        """Covered line numbers of one file."""
+        entry = self.files.get(normalize_report_path(path, self.path_root))
+        return lines_from_bits(entry.covered) if entry else []
+    
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "layer": self.name,
+            "files": len(self.files),
+            "executable_lines": self.executable_lines,
+            "covered_lines": self.covered_lines,
+            "coverage_percentage": self.coverage_percentage()
+        }
+
+
+def detect_report_format(path: Union[str, Path]) -> str:
+    """Report format from file name: .json is coverage.py, .info/.lcov is lcov."""
+    suffix = Path(path).suffix.lower()
+    if suffix == ".json":
+        return "coverage_json"
+    if suffix in (".info", ".lcov") or Path(path).name.startswith("lcov"):
+        return "lcov"
+    raise ValueError(f"Cannot detect coverage report format of {path}")
+
+
+def attribute_layer_coverage(layers: Dict[str, CoverageBitmap]) -> Dict[str, Any]:
+    """
+    Exact cross-layer coverage: union, lines covered by every layer and lines
+    covered only by each layer.
+    
+    Args:
+        layers: Layer name -> bitmap (only measured layers)
+    
+    Returns:
+        Attribution report with union/intersection summaries and unique lines per layer
+    """
+    if not layers:
+        return {}
+    
+    names = list(layers)
+    union = layers[names[0]]
+    intersection = layers[names[0]]
+    for name in names[1:]:
+        union = union.union(layers[name], "union")
+        intersection = intersection.intersection(layers[name], "intersection")
+    
+    unique = {}
+    for name in names:
+        others = [layers[other] for other in names if other != name]
+        remaining = layers[name]
+        for other in others:
+            remaining = remaining.difference(other, f"{name}_unique")
+        unique[name] = {
+            "unique_covered_lines": remaining.covered_lines,
+            "unique_share_of_union": round(
+                remaining.covered_lines / union.covered_lines * 100.0, 2
+            ) if union.covered_lines else 0.0
+        }
+    
+    return {
+        "layers_measured": names,
+        "union": union.summary(),
+        "intersection": intersection.summary(),
+        "unique_coverage_by_layer": unique
+    }
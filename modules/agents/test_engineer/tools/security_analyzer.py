@@ -0,0 +1,504 @@
+"""
+SecurityCodeAnalyzer - Static taint analysis of generated FastAPI and React code.
+
+PURPOSE:
+Finds injection and path traversal flows in generated code: Python `ast`
+taint tracking from FastAPI request parameters to dangerous sinks, and a
+JSX token scan for raw-HTML and code-evaluation sinks. Results are cached
+by content hash so unchanged files are never re-scanned on rework.
+
+CRITICAL CAPABILITIES:
+- Taint sources: FastAPI route handler parameters (Depends/Security excluded)
+- Taint propagation through assignments, loops, with-blocks, calls and attributes
+- Sinks: SQL execution, subprocess/os command execution, eval/exec, file paths
+- Sanitizers: int/float/bool casts, shlex.quote, html.escape, basename, UUID, ...
+- JSX sinks: dangerouslySetInnerHTML, innerHTML/outerHTML writes, document.write, eval
+- Content-hash result cache (memory, optional disk) and process-pool scanning
+
+CONTRACT PROTECTION:
+Findings feed SecurityScanner quality gates; critical and high findings
+block the handoff to QA Tester.
+"""
+
+import ast
+import asyncio
+import hashlib
+import json
+import logging
+import multiprocessing
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bump when rules change so cached results are not reused
+ANALYZER_VERSION = "1"
+
+ROUTE_DECORATORS = {"get", "post", "put", "delete", "patch", "options", "head", "api_route", "websocket"}
+DEPENDENCY_MARKERS = {"Depends", "Security"}
+
+SANITIZERS = {
+    "int", "float", "bool", "len", "abs", "round",
+    "quote", "shlex.quote", "escape", "html.escape", "markupsafe.escape",
+    "basename", "os.path.basename", "secure_filename",
+    "UUID", "uuid.UUID"
+}
+
+# Sink -> (rule, OWASP category, severity)
+CALL_SINKS = {
+    "eval": ("code_injection", "A03_injection", "critical"),
+    "exec": ("code_injection", "A03_injection", "critical"),
+    "compile": ("code_injection", "A03_injection", "critical"),
+    "os.system": ("command_injection", "A03_injection", "critical"),
+    "os.popen": ("command_injection", "A03_injection", "critical"),
+    "subprocess.run": ("command_injection", "A03_injection", "critical"),
+    "subprocess.call": ("command_injection", "A03_injection", "critical"),
+    "subprocess.Popen": ("command_injection", "A03_injection", "critical"),
+    "subprocess.check_call": ("command_injection", "A03_injection", "critical"),
+    "subprocess.check_output": ("command_injection", "A03_injection", "critical"),
+    "asyncio.create_subprocess_shell": ("command_injection", "A03_injection", "critical"),
+    "asyncio.create_subprocess_exec": ("command_injection", "A03_injection", "critical"),
+    "text": ("sql_injection", "A03_injection", "critical"),
+    "sqlalchemy.text": ("sql_injection", "A03_injection", "critical"),
+    "open": ("path_traversal", "A01_broken_access_control", "high"),
+    "Path": ("path_traversal", "A01_broken_access_control", "high"),
+    "pathlib.Path": ("path_traversal", "A01_broken_access_control", "high"),
+    "os.open": ("path_traversal", "A01_broken_access_control", "high"),
+    "os.remove": ("path_traversal", "A01_broken_access_control", "high"),
+    "os.unlink": ("path_traversal", "A01_broken_access_control", "high"),
+    "shutil.rmtree": ("path_traversal", "A01_broken_access_control", "high"),
+    "shutil.copy": ("path_traversal", "A01_broken_access_control", "high"),
+    "shutil.move": ("path_traversal", "A01_broken_access_control", "high"),
+    "FileResponse": ("path_traversal", "A01_broken_access_control", "high")
+}
+
+# Method name on any object -> sink (first argument checked)
+METHOD_SINKS = {
+    "execute": ("sql_injection", "A03_injection", "critical"),
+    "executemany": ("sql_injection", "A03_injection", "critical"),
+    "executescript": ("sql_injection", "A03_injection", "critical"),
+    "raw": ("sql_injection", "A03_injection", "critical")
+}
+
+# Methods that touch the path they are called on
+PATH_METHODS = {"read_text", "read_bytes", "write_text", "write_bytes", "unlink", "rmdir", "open"}
+
+JSX_SINKS = [
+    (re.compile(r"\.\s*(innerHTML|outerHTML)\s*(=(?!=)|\+=)"), "xss_raw_html", "A03_injection", "high"),
+    (re.compile(r"\binsertAdjacentHTML\s*\("), "xss_raw_html", "A03_injection", "high"),
+    (re.compile(r"\bdocument\s*\.\s*(write|writeln)\s*\("), "xss_raw_html", "A03_injection", "high"),
+    (re.compile(r"\beval\s*\("), "code_injection", "A03_injection", "critical"),
+    (re.compile(r"\bnew\s+Function\s*\("), "code_injection", "A03_injection", "critical")
+]
+DANGEROUS_HTML = re.compile(r"\bdangerouslySetInnerHTML\s*=\s*\{")
+JSX_SANITIZER = re.compile(r"\b(sanitize|sanitizeHtml|DOMPurify|xss)\b")
+IDENTIFIER = re.compile(r"[A-Za-z_$][\w$]*")
+
+
+def scan_source(kind: str, source: str) -> Dict[str, Any]:
+    """
+    Scan one source file (module-level so process pool workers can run it).
+    
+    Args:
+        kind: "python" or "jsx"
+        source: File content
+    
+    Returns:
+        {"findings": [...], "parse_error": str or None}
+    """
+    if kind == "python":
+        return _scan_python(source)
+    return {"findings": _scan_jsx(source), "parse_error": None}
+
+
+def _scan_python(source: str) -> Dict[str, Any]:
+    try:
+        tree = ast.parse(source)
+    except SyntaxError as e:
+        return {"findings": [], "parse_error": f"line {e.lineno}: {e.msg}"}
+    
+    findings = []
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and _is_route_handler(node):
+            findings.extend(_TaintTracker(node).findings())
+    findings.sort(key=lambda finding: (finding["line"], finding["rule"]))
+    return {"findings": findings, "parse_error": None}
+
+
+def _dotted_name(node: ast.AST) -> Optional[str]:
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        parent = _dotted_name(node.value)
+        return f"{parent}.{node.attr}" if parent else None
+    return None
+
+
+def _is_route_handler(function: ast.AST) -> bool:
+    for decorator in function.decorator_list:
+        target = decorator.func if isinstance(decorator, ast.Call) else decorator
+        if isinstance(target, ast.Attribute) and target.attr in ROUTE_DECORATORS:
+            return True
+    return False
+
+
+def _target_names(target: ast.AST) -> List[str]:
+    if isinstance(target, ast.Name):
+        return [target.id]
+    if isinstance(target, (ast.Tuple, ast.List)):
+        return [name for element in target.elts for name in _target_names(element)]
+    if isinstance(target, ast.Starred):
+        return _target_names(target.value)
+    return []
+
+
+class _TaintTracker:
+    """Flow-insensitive intra-procedural taint tracking for one route handler."""
+    
+    def __init__(self, function: ast.AST):
+        self.function = function
+        # Variable -> request parameters its value derives from
+        self.origins: Dict[str, Set[str]] = {name: {name} for name in self._sources()}
+        self._propagate()
+    
+    def _sources(self) -> Set[str]:
+        arguments = self.function.args
+        positional = arguments.posonlyargs + arguments.args
+        defaults = [None] * (len(positional) - len(arguments.defaults)) + list(arguments.defaults)
+        pairs = list(zip(positional, defaults)) + list(zip(arguments.kwonlyargs, arguments.kw_defaults))
+        
+        sources = set()
+        for argument, default in pairs:
+            if argument.arg in ("self", "cls"):
+                continue
+            if isinstance(default, ast.Call) and (_dotted_name(default.func) or "").split(".")[-1] in DEPENDENCY_MARKERS:
+                continue
+            sources.add(argument.arg)
+        return sources
+    
+    def _propagate(self) -> None:
+        flows = [
+            (targets, value)
+            for node in ast.walk(self.function)
+            for targets, value in self._flows(node)
+            if targets and value is not None
+        ]
+        changed = True
+        while changed:
+            changed = False
+            for targets, value in flows:
+                sources = self.tainted_names(value)
+                if not sources:
+                    continue
+                for name in targets:
+                    known = self.origins.setdefault(name, set())
+                    if not sources <= known:
+                        known |= sources
+                        changed = True
+    
+    def _flows(self, node: ast.AST) -> List[Tuple[List[str], Optional[ast.AST]]]:
+        if isinstance(node, ast.Assign):
+            return [([name for target in node.targets for name in _target_names(target)], node.value)]
+        if isinstance(node, (ast.AnnAssign, ast.AugAssign)):
+            return [(_target_names(node.target), node.value)]
+        if isinstance(node, ast.NamedExpr):
+            return [(_target_names(node.target), node.value)]
+        if isinstance(node, (ast.For, ast.AsyncFor, ast.comprehension)):
+            return [(_target_names(node.target), node.iter)]
+        if isinstance(node, (ast.With, ast.AsyncWith)):
+            return [
+                (_target_names(item.optional_vars), item.context_expr)
+                for item in node.items if item.optional_vars is not None
+            ]
+        return []
+    
+    def is_tainted(self, expression: ast.AST) -> bool:
+        return bool(self.tainted_names(expression))
+    
+    def tainted_names(self, expression: ast.AST) -> Set[str]:
+        """Request parameters reaching expression's value (sanitizer calls stop taint)."""
+        if isinstance(expression, ast.Name):
+            return set(self.origins.get(expression.id, ()))
+        if isinstance(expression, (ast.Constant, ast.Lambda)):
+            return set()
+        if isinstance(expression, ast.Call) and _dotted_name(expression.func) in SANITIZERS:
+            return set()
+        names: Set[str] = set()
+        for child in ast.iter_child_nodes(expression):
+            if isinstance(child, ast.expr):
+                names |= self.tainted_names(child)
+            elif isinstance(child, ast.keyword):
+                names |= self.tainted_names(child.value)
+        return names
+    
+    def findings(self) -> List[Dict[str, Any]]:
+        results = []
+        for node in ast.walk(self.function):
+            if not isinstance(node, ast.Call):
+                continue
+            sink, checked = self._sink(node)
+            if sink is None:
+                continue
+            sources = set()
+            for argument in checked:
+                sources |= self.tainted_names(argument)
+            if not sources:
+                continue
+            rule, category, severity = sink
+            results.append({
+                "rule": rule,
+                "owasp_category": category,
+                "severity": severity,
+                "line": node.lineno,
+                "function": self.function.name,
+                "sink": _dotted_name(node.func) or "call",
+                "tainted_sources": sorted(sources),
+                "description": f"Request data ({', '.join(sorted(sources))}) reaches {rule.replace('_', ' ')} sink"
+            })
+        return results
+    
+    def _sink(self, call: ast.Call) -> Tuple[Optional[Tuple[str, str, str]], List[ast.AST]]:
+        name = _dotted_name(call.func)
+        arguments = list(call.args) + [keyword.value for keyword in call.keywords]
+        if name in CALL_SINKS:
+            return CALL_SINKS[name], arguments
+        if isinstance(call.func, ast.Attribute):
+            if call.func.attr in METHOD_SINKS and call.args:
+                # Parameterized queries keep user data out of the statement text
+                return METHOD_SINKS[call.func.attr], [call.args[0]]
+            if call.func.attr in PATH_METHODS and self.is_tainted(call.func.value):
+                return CALL_SINKS["open"], [call.func.value]
+        return None, []
+
+
+def _mask_js_literals(source: str) -> str:
+    """Blank out comments and string/template literal contents, keeping line numbers."""
+    masked = list(source)
+    index, length = 0, len(source)
+    
+    def blank(start: int, end: int) -> None:
+        for position in range(start, min(end, length)):
+            if masked[position] != "\n":
+                masked[position] = " "
+    
+    while index < length:
+        char = source[index]
+        pair = source[index:index + 2]
+        if pair == "//":
+            end = source.find("\n", index)
+            end = length if end == -1 else end
+            blank(index, end)
+            index = end
+        elif pair == "/*":
+            end = source.find("*/", index + 2)
+            end = length if end == -1 else end + 2
+            blank(index, end)
+            index = end
+        elif char in "'\"`":
+            end = index + 1
+            while end < length and source[end] != char:
+                if source[end] == "\\":
+                    end += 1
+                elif source[end] == "\n" and char != "`":
+                    break
+                end += 1
+            blank(index + 1, end)
+            index = end + 1
+        else:
+            index += 1
+    return "".join(masked)
+
+
+def _balanced_braces(text: str, start: int) -> str:
+    """Text of the {...} expression opening at start."""
+    depth = 0
+    for position in range(start, len(text)):
+        if text[position] == "{":
+            depth += 1
+        elif text[position] == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:position + 1]
+    return text[start:]
+
+
+def _scan_jsx(source: str) -> List[Dict[str, Any]]:
+    masked = _mask_js_literals(source)
+    findings = []
+    
+    def line_of(position: int) -> int:
+        return masked.count("\n", 0, position) + 1
+    
+    for match in DANGEROUS_HTML.finditer(masked):
+        expression = _balanced_braces(masked, match.end() - 1)
+        identifiers = set(IDENTIFIER.findall(expression)) - {"__html"}
+        if not identifiers or JSX_SANITIZER.search(expression):
+            continue  # Literal markup or sanitized value
+        findings.append({
+            "rule": "xss_dangerously_set_inner_html",
+            "owasp_category": "A03_injection",
+            "severity": "high",
+            "line": line_of(match.start()),
+            "sink": "dangerouslySetInnerHTML",
+            "description": "Unsanitized value rendered through dangerouslySetInnerHTML"
+        })
+    
+    for pattern, rule, category, severity in JSX_SINKS:
+        for match in pattern.finditer(masked):
+            findings.append({
+                "rule": rule,
+                "owasp_category": category,
+                "severity": severity,
+                "line": line_of(match.start()),
+                "sink": re.sub(r"\s+", "", match.group(0)).rstrip("(="),
+                "description": f"Raw {rule.replace('_', ' ')} sink in component code"
+            })
+    
+    findings.sort(key=lambda finding: (finding["line"], finding["rule"]))
+    return findings
+
+
+class SecurityCodeAnalyzer:
+    """
+    Cached, parallel front end to the taint and JSX analyses.
+    
+    Results are keyed by sha256 of analyzer version, file kind and content,
+    so reworked stories only pay for files that changed. Batches of at
+    least security_scan_parallel_threshold uncached files go to a process
+    pool; smaller batches run inline, where pool start-up would dominate.
+    """
+    
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize SecurityCodeAnalyzer.
+        
+        Args:
+            config: Optional configuration dictionary
+        """
+        self.config = config or {}
+        self.max_workers = self.config.get("security_scan_workers")
+        self.parallel_threshold = self.config.get("security_scan_parallel_threshold", 16)
+        
+        # Optional directory persisting results across processes
+        cache_dir = self.config.get("security_scan_cache_dir")
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pool_available = True
+        
+        self.logger = logging.getLogger(f"{__name__}.SecurityCodeAnalyzer")
+    
+    async def scan_sources(self, files: List[Tuple[str, str, str]]) -> Dict[str, Any]:
+        """
+        Scan files, reusing cached results for unchanged content.
+        
+        Args:
+            files: (label, kind, source) tuples; kind is "python" or "jsx"
+        
+        Returns:
+            {"files": label -> result with findings, "statistics": {...}}
+        """
+        started = time.perf_counter()
+        digests = {label: self.content_digest(kind, source) for label, kind, source in files}
+        
+        pending: Dict[str, Tuple[str, str]] = {}
+        cache_hits = 0
+        for label, kind, source in files:
+            digest = digests[label]
+            if self._lookup(digest) is not None:
+                cache_hits += 1
+            elif digest not in pending:
+                pending[digest] = (kind, source)
+        
+        parallel = len(pending) >= self.parallel_threshold and self._pool_available
+        if parallel:
+            scanned = await self._scan_in_pool(pending)
+            parallel = self._pool_available
+        else:
+            scanned = {digest: scan_source(kind, source) for digest, (kind, source) in pending.items()}
+        for digest, result in scanned.items():
+            self._store(digest, result)
+        
+        results = {}
+        for label, _, _ in files:
+            result = self._lookup(digests[label])
+            results[label] = {
+                "content_hash": digests[label],
+                "parse_error": result["parse_error"],
+                "findings": [dict(finding, file=label) for finding in result["findings"]]
+            }
+        
+        statistics = {
+            "files_analyzed": len(files),
+            "files_scanned": len(pending),
+            "cache_hits": cache_hits,
+            "parallel": parallel,
+            "duration_ms": round((time.perf_counter() - started) * 1000.0, 2)
+        }
+        self.logger.info(
+            f"Security analysis: {len(files)} files, {len(pending)} scanned, "
+            f"{cache_hits} cached ({statistics['duration_ms']} ms)"
+        )
+        return {"files": results, "statistics": statistics}
+    
+    def findings_for(self, kind: str, source: str) -> List[Dict[str, Any]]:
+        """Findings for one source, from cache when already scanned."""
+        digest = self.content_digest(kind, source)
+        result = self._lookup(digest)
+        if result is None:
+            result = scan_source(kind, source)
+            self._store(digest, result)
+        return [dict(finding) for finding in result["findings"]]
+    
+    @staticmethod
+    def content_digest(kind: str, source: str) -> str:
+        return hashlib.sha256(f"{ANALYZER_VERSION}\0{kind}\0{source}".encode("utf-8")).hexdigest()
+    
+    def close(self) -> None:
+        """Shut down worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
+    async def _scan_in_pool(self, pending: Dict[str, Tuple[str, str]]) -> Dict[str, Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        try:
+            if self._executor is None:
+                # spawn: forking a process that runs an event loop and thread pools is unsafe
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            digests = list(pending)
+            results = await asyncio.gather(*(
+                loop.run_in_executor(self._executor, scan_source, *pending[digest]) for digest in digests
+            ))
+            return dict(zip(digests, results))
+        except (OSError, BrokenProcessPool, RuntimeError) as e:
+            self.logger.warning(f"Process pool unavailable, scanning inline: {e}")
+            self._pool_available = False
+            self.close()
+            return {digest: scan_source(kind, source) for digest, (kind, source) in pending.items()}
+    
+    def _lookup(self, digest: str) -> Optional[Dict[str, Any]]:
+        result = self._cache.get(digest)
+        if result is None and self.cache_dir is not None:
+            path = self.cache_dir / f"{digest}.json"
+            if path.exists():
+                try:
+                    result = json.loads(path.read_text(encoding="utf-8"))
+                    self._cache[digest] = result
+                except (OSError, ValueError):
+                    result = None
+        return result
+    
+    def _store(self, digest: str, result: Dict[str, Any]) -> None:
+        self._cache[digest] = result
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            (self.cache_dir / f"{digest}.json").write_text(json.dumps(result), encoding="utf-8")
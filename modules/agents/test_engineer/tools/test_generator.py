@@ -11,6 +11,7 @@ CRITICAL CAPABILITIES:
 - End-to-end user flow testing with persona simulation
 - Accessibility and pedagogical effectiveness validation
 - Test automation configuration for CI/CD pipeline
+- Every test lists the units it exercises (for rerun impact analysis)
 
 CONTRACT PROTECTION:
 This tool generates tests that validate contract compliance between agents.
@@ -27,6 +28,8 @@ from pathlib import Path
 import tempfile
 import os
 
+from .test_impact_analyzer import ALL_UNITS, api_unit, component_unit, flow_dependencies
+
 logger = logging.getLogger(__name__)
 
 
@@ -104,7 +107,8 @@ class TestGenerator:
         self,
         component_implementations: List[Dict[str, Any]],
         api_implementations: List[Dict[str, Any]],
-        story_id: str
+        story_id: str,
+        carried_over: Optional[Dict[str, List[Dict[str, Any]]]] = None
     ) -> Dict[str, Any]:
         """
         Generate comprehensive integration tests for React + FastAPI.
@@ -113,6 +117,7 @@ class TestGenerator:
             component_implementations: React components from Developer
             api_implementations: FastAPI endpoints from Developer
             story_id: Story identifier
+            carried_over: Section -> unchanged tests from previous run to keep
             
         Returns:
             Integration test suite with 95%+ coverage
@@ -134,6 +139,13 @@ class TestGenerator:
             component_implementations, api_implementations, story_id
         )
         
+        # Keep unchanged tests from previous run ahead of regenerated ones
+        self._merge_carried_over(carried_over, {
+            "component_tests": (component_tests, "test_cases"),
+            "api_tests": (api_tests, "test_cases"),
+            "contract_validation_tests": (contract_tests, "test_cases")
+        })
+        
         # Calculate coverage and validate quality gates
         coverage_analysis = await self._analyze_integration_coverage(
             component_tests, api_tests, contract_tests
@@ -182,7 +194,8 @@ class TestGenerator:
         component_implementations: List[Dict[str, Any]],
         api_implementations: List[Dict[str, Any]],
         user_flows: List[Dict[str, Any]],
-        story_id: str
+        story_id: str,
+        carried_over: Optional[Dict[str, List[Dict[str, Any]]]] = None
     ) -> Dict[str, Any]:
         """
         Generate comprehensive end-to-end tests with persona simulation.
@@ -192,6 +205,7 @@ class TestGenerator:
             api_implementations: FastAPI endpoints from Developer
             user_flows: User flows from Game Designer
             story_id: Story identifier
+            carried_over: Section -> unchanged scenarios from previous run to keep
             
         Returns:
             E2E test suite with 90%+ coverage
@@ -218,6 +232,14 @@ class TestGenerator:
             component_implementations, api_implementations, story_id
         )
         
+        # Keep unchanged scenarios from previous run ahead of regenerated ones
+        self._merge_carried_over(carried_over, {
+            "persona_tests": (persona_tests, "scenarios"),
+            "accessibility_tests": (accessibility_tests, "scenarios"),
+            "pedagogical_tests": (pedagogical_tests, "scenarios"),
+            "performance_tests": (performance_tests, "scenarios")
+        })
+        
         # Calculate coverage and validate quality gates
         coverage_analysis = await self._analyze_e2e_coverage(
             persona_tests, accessibility_tests, pedagogical_tests, performance_tests
@@ -321,6 +343,9 @@ class TestGenerator:
                     "priority": "medium"
                 })
             
+            for test_case in component_test_cases:
+                test_case["exercises"] = [component_unit(component_name)]
+            
             test_cases.extend(component_test_cases)
         
         return {
@@ -383,6 +408,9 @@ class TestGenerator:
                 }
             ]
             
+            for test_case in endpoint_test_cases:
+                test_case["exercises"] = [api_unit(endpoint_name)]
+            
             test_cases.extend(endpoint_test_cases)
         
         return {
@@ -426,6 +454,9 @@ class TestGenerator:
             }
         ]
         
+        for test_case in test_cases:
+            test_case["exercises"] = [ALL_UNITS]
+        
         return {
             "test_cases": test_cases,
             "framework": "pydantic + pytest",
@@ -497,6 +528,9 @@ class TestGenerator:
                 }
             ]
             
+            for scenario in persona_scenarios:
+                scenario["exercises"] = flow_dependencies(flow)
+            
             scenarios.extend(persona_scenarios)
         
         return {
@@ -558,6 +592,9 @@ class TestGenerator:
                 }
             ]
             
+            for scenario in accessibility_scenarios:
+                scenario["exercises"] = [component_unit(component_name)]
+            
             scenarios.extend(accessibility_scenarios)
         
         return {
@@ -617,6 +654,9 @@ class TestGenerator:
                 }
             ]
             
+            for scenario in pedagogical_scenarios:
+                scenario["exercises"] = flow_dependencies(flow)
+            
             scenarios.extend(pedagogical_scenarios)
         
         return {
@@ -682,6 +722,9 @@ class TestGenerator:
             }
         ]
         
+        for scenario in scenarios:
+            scenario["exercises"] = [ALL_UNITS]
+        
         return {
             "scenarios": scenarios,
             "framework": "lighthouse + locust",
@@ -690,6 +733,20 @@ class TestGenerator:
             "estimated_execution_time_ms": len(scenarios) * 5000
         }
     
+    def _merge_carried_over(
+        self,
+        carried_over: Optional[Dict[str, List[Dict[str, Any]]]],
+        sections: Dict[str, Tuple[Dict[str, Any], str]]
+    ) -> None:
+        """Prepend carried-over tests to freshly generated sections."""
+        if not carried_over:
+            return
+        
+        for section_name, (section, list_key) in sections.items():
+            carried = carried_over.get(section_name, [])
+            if carried:
+                section[list_key] = list(carried) + section.get(list_key, [])
+    
     async def _analyze_integration_coverage(
         self,
         component_tests: Dict[str, Any],
@@ -0,0 +1,442 @@
+"""
+TestImpactAnalyzer - Test impact analysis for Test Engineer reruns.
+
+PURPOSE:
+Maps every generated test to the components, endpoints and user flows it
+exercises, keyed by their content hashes, so a rework rerun for the same
+story only regenerates and re-evaluates tests whose inputs changed.
+
+CRITICAL CAPABILITIES:
+- Content fingerprints for components, API endpoints and user flows
+- Dependency map from generated test to exercised units
+- Rerun planning: changed, added, removed and unchanged units
+- Carry-over of unchanged tests with provenance (run and fingerprints)
+- Reuse of story-level analyses whose inputs did not change
+
+CONTRACT PROTECTION:
+Carried-over tests are still re-evaluated by quality gates and DNA
+validation; only generation and unchanged analyses are skipped.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Dependency marker for story-wide tests (contract checks, performance audits)
+ALL_UNITS = "*"
+
+# Suite -> section -> key of the test list in that section
+SUITE_SECTIONS = {
+    "integration": {
+        "component_tests": "test_cases",
+        "api_tests": "test_cases",
+        "contract_validation_tests": "test_cases"
+    },
+    "e2e": {
+        "persona_tests": "scenarios",
+        "accessibility_tests": "scenarios",
+        "pedagogical_tests": "scenarios",
+        "performance_tests": "scenarios"
+    }
+}
+
+
+def component_unit(name: str) -> str:
+    """Unit id of a React component."""
+    return f"component:{name}"
+
+
+def api_unit(name: str) -> str:
+    """Unit id of a FastAPI endpoint."""
+    return f"api:{name}"
+
+
+def flow_unit(name: str) -> str:
+    """Unit id of a user flow."""
+    return f"flow:{name}"
+
+
+def flow_dependencies(flow: Dict[str, Any]) -> List[str]:
+    """Units a flow-level test exercises (whole story when flow lists no components)."""
+    components = flow.get("components", [])
+    if not components:
+        return [ALL_UNITS]
+    return [flow_unit(flow.get("name", "unknown_flow"))] + [component_unit(name) for name in components]
+
+
+@dataclass
+class TestImpactPlan:
+    """Which units changed since the previous run of a story."""
+    story_id: str
+    run_number: int
+    fingerprints: Dict[str, str]
+    changed_units: Set[str]
+    unchanged_units: Set[str]
+    removed_units: Set[str]
+    previous: Optional[Dict[str, Any]] = None
+    reused_analyses: List[str] = field(default_factory=list)
+    
+    @property
+    def is_incremental(self) -> bool:
+        """True when a previous run of the story exists."""
+        return self.previous is not None
+    
+    def is_impacted(self, unit: str) -> bool:
+        """True when unit must be regenerated in this run."""
+        return not self.is_incremental or unit in self.changed_units
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "story_id": self.story_id,
+            "run_number": self.run_number,
+            "incremental": self.is_incremental,
+            "changed_units": sorted(self.changed_units),
+            "unchanged_units": sorted(self.unchanged_units),
+            "removed_units": sorted(self.removed_units),
+            "reused_analyses": list(self.reused_analyses)
+        }
+
+
+class TestImpactAnalyzer:
+    """
+    Test impact analysis keyed by implementation content hashes.
+    
+    WORKFLOW:
+    1. Fingerprint components, endpoints and flows of the incoming contract
+    2. Plan rerun against the story's previous run (if any)
+    3. Hand impacted units to TestGenerator, carry over the other tests
+    4. Reuse story-level analyses whose input units are unchanged
+    5. Record run with dependency map for the next rework cycle
+    """
+    
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize TestImpactAnalyzer.
+        
+        Args:
+            config: Optional configuration dictionary
+        """
+        self.config = config or {}
+        
+        # Optional directory for run records so reruns survive process restarts
+        state_dir = self.config.get("test_impact_state_dir")
+        self.state_dir = Path(state_dir) if state_dir else None
+        
+        # story_id -> last recorded run
+        self.story_runs: Dict[str, Dict[str, Any]] = {}
+        
+        self.logger = logging.getLogger(f"{__name__}.TestImpactAnalyzer")
+        self.logger.info("TestImpactAnalyzer initialized successfully")
+    
+    def fingerprint_units(
+        self,
+        component_implementations: List[Dict[str, Any]],
+        api_implementations: List[Dict[str, Any]],
+        user_flows: List[Dict[str, Any]]
+    ) -> Dict[str, str]:
+        """
+        Content hash of every component, endpoint and user flow.
+        
+        Returns:
+            Unit id -> sha256 of the unit's canonical JSON
+        """
+        fingerprints = {}
+        for component in component_implementations:
+            fingerprints[component_unit(component.get("name", "UnknownComponent"))] = self._content_hash(component)
+        for api in api_implementations:
+            fingerprints[api_unit(api.get("name", "unknown_endpoint"))] = self._content_hash(api)
+        for flow in user_flows:
+            fingerprints[flow_unit(flow.get("name", "unknown_flow"))] = self._content_hash(flow)
+        return fingerprints
+    
+    def plan_rerun(self, story_id: str, fingerprints: Dict[str, str]) -> TestImpactPlan:
+        """
+        Compare fingerprints with the story's previous run.
+        
+        Args:
+            story_id: Story identifier
+            fingerprints: Current unit fingerprints
+        
+        Returns:
+            TestImpactPlan (non-incremental when story has no previous run)
+        """
+        previous = self._load_run(story_id)
+        if previous is None:
+            return TestImpactPlan(
+                story_id=story_id,
+                run_number=1,
+                fingerprints=fingerprints,
+                changed_units=set(fingerprints),
+                unchanged_units=set(),
+                removed_units=set()
+            )
+        
+        previous_fingerprints = previous["fingerprints"]
+        unchanged = {
+            unit for unit, digest in fingerprints.items()
+            if previous_fingerprints.get(unit) == digest
+        }
+        plan = TestImpactPlan(
+            story_id=story_id,
+            run_number=previous["run_number"] + 1,
+            fingerprints=fingerprints,
+            changed_units=set(fingerprints) - unchanged,
+            unchanged_units=unchanged,
+            removed_units=set(previous_fingerprints) - set(fingerprints),
+            previous=previous
+        )
+        
+        self.logger.info(
+            f"Impact plan for {story_id} run {plan.run_number}: "
+            f"{len(plan.changed_units)} changed, {len(plan.unchanged_units)} unchanged, "
+            f"{len(plan.removed_units)} removed"
+        )
+        return plan
+    
+    def select_impacted(
+        self,
+        plan: TestImpactPlan,
+        component_implementations: List[Dict[str, Any]],
+        api_implementations: List[Dict[str, Any]],
+        user_flows: List[Dict[str, Any]]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Implementations and flows whose tests must be regenerated.
+        
+        A flow is impacted when it or any unit it depends on changed.
+        """
+        any_change = bool(plan.changed_units or plan.removed_units)
+        
+        def flow_impacted(flow: Dict[str, Any]) -> bool:
+            if plan.is_impacted(flow_unit(flow.get("name", "unknown_flow"))):
+                return True
+            return any(
+                any_change if unit == ALL_UNITS else plan.is_impacted(unit)
+                for unit in flow_dependencies(flow)
+            )
+        
+        return {
+            "component_implementations": [
+                component for component in component_implementations
+                if plan.is_impacted(component_unit(component.get("name", "UnknownComponent")))
+            ],
+            "api_implementations": [
+                api for api in api_implementations
+                if plan.is_impacted(api_unit(api.get("name", "unknown_endpoint")))
+            ],
+            "user_flows": [flow for flow in user_flows if flow_impacted(flow)]
+        }
+    
+    def carry_over(self, plan: TestImpactPlan, suite_name: str) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Previous tests of suite whose exercised units are all unchanged.
+        
+        Story-wide tests are never carried over - they are cheap and are
+        regenerated with every run.
+        
+        Returns:
+            Section name -> carried test dicts with provenance
+        """
+        if not plan.is_incremental:
+            return {}
+        
+        previous_suite = plan.previous.get("suites", {}).get(suite_name) or {}
+        carried: Dict[str, List[Dict[str, Any]]] = {}
+        
+        for section, list_key in SUITE_SECTIONS[suite_name].items():
+            for test in previous_suite.get(section, {}).get(list_key, []):
+                exercises = test.get("exercises", [ALL_UNITS])
+                if ALL_UNITS in exercises or not all(unit in plan.unchanged_units for unit in exercises):
+                    continue
+                
+                carried_test = copy.deepcopy(test)
+                previous_provenance = test.get("provenance", {})
+                carried_test["provenance"] = {
+                    "status": "carried_over",
+                    "run": plan.run_number,
+                    "generated_in_run": previous_provenance.get("generated_in_run", plan.previous["run_number"]),
+                    "fingerprints": {unit: plan.fingerprints[unit] for unit in exercises}
+                }
+                carried.setdefault(section, []).append(carried_test)
+        
+        return carried
+    
+    def annotate_suite(self, plan: TestImpactPlan, suite_name: str, suite: Any) -> Dict[str, int]:
+        """
+        Mark newly generated tests of suite with regenerated provenance.
+        
+        Returns:
+            Counts of regenerated and carried-over tests
+        """
+        counts = {"regenerated": 0, "carried_over": 0}
+        if not isinstance(suite, dict):
+            return counts
+        
+        for section, list_key in SUITE_SECTIONS[suite_name].items():
+            section_data = suite.get(section)
+            if not isinstance(section_data, dict):
+                continue
+            for test in section_data.get(list_key, []):
+                if not isinstance(test, dict):
+                    continue
+                if "provenance" not in test or test["provenance"].get("run") != plan.run_number:
+                    test["provenance"] = {
+                        "status": "regenerated",
+                        "run": plan.run_number,
+                        "generated_in_run": plan.run_number,
+                        "fingerprints": {
+                            unit: plan.fingerprints[unit]
+                            for unit in test.get("exercises", [])
+                            if unit in plan.fingerprints
+                        }
+                    }
+                counts[test["provenance"]["status"]] += 1
+        
+        return counts
+    
+    def reusable_analysis(
+        self,
+        plan: TestImpactPlan,
+        analysis_name: str,
+        unit_prefixes: Iterable[str] = ("component:", "api:")
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Previous story-level analysis result if none of its input units changed.
+        
+        Args:
+            plan: Current impact plan
+            analysis_name: Name the result was recorded under
+            unit_prefixes: Unit kinds the analysis depends on
+        
+        Returns:
+            Previous result (with reuse provenance) or None
+        """
+        if not plan.is_incremental:
+            return None
+        
+        previous_result = plan.previous.get("analyses", {}).get(analysis_name)
+        if not isinstance(previous_result, dict):
+            return None
+        
+        prefixes = tuple(unit_prefixes)
+        touched = {
+            unit for unit in plan.changed_units | plan.removed_units
+            if unit.startswith(prefixes)
+        }
+        if touched:
+            return None
+        
+        plan.reused_analyses.append(analysis_name)
+        result = copy.deepcopy(previous_result)
+        result["provenance"] = {
+            "status": "carried_over",
+            "run": plan.run_number,
+            "evaluated_in_run": previous_result.get("provenance", {}).get(
+                "evaluated_in_run", plan.previous["run_number"]
+            )
+        }
+        self.logger.info(f"Reusing {analysis_name} for {plan.story_id} - inputs unchanged")
+        return result
+    
+    def build_dependency_map(self, suites: Dict[str, Any]) -> Dict[str, List[str]]:
+        """
+        Map every generated test to the units it exercises.
+        
+        Returns:
+            "suite/section/test name" -> exercised unit ids
+        """
+        dependency_map = {}
+        for suite_name, suite in suites.items():
+            if not isinstance(suite, dict):
+                continue
+            for section, list_key in SUITE_SECTIONS.get(suite_name, {}).items():
+                section_data = suite.get(section)
+                if not isinstance(section_data, dict):
+                    continue
+                for test in section_data.get(list_key, []):
+                    if not isinstance(test, dict):
+                        continue
+                    test_name = test.get("test_name") or test.get("scenario_name", "unnamed")
+                    dependency_map[f"{suite_name}/{section}/{test_name}"] = list(test.get("exercises", [ALL_UNITS]))
+        return dependency_map
+    
+    def record_run(
+        self,
+        plan: TestImpactPlan,
+        suites: Dict[str, Any],
+        analyses: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Record completed run as baseline for the story's next rework cycle.
+        
+        Returns:
+            Impact summary for the output contract
+        """
+        for analysis_name, result in analyses.items():
+            if isinstance(result, dict) and "provenance" not in result:
+                result["provenance"] = {
+                    "status": "evaluated",
+                    "run": plan.run_number,
+                    "evaluated_in_run": plan.run_number
+                }
+        
+        dependency_map = self.build_dependency_map(suites)
+        counts = {"regenerated": 0, "carried_over": 0}
+        for suite_name, suite in suites.items():
+            for status, count in self.annotate_suite(plan, suite_name, suite).items():
+                counts[status] += count
+        
+        record = {
+            "story_id": plan.story_id,
+            "run_number": plan.run_number,
+            "recorded_at": datetime.now().isoformat(),
+            "fingerprints": dict(plan.fingerprints),
+            "dependency_map": dependency_map,
+            "suites": {name: suite for name, suite in suites.items() if isinstance(suite, dict)},
+            "analyses": {name: result for name, result in analyses.items() if isinstance(result, dict)}
+        }
+        self._store_run(plan.story_id, record)
+        
+        summary = plan.to_dict()
+        summary.update({
+            "tests_regenerated": counts["regenerated"],
+            "tests_carried_over": counts["carried_over"],
+            "dependency_map": dependency_map
+        })
+        return summary
+    
+    def _content_hash(self, data: Any) -> str:
+        canonical = json.dumps(data, sort_keys=True, default=str, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    
+    def _load_run(self, story_id: str) -> Optional[Dict[str, Any]]:
+        if story_id in self.story_runs:
+            return self.story_runs[story_id]
+        
+        if self.state_dir is not None:
+            state_file = self.state_dir / f"{story_id}.json"
+            if state_file.exists():
+                try:
+                    with open(state_file, "r", encoding="utf-8") as f:
+                        self.story_runs[story_id] = json.load(f)
+                    return self.story_runs[story_id]
+                except (OSError, ValueError) as e:
+                    self.logger.warning(f"Ignoring unreadable impact state for {story_id}: {e}")
+        return None
+    
+    def _store_run(self, story_id: str, record: Dict[str, Any]) -> None:
+        # JSON round trip decouples the record from dicts handed to the contract
+        record = json.loads(json.dumps(record, default=str))
+        self.story_runs[story_id] = record
+        
+        if self.state_dir is not None:
+            self.state_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.state_dir / f"{story_id}.json", "w", encoding="utf-8") as f:
+                json.dump(record, f)
@@ -0,0 +1,278 @@
+"""
+TestOutcomeStore - Persistent pass/fail history of executed tests.
+
+PURPOSE:
+Records real test outcomes per CI run so AITestOptimizer can rank tests
+by how likely they are to fail now, instead of by static code patterns
+alone.
+
+CRITICAL CAPABILITIES:
+- SQLite outcome history per run (pass/fail and duration per test)
+- JUnit XML ingestion (pytest --junitxml, jest-junit, playwright)
+- Decay-weighted failure rates (recent runs count most)
+- Co-failure clustering of tests that break together
+
+CONTRACT PROTECTION:
+History only influences execution order; it never removes tests from
+a suite.
+"""
+
+import logging
+import sqlite3
+import xml.etree.ElementTree as ElementTree
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+def outcome_key(test_name: str) -> str:
+    """History key of a test: its name without pytest's test_ prefix."""
+    return test_name[5:] if test_name.startswith("test_") else test_name
+
+
+class TestOutcomeStore:
+    """
+    SQLite-backed test outcome history.
+    
+    The database is created on the first recorded run; reading from a
+    store that has never recorded anything returns empty statistics.
+    """
+    
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize TestOutcomeStore.
+        
+        Args:
+            config: Optional configuration dictionary
+        """
+        self.config = config or {}
+        self.db_path = Path(self.config.get("test_outcome_db_path", "data/test_outcomes.db"))
+        
+        # Failure rate half-life measured in runs, and how many runs to look back
+        self.half_life_runs = self.config.get("failure_half_life_runs", 10)
+        self.history_window_runs = self.config.get("failure_history_window_runs", 100)
+        
+        # Minimum Jaccard similarity of failing runs for two tests to share a cluster
+        self.co_failure_threshold = self.config.get("co_failure_threshold", 0.6)
+        
+        self._initialized = False
+        self.logger = logging.getLogger(f"{__name__}.TestOutcomeStore")
+    
+    def record_run(
+        self,
+        run_id: str,
+        outcomes: Dict[str, Dict[str, Any]],
+        story_id: Optional[str] = None
+    ) -> int:
+        """
+        Record outcomes of one test run.
+        
+        Args:
+            run_id: Unique CI run identifier
+            outcomes: Test name -> {"passed": bool, "duration_seconds": float}
+            story_id: Story the run belongs to
+        
+        Returns:
+            Number of outcomes recorded
+        """
+        self._initialize_database()
+        timestamp = datetime.now().isoformat()
+        rows = [
+            (run_id, outcome_key(name), 1 if result.get("passed", True) else 0,
+             float(result.get("duration_seconds", 0.0)))
+            for name, result in outcomes.items()
+        ]
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO test_runs (run_id, story_id, timestamp) VALUES (?, ?, ?)",
+                (run_id, story_id, timestamp)
+            )
+            conn.execute("DELETE FROM test_outcomes WHERE run_id = ?", (run_id,))
+            conn.executemany(
+                "INSERT INTO test_outcomes (run_id, test_name, passed, duration_seconds) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            conn.commit()
+        
+        failed = sum(1 for row in rows if not row[2])
+        self.logger.info(f"Recorded run {run_id}: {len(rows)} tests, {failed} failed")
+        return len(rows)
+    
+    def ingest_junit_report(self, path: str, run_id: str, story_id: Optional[str] = None) -> int:
+        """
+        Record outcomes of a JUnit XML report (streamed).
+        
+        A testcase with a failure or error child counts as failed; skipped
+        tests are not recorded.
+        """
+        outcomes = {}
+        for _, element in ElementTree.iterparse(path, events=("end",)):
+            if element.tag != "testcase":
+                continue
+            name = element.get("name")
+            children = {child.tag for child in element}
+            if name and "skipped" not in children:
+                try:
+                    duration = float(element.get("time", 0.0))
+                except ValueError:
+                    duration = 0.0
+                outcomes[name] = {
+                    "passed": not children & {"failure", "error"},
+                    "duration_seconds": duration
+                }
+            element.clear()
+        return self.record_run(run_id, outcomes, story_id)
+    
+    def has_run(self, run_id: str) -> bool:
+        """Whether outcomes of run_id were already recorded."""
+        if not self.db_path.exists():
+            return False
+        self._initialize_database()
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute(
+                "SELECT 1 FROM test_runs WHERE run_id = ?", (run_id,)
+            ).fetchone() is not None
+    
+    def failure_statistics(self, test_names: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Decay-weighted failure statistics over recent runs.
+        
+        A run k runs ago weighs 0.5 ** (k / half_life_runs).
+        
+        Args:
+            test_names: Restrict to these tests (default: all with history)
+        
+        Returns:
+            Test name -> failure_rate, runs_seen, failures, mean_duration_seconds
+        """
+        wanted = {outcome_key(name) for name in test_names} if test_names is not None else None
+        stats: Dict[str, Dict[str, float]] = {}
+        
+        for age, run_outcomes in enumerate(self._recent_runs()):
+            weight = 0.5 ** (age / self.half_life_runs)
+            for name, passed, duration in run_outcomes:
+                if wanted is not None and name not in wanted:
+                    continue
+                entry = stats.setdefault(name, {
+                    "weighted_failures": 0.0, "weight": 0.0, "runs_seen": 0,
+                    "failures": 0, "duration_total": 0.0
+                })
+                entry["weight"] += weight
+                entry["runs_seen"] += 1
+                entry["duration_total"] += duration
+                if not passed:
+                    entry["weighted_failures"] += weight
+                    entry["failures"] += 1
+        
+        return {
+            name: {
+                "failure_rate": entry["weighted_failures"] / entry["weight"],
+                "runs_seen": entry["runs_seen"],
+                "failures": entry["failures"],
+                "mean_duration_seconds": entry["duration_total"] / entry["runs_seen"]
+            }
+            for name, entry in stats.items()
+        }
+    
+    def co_failure_clusters(self, test_names: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """
+        Group tests that fail in the same runs.
+        
+        Two tests are linked when the Jaccard similarity of their failing
+        runs reaches co_failure_threshold; clusters are connected components.
+        
+        Returns:
+            Test name -> cluster id (only tests that share a cluster)
+        """
+        wanted = {outcome_key(name) for name in test_names} if test_names is not None else None
+        failing_runs: Dict[str, Set[int]] = defaultdict(set)
+        for run_index, run_outcomes in enumerate(self._recent_runs()):
+            for name, passed, _ in run_outcomes:
+                if not passed and (wanted is None or name in wanted):
+                    failing_runs[name].add(run_index)
+        
+        names = sorted(failing_runs)
+        parent = {name: name for name in names}
+        
+        def find(name: str) -> str:
+            while parent[name] != name:
+                parent[name] = parent[parent[name]]
+                name = parent[name]
+            return name
+        
+        # Only tests that failed in a common run can be linked
+        by_run: Dict[int, List[str]] = defaultdict(list)
+        for name in names:
+            for run_index in failing_runs[name]:
+                by_run[run_index].append(name)
+        candidate_pairs = {
+            (first, second)
+            for members in by_run.values()
+            for i, first in enumerate(members)
+            for second in members[i + 1:]
+        }
+        for first, second in candidate_pairs:
+            shared = len(failing_runs[first] & failing_runs[second])
+            union = len(failing_runs[first] | failing_runs[second])
+            if shared / union >= self.co_failure_threshold:
+                parent[find(first)] = find(second)
+        
+        members_by_root: Dict[str, List[str]] = defaultdict(list)
+        for name in names:
+            members_by_root[find(name)].append(name)
+        
+        clusters = {}
+        for members in members_by_root.values():
+            if len(members) > 1:
+                cluster_id = f"cluster:{min(members)}"
+                for name in members:
+                    clusters[name] = cluster_id
+        return clusters
+    
+    def _recent_runs(self) -> List[List[tuple]]:
+        """Outcomes of the most recent runs, newest first."""
+        if not self.db_path.exists():
+            return []
+        with sqlite3.connect(self.db_path) as conn:
+            run_ids = [row[0] for row in conn.execute(
+                "SELECT run_id FROM test_runs ORDER BY timestamp DESC, rowid DESC LIMIT ?",
+                (self.history_window_runs,)
+            )]
+            if not run_ids:
+                return []
+            outcomes: Dict[str, List[tuple]] = defaultdict(list)
+            placeholders = ",".join("?" for _ in run_ids)
+            for run_id, name, passed, duration in conn.execute(
+                f"SELECT run_id, test_name, passed, duration_seconds FROM test_outcomes WHERE run_id IN ({placeholders})",
+                run_ids
+            ):
+                outcomes[run_id].append((name, bool(passed), duration))
+        return [outcomes[run_id] for run_id in run_ids]
+    
+    def _initialize_database(self) -> None:
+        """Create outcome tables on first write."""
+        if self._initialized:
+            return
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS test_runs (
+                    run_id TEXT PRIMARY KEY,
+                    story_id TEXT,
+                    timestamp TEXT NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS test_outcomes (
+                    run_id TEXT NOT NULL,
+                    test_name TEXT NOT NULL,
+                    passed INTEGER NOT NULL,
+                    duration_seconds REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_test_outcomes_run ON test_outcomes (run_id)")
+            conn.commit()
+        self._initialized = True
@@ -0,0 +1,414 @@
+"""
+TestShardPlanner - Duration-aware sharding of generated test suites.
+
+PURPOSE:
+Splits unit, integration and e2e suites into N shards of balanced
+expected wall-clock time, so the slow persona, accessibility and
+performance scenarios no longer pile up on one CI worker.
+
+CRITICAL CAPABILITIES:
+- Local per-test duration history (exponential moving average)
+- Duration ingestion from JUnit XML (pytest --junitxml, jest-junit, playwright)
+- Fallback estimates from AITestOptimizer complexity for unseen tests
+- Longest-processing-time-first bin packing into N shards
+- Shard manifests for pytest-xdist, jest and playwright workers
+
+CONTRACT PROTECTION:
+Planning only orders and groups tests; every generated test appears in
+exactly one shard.
+"""
+
+import heapq
+import json
+import logging
+import re
+import xml.etree.ElementTree as ElementTree
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Section -> (file name under tests/<level>/<story_id>/, runner)
+SECTION_FILES = {
+    ("integration", "component_tests"): ("components.test.tsx", "jest"),
+    ("integration", "api_tests"): ("api.test.py", "pytest"),
+    ("integration", "contract_validation_tests"): ("contracts.test.js", "jest"),
+    ("e2e", "persona_tests"): ("persona.spec.ts", "playwright"),
+    ("e2e", "accessibility_tests"): ("accessibility.spec.ts", "playwright"),
+    ("e2e", "pedagogical_tests"): ("pedagogical.spec.ts", "playwright"),
+    ("e2e", "performance_tests"): ("performance.spec.ts", "playwright")
+}
+
+# Expected seconds per test when neither history nor complexity is known
+DEFAULT_SECTION_SECONDS = {
+    "unit_tests": 0.5,
+    "component_tests": 2.0,
+    "api_tests": 1.5,
+    "contract_validation_tests": 1.0,
+    "persona_tests": 45.0,
+    "accessibility_tests": 20.0,
+    "pedagogical_tests": 30.0,
+    "performance_tests": 90.0
+}
+
+# AITestOptimizer estimate (minutes) of a MODERATE implementation, the 1.0x baseline
+BASELINE_COMPLEXITY_MINUTES = 4.0
+
+
+def _pytest_function(test_name: str) -> str:
+    """pytest function name of a generated test (generators drop the test_ prefix)."""
+    return test_name if test_name.startswith("test_") else f"test_{test_name}"
+
+
+@dataclass
+class PlannedTest:
+    """One test with its expected duration and where it runs."""
+    test_id: str
+    test_name: str
+    runner: str
+    test_file: str
+    expected_seconds: float
+    duration_source: str  # "history", "complexity_estimate" or "section_default"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "test_id": self.test_id,
+            "test_name": self.test_name,
+            "runner": self.runner,
+            "test_file": self.test_file,
+            "expected_seconds": round(self.expected_seconds, 3),
+            "duration_source": self.duration_source
+        }
+
+
+@dataclass
+class TestShard:
+    """Tests assigned to one CI worker."""
+    index: int
+    tests: List[PlannedTest] = field(default_factory=list)
+    expected_seconds: float = 0.0
+    
+    def manifests(self, xdist_workers: str = "auto") -> Dict[str, Dict[str, Any]]:
+        """Runner -> command and test selection for this shard."""
+        by_runner: Dict[str, List[PlannedTest]] = {}
+        for test in self.tests:
+            by_runner.setdefault(test.runner, []).append(test)
+        
+        manifests = {}
+        for runner, tests in sorted(by_runner.items()):
+            files = sorted({test.test_file for test in tests})
+            names = [test.test_name for test in tests]
+            name_pattern = "^(" + "|".join(re.escape(name) for name in names) + ")$"
+            if runner == "pytest":
+                node_ids = [f"{test.test_file}::{_pytest_function(test.test_name)}" for test in tests]
+                command = ["python", "-m", "pytest", "-p", "xdist", "-n", xdist_workers] + node_ids
+                selection = {"node_ids": node_ids}
+            elif runner == "jest":
+                command = ["npx", "jest", "--runTestsByPath"] + files + ["-t", name_pattern]
+                selection = {"files": files, "test_name_pattern": name_pattern}
+            else:
+                command = ["npx", "playwright", "test"] + files + ["--grep", name_pattern]
+                selection = {"files": files, "grep": name_pattern}
+            manifests[runner] = {
+                "command": command,
+                "tests": [test.test_id for test in tests],
+                "expected_seconds": round(sum(test.expected_seconds for test in tests), 3),
+                **selection
+            }
+        return manifests
+    
+    def to_dict(self, xdist_workers: str = "auto") -> Dict[str, Any]:
+        return {
+            "shard_index": self.index,
+            "test_count": len(self.tests),
+            "expected_seconds": round(self.expected_seconds, 3),
+            "manifests": self.manifests(xdist_workers)
+        }
+
+
+@dataclass
+class ShardPlan:
+    """Balanced split of a story's tests into CI shards."""
+    story_id: str
+    shards: List[TestShard]
+    xdist_workers: str = "auto"
+    test_ordering: str = "longest_first"
+    
+    @property
+    def makespan_seconds(self) -> float:
+        """Expected CI wall-clock: duration of the heaviest shard."""
+        return max((shard.expected_seconds for shard in self.shards), default=0.0)
+    
+    @property
+    def total_seconds(self) -> float:
+        return sum(shard.expected_seconds for shard in self.shards)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        total = self.total_seconds
+        sources: Dict[str, int] = {}
+        for shard in self.shards:
+            for test in shard.tests:
+                sources[test.duration_source] = sources.get(test.duration_source, 0) + 1
+        return {
+            "story_id": self.story_id,
+            "shard_count": len(self.shards),
+            "total_tests": sum(len(shard.tests) for shard in self.shards),
+            "expected_total_seconds": round(total, 3),
+            "expected_wall_clock_seconds": round(self.makespan_seconds, 3),
+            "balance_ratio": round(total / (self.makespan_seconds * len(self.shards)), 3) if self.makespan_seconds else 1.0,
+            "duration_sources": sources,
+            "test_ordering": self.test_ordering,
+            "shards": [shard.to_dict(self.xdist_workers) for shard in self.shards]
+        }
+
+
+class TestShardPlanner:
+    """
+    Duration-aware test shard planner.
+    
+    WORKFLOW:
+    1. Collect tests of unit, integration and e2e suites with runner and file
+    2. Look up expected duration: history, then complexity estimate, then section default
+    3. Assign longest tests first to the currently lightest shard
+    4. Emit per-shard manifests for each runner
+    5. Record measured durations after CI runs to sharpen the next plan
+    """
+    
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize TestShardPlanner.
+        
+        Args:
+            config: Optional configuration dictionary
+        """
+        self.config = config or {}
+        
+        self.shard_count = self.config.get("test_shard_count", 4)
+        self.xdist_workers = str(self.config.get("xdist_workers", "auto"))
+        self.smoothing = self.config.get("duration_smoothing", 0.3)
+        self.section_seconds = {**DEFAULT_SECTION_SECONDS, **self.config.get("default_test_seconds", {})}
+        
+        # Optional JSON file keeping durations between runs
+        history_path = self.config.get("test_duration_history_path")
+        self.history_path = Path(history_path) if history_path else None
+        
+        # test name -> {"seconds": EMA, "samples": count}
+        self.duration_history: Dict[str, Dict[str, float]] = self._load_history()
+        
+        self.logger = logging.getLogger(f"{__name__}.TestShardPlanner")
+        self.logger.info("TestShardPlanner initialized successfully")
+    
+    def plan_shards(
+        self,
+        story_id: str,
+        integration_test_suite: Optional[Dict[str, Any]] = None,
+        e2e_test_suite: Optional[Dict[str, Any]] = None,
+        unit_test_suite: Optional[Dict[str, Any]] = None,
+        test_priorities: Optional[Iterable[Any]] = None,
+        shard_count: Optional[int] = None
+    ) -> ShardPlan:
+        """
+        Split suites into balanced shards.
+        
+        Args:
+            story_id: Story identifier
+            integration_test_suite: Suite from TestGenerator.generate_integration_tests
+            e2e_test_suite: Suite from TestGenerator.generate_e2e_tests
+            unit_test_suite: Suite from CodeGenerator.generate_tests
+            test_priorities: AITestOptimizer TestPriority entries for fallback estimates
+            shard_count: Number of shards (default from config)
+        
+        Returns:
+            ShardPlan with every test in exactly one shard
+        """
+        tests = self.plan_tests(story_id, integration_test_suite, e2e_test_suite, unit_test_suite, test_priorities)
+        return self.shard_tests(story_id, tests, shard_count)
+    
+    def plan_tests(
+        self,
+        story_id: str,
+        integration_test_suite: Optional[Dict[str, Any]] = None,
+        e2e_test_suite: Optional[Dict[str, Any]] = None,
+        unit_test_suite: Optional[Dict[str, Any]] = None,
+        test_priorities: Optional[Iterable[Any]] = None
+    ) -> List[PlannedTest]:
+        """Every test of the suites with runner, file and expected duration."""
+        complexity_factors = self._complexity_factors(test_priorities or [])
+        return [
+            self._plan_test(test_id, test_name, section, runner, test_file, exercises, complexity_factors)
+            for test_id, test_name, section, runner, test_file, exercises in self._collect_tests(
+                story_id, unit_test_suite, integration_test_suite, e2e_test_suite
+            )
+        ]
+    
+    def shard_tests(
+        self,
+        story_id: str,
+        tests: List[PlannedTest],
+        shard_count: Optional[int] = None,
+        execution_rank: Optional[Dict[str, int]] = None
+    ) -> ShardPlan:
+        """
+        Bin-pack planned tests into shards.
+        
+        Args:
+            story_id: Story identifier
+            tests: Tests from plan_tests
+            shard_count: Number of shards (default from config)
+            execution_rank: Test id -> position in a prioritized order; tests
+                inside each shard run in that order (default: longest first)
+        
+        Returns:
+            ShardPlan with every test in exactly one shard
+        """
+        count = max(1, shard_count or self.shard_count)
+        shards = [TestShard(index) for index in range(count)]
+        
+        # Longest processing time first onto the lightest shard
+        heap: List[Tuple[float, int]] = [(0.0, index) for index in range(count)]
+        for test in sorted(tests, key=lambda planned: (-planned.expected_seconds, planned.test_id)):
+            load, index = heapq.heappop(heap)
+            shards[index].tests.append(test)
+            shards[index].expected_seconds = load + test.expected_seconds
+            heapq.heappush(heap, (shards[index].expected_seconds, index))
+        
+        if execution_rank:
+            last = len(execution_rank)
+            for shard in shards:
+                shard.tests.sort(key=lambda planned: execution_rank.get(planned.test_id, last))
+        
+        plan = ShardPlan(
+            story_id, shards, self.xdist_workers,
+            test_ordering="prioritized" if execution_rank else "longest_first"
+        )
+        self.logger.info(
+            f"Planned {len(tests)} tests for {story_id} into {count} shards: "
+            f"expected wall clock {plan.makespan_seconds:.1f}s of {plan.total_seconds:.1f}s total"
+        )
+        return plan
+    
+    def record_durations(self, durations: Dict[str, float]) -> None:
+        """
+        Fold measured durations into history.
+        
+        Args:
+            durations: Test name -> measured seconds
+        """
+        for test_name, seconds in durations.items():
+            key = self._history_key(test_name)
+            entry = self.duration_history.get(key)
+            if entry is None:
+                self.duration_history[key] = {"seconds": float(seconds), "samples": 1}
+            else:
+                entry["seconds"] += self.smoothing * (float(seconds) - entry["seconds"])
+                entry["samples"] += 1
+        self._save_history()
+    
+    def ingest_junit_report(self, path: str) -> int:
+        """
+        Record durations from a JUnit XML report (streamed).
+        
+        Returns:
+            Number of test cases recorded
+        """
+        durations = {}
+        for _, element in ElementTree.iterparse(path, events=("end",)):
+            if element.tag == "testcase":
+                name = element.get("name")
+                try:
+                    seconds = float(element.get("time", ""))
+                except ValueError:
+                    seconds = None
+                if name and seconds is not None:
+                    durations[name] = seconds
+                element.clear()
+        self.record_durations(durations)
+        return len(durations)
+    
+    def _collect_tests(
+        self,
+        story_id: str,
+        unit_test_suite: Optional[Dict[str, Any]],
+        integration_test_suite: Optional[Dict[str, Any]],
+        e2e_test_suite: Optional[Dict[str, Any]]
+    ) -> Iterable[Tuple[str, str, str, str, str, List[str]]]:
+        """Yield (test id, name, section, runner, file, exercised units) for every test."""
+        for unit_test in (unit_test_suite or {}).get("unit_tests", []):
+            test_file = unit_test.get("test_file", f"tests/unit/{story_id}")
+            runner = "pytest" if test_file.endswith(".py") else "jest"
+            owner = unit_test.get("component_name") or unit_test.get("api_name", "unknown")
+            exercises = [f"component:{owner}" if "component_name" in unit_test else f"api:{owner}"]
+            for test_name in unit_test.get("test_cases", []):
+                yield f"unit/{owner}/{test_name}", test_name, "unit_tests", runner, test_file, exercises
+        
+        for level, suite in (("integration", integration_test_suite), ("e2e", e2e_test_suite)):
+            if not isinstance(suite, dict):
+                continue
+            list_key = "test_cases" if level == "integration" else "scenarios"
+            for (suite_level, section), (file_name, runner) in SECTION_FILES.items():
+                if suite_level != level or not isinstance(suite.get(section), dict):
+                    continue
+                test_file = f"tests/{level}/{story_id}/{file_name}"
+                for test in suite[section].get(list_key, []):
+                    test_name = test.get("test_name") or test.get("scenario_name", "unnamed")
+                    yield (
+                        f"{level}/{section}/{test_name}", test_name, section, runner, test_file,
+                        list(test.get("exercises", []))
+                    )
+    
+    def _plan_test(
+        self,
+        test_id: str,
+        test_name: str,
+        section: str,
+        runner: str,
+        test_file: str,
+        exercises: List[str],
+        complexity_factors: Dict[str, float]
+    ) -> PlannedTest:
+        history = self.duration_history.get(self._history_key(test_name))
+        if history:
+            seconds, source = history["seconds"], "history"
+        else:
+            factors = [complexity_factors[unit] for unit in exercises if unit in complexity_factors]
+            base = self.section_seconds.get(section, 1.0)
+            if factors:
+                seconds, source = base * max(factors), "complexity_estimate"
+            else:
+                seconds, source = base, "section_default"
+        return PlannedTest(test_id, test_name, runner, test_file, seconds, source)
+    
+    def _complexity_factors(self, test_priorities: Iterable[Any]) -> Dict[str, float]:
+        """Unit id -> duration multiplier from AITestOptimizer execution time estimates."""
+        factors = {}
+        for priority in test_priorities:
+            if isinstance(priority, dict):
+                case_id = priority.get("test_case_id", "")
+                minutes = priority.get("estimated_execution_time_minutes")
+            else:
+                case_id = getattr(priority, "test_case_id", "")
+                minutes = getattr(priority, "estimated_execution_time_minutes", None)
+            kind, _, name = case_id.partition("_")
+            if kind in ("component", "api") and name and minutes:
+                factors[f"{kind}:{name}"] = float(minutes) / BASELINE_COMPLEXITY_MINUTES
+        return factors
+    
+    def _history_key(self, test_name: str) -> str:
+        """History key of a test: its name without pytest's test_ prefix."""
+        return test_name[5:] if test_name.startswith("test_") else test_name
+    
+    def _load_history(self) -> Dict[str, Dict[str, float]]:
+        if self.history_path is None or not self.history_path.exists():
+            return {}
+        try:
+            return json.loads(self.history_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable test duration history {self.history_path}: {e}")
+            return {}
+    
+    def _save_history(self) -> None:
+        if self.history_path is None:
+            return
+        self.history_path.parent.mkdir(parents=True, exist_ok=True)
+        self.history_path.write_text(json.dumps(self.duration_history, indent=2, sort_keys=True), encoding="utf-8")
@@ -0,0 +1,291 @@
+"""
+ArtifactWriter - Shared asynchronous artifact writing for DigiNativa AI agents.
+
+PURPOSE:
+Gives every agent one place to persist documentation, reports and metadata
+without blocking the event loop on file I/O.
+
+CRITICAL IMPORTANCE:
+- Writes run on worker threads, never on the event loop
+- JSON is serialized with orjson (2-space indent, UTF-8)
+- Files are replaced atomically (temp file + rename), so readers never see partial artifacts
+- Writes whose content hash matches the file on disk are skipped
+- Repeated writes to a path that has not been written yet coalesce into one
+- Bytes written, files skipped and writes coalesced are tracked per agent
+
+ADAPTATION GUIDE:
+🔧 To adapt for your project:
+1. Declare artifact_writer = LazyTool("modules.shared.artifact_writer.ArtifactWriter", pass_config=False)
+   on agents, or call get_artifact_writer() from tools
+2. await write_text / write_json; gather them to write a story's artifacts concurrently
+3. Read statistics() for per-agent I/O reporting
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import uuid
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import orjson
+
+from .lazy_tools import get_shared_instance
+
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_WRITER_TARGET = "modules.shared.artifact_writer.ArtifactWriter"
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+def json_default(value: Any) -> Any:
+    """
+    orjson fallback for types it does not serialize natively.
+    
+    Lazily serialized sequences (e.g. columnar QA result records) become
+    lists; anything else is serialized via str.
+    """
+    if isinstance(value, Sequence) and not isinstance(value, (str, bytes, bytearray)):
+        return list(value)
+    return str(value)
+
+
+def dump_json(data: Any) -> bytes:
+    """Serialize artifact data as indented UTF-8 JSON (unknown types via json_default)."""
+    return orjson.dumps(data, default=json_default, option=JSON_OPTIONS)
+
+
+def get_artifact_writer() -> "ArtifactWriter":
+    """Process-wide writer (the same instance LazyTool declarations receive)."""
+    return get_shared_instance(ARTIFACT_WRITER_TARGET, ArtifactWriter)
+
+
+class _PendingWrite:
+    """Latest content queued for a path, and everyone waiting on it."""
+    
+    __slots__ = ("data", "agent_id", "story_id", "loop", "waiters")
+    
+    def __init__(self, data: bytes, agent_id: str, story_id: Optional[str], loop: asyncio.AbstractEventLoop):
+        self.data = data
+        self.agent_id = agent_id
+        self.story_id = story_id
+        self.loop = loop
+        self.waiters: List[asyncio.Future] = []
+
+
+class ArtifactWriter:
+    """
+    Queued, atomic, skip-if-unchanged artifact writer.
+    
+    Each path has at most one queued write. A write submitted while an
+    earlier one for the same path is still queued replaces its content,
+    and all callers resolve when the final content lands. Writes to
+    different paths proceed concurrently.
+    """
+    
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize ArtifactWriter.
+        
+        Args:
+            config: Optional configuration dictionary
+        """
+        self.config = config or {}
+        self.fsync = self.config.get("artifact_fsync", False)
+        
+        self._pending: Dict[str, _PendingWrite] = {}
+        self._tasks: Dict[str, Tuple[asyncio.Task, Optional[str]]] = {}
+        
+        # Path -> (mtime_ns, size, sha256) of content this writer last saw on disk
+        self._disk_state: Dict[str, Tuple[int, int, str]] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+        
+        self.logger = logging.getLogger(f"{__name__}.ArtifactWriter")
+    
+    async def write_text(
+        self,
+        path: Union[str, Path],
+        content: str,
+        agent_id: str = "unknown",
+        story_id: Optional[str] = None
+    ) -> bool:
+        """
+        Write text artifact (UTF-8).
+        
+        Returns:
+            True if the file changed on disk, False if identical content was already there
+        """
+        return await self.write_bytes(path, content.encode("utf-8"), agent_id, story_id)
+    
+    async def write_json(
+        self,
+        path: Union[str, Path],
+        data: Any,
+        agent_id: str = "unknown",
+        story_id: Optional[str] = None
+    ) -> bool:
+        """
+        Write JSON artifact.
+        
+        Returns:
+            True if the file changed on disk, False if identical content was already there
+        """
+        return await self.write_bytes(path, dump_json(data), agent_id, story_id)
+    
+    async def write_bytes(
+        self,
+        path: Union[str, Path],
+        data: bytes,
+        agent_id: str = "unknown",
+        story_id: Optional[str] = None
+    ) -> bool:
+        """Write raw artifact bytes; see write_text."""
+        return await self.submit(path, data, agent_id, story_id)
+    
+    def submit(
+        self,
+        path: Union[str, Path],
+        data: bytes,
+        agent_id: str = "unknown",
+        story_id: Optional[str] = None
+    ) -> asyncio.Future:
+        """
+        Queue write without waiting for it.
+        
+        Returns:
+            Future resolving to whether the file changed (see write_text)
+        """
+        loop = asyncio.get_running_loop()
+        key = os.path.abspath(path)
+        waiter = loop.create_future()
+        
+        pending = self._pending.get(key)
+        if pending is not None and pending.loop is loop:
+            pending.data = data
+            pending.agent_id = agent_id
+            pending.story_id = story_id
+            pending.waiters.append(waiter)
+            self._count(agent_id, "writes_coalesced")
+            return waiter
+        
+        pending = _PendingWrite(data, agent_id, story_id, loop)
+        pending.waiters.append(waiter)
+        self._pending[key] = pending
+        
+        previous = self._tasks.get(key)
+        previous_task = previous[0] if previous and previous[0].get_loop() is loop else None
+        task = loop.create_task(self._drain(key, pending, previous_task))
+        self._tasks[key] = (task, story_id)
+        task.add_done_callback(lambda done, key=key: self._forget_task(key, done))
+        return waiter
+    
+    async def flush(self, story_id: Optional[str] = None) -> None:
+        """Wait for queued writes (of one story, or all) to land."""
+        loop = asyncio.get_running_loop()
+        tasks = [
+            task for task, task_story in list(self._tasks.values())
+            if task.get_loop() is loop and (story_id is None or task_story == story_id)
+        ]
+        if tasks:
+            await asyncio.wait(tasks)
+    
+    def statistics(self, agent_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Per-agent write statistics.
+        
+        Returns:
+            agent_id -> bytes_written, files_written, files_skipped, writes_coalesced
+            (a single agent's counters when agent_id is given)
+        """
+        with self._lock:
+            if agent_id is not None:
+                return dict(self._stats.get(agent_id, self._empty_stats()))
+            return {agent: dict(stats) for agent, stats in self._stats.items()}
+    
+    async def _drain(self, key: str, pending: _PendingWrite, previous: Optional[asyncio.Task]) -> None:
+        # Let writes issued in the same tick coalesce, and keep writes to one path ordered
+        if previous is not None:
+            await asyncio.wait([previous])
+        else:
+            await asyncio.sleep(0)
+        if self._pending.get(key) is pending:
+            del self._pending[key]
+        
+        try:
+            written = await asyncio.to_thread(self._write_file, key, pending.data)
+        except Exception as e:
+            self.logger.error(f"Failed to write artifact {key}: {e}")
+            for waiter in pending.waiters:
+                if not waiter.done():
+                    waiter.set_exception(e)
+            return
+        
+        if written:
+            self._count(pending.agent_id, "files_written")
+            self._count(pending.agent_id, "bytes_written", len(pending.data))
+        else:
+            self._count(pending.agent_id, "files_skipped")
+        for waiter in pending.waiters:
+            if not waiter.done():
+                waiter.set_result(written)
+    
+    def _write_file(self, key: str, data: bytes) -> bool:
+        """Atomically replace file with data unless it already holds it (worker thread)."""
+        path = Path(key)
+        digest = hashlib.sha256(data).hexdigest()
+        
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            stat = None
+        if stat is not None and stat.st_size == len(data):
+            with self._lock:
+                known = self._disk_state.get(key)
+            if known is not None and known[:2] == (stat.st_mtime_ns, stat.st_size):
+                on_disk = known[2]
+            else:
+                on_disk = hashlib.sha256(path.read_bytes()).hexdigest()
+            if on_disk == digest:
+                with self._lock:
+                    self._disk_state[key] = (stat.st_mtime_ns, stat.st_size, digest)
+                return False
+        
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with open(temp_path, "xb") as f:
+                f.write(data)
+                if self.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+        
+        stat = path.stat()
+        with self._lock:
+            self._disk_state[key] = (stat.st_mtime_ns, stat.st_size, digest)
+        return True
+    
+    def _forget_task(self, key: str, task: asyncio.Task) -> None:
+        current = self._tasks.get(key)
+        if current is not None and current[0] is task:
+            del self._tasks[key]
+    
+    def _count(self, agent_id: str, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(agent_id, self._empty_stats())
+            stats[counter] += amount
+    
+    @staticmethod
+    def _empty_stats() -> Dict[str, int]:
+        return {"bytes_written": 0, "files_written": 0, "files_skipped": 0, "writes_coalesced": 0}
@@ -35,6 +35,7 @@ from dataclasses import dataclass, asdict
 
 # Import our critical shared components
 from .contract_validator import ContractValidator, ValidationResult, ContractValidationError
+from .lazy_tools import LazyTool, get_shared_instance
 from .exceptions import (
     DNAComplianceError, AgentExecutionError, StateManagementError,
     QualityGateError, HandoffError
@@ -106,6 +107,9 @@ class BaseAgent(ABC):
     NEVER skip the validation methods - they protect system integrity.
     """
     
+    # Content-addressed store for large contract payloads (code, full reports)
+    blob_store = LazyTool("modules.shared.blob_store.BlobStore", config_key="blob_store")
+    
     def __init__(self, agent_id: str, agent_type: str, config: Optional[Dict[str, Any]] = None):
         """
         Initialize the base agent.
@@ -139,7 +143,10 @@ class BaseAgent(ABC):
         
         # Initialize critical system components
         try:
-            self.contract_validator = ContractValidator()
+            # Validator is stateless after schema load - one per process is enough
+            self.contract_validator = get_shared_instance(
+                "modules.shared.contract_validator.ContractValidator", ContractValidator
+            )
             self.logger.info("ContractValidator initialized successfully")
         except Exception as e:
             self.logger.error(f"Failed to initialize ContractValidator: {e}")
@@ -239,7 +246,7 @@ class BaseAgent(ABC):
             
             # Step 1: Validate input contract
             self.logger.debug("Validating input contract")
-            validation_result = self.contract_validator.validate_contract(input_contract)
+            validation_result = self.contract_validator.validate_contract(input_contract, blob_store=self.blob_store)
             
             if not validation_result.is_valid:
                 error_msg = f"Input contract validation failed: {validation_result.errors}"
@@ -281,7 +288,7 @@ class BaseAgent(ABC):
             
             # Step 6: Validate output contract structure
             self.logger.debug("Validating output contract")
-            output_validation = self.contract_validator.validate_contract(output_contract)
+            output_validation = self.contract_validator.validate_contract(output_contract, blob_store=self.blob_store)
             
             if not output_validation.is_valid:
                 error_msg = f"Output contract validation failed: {output_validation.errors}"
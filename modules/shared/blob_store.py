@@ -0,0 +1,323 @@
+"""
+BlobStore - Content-addressed storage for large contract payloads.
+
+PURPOSE:
+Lets contracts carry small references instead of generated source code and
+full result lists, so handoffs, validation and persisted agent states stay
+kilobytes in size while the payload is stored once per distinct content.
+
+CRITICAL IMPORTANCE:
+- Blobs are addressed by sha256 of their content (identical content stored once)
+- Sharded directory layout (data/blobs/ab/abcdef...), atomic writes
+- Optional zstd compression (blob_compression: "zstd"); reads detect the format
+- References are plain JSON: {"$blob": "<sha256>", "size": n, "media_type": "..."}
+- Downstream agents load payloads lazily through LazyBlobDict
+- Bounded in-memory cache of recently loaded blobs
+
+ADAPTATION GUIDE:
+🔧 To adapt for your project:
+1. Configure blob_store_path, blob_compression and min_blob_bytes in the agent's "blob_store" config
+2. externalize() contract sections before handoff (choose which keys move to blobs)
+3. lazy() received sections so tools read values as if they were inline
+"""
+
+import copy
+import hashlib
+import logging
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
+
+import orjson
+
+from .artifact_writer import json_default
+from .exceptions import ConfigurationError, StateManagementError
+
+
+logger = logging.getLogger(__name__)
+
+BLOB_REF_KEY = "$blob"
+TEXT_MEDIA_TYPE = "text/plain; charset=utf-8"
+JSON_MEDIA_TYPE = "application/json"
+
+# Contract keys whose string values (or dict of strings) hold generated source
+CODE_FIELDS = frozenset({"code", "test_code"})
+
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def is_blob_ref(value: Any) -> bool:
+    """Whether value is a blob reference."""
+    return isinstance(value, dict) and isinstance(value.get(BLOB_REF_KEY), str)
+
+
+def iter_blob_refs(value: Any) -> Iterable[Dict[str, Any]]:
+    """Yield every blob reference inside a contract structure."""
+    stack = [value]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            if BLOB_REF_KEY in current:
+                yield current
+                continue
+            stack.extend(dict.values(current))
+        elif isinstance(current, (list, tuple)):
+            stack.extend(current)
+
+
+class LazyBlobDict(dict):
+    """
+    Dict whose blob reference values load on item access.
+    
+    Reading through [] or get() returns the stored text or JSON value;
+    the dict itself keeps only references, so serializing, copying or
+    persisting it never inlines the payload.
+    """
+    
+    def __init__(self, data: Any = (), store: Optional["BlobStore"] = None):
+        super().__init__(data)
+        self._store = store
+    
+    def __getitem__(self, key: Any) -> Any:
+        value = super().__getitem__(key)
+        if self._store is not None and is_blob_ref(value):
+            return self._store.resolve(value)
+        return value
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self[key] if key in self else default
+    
+    def resolved(self) -> Dict[str, Any]:
+        """Plain dict with every direct reference loaded."""
+        return {key: self[key] for key in self}
+    
+    def __repr__(self) -> str:
+        return repr(self.resolved())
+    
+    def __copy__(self) -> "LazyBlobDict":
+        return LazyBlobDict(dict.items(self), self._store)
+    
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "LazyBlobDict":
+        return LazyBlobDict(copy.deepcopy(dict(dict.items(self)), memo), self._store)
+
+
+class BlobStore:
+    """
+    Local content-addressed blob store.
+    
+    Blobs are immutable: a put of content already present only returns its
+    reference. Each stored file is verified against its digest on load.
+    """
+    
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize BlobStore.
+        
+        Args:
+            config: Optional configuration dictionary
+        """
+        self.config = config or {}
+        self.root = Path(self.config.get("blob_store_path", "data/blobs"))
+        self.compression = self.config.get("blob_compression")
+        self.compression_level = self.config.get("blob_compression_level", 3)
+        
+        # Strings shorter than this stay inline in contracts
+        self.min_blob_bytes = self.config.get("min_blob_bytes", 1024)
+        
+        if self.compression not in (None, "zstd"):
+            raise ConfigurationError(
+                f"Unsupported blob compression: {self.compression}",
+                config_section="blob_store", invalid_fields=["blob_compression"]
+            )
+        
+        # Recently loaded blobs (digest -> bytes), bounded by total size
+        self.cache_bytes = self.config.get("blob_cache_bytes", 8 * 1024 * 1024)
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._cached_size = 0
+        self._lock = threading.Lock()
+        
+        self.logger = logging.getLogger(f"{__name__}.BlobStore")
+    
+    def put_bytes(self, data: bytes, media_type: str = "application/octet-stream") -> Dict[str, Any]:
+        """
+        Store bytes.
+        
+        Returns:
+            Blob reference
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        if not path.exists():
+            payload = self._compress(data) if self.compression == "zstd" else data
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_name(f".{digest}.{uuid.uuid4().hex}.tmp")
+            with open(temp_path, "wb") as f:
+                f.write(payload)
+            os.replace(temp_path, path)
+        return {BLOB_REF_KEY: digest, "size": len(data), "media_type": media_type}
+    
+    def put_text(self, text: str) -> Dict[str, Any]:
+        """Store text (UTF-8)."""
+        return self.put_bytes(text.encode("utf-8"), TEXT_MEDIA_TYPE)
+    
+    def put_json(self, value: Any) -> Dict[str, Any]:
+        """Store JSON-serializable value."""
+        return self.put_bytes(orjson.dumps(value, default=json_default, option=orjson.OPT_NON_STR_KEYS), JSON_MEDIA_TYPE)
+    
+    def get_bytes(self, ref: Dict[str, Any]) -> bytes:
+        """
+        Load blob content.
+        
+        Raises:
+            StateManagementError: If the blob is missing or corrupted
+        """
+        digest = ref[BLOB_REF_KEY]
+        with self._lock:
+            data = self._cache.get(digest)
+            if data is not None:
+                self._cache.move_to_end(digest)
+                return data
+        
+        try:
+            payload = self._blob_path(digest).read_bytes()
+        except (OSError, ValueError) as e:
+            raise StateManagementError(f"Blob {digest} not found: {e}", operation="blob_load")
+        data = self._decompress(payload) if payload.startswith(ZSTD_MAGIC) else payload
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise StateManagementError(f"Blob {digest} failed integrity check", operation="blob_load")
+        
+        self._remember(digest, data)
+        return data
+    
+    def resolve(self, ref: Dict[str, Any]) -> Any:
+        """Load reference as text, or as parsed value for JSON blobs."""
+        data = self.get_bytes(ref)
+        if ref.get("media_type") == JSON_MEDIA_TYPE:
+            return orjson.loads(data)
+        if ref.get("media_type", TEXT_MEDIA_TYPE).startswith("text/"):
+            return data.decode("utf-8")
+        return data
+    
+    def exists(self, ref: Dict[str, Any]) -> bool:
+        """Whether referenced blob is stored."""
+        try:
+            return self._blob_path(ref[BLOB_REF_KEY]).exists()
+        except ValueError:
+            return False
+    
+    def externalize(self, value: Any, fields: Iterable[str] = CODE_FIELDS) -> Any:
+        """
+        Copy of value with large strings under the given keys moved to blobs.
+        
+        A field's value may be a string or a dict of strings (e.g. the
+        "code" dict of a generated component); strings shorter than
+        min_blob_bytes stay inline.
+        
+        Args:
+            value: Contract section (dicts and lists)
+            fields: Keys whose contents are externalized
+        
+        Returns:
+            Structure with blob references in place of large strings
+        """
+        fields = frozenset(fields)
+        
+        def walk(current: Any) -> Any:
+            if isinstance(current, dict):
+                if is_blob_ref(current):
+                    return current
+                result = {}
+                for key, item in dict.items(current):
+                    if key in fields and isinstance(item, str):
+                        result[key] = self._text_ref(item)
+                    elif key in fields and isinstance(item, dict):
+                        result[key] = {
+                            part: self._text_ref(text) if isinstance(text, str) else walk(text)
+                            for part, text in dict.items(item)
+                        }
+                    else:
+                        result[key] = walk(item)
+                return result
+            if isinstance(current, list):
+                return [walk(item) for item in current]
+            return current
+        
+        return walk(value)
+    
+    def lazy(self, value: Any) -> Any:
+        """
+        Wrap dicts holding blob references so their values load on access.
+        
+        Args:
+            value: Contract section received from another agent
+        
+        Returns:
+            Equivalent structure; dicts with direct references become LazyBlobDict
+        """
+        if isinstance(value, dict):
+            if is_blob_ref(value):
+                return value
+            items = {key: self.lazy(item) for key, item in dict.items(value)}
+            if any(is_blob_ref(item) for item in items.values()):
+                return LazyBlobDict(items, self)
+            return items
+        if isinstance(value, list):
+            return [self.lazy(item) for item in value]
+        return value
+    
+    def reference_errors(self, value: Any) -> List[str]:
+        """Malformed or dangling references inside a contract structure."""
+        errors = []
+        seen: Set[str] = set()
+        for ref in iter_blob_refs(value):
+            digest = ref.get(BLOB_REF_KEY)
+            if not isinstance(digest, str) or len(digest) != 64 or not all(c in "0123456789abcdef" for c in digest):
+                errors.append(f"Malformed blob reference: {digest!r}")
+            elif digest not in seen:
+                seen.add(digest)
+                if not self.exists(ref):
+                    errors.append(f"Blob reference {digest} not found in blob store")
+        return errors
+    
+    def _text_ref(self, text: str) -> Union[str, Dict[str, Any]]:
+        if len(text) < self.min_blob_bytes:
+            return text
+        return self.put_text(text)
+    
+    def _blob_path(self, digest: str) -> Path:
+        if len(digest) != 64 or not all(c in "0123456789abcdef" for c in digest):
+            raise ValueError(f"Invalid blob digest: {digest!r}")
+        return self.root / digest[:2] / digest
+    
+    def _remember(self, digest: str, data: bytes) -> None:
+        if len(data) > self.cache_bytes:
+            return
+        with self._lock:
+            if digest in self._cache:
+                return
+            self._cache[digest] = data
+            self._cached_size += len(data)
+            while self._cached_size > self.cache_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self._cached_size -= len(evicted)
+    
+    def _compress(self, data: bytes) -> bytes:
+        return self._zstd().ZstdCompressor(level=self.compression_level).compress(data)
+    
+    def _decompress(self, payload: bytes) -> bytes:
+        return self._zstd().ZstdDecompressor().decompress(payload)
+    
+    @staticmethod
+    def _zstd():
+        # Imported only when zstd blobs are written or read
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ConfigurationError(
+                f"zstd blob compression requires the zstandard package: {e}",
+                config_section="blob_store", invalid_fields=["blob_compression"]
+            )
+        return zstandard
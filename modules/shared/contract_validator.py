@@ -21,13 +21,15 @@ ADAPTATION GUIDE:
 """
 
 import json
-import jsonschema
 import logging
-from typing import Dict, List, Any, Optional, Set
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Set
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass
 
+if TYPE_CHECKING:
+    import jsonschema
+
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -200,7 +202,7 @@ class ContractValidator:
             self.logger.error(f"Unexpected error loading schema {self.schema_path}: {e}")
             raise
     
-    def validate_contract(self, contract: Dict[str, Any]) -> ValidationResult:
+    def validate_contract(self, contract: Dict[str, Any], blob_store: Optional[Any] = None) -> ValidationResult:
         """
         Complete contract validation including schema, business rules, and DNA compliance.
         
@@ -209,6 +211,7 @@ class ContractValidator:
         
         Args:
             contract: The contract dictionary to validate
+            blob_store: BlobStore that blob references in the contract must resolve against
             
         Returns:
             ValidationResult with validation status, errors, and warnings
@@ -236,6 +239,10 @@ class ContractValidator:
             quality_warnings = self._validate_quality_gates(contract)
             warnings.extend(quality_warnings)
             
+            # 5. Blob references must be well-formed and stored
+            if blob_store is not None:
+                errors.extend(blob_store.reference_errors(contract))
+            
             # Create validation result
             result = ValidationResult(
                 is_valid=len(errors) == 0,
@@ -275,6 +282,9 @@ class ContractValidator:
         """
         errors = []
         
+        # Imported on first validation - jsonschema dominates agent import time
+        import jsonschema
+        
         try:
             # Perform JSON schema validation
             jsonschema.validate(instance=contract, schema=self.schema)
@@ -306,7 +316,7 @@ class ContractValidator:
         
         return errors
     
-    def _format_validation_error(self, error: jsonschema.ValidationError) -> str:
+    def _format_validation_error(self, error: "jsonschema.ValidationError") -> str:
         """
         Format a jsonschema ValidationError into a human-readable error message.
         
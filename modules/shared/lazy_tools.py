@@ -0,0 +1,169 @@
+"""
+LazyTool - On-demand tool construction for DigiNativa AI agents.
+
+PURPOSE:
+Lets agents declare their tools as class attributes that import the tool
+module and construct the tool on first use, instead of building every tool
+(and its static tables) in __init__.
+
+CRITICAL IMPORTANCE:
+- Short-lived CLI runs only pay for the tools they actually touch
+- Tools with identical configuration are shared across agents in a process
+- Tests can still replace tools per agent instance (plain attribute assignment)
+
+ADAPTATION GUIDE:
+🔧 To adapt for your project:
+1. Declare tools with LazyTool(".tools.module.ClassName") on the agent class
+2. Use config_key to pass a config sub-section, or pass_config=False for no-arg tools
+3. Set shared=False for tools that must never be shared between agents
+"""
+
+import importlib
+import json
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# Marker for "pass the agent's full config positionally"
+FULL_CONFIG = object()
+
+_shared_instances: Dict[Tuple[str, str], Any] = {}
+_shared_lock = threading.RLock()
+
+
+def resolve_class(target: str, package: Optional[str] = None) -> type:
+    """
+    Import module and return class named by dotted target.
+    
+    Args:
+        target: "module.path.ClassName", relative targets start with "."
+        package: Package relative targets resolve against
+    
+    Returns:
+        Resolved class
+    """
+    module_name, _, class_name = target.rpartition(".")
+    module = importlib.import_module(module_name, package)
+    return getattr(module, class_name)
+
+
+def get_shared_instance(target: str, factory, config: Any = None) -> Any:
+    """
+    Get process-wide instance for target and configuration.
+    
+    Args:
+        target: Absolute class target used as registry key
+        factory: Zero-argument callable building the instance
+        config: Configuration the instance is built with (part of key)
+    
+    Returns:
+        Shared instance
+    """
+    key = (target, _config_key(config))
+    instance = _shared_instances.get(key)
+    if instance is not None:
+        return instance
+    
+    with _shared_lock:
+        instance = _shared_instances.get(key)
+        if instance is None:
+            instance = factory()
+            _shared_instances[key] = instance
+            logger.debug(f"Constructed shared {target}")
+    return instance
+
+
+def clear_shared_instances() -> None:
+    """Drop all shared instances (used by tests and long-running reloads)."""
+    with _shared_lock:
+        _shared_instances.clear()
+
+
+def _config_key(config: Any) -> str:
+    try:
+        return json.dumps(config, sort_keys=True, default=repr)
+    except (TypeError, ValueError):
+        return repr(config)
+
+
+class LazyTool:
+    """
+    Descriptor that constructs a tool on first attribute access.
+    
+    The built tool is stored in the instance __dict__, so later reads are
+    plain attribute lookups and assignment (e.g. tests installing a mock)
+    replaces it for that instance only.
+    """
+    
+    def __init__(
+        self,
+        target: str,
+        config_key: Any = FULL_CONFIG,
+        pass_config: bool = True,
+        shared: bool = True
+    ):
+        """
+        Declare lazily constructed tool.
+        
+        Args:
+            target: Class target, relative to the declaring module's package when it starts with "."
+            config_key: Agent config section passed as config= (FULL_CONFIG passes whole config positionally)
+            pass_config: Whether the tool constructor takes a config at all
+            shared: Whether instances with equal config are shared per process
+        """
+        self.target = target
+        self.config_key = config_key
+        self.pass_config = pass_config
+        self.shared = shared
+        self.name: Optional[str] = None
+        self.package: Optional[str] = None
+    
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.package = owner.__module__.rpartition(".")[0]
+    
+    def __get__(self, instance: Any, owner: type = None) -> Any:
+        if instance is None:
+            return self
+        
+        tool = self.build(instance)
+        instance.__dict__[self.name] = tool
+        return tool
+    
+    def build(self, instance: Any) -> Any:
+        """Construct (or fetch shared) tool for agent instance."""
+        config = self._tool_config(instance)
+        
+        def factory():
+            tool_class = resolve_class(self.target, self.package)
+            if not self.pass_config:
+                return tool_class()
+            if self.config_key is FULL_CONFIG:
+                return tool_class(config)
+            return tool_class(config=config)
+        
+        if not self.shared:
+            return factory()
+        return get_shared_instance(self.absolute_target, factory, config if self.pass_config else None)
+    
+    @property
+    def absolute_target(self) -> str:
+        """Target with relative prefix resolved."""
+        if not self.target.startswith("."):
+            return self.target
+        stripped = self.target.lstrip(".")
+        package = self.package or ""
+        for _ in range(len(self.target) - len(stripped) - 1):
+            package = package.rpartition(".")[0]
+        return f"{package}.{stripped}"
+    
+    def _tool_config(self, instance: Any) -> Optional[Dict[str, Any]]:
+        if not self.pass_config:
+            return None
+        agent_config = getattr(instance, "config", None) or {}
+        if self.config_key is FULL_CONFIG:
+            return agent_config
+        return agent_config.get(self.config_key, {})
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Agent Startup Benchmark
+
+PURPOSE:
+Measures import + construction time of each of the six agents in a fresh
+interpreter, the cost every short-lived CLI run (start_production_pipeline.py)
+pays before doing any work. Fails when an agent exceeds its startup budget.
+
+USAGE:
+    python scripts/benchmark_agent_startup.py
+    python scripts/benchmark_agent_startup.py --budget-ms 1500 --runs 3 --json
+
+ADAPTATION GUIDE:
+🔧 To adapt for your project:
+1. Register your agents in AGENT_TARGETS (module, class, constructor config)
+2. Tune DEFAULT_BUDGET_MS or set AGENT_STARTUP_BUDGET_MS in CI
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+DEFAULT_BUDGET_MS = 750.0
+
+# agent_type -> (module, class name, constructor config)
+AGENT_TARGETS: Dict[str, tuple] = {
+    "project_manager": (
+        "modules.agents.project_manager.agent", "ProjectManagerAgent",
+        {
+            "github_token": "startup-benchmark",
+            "github_repo_owner": "startup-benchmark",
+            "github_repo_name": "startup-benchmark"
+        }
+    ),
+    "game_designer": ("modules.agents.game_designer.agent", "GameDesignerAgent", {}),
+    "developer": ("modules.agents.developer.agent", "DeveloperAgent", {}),
+    "test_engineer": ("modules.agents.test_engineer.agent", "TestEngineerAgent", {}),
+    "qa_tester": ("modules.agents.qa_tester.agent", "QATesterAgent", {}),
+    "quality_reviewer": ("modules.agents.quality_reviewer.agent", "QualityReviewerAgent", {}),
+}
+
+# Runs inside the fresh interpreter; prints timings as one JSON line
+_PROBE = """
+import importlib, json, logging, sys, time
+logging.disable(logging.CRITICAL)
+module_name, class_name, config = sys.argv[1], sys.argv[2], json.loads(sys.argv[3])
+start = time.perf_counter()
+module = importlib.import_module(module_name)
+imported = time.perf_counter()
+getattr(module, class_name)(config=config)
+constructed = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - start) * 1000.0,
+    "construct_ms": (constructed - imported) * 1000.0,
+    "modules_loaded": len(sys.modules)
+}))
+"""
+
+
+def measure_agent_startup(agent_type: str, runs: int = 1) -> Dict[str, Any]:
+    """
+    Measure import and construction time of one agent in fresh interpreters.
+
+    Args:
+        agent_type: Key of AGENT_TARGETS
+        runs: Number of fresh interpreters; the fastest run is reported
+
+    Returns:
+        Timing dict with import_ms, construct_ms, total_ms, modules_loaded
+    """
+    module_name, class_name, config = AGENT_TARGETS[agent_type]
+    best: Optional[Dict[str, Any]] = None
+
+    for _ in range(max(1, runs)):
+        completed = subprocess.run(
+            [sys.executable, "-c", _PROBE, module_name, class_name, json.dumps(config)],
+            cwd=str(project_root),
+            capture_output=True,
+            text=True,
+            check=False
+        )
+        if completed.returncode != 0:
+            raise RuntimeError(
+                f"{agent_type} failed to start: {completed.stderr.strip().splitlines()[-1:]}"
+            )
+
+        timing = json.loads(completed.stdout.strip().splitlines()[-1])
+        timing["total_ms"] = timing["import_ms"] + timing["construct_ms"]
+        if best is None or timing["total_ms"] < best["total_ms"]:
+            best = timing
+
+    return best
+
+
+def run_benchmark(
+    budget_ms: float = DEFAULT_BUDGET_MS,
+    runs: int = 1,
+    agents: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Benchmark startup of agents against budget.
+
+    Args:
+        budget_ms: Maximum allowed import + construct time per agent
+        runs: Fresh interpreters per agent (fastest counts)
+        agents: Agent types to measure (default: all six)
+
+    Returns:
+        Report with per-agent timings, over_budget list and passed flag
+    """
+    results = {}
+    for agent_type in agents or list(AGENT_TARGETS):
+        timing = measure_agent_startup(agent_type, runs)
+        timing["within_budget"] = timing["total_ms"] <= budget_ms
+        results[agent_type] = timing
+
+    over_budget = [agent for agent, timing in results.items() if not timing["within_budget"]]
+    return {
+        "budget_ms": budget_ms,
+        "agents": results,
+        "over_budget": over_budget,
+        "passed": not over_budget
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark agent import + construction time")
+    parser.add_argument(
+        "--budget-ms", type=float,
+        default=float(os.getenv("AGENT_STARTUP_BUDGET_MS", DEFAULT_BUDGET_MS)),
+        help="Per-agent startup budget in milliseconds"
+    )
+    parser.add_argument("--runs", type=int, default=3, help="Fresh interpreters per agent")
+    parser.add_argument("--agent", action="append", choices=list(AGENT_TARGETS), help="Only measure this agent")
+    parser.add_argument("--json", action="store_true", help="Print JSON report")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.budget_ms, args.runs, args.agent)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"Agent startup budget: {report['budget_ms']:.0f} ms")
+        for agent_type, timing in report["agents"].items():
+            status = "OK  " if timing["within_budget"] else "SLOW"
+            print(
+                f"  {status} {agent_type:<17} import {timing['import_ms']:7.1f} ms  "
+                f"construct {timing['construct_ms']:6.1f} ms  total {timing['total_ms']:7.1f} ms  "
+                f"({timing['modules_loaded']} modules)"
+            )
+        if not report["passed"]:
+            print(f"❌ Over budget: {', '.join(report['over_budget'])}")
+
+    return 0 if report["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Shared Feature Queue Benchmark
+
+PURPOSE:
+Measures how claim/complete throughput of SharedFeatureQueue scales with the
+number of worker processes draining one SQLite queue. Each worker claims a
+feature, optionally simulates development work, and completes it with its
+claim token. Fails when scaling efficiency drops below the threshold.
+
+Simulated work is a blocking sleep, like a worker waiting on LLM and GitHub
+calls. Claims and completions serialize on SQLite's write lock, so with
+--work-ms 0 the benchmark only reports raw queue contention (not gated); with
+per-feature work the queue must stay out of the way and throughput must grow
+close to linearly with workers.
+
+USAGE:
+    python scripts/benchmark_shared_queue.py
+    python scripts/benchmark_shared_queue.py --workers 1 2 4 --features 400 --work-ms 5 --json
+
+ADAPTATION GUIDE:
+🔧 To adapt for your project:
+1. Tune DEFAULT_WORK_MS to the per-feature time of your workers
+2. Set SHARED_QUEUE_MIN_EFFICIENCY in CI to gate regressions
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules.agents.project_manager.tools.shared_feature_queue import SharedFeatureQueue
+
+
+DEFAULT_WORK_MS = 5.0
+DEFAULT_MIN_EFFICIENCY = 0.8
+
+
+def _fill_queue(db_path: str, features: int) -> None:
+    """Add benchmark features to a fresh queue."""
+    async def fill():
+        queue = SharedFeatureQueue({"db_path": db_path})
+        for i in range(features):
+            await queue.add_feature_to_queue(
+                story_id=f"BENCH-{i:05d}",
+                title=f"Benchmark feature {i}",
+                description="Shared queue benchmark feature",
+                priority=("critical", "high", "medium", "low")[i % 4],
+                acceptance_criteria=["Completed"]
+            )
+        queue.close()
+
+    asyncio.run(fill())
+
+
+def _worker(db_path: str, worker_id: str, work_ms: float, ready, start, results) -> None:
+    """Worker process: claim, work and complete until the queue is empty."""
+    async def drain():
+        queue = SharedFeatureQueue({"db_path": db_path})
+        ready.put(worker_id)
+        start.wait()
+
+        completed = 0
+        while True:
+            feature = await queue.claim_next_feature(worker_id)
+            if not feature:
+                break
+            if work_ms:
+                time.sleep(work_ms / 1000.0)  # Simulated blocking development work
+            if await queue.complete_feature(feature.story_id, feature.metadata["claim_token"]):
+                completed += 1
+        queue.close()
+        return completed
+
+    results.put(asyncio.run(drain()))
+
+
+def measure_throughput(workers: int, features: int, work_ms: float) -> Dict[str, Any]:
+    """
+    Drain a fresh queue with worker processes and measure throughput.
+
+    Args:
+        workers: Number of worker processes
+        features: Number of features in the queue
+        work_ms: Simulated work per feature in milliseconds
+
+    Returns:
+        Timing dict with elapsed_s, completed and features_per_second
+    """
+    with tempfile.TemporaryDirectory(prefix="queue-bench-") as db_path:
+        _fill_queue(db_path, features)
+
+        ready = multiprocessing.Queue()
+        results = multiprocessing.Queue()
+        start = multiprocessing.Event()
+        processes = [
+            multiprocessing.Process(
+                target=_worker, args=(db_path, f"w{i}", work_ms, ready, start, results)
+            )
+            for i in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        for _ in processes:
+            ready.get(timeout=60)  # Exclude process startup from the measurement
+
+        started = time.perf_counter()
+        start.set()
+        completed = sum(results.get(timeout=600) for _ in processes)
+        elapsed = time.perf_counter() - started
+        for process in processes:
+            process.join(timeout=60)
+
+    if completed != features:
+        raise RuntimeError(f"{workers} workers completed {completed} of {features} features")
+
+    return {
+        "workers": workers,
+        "elapsed_s": elapsed,
+        "completed": completed,
+        "features_per_second": completed / elapsed
+    }
+
+
+def run_benchmark(
+    worker_counts: List[int],
+    features: int = 400,
+    work_ms: float = DEFAULT_WORK_MS,
+    min_efficiency: float = DEFAULT_MIN_EFFICIENCY
+) -> Dict[str, Any]:
+    """
+    Benchmark queue throughput for each worker count.
+
+    Scaling efficiency of n workers is throughput(n) / (n * throughput(1)).
+    Without simulated work only contention is reported and nothing is gated.
+
+    Args:
+        worker_counts: Worker process counts to measure (1 is always included)
+        features: Features drained per measurement
+        work_ms: Simulated work per feature in milliseconds
+        min_efficiency: Minimum scaling efficiency for gated worker counts
+
+    Returns:
+        Report with per-count results, below_threshold list and passed flag
+    """
+    cpu_count = os.cpu_count() or 1
+    counts = sorted(set([1] + worker_counts))
+    results = [measure_throughput(workers, features, work_ms) for workers in counts]
+
+    baseline = results[0]["features_per_second"]
+    for result in results:
+        result["speedup"] = result["features_per_second"] / baseline
+        result["efficiency"] = result["speedup"] / result["workers"]
+        result["gated"] = work_ms > 0
+
+    below_threshold = [
+        result["workers"] for result in results
+        if result["gated"] and result["efficiency"] < min_efficiency
+    ]
+    return {
+        "features": features,
+        "work_ms": work_ms,
+        "cpu_count": cpu_count,
+        "min_efficiency": min_efficiency,
+        "results": results,
+        "below_threshold": below_threshold,
+        "passed": not below_threshold
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark shared feature queue scaling across processes")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker process counts")
+    parser.add_argument("--features", type=int, default=400, help="Features drained per measurement")
+    parser.add_argument("--work-ms", type=float, default=DEFAULT_WORK_MS, help="Simulated work per feature")
+    parser.add_argument(
+        "--min-efficiency", type=float,
+        default=float(os.getenv("SHARED_QUEUE_MIN_EFFICIENCY", DEFAULT_MIN_EFFICIENCY)),
+        help="Minimum scaling efficiency when simulating work"
+    )
+    parser.add_argument("--json", action="store_true", help="Print JSON report")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.workers, args.features, args.work_ms, args.min_efficiency)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(
+            f"Shared queue: {report['features']} features, {report['work_ms']:.1f} ms work each, "
+            f"{report['cpu_count']} CPU core(s)"
+        )
+        for result in report["results"]:
+            status = "OK  " if not result["gated"] or result["efficiency"] >= args.min_efficiency else "SLOW"
+            note = "" if result["gated"] else "  (contention only, not gated)"
+            print(
+                f"  {status} {result['workers']:>2} worker(s)  {result['features_per_second']:8.1f} features/s  "
+                f"speedup {result['speedup']:5.2f}x  efficiency {result['efficiency']:5.0%}{note}"
+            )
+        if not report["passed"]:
+            print(f"❌ Below {args.min_efficiency:.0%} efficiency: {report['below_threshold']} workers")
+
+    return 0 if report["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
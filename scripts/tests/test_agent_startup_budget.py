@@ -0,0 +1,53 @@
+"""
+Agent Startup Budget Tests
+
+Guards import + construction time of all six agents so short-lived CLI
+runs (start_production_pipeline.py) stay fast. Each agent is measured in
+a fresh interpreter; set AGENT_STARTUP_BUDGET_MS to tune the budget.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts.benchmark_agent_startup import AGENT_TARGETS, DEFAULT_BUDGET_MS, run_benchmark
+
+
+BUDGET_MS = float(os.getenv("AGENT_STARTUP_BUDGET_MS", DEFAULT_BUDGET_MS))
+
+
+class TestAgentStartupBudget:
+    """Test agent startup stays within budget."""
+    
+    @pytest.mark.parametrize("agent_type", list(AGENT_TARGETS))
+    def test_agent_starts_within_budget(self, agent_type):
+        """Test agent import + construction time is within budget."""
+        report = run_benchmark(BUDGET_MS, runs=2, agents=[agent_type])
+        timing = report["agents"][agent_type]
+        
+        assert report["passed"], (
+            f"{agent_type} startup {timing['total_ms']:.0f} ms exceeds budget {BUDGET_MS:.0f} ms "
+            f"(import {timing['import_ms']:.0f} ms, construct {timing['construct_ms']:.0f} ms)"
+        )
+    
+    def test_heavy_modules_not_imported_at_startup(self):
+        """Test tool modules and jsonschema load lazily rather than at agent construction."""
+        probe = (
+            "import sys, logging; logging.disable(logging.CRITICAL);"
+            "from modules.agents.quality_reviewer.agent import QualityReviewerAgent;"
+            "QualityReviewerAgent();"
+            "print('jsonschema' in sys.modules,"
+            " 'modules.agents.quality_reviewer.tools.quality_scorer' in sys.modules)"
+        )
+        completed = subprocess.run(
+            [sys.executable, "-c", probe], cwd=str(project_root),
+            capture_output=True, text=True, check=True
+        )
+        assert completed.stdout.split() == ["False", "False"]
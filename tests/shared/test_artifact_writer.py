@@ -0,0 +1,111 @@
+"""
+ArtifactWriter tests for DigiNativa AI Team system.
+
+PURPOSE:
+Validate that agent artifacts are written atomically off the event loop,
+identical content is not rewritten, queued writes to one path coalesce
+and bytes written are reported per agent.
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules.shared.artifact_writer import ArtifactWriter, dump_json, get_artifact_writer
+from modules.shared.lazy_tools import LazyTool, clear_shared_instances
+
+
+class WritingAgent:
+    """Agent declaring the shared artifact writer."""
+    
+    config = {}
+    artifact_writer = LazyTool("modules.shared.artifact_writer.ArtifactWriter", pass_config=False)
+
+
+@pytest.mark.asyncio
+async def test_write_json_and_text(tmp_path):
+    """Test JSON and text artifacts land in new directories with readable content."""
+    writer = ArtifactWriter()
+    report_path = tmp_path / "docs" / "qa_reports" / "STORY-001_report.json"
+    
+    written = await asyncio.gather(
+        writer.write_json(report_path, {"score": 92, 3: "ä", "tags": ("a", "b")}, "qa-tester", "STORY-001"),
+        writer.write_text(tmp_path / "docs" / "STORY-001.md", "# Rapport för Anna\n", "qa-tester", "STORY-001")
+    )
+    
+    assert written == [True, True]
+    assert json.loads(report_path.read_text(encoding="utf-8")) == {"score": 92, "3": "ä", "tags": ["a", "b"]}
+    assert (tmp_path / "docs" / "STORY-001.md").read_text(encoding="utf-8") == "# Rapport för Anna\n"
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_lazy_sequences_serialize_as_lists():
+    """Test sequences orjson does not know become lists while other types fall back to str."""
+    data = json.loads(dump_json({"results": range(3), "path": Path("docs"), "raw": b"x"}))
+    
+    assert data == {"results": [0, 1, 2], "path": "docs", "raw": "b'x'"}
+
+
+@pytest.mark.asyncio
+async def test_unchanged_content_is_skipped(tmp_path):
+    """Test identical content is not rewritten, even by a fresh writer."""
+    path = tmp_path / "spec.json"
+    data = {"story_id": "STORY-002", "components": ["Quiz", "Results"]}
+    
+    writer = ArtifactWriter()
+    assert await writer.write_json(path, data, "game-designer") is True
+    modified = path.stat().st_mtime_ns
+    
+    assert await writer.write_json(path, data, "game-designer") is False
+    assert await ArtifactWriter().write_json(path, data, "game-designer") is False
+    assert path.stat().st_mtime_ns == modified
+    
+    assert await writer.write_json(path, dict(data, components=["Quiz"]), "game-designer") is True
+    stats = writer.statistics("game-designer")
+    assert stats["files_written"] == 2
+    assert stats["files_skipped"] == 1
+
+
+@pytest.mark.asyncio
+async def test_queued_writes_to_same_path_coalesce(tmp_path):
+    """Test writes queued before the first lands produce one write with the last content."""
+    writer = ArtifactWriter()
+    path = tmp_path / "story.md"
+    
+    futures = [writer.submit(path, f"revision {i}".encode(), "project-manager", "STORY-003") for i in range(5)]
+    await writer.flush("STORY-003")
+    
+    assert [future.result() for future in futures] == [True] * 5
+    assert path.read_text() == "revision 4"
+    stats = writer.statistics()["project-manager"]
+    assert stats == {"bytes_written": 10, "files_written": 1, "files_skipped": 0, "writes_coalesced": 4}
+
+
+@pytest.mark.asyncio
+async def test_failed_write_raises_and_leaves_original(tmp_path):
+    """Test a failed write surfaces to the caller and never leaves partial files."""
+    writer = ArtifactWriter()
+    blocker = tmp_path / "not_a_directory"
+    blocker.write_text("file")
+    
+    with pytest.raises(OSError):
+        await writer.write_text(blocker / "report.md", "content", "qa-tester")
+    assert blocker.read_text() == "file"
+    assert writer.statistics("qa-tester")["files_written"] == 0
+
+
+def test_agents_and_tools_share_one_writer():
+    """Test LazyTool declarations and get_artifact_writer() return the same instance."""
+    clear_shared_instances()
+    try:
+        assert WritingAgent().artifact_writer is get_artifact_writer()
+        assert WritingAgent().artifact_writer is WritingAgent().artifact_writer
+    finally:
+        clear_shared_instances()
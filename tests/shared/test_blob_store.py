@@ -0,0 +1,152 @@
+"""
+BlobStore tests for DigiNativa AI Team system.
+
+PURPOSE:
+Validate that large contract payloads move to content-addressed blobs,
+handoff contracts shrink to references, downstream agents read payloads
+lazily and contract validation rejects dangling references.
+"""
+
+import copy
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules.shared.base_agent import AgentState
+from modules.shared.blob_store import BlobStore, LazyBlobDict, is_blob_ref, iter_blob_refs
+from modules.shared.contract_validator import ContractValidator
+from modules.shared.exceptions import StateManagementError
+
+
+def _implementations(count=20, lines=400):
+    """Developer-style component implementations with large generated source."""
+    return [
+        {
+            "name": f"Component{i}",
+            "files": {"component": f"components/STORY-BLOB-001/Component{i}.tsx"},
+            "code": {
+                "component": "\n".join(f"const line{n} = {i * n};" for n in range(lines)),
+                "tests": "\n".join(f"it('renders {n}', () => {{}});" for n in range(lines)),
+                "story": "export default {};"
+            },
+            "typescript_errors": 0
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def blob_store(tmp_path):
+    return BlobStore({"blob_store_path": str(tmp_path / "blobs")})
+
+
+def test_externalize_shrinks_handoff_payload(blob_store):
+    """Test generated source is replaced by references and the payload drops to kilobytes."""
+    implementations = _implementations()
+    
+    externalized = blob_store.externalize(implementations)
+    
+    inline_size = len(json.dumps(implementations))
+    referenced_size = len(json.dumps(externalized))
+    assert inline_size > 400_000
+    assert referenced_size < 10_000
+    first = externalized[0]
+    assert is_blob_ref(first["code"]["component"])
+    assert first["code"]["story"] == "export default {};"
+    assert first["typescript_errors"] == 0
+    assert implementations[0]["code"]["component"].startswith("const line0")
+
+
+def test_identical_content_is_stored_once(blob_store):
+    """Test blobs are content-addressed and deduplicated."""
+    first = blob_store.put_text("x" * 5000)
+    second = blob_store.put_text("x" * 5000)
+    
+    assert first == second
+    assert len(list(blob_store.root.rglob("*"))) == 2  # one shard directory, one blob
+
+
+def test_lazy_values_load_on_access(blob_store):
+    """Test downstream reads see source text while the structure keeps references."""
+    implementations = _implementations(count=2)
+    lazy = blob_store.lazy(blob_store.externalize(implementations))
+    
+    code = lazy[0]["code"]
+    assert isinstance(code, LazyBlobDict)
+    assert code.get("component") == implementations[0]["code"]["component"]
+    assert code["tests"] == implementations[0]["code"]["tests"]
+    assert code.get("missing", "") == ""
+    assert "const line399" in str(code)
+    
+    # Serialization, copies and persisted agent state keep references only
+    assert len(json.dumps(lazy)) < 2_000
+    assert is_blob_ref(dict.__getitem__(copy.deepcopy(code), "component"))
+    state = AgentState(
+        agent_id="test-engineer", story_id="STORY-BLOB-001", status="started",
+        input_contract={"required_data": {"component_implementations": lazy}}, output_contract=None,
+        progress_data={}, error_data=None, started_at="", last_updated=""
+    )
+    assert len(json.dumps(asdict(state))) < 2_000
+
+
+def test_json_blobs_round_trip(blob_store):
+    """Test full result lists stored as JSON blobs resolve to equal values."""
+    report = {"scenario_results": [{"scenario": i, "passed": i % 3 != 0} for i in range(500)]}
+    
+    lazy = blob_store.lazy({"qa_validation_results": blob_store.put_json(report)})
+    
+    assert lazy.get("qa_validation_results") == report
+
+
+def test_corrupted_and_missing_blobs_raise(blob_store):
+    """Test integrity failures and missing blobs surface as state errors."""
+    ref = blob_store.put_text("payload " * 200)
+    path = blob_store.root / ref["$blob"][:2] / ref["$blob"]
+    path.write_bytes(b"tampered")
+    
+    with pytest.raises(StateManagementError, match="integrity"):
+        BlobStore(blob_store.config).get_bytes(ref)
+    
+    path.unlink()
+    with pytest.raises(StateManagementError, match="not found"):
+        BlobStore(blob_store.config).get_bytes(ref)
+
+
+def test_zstd_compression(tmp_path):
+    """Test zstd-compressed blobs are smaller on disk and readable by any store."""
+    pytest.importorskip("zstandard")
+    compressed_store = BlobStore({"blob_store_path": str(tmp_path), "blob_compression": "zstd"})
+    text = "const value = 1;\n" * 2000
+    
+    ref = compressed_store.put_text(text)
+    
+    assert (tmp_path / ref["$blob"][:2] / ref["$blob"]).stat().st_size < len(text) / 10
+    assert BlobStore({"blob_store_path": str(tmp_path)}).resolve(ref) == text
+
+
+def test_contract_validator_rejects_dangling_references(blob_store, tmp_path):
+    """Test reference-aware validation flags missing and malformed blobs."""
+    externalized = blob_store.externalize(_implementations(count=1))
+    contract = {"input_requirements": {"required_data": {"component_implementations": externalized}}}
+    refs = list(iter_blob_refs(contract))
+    assert len(refs) == 2
+    
+    assert blob_store.reference_errors(contract) == []
+    empty_store = BlobStore({"blob_store_path": str(tmp_path / "empty")})
+    assert len(empty_store.reference_errors(contract)) == 2
+    assert blob_store.reference_errors({"code": {"$blob": "../../etc/passwd"}}) == [
+        "Malformed blob reference: '../../etc/passwd'"
+    ]
+    
+    validator = ContractValidator()
+    with_store = validator.validate_contract(contract, blob_store=empty_store)
+    without_store = validator.validate_contract(contract)
+    assert "Blob reference" in " ".join(with_store.errors)
+    assert "Blob reference" not in " ".join(without_store.errors)
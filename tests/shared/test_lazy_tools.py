@@ -0,0 +1,117 @@
+"""
+LazyTool tests for DigiNativa AI Team system.
+
+PURPOSE:
+Validate that agent tools are imported and constructed on first use,
+shared per process when configuration matches, and still replaceable
+per agent instance in tests.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules.shared.lazy_tools import (
+    LazyTool, clear_shared_instances, get_shared_instance, resolve_class
+)
+
+
+class RecordingTool:
+    """Tool recording how it was constructed."""
+    
+    constructed = 0
+    
+    def __init__(self, config=None):
+        RecordingTool.constructed += 1
+        self.config = config
+
+
+class FakeAgent:
+    """Agent declaring lazy tools."""
+    
+    full = LazyTool("tests.shared.test_lazy_tools.RecordingTool")
+    section = LazyTool("tests.shared.test_lazy_tools.RecordingTool", config_key="section_config")
+    bare = LazyTool("tests.shared.test_lazy_tools.RecordingTool", pass_config=False)
+    private = LazyTool("tests.shared.test_lazy_tools.RecordingTool", shared=False)
+    
+    def __init__(self, config=None):
+        self.config = config or {}
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    clear_shared_instances()
+    RecordingTool.constructed = 0
+    yield
+    clear_shared_instances()
+
+
+class TestLazyTool:
+    """Test lazy tool construction and sharing."""
+    
+    def test_tool_built_on_first_access_only(self):
+        """Test construction is deferred until attribute is read, then cached."""
+        agent = FakeAgent({"mode": "a"})
+        assert RecordingTool.constructed == 0
+        
+        tool = agent.full
+        assert RecordingTool.constructed == 1
+        assert tool.config == {"mode": "a"}
+        assert agent.full is tool
+        assert "full" in agent.__dict__
+    
+    def test_config_key_and_no_arg_tools(self):
+        """Test config section and no-config declarations."""
+        agent = FakeAgent({"section_config": {"depth": 3}})
+        
+        assert agent.section.config == {"depth": 3}
+        assert agent.bare.config is None
+        assert FakeAgent().section.config == {}
+    
+    def test_shared_per_process_by_config(self):
+        """Test agents with equal config share one tool and different config does not."""
+        first = FakeAgent({"mode": "a"})
+        second = FakeAgent({"mode": "a"})
+        other = FakeAgent({"mode": "b"})
+        
+        assert first.full is second.full
+        assert first.full is not other.full
+        assert first.private is not second.private
+        assert RecordingTool.constructed == 4
+    
+    def test_instance_override_does_not_leak(self):
+        """Test assigning a replacement (e.g. a mock) only affects that instance."""
+        patched = FakeAgent()
+        untouched = FakeAgent()
+        replacement = object()
+        
+        patched.full = replacement
+        
+        assert patched.full is replacement
+        assert untouched.full is not replacement
+        assert isinstance(FakeAgent.full, LazyTool)
+    
+    def test_relative_targets_resolve_against_owner_package(self):
+        """Test relative targets resolve like relative imports of the declaring module."""
+        from modules.agents.qa_tester.agent import QATesterAgent
+        
+        descriptor = QATesterAgent.__dict__["persona_simulator"]
+        assert descriptor.absolute_target == "modules.agents.qa_tester.tools.persona_simulator.PersonaSimulator"
+        assert resolve_class(descriptor.target, descriptor.package).__name__ == "PersonaSimulator"
+    
+    def test_get_shared_instance_calls_factory_once(self):
+        """Test explicit registry use (e.g. the shared ContractValidator)."""
+        calls = []
+        
+        def factory():
+            calls.append(1)
+            return object()
+        
+        first = get_shared_instance("demo.Target", factory, {"a": 1})
+        assert get_shared_instance("demo.Target", factory, {"a": 1}) is first
+        assert len(calls) == 1